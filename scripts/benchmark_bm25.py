@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark LearningCache.bm25_query_fast latency.
+
+Builds synthetic learning caches of increasing size and reports p50/p99
+query latency for the grouped-SQL BM25 scorer. With --legacy, also times
+the previous per-term/per-document strategy (one df query per term plus
+one doc-length aggregate per candidate) on the same data for comparison.
+
+Usage:
+    python scripts/benchmark_bm25.py
+    python scripts/benchmark_bm25.py --sizes 1000 10000 100000 --queries 200
+    python scripts/benchmark_bm25.py --sizes 10000 --legacy
+"""
+
+import argparse
+import math
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sunwell.agent.learning.learning import Learning
+from sunwell.memory.core.learning_cache import LearningCache
+
+CATEGORIES = ("fact", "pattern", "preference", "constraint", "dead_end")
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Pseudo-words; drawn with a Zipf-like skew so df varies realistically."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(3, 9))) for _ in range(size)]
+
+
+def make_learnings(count: int, vocab: list[str], rng: random.Random) -> list[Learning]:
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    learnings = []
+    for i in range(count):
+        words = rng.choices(vocab, weights=weights, k=rng.randint(6, 20))
+        learnings.append(
+            Learning(fact=f"{' '.join(words)} #{i}", category=rng.choice(CATEGORIES))
+        )
+    return learnings
+
+
+def legacy_query(cache: LearningCache, query: str, limit: int = 100) -> list[tuple[str, float]]:
+    """The previous scorer: N+1 queries, doc length aggregated from postings."""
+    k1, b = 1.5, 0.75
+    terms = query.lower().split()
+    conn = cache._get_connection()
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM bm25_metadata").fetchall())
+        total_docs, avgdl = int(meta["total_docs"]), meta["avg_doc_length"]
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = conn.execute(
+                "SELECT learning_id, term_frequency FROM bm25_index WHERE term = ?", (term,)
+            ).fetchall()
+            if not postings:
+                continue
+            idf = math.log((total_docs - len(postings) + 0.5) / (len(postings) + 0.5) + 1.0)
+            for learning_id, tf in postings:
+                doc_len = conn.execute(
+                    "SELECT SUM(term_frequency) FROM bm25_index WHERE learning_id = ?",
+                    (learning_id,),
+                ).fetchone()[0]
+                denom = tf + k1 * (1 - b + b * doc_len / avgdl)
+                scores[learning_id] = scores.get(learning_id, 0.0) + idf * tf * (k1 + 1) / denom
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+    finally:
+        conn.close()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_queries(fn: Callable[[str], object], queries: list[str]) -> tuple[float, float]:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=100, help="Queries per size")
+    parser.add_argument("--vocab", type=int, default=5_000, help="Vocabulary size")
+    parser.add_argument("--limit", type=int, default=100, help="Results per query")
+    parser.add_argument("--legacy", action="store_true", help="Also time the old scorer")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocabulary(args.vocab, rng)
+
+    header = f"{'docs':>8}  {'ingest s':>9}  {'p50 ms':>8}  {'p99 ms':>8}"
+    if args.legacy:
+        header += f"  {'legacy p50':>10}  {'legacy p99':>10}"
+    print(header)
+
+    for size in args.sizes:
+        learnings = make_learnings(size, vocab, rng)
+        queries = [
+            " ".join(rng.sample(vocab[:500], rng.randint(1, 4))) for _ in range(args.queries)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LearningCache(Path(tmp))
+            start = time.perf_counter()
+            for i in range(0, size, 1_000):
+                cache.add_batch(learnings[i : i + 1_000])
+            ingest = time.perf_counter() - start
+
+            p50, p99 = time_queries(
+                lambda q, cache=cache: cache.bm25_query_fast(q, limit=args.limit), queries
+            )
+            line = f"{size:>8}  {ingest:>9.2f}  {p50:>8.2f}  {p99:>8.2f}"
+            if args.legacy:
+                lp50, lp99 = time_queries(
+                    lambda q, cache=cache: legacy_query(cache, q, args.limit), queries
+                )
+                line += f"  {lp50:>10.2f}  {lp99:>10.2f}"
+            print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,8 @@ from pathlib import Path
 from time import time
 from typing import TYPE_CHECKING, Any
 
+from sunwell.agent.core.bootstrap import StagePipeline, stage_latency_event
+
 logger = logging.getLogger(__name__)
 
 from sunwell.agent.core.task_graph import TaskGraph, sanitize_code_content
@@ -419,121 +421,14 @@ class Agent:
             self._naaru.simulacrum = self._simulacrum
             self._naaru.memory = self._memory
 
-        # RFC-126: Store workspace context for task execution
-        # RFC-135: Enrich with goal-aware context from SmartContext
-        base_context = session.to_planning_prompt()
-        from sunwell.knowledge import enrich_context_for_goal
-
-        self._workspace_context = await enrich_context_for_goal(
-            goal=session.goal,
-            workspace=session.cwd,
-            model=self.model,
-            base_context=base_context,
-        )
-
-        # ─── PHASE 0.1: INTENT CLASSIFICATION (Conversational DAG Architecture) ───
-        # Classify intent and emit event for UI display
-        from sunwell.agent.intent import (
-            classify_intent,
-            format_path,
-            get_tool_scope,
-            requires_approval,
-        )
-
-        classification = await classify_intent(session.goal, model=self.model)
-        tool_scope = get_tool_scope(classification.path)
-        yield intent_classified_event(
-            path=tuple(n.value for n in classification.path),
-            confidence=classification.confidence,
-            reasoning=classification.reasoning,
-            requires_approval=requires_approval(classification.path),
-            tool_scope=tool_scope.value if tool_scope else None,
-        )
-
-        # ─── PHASE 0.2: DOMAIN DETECTION (RFC-DOMAINS) ───
-        # Detect domain for goal-appropriate tools and validators
-        from sunwell.domains import DomainRegistry
-
-        detected_domain, domain_confidence = DomainRegistry.detect(session.goal)
-        self._detected_domain = detected_domain
-        yield domain_detected_event(
-            domain_type=detected_domain.domain_type.value,
-            confidence=domain_confidence,
-            tools_package=detected_domain.tools_package,
-            validators=[v.name for v in detected_domain.validators],
-        )
-
-        # ─── PHASE 0: PREFETCH (RFC-130) ───
-        # Memory-informed prefetch to warm context before main execution
-        if session.briefing:
-            prefetched = await self._run_memory_informed_prefetch(
-                session.briefing, memory
-            )
-            if prefetched:
-                self._prefetched_context = prefetched
-                # If prefetch suggests a lens, use it (unless explicitly set)
-                if prefetched.lens and not session.lens:
-                    from sunwell.planning.lens.manager import LensManager
-                    try:
-                        manager = LensManager()
-                        suggested_lens = manager.load(prefetched.lens)
-                        if suggested_lens:
-                            self.lens = suggested_lens
-                            yield lens_selected_event(
-                                name=suggested_lens.metadata.name,
-                                source="memory_prefetch",
-                                confidence=0.75,
-                                reason="Lens from similar past goal",
-                            )
-                    except Exception as e:
-                        logger.debug("Failed to load prefetched lens %r: %s", prefetched.lens, e)
-
-        # ─── PHASE 1: ORIENT ───
-        # What do we know? What should we avoid?
-        memory_ctx = await memory.get_relevant(session.goal)
-
-        yield orient_event(
-            learnings=len(memory_ctx.learnings),
-            constraints=len(memory_ctx.constraints),
-            dead_ends=len(memory_ctx.dead_ends),
-        )
-
-        # Use session's briefing if available
-        if session.briefing:
-            self._briefing = session.briefing
-            yield briefing_loaded_event(
-                mission=session.briefing.mission,
-                status=session.briefing.status.value,
-                has_hazards=len(session.briefing.hazards) > 0,
-                has_dispatch_hints=bool(
-                    session.briefing.predicted_skills or session.briefing.suggested_lens
-                ),
-            )
-
-        # Resolve lens
-        if session.lens:
-            self.lens = session.lens
-        elif self.lens is None and self.auto_lens:
-            from sunwell.agent.utils.lens import resolve_lens_for_goal
-
-            resolution = await resolve_lens_for_goal(
-                goal=session.goal,
-                project_path=session.cwd,
-                auto_select=True,
-            )
-            if resolution.lens:
-                self.lens = resolution.lens
-                yield lens_selected_event(
-                    name=resolution.lens.metadata.name,
-                    source=resolution.source,
-                    confidence=resolution.confidence,
-                    reason=resolution.reason,
-                )
-
-        # ─── PHASE 2: SIGNAL ───
-        yield signal_event("extracting")
-        signals = await self._extract_signals_with_memory(session.goal)
-        yield signal_event("extracted", signals=signals.to_dict())
+        # ─── PHASES 0-2: BOOTSTRAP ───
+        # Context, intent, prefetch, orient, lens and signal stages run
+        # concurrently; their events are still emitted in pipeline order.
+        stages = StagePipeline()
+        async for event in self._bootstrap_goal(session, memory, stages):
+            yield event
+        memory_ctx = (await stages.result("memory")).value
+        signals = (await stages.result("signals")).value
 
         # Check for dangerous or ambiguous goals
         if signals.is_dangerous == "YES":
@@ -854,6 +749,160 @@ class Agent:
 
         return PlanResult(task_graph=task_graph, metrics=metrics, signals=signals)
 
+    async def _bootstrap_goal(
+        self,
+        session: SessionContext,
+        memory: PersistentMemory,
+        stages: StagePipeline,
+    ) -> AsyncIterator[AgentEvent]:
+        """Run the pre-planning stages concurrently.
+
+        Every stage that depends only on the goal starts immediately. Lens
+        resolution starts speculatively and is cancelled if prefetch supplies
+        a lens. Results are consumed in the original pipeline order, and each
+        stage's status and latency is reported as a goal_analyzing event.
+
+        Args:
+            session: SessionContext with goal, workspace, options
+            memory: PersistentMemory with decisions, failures, patterns
+            stages: Pipeline that holds the stage results afterwards
+
+        Yields:
+            AgentEvent for each bootstrap step
+        """
+        from sunwell.agent.intent import classify_intent, get_tool_scope, requires_approval
+        from sunwell.agent.utils.lens import resolve_lens_for_goal
+        from sunwell.domains import DomainRegistry
+        from sunwell.knowledge import enrich_context_for_goal
+        from sunwell.memory import MemoryContext
+
+        goal = session.goal
+        base_context = session.to_planning_prompt()
+
+        async with stages:
+            # RFC-126/RFC-135: Goal-aware workspace context for task execution
+            stages.start(
+                "context",
+                enrich_context_for_goal(
+                    goal=goal,
+                    workspace=session.cwd,
+                    model=self.model,
+                    base_context=base_context,
+                ),
+                default=base_context,
+            )
+            stages.start("intent", classify_intent(goal, model=self.model))
+            if session.briefing:
+                stages.start(
+                    "prefetch", self._run_memory_informed_prefetch(session.briefing, memory)
+                )
+            stages.start("memory", memory.get_relevant(goal), default=MemoryContext())
+            if not session.lens and self.lens is None and self.auto_lens:
+                stages.start(
+                    "lens",
+                    resolve_lens_for_goal(goal=goal, project_path=session.cwd, auto_select=True),
+                )
+            stages.start("signals", self._extract_signals_with_memory(goal))
+
+            context = await stages.result("context")
+            yield stage_latency_event(goal, context)
+            self._workspace_context = context.value
+
+            # ─── PHASE 0.1: INTENT CLASSIFICATION (Conversational DAG Architecture) ───
+            intent = await stages.result("intent")
+            yield stage_latency_event(goal, intent)
+            if intent.ok:
+                classification = intent.value
+                tool_scope = get_tool_scope(classification.path)
+                yield intent_classified_event(
+                    path=tuple(n.value for n in classification.path),
+                    confidence=classification.confidence,
+                    reasoning=classification.reasoning,
+                    requires_approval=requires_approval(classification.path),
+                    tool_scope=tool_scope.value if tool_scope else None,
+                )
+
+            # ─── PHASE 0.2: DOMAIN DETECTION (RFC-DOMAINS) ───
+            detected_domain, domain_confidence = DomainRegistry.detect(goal)
+            self._detected_domain = detected_domain
+            yield domain_detected_event(
+                domain_type=detected_domain.domain_type.value,
+                confidence=domain_confidence,
+                tools_package=detected_domain.tools_package,
+                validators=[v.name for v in detected_domain.validators],
+            )
+
+            # ─── PHASE 0: PREFETCH (RFC-130) ───
+            if "prefetch" in stages:
+                prefetch = await stages.result("prefetch")
+                yield stage_latency_event(goal, prefetch)
+                prefetched = prefetch.value
+                if prefetched:
+                    self._prefetched_context = prefetched
+                    # If prefetch suggests a lens, use it (unless explicitly set)
+                    if prefetched.lens and not session.lens:
+                        from sunwell.planning.lens.manager import LensManager
+                        try:
+                            suggested_lens = LensManager().load(prefetched.lens)
+                            if suggested_lens:
+                                self.lens = suggested_lens
+                                # Fast path: auto lens resolution is no longer needed
+                                stages.cancel("lens")
+                                yield lens_selected_event(
+                                    name=suggested_lens.metadata.name,
+                                    source="memory_prefetch",
+                                    confidence=0.75,
+                                    reason="Lens from similar past goal",
+                                )
+                        except Exception as e:
+                            logger.debug(
+                                "Failed to load prefetched lens %r: %s", prefetched.lens, e
+                            )
+
+            # ─── PHASE 1: ORIENT ───
+            orient = await stages.result("memory")
+            yield stage_latency_event(goal, orient)
+            memory_ctx = orient.value
+            yield orient_event(
+                learnings=len(memory_ctx.learnings),
+                constraints=len(memory_ctx.constraints),
+                dead_ends=len(memory_ctx.dead_ends),
+            )
+
+            # Use session's briefing if available
+            if session.briefing:
+                self._briefing = session.briefing
+                yield briefing_loaded_event(
+                    mission=session.briefing.mission,
+                    status=session.briefing.status.value,
+                    has_hazards=len(session.briefing.hazards) > 0,
+                    has_dispatch_hints=bool(
+                        session.briefing.predicted_skills or session.briefing.suggested_lens
+                    ),
+                )
+
+            # Resolve lens
+            if session.lens:
+                self.lens = session.lens
+            elif "lens" in stages:
+                lens = await stages.result("lens")
+                yield stage_latency_event(goal, lens)
+                resolution = lens.value
+                if lens.ok and resolution.lens:
+                    self.lens = resolution.lens
+                    yield lens_selected_event(
+                        name=resolution.lens.metadata.name,
+                        source=resolution.source,
+                        confidence=resolution.confidence,
+                        reason=resolution.reason,
+                    )
+
+            # ─── PHASE 2: SIGNAL ───
+            yield signal_event("extracting")
+            extracted = await stages.result("signals")
+            yield stage_latency_event(goal, extracted)
+            yield signal_event("extracted", signals=extracted.value.to_dict())
+
     async def _extract_signals_with_memory(self, goal: str) -> AdaptiveSignals:
         """Extract signals with memory context."""
         signals = await extract_signals(goal, self.model)
@@ -0,0 +1,197 @@
+"""Concurrent goal bootstrap for Agent.run() (RFC-MEMORY).
+
+Before planning, the agent enriches workspace context, classifies intent,
+prefetches from memory, loads memory context, resolves a lens and extracts
+signals. Most of these depend only on the goal, so they are started
+together and awaited in the order their events are emitted.
+
+Each stage has its own timeout and a default value used when it times out
+or is cancelled. A stage made redundant by an earlier result (lens
+resolution once prefetch has supplied a lens) is cancelled, and any stage
+still running when bootstrap ends early is cancelled on exit.
+
+Example:
+    >>> async with StagePipeline() as stages:
+    ...     stages.start("memory", memory.get_relevant(goal), default=MemoryContext())
+    ...     stages.start("signals", extract_signals(goal, model))
+    ...     memory_ctx = (await stages.result("memory")).value
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Literal, Self
+
+from sunwell.agent.events import AgentEvent, goal_analyzing_event
+
+logger = logging.getLogger(__name__)
+
+StageStatus = Literal["complete", "timeout", "cancelled"]
+
+DEFAULT_STAGE_TIMEOUTS: Mapping[str, float | None] = MappingProxyType({
+    "context": 15.0,
+    "intent": 10.0,
+    "prefetch": 5.0,
+    "memory": 10.0,
+    "lens": 10.0,
+    # Planning cannot proceed without signals, so never give up on them
+    "signals": None,
+})
+"""Per-stage timeouts in seconds (None waits indefinitely)."""
+
+
+@dataclass(frozen=True, slots=True)
+class StageResult:
+    """Outcome of one bootstrap stage."""
+
+    name: str
+    """Stage name."""
+
+    status: StageStatus
+    """How the stage ended."""
+
+    duration_ms: int
+    """Time from start until the stage finished or was abandoned."""
+
+    value: Any = None
+    """Stage result, or the stage default if it did not complete."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the stage completed and ``value`` is its own result."""
+        return self.status == "complete"
+
+
+class StagePipeline:
+    """Runs named bootstrap stages concurrently.
+
+    Stages start as soon as they are added and time out relative to their
+    start. ``result()`` waits for one stage and caches the outcome.
+    Exceptions raised by a stage propagate from ``result()`` unchanged.
+    """
+
+    __slots__ = (
+        "timeouts",
+        "_tasks",
+        "_defaults",
+        "_started",
+        "_finished",
+        "_cancelled",
+        "_timed_out",
+        "_results",
+    )
+
+    def __init__(self, timeouts: Mapping[str, float | None] = DEFAULT_STAGE_TIMEOUTS):
+        """Create an empty pipeline.
+
+        Args:
+            timeouts: Per-stage timeouts in seconds; missing stages never time out
+        """
+        self.timeouts = timeouts
+        self._tasks: dict[str, asyncio.Future[Any]] = {}
+        self._defaults: dict[str, Any] = {}
+        self._started: dict[str, float] = {}
+        self._finished: dict[str, float] = {}
+        self._cancelled: set[str] = set()
+        self._timed_out: set[str] = set()
+        self._results: dict[str, StageResult] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tasks
+
+    def start(self, name: str, work: Awaitable[Any], *, default: Any = None) -> None:
+        """Start a stage in the background.
+
+        Args:
+            name: Stage name, used for its timeout and in latency events
+            work: Coroutine producing the stage result
+            default: Value reported if the stage times out or is cancelled
+        """
+        self._started[name] = perf_counter()
+        self._defaults[name] = default
+        task = asyncio.ensure_future(work)
+        task.add_done_callback(lambda _: self._finished.setdefault(name, perf_counter()))
+        self._tasks[name] = task
+
+        # The deadline runs from start, not from when result() is called
+        timeout = self.timeouts.get(name)
+        if timeout is not None:
+            deadline = asyncio.get_running_loop().call_later(timeout, self._expire, name)
+            task.add_done_callback(lambda _: deadline.cancel())
+
+    def _expire(self, name: str) -> None:
+        self._timed_out.add(name)
+        self._tasks[name].cancel()
+
+    def cancel(self, name: str) -> None:
+        """Abandon a stage whose result is no longer needed.
+
+        The stage reports ``cancelled`` even if it already finished.
+        """
+        if name in self._tasks and name not in self._results:
+            self._cancelled.add(name)
+            self._tasks[name].cancel()
+
+    async def result(self, name: str) -> StageResult:
+        """Wait for a stage and return its outcome."""
+        if name in self._results:
+            return self._results[name]
+
+        task = self._tasks[name]
+        status: StageStatus = "complete"
+        value = self._defaults[name]
+        if name in self._cancelled:
+            status = "cancelled"
+        else:
+            try:
+                value = await task
+            except asyncio.CancelledError:
+                # Only swallow cancellations we asked for, never our caller's
+                if name in self._timed_out:
+                    status = "timeout"
+                    logger.debug("Bootstrap stage %r timed out", name)
+                elif name in self._cancelled:
+                    status = "cancelled"
+                else:
+                    raise
+
+        finished = self._finished.get(name, perf_counter())
+        result = StageResult(
+            name=name,
+            status=status,
+            duration_ms=int((finished - self._started[name]) * 1000),
+            value=value,
+        )
+        self._results[name] = result
+        return result
+
+    async def aclose(self) -> None:
+        """Cancel every stage that is still running."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        # Retrieve exceptions of stages nobody awaited to avoid asyncio warnings
+        for task in self._tasks.values():
+            if not task.cancelled():
+                task.exception()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+def stage_latency_event(goal: str, result: StageResult) -> AgentEvent:
+    """Report a bootstrap stage's outcome and latency as goal_analyzing."""
+    return goal_analyzing_event(
+        goal,
+        stage=result.name,
+        status=result.status,
+        duration_ms=result.duration_ms,
+    )
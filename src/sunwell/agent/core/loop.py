@@ -17,8 +17,9 @@ Sunwell differentiators:
 - Smart-to-dumb model delegation (RFC-137)
 """
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -80,6 +81,8 @@ from sunwell.agent.loop.routing import (
 )
 from sunwell.agent.validation.introspection import introspect_tool_call
 from sunwell.models import GenerateOptions, GenerateResult, Message, Tool, ToolCall
+from sunwell.models.capability.parallel import plan_parallel_execution
+from sunwell.models.capability.registry import get_capability
 
 if TYPE_CHECKING:
     from sunwell.agent.learning import LearningStore, RoutingOutcomeStore
@@ -91,6 +94,7 @@ if TYPE_CHECKING:
     from sunwell.memory.briefing.briefing import Briefing
     from sunwell.memory.simulacrum.core.store import SimulacrumStore
     from sunwell.models import ModelProtocol
+    from sunwell.tools.core.types import ToolResult
     from sunwell.tools.execution import ToolExecutor
     from sunwell.tools.progressive import ProgressivePolicy
     from sunwell.tools.selection import MultiSignalToolSelector
@@ -992,81 +996,205 @@ class AgentLoop:
 
         RFC-134: Includes introspection for argument validation/repair
         and retry escalation on failures.
+
+        Consecutive read-only calls run concurrently (see
+        :meth:`_plan_tool_groups`); events and conversation messages are
+        still produced in the order the model emitted the calls.
         """
-        for tc in tool_calls:
-            # RFC-134: Pre-execution introspection
-            if self.config.enable_introspection:
-                introspection = introspect_tool_call(tc, self.workspace)
+        for group in self._plan_tool_groups(tool_calls):
+            if len(group) == 1:
+                async for event in self._execute_sequential_call(group[0], state):
+                    yield event
+            else:
+                async for event in self._execute_parallel_group(group, state):
+                    yield event
 
-                # Handle blocked calls
-                if introspection.blocked:
-                    logger.warning(
-                        "Tool call blocked by introspection: %s - %s",
-                        tc.name,
-                        introspection.block_reason,
-                    )
-                    yield tool_error_event(
-                        tool_name=tc.name,
-                        tool_call_id=tc.id,
-                        error=f"Blocked: {introspection.block_reason}",
-                    )
-                    # Append error as tool result for conversation continuity
-                    state.messages.append(Message(
-                        role="assistant",
-                        tool_calls=(tc,),
-                    ))
-                    state.messages.append(Message(
-                        role="tool",
-                        content=f"Error: {introspection.block_reason}",
-                        tool_call_id=tc.id,
-                    ))
-                    continue
+    def _plan_tool_groups(
+        self,
+        tool_calls: tuple[ToolCall, ...],
+    ) -> list[tuple[ToolCall, ...]]:
+        """Split a turn's tool calls into ordered execution groups.
 
-                # Emit and log repairs made
-                if introspection.repairs:
-                    state.repairs_made += len(introspection.repairs)
-                    # Emit TOOL_REPAIR event
-                    yield tool_repair_event(
-                        tool_name=tc.name,
-                        tool_call_id=tc.id,
-                        repairs=tuple(introspection.repairs),
-                    )
-                    for repair in introspection.repairs:
-                        logger.info("Introspection repair: %s", repair)
+        ``plan_parallel_execution`` decides which calls are read-only; each
+        run of consecutive read-only calls becomes one concurrent group and
+        every other call is a group of its own, so a read never moves across
+        a write or side effect.
+        """
+        if (
+            len(tool_calls) < 2
+            or not self.config.enable_parallel_tools
+            or self.config.max_parallel_tools < 2
+        ):
+            return [(tc,) for tc in tool_calls]
 
-                # Log warnings
-                for warning in introspection.warnings:
-                    logger.warning("Introspection warning: %s", warning)
+        model_id = getattr(self.model, "model_id", None)
+        if not isinstance(model_id, str):
+            return [(tc,) for tc in tool_calls]
+        tools = {t.name: t for t in self.executor.get_tool_definitions()}
+        plan = plan_parallel_execution(tool_calls, tools, get_capability(model_id))
+        read_only = {id(tc) for group in plan.parallel_groups for tc in group}
 
-                # Use repaired tool call
-                tc = introspection.tool_call
+        groups: list[tuple[ToolCall, ...]] = []
+        run: list[ToolCall] = []
+        for tc in tool_calls:
+            if id(tc) in read_only:
+                run.append(tc)
+                continue
+            if run:
+                groups.append(tuple(run))
+                run = []
+            groups.append((tc,))
+        if run:
+            groups.append(tuple(run))
+        return groups
+
+    def _prepare_tool_call(
+        self,
+        tc: ToolCall,
+        state: LoopState,
+    ) -> tuple[ToolCall, str | None, AgentEvent | None]:
+        """Introspect a call before execution (RFC-134).
 
-            # Emit tool start
-            yield tool_start_event(
-                tool_name=tc.name,
-                tool_call_id=tc.id,
-                arguments=tc.arguments,
+        Returns:
+            The (possibly repaired) call, the block reason (None if the call
+            may run) and the repair event to emit, if any.
+        """
+        if not self.config.enable_introspection:
+            return tc, None, None
+
+        introspection = introspect_tool_call(tc, self.workspace)
+
+        # Handle blocked calls
+        if introspection.blocked:
+            logger.warning(
+                "Tool call blocked by introspection: %s - %s",
+                tc.name,
+                introspection.block_reason,
             )
+            return tc, str(introspection.block_reason), None
 
-            # Emit hook for tool start
-            emit_hook_sync(
-                HookEvent.TOOL_START,
+        # Emit and log repairs made
+        repair_event = None
+        if introspection.repairs:
+            state.repairs_made += len(introspection.repairs)
+            repair_event = tool_repair_event(
                 tool_name=tc.name,
                 tool_call_id=tc.id,
-                arguments=tc.arguments,
+                repairs=tuple(introspection.repairs),
             )
+            for repair in introspection.repairs:
+                logger.info("Introspection repair: %s", repair)
+
+        # Log warnings
+        for warning in introspection.warnings:
+            logger.warning("Introspection warning: %s", warning)
+
+        # Use repaired tool call
+        return introspection.tool_call, None, repair_event
+
+    def _block_tool_call(self, tc: ToolCall, reason: str, state: LoopState) -> AgentEvent:
+        """Record a blocked call in the conversation and return its error event."""
+        # Append error as tool result for conversation continuity
+        state.messages.append(Message(
+            role="assistant",
+            tool_calls=(tc,),
+        ))
+        state.messages.append(Message(
+            role="tool",
+            content=f"Error: {reason}",
+            tool_call_id=tc.id,
+        ))
+        return tool_error_event(
+            tool_name=tc.name,
+            tool_call_id=tc.id,
+            error=f"Blocked: {reason}",
+        )
 
-            # RFC-134: Track tool sequence for learning
-            state.tool_sequence.append(tc.name)
+    def _start_tool_call(self, tc: ToolCall, state: LoopState) -> AgentEvent:
+        """Announce a call about to execute and return its start event."""
+        # Emit hook for tool start
+        emit_hook_sync(
+            HookEvent.TOOL_START,
+            tool_name=tc.name,
+            tool_call_id=tc.id,
+            arguments=tc.arguments,
+        )
 
-            # Execute tool with retry escalation support
-            async for event in self._execute_single_tool(tc, state):
-                yield event
+        # RFC-134: Track tool sequence for learning
+        state.tool_sequence.append(tc.name)
+
+        return tool_start_event(
+            tool_name=tc.name,
+            tool_call_id=tc.id,
+            arguments=tc.arguments,
+        )
+
+    async def _execute_sequential_call(
+        self,
+        tc: ToolCall,
+        state: LoopState,
+    ) -> AsyncIterator[AgentEvent]:
+        """Introspect, announce and execute one call."""
+        tc, block_reason, repair_event = self._prepare_tool_call(tc, state)
+        if repair_event is not None:
+            yield repair_event
+        if block_reason is not None:
+            yield self._block_tool_call(tc, block_reason, state)
+            return
+
+        yield self._start_tool_call(tc, state)
+
+        # Execute tool with retry escalation support
+        async for event in self._execute_single_tool(tc, state):
+            yield event
+
+    async def _execute_parallel_group(
+        self,
+        group: tuple[ToolCall, ...],
+        state: LoopState,
+    ) -> AsyncIterator[AgentEvent]:
+        """Execute read-only calls concurrently, reporting them in order.
+
+        Every call is introspected and announced first, then all of them are
+        started (at most ``max_parallel_tools`` in flight). Results are then
+        consumed in the original order, so completion events and messages
+        are deterministic; failures go through the usual retry escalation,
+        which re-executes sequentially.
+        """
+        prepared: list[tuple[ToolCall, str | None]] = []
+        for tc in group:
+            tc, block_reason, repair_event = self._prepare_tool_call(tc, state)
+            if repair_event is not None:
+                yield repair_event
+            prepared.append((tc, block_reason))
+
+        runnable = [tc for tc, block_reason in prepared if block_reason is None]
+        for tc in runnable:
+            yield self._start_tool_call(tc, state)
+
+        semaphore = asyncio.Semaphore(self.config.max_parallel_tools)
+
+        async def run(call: ToolCall) -> ToolResult:
+            async with semaphore:
+                return await self.executor.execute(call)
+
+        tasks = {id(tc): asyncio.create_task(run(tc)) for tc in runnable}
+        try:
+            for tc, block_reason in prepared:
+                if block_reason is not None:
+                    yield self._block_tool_call(tc, block_reason, state)
+                    continue
+                async for event in self._execute_single_tool(tc, state, tasks[id(tc)]):
+                    yield event
+        finally:
+            for task in tasks.values():
+                task.cancel()
 
     async def _execute_single_tool(
         self,
         tc: ToolCall,
         state: LoopState,
+        outcome: Awaitable[ToolResult] | None = None,
     ) -> AsyncIterator[AgentEvent]:
         """Execute a single tool with retry escalation on failure (RFC-134).
 
@@ -1075,9 +1203,15 @@ class AgentLoop:
         - Failure 2: Interference (3 perspectives)
         - Failure 3: Vortex (multiple candidates)
         - Failure 4+: Record dead-end, escalate to user
+
+        Args:
+            tc: The tool call
+            state: Loop state
+            outcome: Already-started execution of ``tc`` (parallel groups);
+                None to execute it here
         """
         try:
-            result = await self.executor.execute(tc)
+            result = await (outcome if outcome is not None else self.executor.execute(tc))
             state.tool_calls_total += 1
 
             # Track file writes for validation gates
@@ -48,6 +48,9 @@ class GoalAnalyzingData(TypedDict, total=False):
     """Data for goal_analyzing event."""
 
     goal: str | None
+    stage: str | None  # Bootstrap stage (context, intent, memory, ...)
+    status: str | None  # complete, timeout or cancelled
+    duration_ms: int | None
 
 
 class GoalReadyData(TypedDict, total=False):
@@ -96,6 +96,13 @@ class LoopConfig:
     tool_selection_max_tools: int | None = None
     """Override max tools for selection (None = model-adaptive)."""
 
+    # Concurrent tool execution
+    enable_parallel_tools: bool = True
+    """Run consecutive read-only tool calls from one turn concurrently."""
+
+    max_parallel_tools: int = 4
+    """Maximum tool calls of a read-only group in flight at once."""
+
     # =========================================================================
     # Reliability Settings (Solo Dev Hardening)
     # =========================================================================
@@ -258,12 +258,12 @@ class Coordinator:
 
         try:
             backlog = BacklogManager(self.root)
-            async with backlog.exclusive_access():
-                # Find and unclaim any goals claimed by this worker
-                for goal in backlog.backlog.goals.values():
-                    if goal.claimed_by == worker_id:
-                        await backlog.unclaim_goal(goal.id)
-                        logger.info(f"Unclaimed goal {goal.id} from crashed worker {worker_id}")
+            # Find and unclaim any goals claimed by this worker (each
+            # unclaim is atomic in the backlog store)
+            for goal_id, claimed_by in backlog.get_claims().items():
+                if claimed_by == worker_id:
+                    await backlog.unclaim_goal(goal_id)
+                    logger.info(f"Unclaimed goal {goal_id} from crashed worker {worker_id}")
         except Exception as e:
             logger.error(f"Failed to recover crashed worker {worker_id}: {e}")
 
@@ -138,47 +138,33 @@ class WorkerProcess:
         1. Not already claimed by another worker
         2. Dependencies satisfied
         3. No file conflicts with in-progress goals
+
+        The first two are checked by the backlog's atomic claim; a claimed
+        goal whose files are locked is released and the next one tried, so
+        no backlog-wide lock is held while estimating files.
         """
         self._update_status(WorkerState.CLAIMING)
 
-        async with self.backlog_manager.exclusive_access():
-            # Get all pending goals
-            pending = await self.backlog_manager.get_pending_goals()
-
-            for goal in pending:
-                # Check if claimable
-                if await self._can_claim(goal):
-                    # Claim it
-                    await self.backlog_manager.claim_goal(
-                        goal.id,
-                        worker_id=self.worker_id,
-                    )
-                    return goal
-
-            return None  # Nothing available
-
-    async def _can_claim(self, goal: Goal) -> bool:
-        """Check if this worker can claim a goal.
+        rejected: set[str] = set()
+        while True:
+            goal = await self.backlog_manager.claim_next_goal(
+                self.worker_id,
+                exclude=rejected,
+            )
+            if goal is None:
+                return None  # Nothing available
 
-        Checks:
-        1. Not already claimed
-        2. Dependencies satisfied
-        3. Estimated files don't conflict with locked files
-        """
-        # Already claimed?
-        if hasattr(goal, "claimed_by") and goal.claimed_by is not None:
-            return False
+            if not await self._has_file_conflicts(goal):
+                return goal
 
-        # Dependencies satisfied?
-        for dep_id in goal.requires:
-            dep_goal = await self.backlog_manager.get_goal(dep_id)
-            if dep_goal and dep_goal.id not in self.backlog_manager.backlog.completed:
-                return False
+            await self.backlog_manager.unclaim_goal(goal.id)
+            rejected.add(goal.id)
 
-        # File conflicts?
+    async def _has_file_conflicts(self, goal: Goal) -> bool:
+        """Check whether files the goal will likely touch are locked."""
         estimated_files = await self._estimate_affected_files(goal)
-        return all(
-            not self._lock_manager.is_locked(file_path)
+        return any(
+            self._lock_manager.is_locked(file_path)
             for file_path in estimated_files
         )
 
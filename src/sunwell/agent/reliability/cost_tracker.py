@@ -3,16 +3,24 @@
 Tracks model costs across a session for budget monitoring and reporting.
 Local models are tracked as free (zero cost).
 
+Response cache lookups (``sunwell.models.cache.CachingModel``) can be
+reported too; hits are free and count towards tokens/cost saved.
+
 Example:
     >>> tracker = SessionCostTracker(session_id="sess-123", budget_usd=1.0)
     >>> tracker.record("gpt-4o", input_tokens=1000, output_tokens=500)
     >>> print(tracker.summary())
     {'total_cost_usd': 0.0125, 'total_tokens': 1500, ...}
+
+    >>> model = CachingModel(inner, ResponseCache(), on_event=tracker.record_cache)
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sunwell.models.cache import CacheEvent
 
 
 @dataclass(frozen=True, slots=True)
@@ -119,6 +127,20 @@ class SessionCostTracker:
 
     _entries: list[CostEntry] = field(default_factory=list, init=False)
 
+    cache_hits: int = field(default=0, init=False)
+    """Model calls answered from the response cache."""
+
+    cache_misses: int = field(default=0, init=False)
+    """Cacheable model calls that ran inference."""
+
+    cache_bytes_saved: int = field(default=0, init=False)
+    """Response bytes served from the cache."""
+
+    cache_tokens_saved: int = field(default=0, init=False)
+    """Tokens the cached responses originally cost."""
+
+    cache_cost_saved_usd: float = field(default=0.0, init=False)
+
     def record(
         self,
         model: str,
@@ -154,6 +176,35 @@ class SessionCostTracker:
         self._entries.append(entry)
         return entry
 
+    def record_cache(self, event: CacheEvent) -> None:
+        """Record a response cache lookup.
+
+        Pass as ``CachingModel(on_event=...)``. Hits are not charged; the
+        tokens and cost of the cached response are counted as saved.
+
+        Args:
+            event: Lookup outcome from CachingModel
+        """
+        if not event.hit:
+            self.cache_misses += 1
+            return
+
+        self.cache_hits += 1
+        self.cache_bytes_saved += event.size_bytes
+        if event.usage is not None:
+            cost_config = get_model_cost(event.model)
+            self.cache_tokens_saved += event.usage.total_tokens
+            self.cache_cost_saved_usd += (
+                (event.usage.prompt_tokens / 1000) * cost_config.input_per_1k +
+                (event.usage.completion_tokens / 1000) * cost_config.output_per_1k
+            )
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cache lookups that hit."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
     @property
     def total_cost_usd(self) -> float:
         """Total cost in USD."""
@@ -221,6 +272,12 @@ class SessionCostTracker:
                 round(self.budget_percentage_used, 1) if self.budget_percentage_used is not None else None
             ),
             "is_over_budget": self.is_over_budget,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": round(self.cache_hit_rate, 3),
+            "cache_bytes_saved": self.cache_bytes_saved,
+            "cache_tokens_saved": self.cache_tokens_saved,
+            "cache_cost_saved_usd": round(self.cache_cost_saved_usd, 6),
         }
 
     def cost_by_model(self) -> dict[str, float]:
@@ -237,3 +294,8 @@ class SessionCostTracker:
     def reset(self) -> None:
         """Reset all tracked entries."""
         self._entries = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_bytes_saved = 0
+        self.cache_tokens_saved = 0
+        self.cache_cost_saved_usd = 0.0
@@ -4,26 +4,37 @@ Maintain goal DAG and coordinate execution.
 
 RFC-051 Extensions:
 - claim_goal(goal_id, worker_id) - Claim a goal for multi-instance
+- claim_next_goal(worker_id) - Atomically claim the best ready goal
 - exclusive_access() - Context manager for cross-process safety
 - get_pending_goals() - Get unclaimed, incomplete goals
 - mark_failed(goal_id, error) - Mark a goal as failed
 - get_goal(goal_id) - Get a goal by ID
+
+The backlog is persisted in a SQLite store (see ``store.py``); ``current.json``
+is imported on first use and remains available via export_json/import_json.
 """
 
 
-import contextlib
 import fcntl
 import json
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Collection
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sunwell.features.backlog.goals import Goal, GoalGenerator, GoalPolicy, GoalResult, GoalScope
+from sunwell.features.backlog.goals import Goal, GoalGenerator, GoalPolicy, GoalResult
 from sunwell.features.backlog.signals import SignalExtractor
+from sunwell.features.backlog.store import (
+    BACKLOG_DB_NAME,
+    BacklogStore,
+    StoredGoal,
+    goal_data,
+    goal_from_dict,
+    goal_to_dict,
+)
 from sunwell.foundation.utils import safe_jsonl_append, safe_jsonl_load
 
 if TYPE_CHECKING:
@@ -225,6 +236,13 @@ class BacklogManager:
         # External ref index for deduplication (RFC-049)
         self._external_refs: dict[str, str] = {}  # external_ref → goal_id
 
+        self._store = BacklogStore(self.backlog_path / BACKLOG_DB_NAME)
+        # What the store holds, as of our last load/save: lets _save write
+        # only the goals this process changed.
+        self._synced: dict[str, StoredGoal] = {}
+        self._synced_meta: dict[str, Any] = {}
+        self._data_version: int | None = None
+
         # Load existing backlog
         self._load()
 
@@ -250,7 +268,10 @@ class BacklogManager:
             intelligence_signals=intelligence_signals,
         )
 
-        # 3. Merge with existing backlog (preserve completed, update priorities)
+        # 3. Merge with the latest stored backlog (preserve completed and
+        # claimed goals, update priorities)
+        self._save()
+        self._load()
         self.backlog = self._merge_backlog(self.backlog, goals)
 
         # 4. Save
@@ -261,13 +282,15 @@ class BacklogManager:
     def _merge_backlog(self, existing: Backlog, new_goals: list[Goal]) -> Backlog:
         """Merge new goals with existing backlog.
 
-        Preserves completed goals, updates priorities for existing goals.
+        Preserves completed goals and goals a worker has claimed, and keeps
+        the claim when a claimed goal is regenerated; updates priorities for
+        existing goals.
         """
         merged_goals: dict[str, Goal] = {}
 
-        # Keep completed goals (for history)
+        # Keep completed goals (for history) and goals being worked on
         for goal_id, goal in existing.goals.items():
-            if goal_id in existing.completed:
+            if goal_id in existing.completed or goal.claimed_by is not None:
                 merged_goals[goal_id] = goal
 
         # Add/update new goals
@@ -276,7 +299,11 @@ class BacklogManager:
                 # Update priority if higher
                 existing_goal = merged_goals[goal.id]
                 if goal.priority > existing_goal.priority:
-                    merged_goals[goal.id] = goal
+                    merged_goals[goal.id] = replace(
+                        goal,
+                        claimed_by=existing_goal.claimed_by,
+                        claimed_at=existing_goal.claimed_at,
+                    )
             else:
                 merged_goals[goal.id] = goal
 
@@ -370,8 +397,9 @@ class BacklogManager:
     async def claim_goal(self, goal_id: str, worker_id: int | None = None) -> bool:
         """Claim a goal for a worker (RFC-051, RFC-094).
 
-        Must be called within exclusive_access() context for multi-instance.
-        Single-instance execution can pass worker_id=None (uses -1 sentinel).
+        The claim is a single atomic update in the backlog store, so it is
+        safe without exclusive_access(). Single-instance execution can pass
+        worker_id=None (uses -1 sentinel).
 
         Args:
             goal_id: ID of the goal to claim
@@ -380,38 +408,42 @@ class BacklogManager:
         Returns:
             True if successfully claimed, False if already claimed
         """
-        goal = self.backlog.goals.get(goal_id)
-        if goal is None:
-            return False
-
-        # Check if already claimed
-        if goal.claimed_by is not None:
+        if goal_id not in self.backlog.goals:
             return False
 
         # For single-instance, use -1 as sentinel
         effective_worker_id = worker_id if worker_id is not None else -1
 
-        # Create new goal with claim info
-        claimed_goal = Goal(
-            id=goal.id,
-            title=goal.title,
-            description=goal.description,
-            source_signals=goal.source_signals,
-            priority=goal.priority,
-            estimated_complexity=goal.estimated_complexity,
-            requires=goal.requires,
-            category=goal.category,
-            auto_approvable=goal.auto_approvable,
-            scope=goal.scope,
-            external_ref=goal.external_ref,
-            claimed_by=effective_worker_id,
-            claimed_at=datetime.now(),
-        )
-
-        self.backlog.goals[goal_id] = claimed_goal
         self._save()
+        claimed = self._store.claim(goal_id, effective_worker_id)
+        if claimed is None:
+            return False
+        self._apply(self._store.get(goal_id))
         return True
 
+    async def claim_next_goal(
+        self,
+        worker_id: int,
+        exclude: Collection[str] = (),
+    ) -> Goal | None:
+        """Atomically claim the highest-priority ready goal (RFC-051).
+
+        Ready means not completed, blocked or claimed (expired claims count as
+        free), with every requirement completed. Needs no exclusive_access().
+
+        Args:
+            worker_id: ID of the claiming worker
+            exclude: Goal IDs to skip
+
+        Returns:
+            The claimed goal, or None if nothing is ready
+        """
+        self._save()
+        goal = self._store.claim_next(worker_id, exclude=exclude)
+        if goal is not None:
+            self._apply(StoredGoal(goal=goal, state="claimed"))
+        return goal
+
     async def get_pending_goals(self) -> list[Goal]:
         """Get goals that are pending (not completed, not blocked).
 
@@ -467,29 +499,13 @@ class BacklogManager:
         Args:
             goal_id: ID of the goal to unclaim
         """
-        goal = self.backlog.goals.get(goal_id)
-        if goal is None:
+        if goal_id not in self.backlog.goals:
             return
 
-        # Create new goal without claim
-        unclaimed_goal = Goal(
-            id=goal.id,
-            title=goal.title,
-            description=goal.description,
-            source_signals=goal.source_signals,
-            priority=goal.priority,
-            estimated_complexity=goal.estimated_complexity,
-            requires=goal.requires,
-            category=goal.category,
-            auto_approvable=goal.auto_approvable,
-            scope=goal.scope,
-            external_ref=goal.external_ref,
-            claimed_by=None,
-            claimed_at=None,
-        )
-
-        self.backlog.goals[goal_id] = unclaimed_goal
         self._save()
+        released = self._store.release(goal_id)
+        if released is not None:
+            self._apply(released)
 
     def get_claims(self) -> dict[str, int]:
         """Get current goal claims (RFC-051).
@@ -521,35 +537,16 @@ class BacklogManager:
             True if heartbeat accepted, False if goal not claimed by this worker
         """
         goal = self.backlog.goals.get(goal_id)
-        if goal is None or goal.claimed_by != worker_id:
+        if goal is None:
             return False
 
-        # Update claimed_at as the heartbeat timestamp
-        updated_goal = Goal(
-            id=goal.id,
-            title=goal.title,
-            description=goal.description,
-            source_signals=goal.source_signals,
-            priority=goal.priority,
-            estimated_complexity=goal.estimated_complexity,
-            requires=goal.requires,
-            category=goal.category,
-            auto_approvable=goal.auto_approvable,
-            scope=goal.scope,
-            external_ref=goal.external_ref,
-            claimed_by=goal.claimed_by,
-            claimed_at=datetime.now(),  # Refresh heartbeat timestamp
-            produces=goal.produces,
-            integrations=goal.integrations,
-            verification_checks=goal.verification_checks,
-            task_type=goal.task_type,
-            goal_type=goal.goal_type,
-            parent_goal_id=goal.parent_goal_id,
-            milestone_produces=goal.milestone_produces,
-            milestone_index=goal.milestone_index,
-        )
-        self.backlog.goals[goal_id] = updated_goal
         self._save()
+        updated = self._store.heartbeat(goal_id, worker_id)
+        if updated is None:
+            return False
+        # Refresh heartbeat timestamp (claimed_at)
+        self.backlog.goals[goal_id] = updated
+        self._synced[goal_id] = replace(self._synced[goal_id], goal=updated)
         return True
 
     async def expire_stale_claims(
@@ -566,19 +563,11 @@ class BacklogManager:
         Returns:
             List of goal IDs that were released
         """
-        expired: list[str] = []
-        now = datetime.now()
-
-        for goal_id, goal in list(self.backlog.goals.items()):
-            if goal.claimed_by is None or goal.claimed_at is None:
-                continue
-
-            elapsed = (now - goal.claimed_at).total_seconds()
-            if elapsed > timeout_seconds:
-                expired.append(goal_id)
-                await self.unclaim_goal(goal_id)
-
-        return expired
+        self._save()
+        expired = self._store.expire(timeout_seconds)
+        for stored in expired:
+            self._apply(stored)
+        return [stored.goal.id for stored in expired]
 
     def detect_conflicts(self) -> list[dict]:
         """Detect potential file conflicts between claimed goals.
@@ -914,107 +903,25 @@ class BacklogManager:
 
         return related
 
-    def _load(self) -> None:
-        """Load backlog from disk."""
-        current_path = self.backlog_path / "current.json"
-        if not current_path.exists():
-            return
-
-        try:
-            data = json.loads(current_path.read_text())
-            goals: dict[str, Goal] = {}
-
-            for gid, goal_data in data.get("goals", {}).items():
-                # Reconstruct Goal with proper types
-                scope_data = goal_data.get("scope", {})
-                scope = GoalScope(
-                    max_files=scope_data.get("max_files", 5),
-                    max_lines_changed=scope_data.get("max_lines_changed", 500),
-                )
-
-                # RFC-051: Parse claimed_at timestamp
-                claimed_at = None
-                if goal_data.get("claimed_at"):
-                    with contextlib.suppress(ValueError, TypeError):
-                        claimed_at = datetime.fromisoformat(goal_data["claimed_at"])
-
-                goals[gid] = Goal(
-                    id=goal_data["id"],
-                    title=goal_data["title"],
-                    description=goal_data["description"],
-                    source_signals=tuple(goal_data.get("source_signals", [])),
-                    priority=goal_data["priority"],
-                    estimated_complexity=goal_data["estimated_complexity"],
-                    requires=frozenset(goal_data.get("requires", [])),
-                    category=goal_data["category"],
-                    auto_approvable=goal_data.get("auto_approvable", False),
-                    scope=scope,
-                    external_ref=goal_data.get("external_ref"),  # RFC-049
-                    claimed_by=goal_data.get("claimed_by"),  # RFC-051
-                    claimed_at=claimed_at,  # RFC-051
-                    # RFC-115: Hierarchy fields
-                    goal_type=goal_data.get("goal_type", "task"),
-                    parent_goal_id=goal_data.get("parent_goal_id"),
-                    milestone_produces=tuple(goal_data.get("milestone_produces", [])),
-                    milestone_index=goal_data.get("milestone_index"),
-                )
-
-            self.backlog = Backlog(
-                goals=goals,
-                completed=set(data.get("completed", [])),
-                in_progress=data.get("in_progress"),
-                blocked=data.get("blocked", {}),
-                active_epic=data.get("active_epic"),  # RFC-115
-                active_milestone=data.get("active_milestone"),  # RFC-115
-            )
+    # =========================================================================
+    # Persistence
+    # =========================================================================
 
-            # Load or rebuild external refs index (RFC-049)
-            self._external_refs = data.get("external_refs", {})
-            if not self._external_refs:
-                # Rebuild index from goals if migrating from old schema
-                for goal in self.backlog.goals.values():
-                    if goal.external_ref:
-                        self._external_refs[goal.external_ref] = goal.id
+    def export_json(self, path: Path | None = None) -> Path:
+        """Write the backlog in the ``current.json`` format.
 
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
-            # Invalid data - start fresh
-            pass
+        Args:
+            path: Destination (default: ``current.json`` in the backlog dir)
 
-    def _save(self) -> None:
-        """Save backlog to disk."""
-        current_path = self.backlog_path / "current.json"
-        current_path.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            The path written
+        """
+        path = path or self.backlog_path / "current.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "schema_version": 4,  # RFC-115: Added hierarchy fields
-            "goals": {
-                gid: {
-                    "id": goal.id,
-                    "title": goal.title,
-                    "description": goal.description,
-                    "source_signals": list(goal.source_signals),
-                    "priority": goal.priority,
-                    "estimated_complexity": goal.estimated_complexity,
-                    "requires": list(goal.requires),
-                    "category": goal.category,
-                    "auto_approvable": goal.auto_approvable,
-                    "scope": {
-                        "max_files": goal.scope.max_files,
-                        "max_lines_changed": goal.scope.max_lines_changed,
-                    },
-                    "external_ref": goal.external_ref,  # RFC-049
-                    "claimed_by": goal.claimed_by,  # RFC-051
-                    "claimed_at": (
-                        goal.claimed_at.isoformat() if goal.claimed_at else None
-                    ),  # RFC-051
-                    # RFC-115: Hierarchy fields
-                    "goal_type": goal.goal_type,
-                    "parent_goal_id": goal.parent_goal_id,
-                    "milestone_produces": list(goal.milestone_produces),
-                    "milestone_index": goal.milestone_index,
-                }
-                for gid, goal in self.backlog.goals.items()
-            },
+            "schema_version": 5,  # All Goal fields, including scope paths
+            "goals": {gid: goal_to_dict(goal) for gid, goal in self.backlog.goals.items()},
             "completed": list(self.backlog.completed),
             "in_progress": self.backlog.in_progress,
             "blocked": self.backlog.blocked,
@@ -1024,9 +931,173 @@ class BacklogManager:
         }
 
         # Use file locking for process safety (RFC-049/051)
-        with open(current_path, "w") as f:
+        with open(path, "w") as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
                 json.dump(data, f, indent=2)
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return path
+
+    def import_json(self, path: Path | None = None) -> bool:
+        """Replace the backlog with the contents of a ``current.json`` file.
+
+        Args:
+            path: Source (default: ``current.json`` in the backlog dir)
+
+        Returns:
+            True if imported, False if the file is missing or invalid
+        """
+        path = path or self.backlog_path / "current.json"
+        if not path.exists():
+            return False
+
+        try:
+            data = json.loads(path.read_text())
+            goals = {
+                gid: goal_from_dict(goal_data)
+                for gid, goal_data in data.get("goals", {}).items()
+            }
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            # Invalid data - leave the backlog as it is
+            return False
+
+        self.backlog = Backlog(
+            goals=goals,
+            completed=set(data.get("completed", [])),
+            in_progress=data.get("in_progress"),
+            blocked=data.get("blocked", {}),
+            active_epic=data.get("active_epic"),  # RFC-115
+            active_milestone=data.get("active_milestone"),  # RFC-115
+        )
+
+        # Load or rebuild external refs index (RFC-049)
+        self._external_refs = data.get("external_refs", {})
+        if not self._external_refs:
+            # Rebuild index from goals if migrating from old schema
+            for goal in self.backlog.goals.values():
+                if goal.external_ref:
+                    self._external_refs[goal.external_ref] = goal.id
+
+        self._save()
+        return True
+
+    def _load(self) -> None:
+        """Load backlog from the store, importing ``current.json`` on first use.
+
+        Skips the read entirely when no other process has written since the
+        last load (our own commits don't change the store's data version).
+        """
+        if self._store.is_empty():
+            self.import_json()
+
+        version = self._store.data_version()
+        if version == self._data_version:
+            return
+
+        rows, meta = self._store.load()
+        goals: dict[str, Goal] = {}
+        completed = set(meta.get("completed_orphans", []))
+        blocked: dict[str, str] = dict(meta.get("blocked_orphans", {}))
+        for stored in rows:
+            goals[stored.goal.id] = stored.goal
+            if stored.state == "completed":
+                completed.add(stored.goal.id)
+            elif stored.state == "blocked":
+                blocked[stored.goal.id] = stored.blocked_reason or ""
+
+        self.backlog = Backlog(
+            goals=goals,
+            completed=completed,
+            in_progress=meta.get("in_progress"),
+            blocked=blocked,
+            active_epic=meta.get("active_epic"),  # RFC-115
+            active_milestone=meta.get("active_milestone"),  # RFC-115
+        )
+        self._external_refs = dict(meta.get("external_refs", {}))  # RFC-049
+
+        self._synced = {stored.goal.id: stored for stored in rows}
+        self._synced_meta = meta
+        self._data_version = version
+
+    def _save(self) -> None:
+        """Write goals that changed since the last load/save to the store.
+
+        Claims on goals already in the store are never written from here:
+        they change only through the store's atomic claim operations. A
+        goal's state is written only when this process completed, blocked or
+        reopened it, so a stale in-memory backlog cannot undo another
+        worker's claim or completion.
+        """
+        upserts: list[StoredGoal] = []
+        transitions: list[StoredGoal] = []
+        for gid, goal in self.backlog.goals.items():
+            stored = self._stored(goal)
+            previous = self._synced.get(gid)
+            if previous is None or goal_data(previous.goal) != goal_data(goal):
+                upserts.append(stored)
+            if _outcome(previous) != _outcome(stored):
+                transitions.append(stored)
+        deletes = [gid for gid in self._synced if gid not in self.backlog.goals]
+
+        meta = self._meta()
+        changed_meta = {k: v for k, v in meta.items() if self._synced_meta.get(k) != v}
+
+        if not upserts and not transitions and not deletes and not changed_meta:
+            return
+
+        self._store.write(upserts, deletes, changed_meta, transitions)
+        for stored in (*upserts, *transitions):
+            self._synced[stored.goal.id] = stored
+        for gid in deletes:
+            del self._synced[gid]
+        self._synced_meta = meta
+
+    def _stored(self, goal: Goal) -> StoredGoal:
+        """Pair a goal with the state the in-memory backlog gives it."""
+        if goal.id in self.backlog.completed:
+            return StoredGoal(goal=goal, state="completed")
+        if goal.id in self.backlog.blocked:
+            return StoredGoal(
+                goal=goal, state="blocked", blocked_reason=self.backlog.blocked[goal.id]
+            )
+        return StoredGoal(goal=goal, state="claimed" if goal.claimed_by is not None else "pending")
+
+    def _meta(self) -> dict[str, Any]:
+        """Backlog-level state kept beside the goals."""
+        return {
+            "in_progress": self.backlog.in_progress,
+            "active_epic": self.backlog.active_epic,  # RFC-115
+            "active_milestone": self.backlog.active_milestone,  # RFC-115
+            "external_refs": self._external_refs,  # RFC-049
+            # Completed/blocked IDs without a goal (e.g. dropped by a refresh)
+            "completed_orphans": sorted(
+                gid for gid in self.backlog.completed if gid not in self.backlog.goals
+            ),
+            "blocked_orphans": {
+                gid: reason
+                for gid, reason in self.backlog.blocked.items()
+                if gid not in self.backlog.goals
+            },
+        }
+
+    def _apply(self, stored: StoredGoal | None) -> None:
+        """Reflect a goal row changed by an atomic store operation."""
+        if stored is None:
+            return
+        goal = stored.goal
+        self.backlog.goals[goal.id] = goal
+        self.backlog.completed.discard(goal.id)
+        self.backlog.blocked.pop(goal.id, None)
+        if stored.state == "completed":
+            self.backlog.completed.add(goal.id)
+        elif stored.state == "blocked":
+            self.backlog.blocked[goal.id] = stored.blocked_reason or ""
+        self._synced[goal.id] = self._stored(goal)
+
+
+def _outcome(stored: StoredGoal | None) -> tuple[str, str | None]:
+    """State and blocked reason, with claimed goals counted as pending."""
+    if stored is None or stored.state == "claimed":
+        return "pending", None
+    return stored.state, stored.blocked_reason
@@ -0,0 +1,529 @@
+"""Transactional backlog storage for multi-instance workers (RFC-051).
+
+The backlog lives in a WAL-mode SQLite database so that any number of
+worker processes can read it concurrently while writes stay atomic. Goal
+state (pending, claimed, completed, blocked) is an indexed column, and every
+goal carries ``pending_deps``: how many of its existing requirements are
+not completed yet. The counter is maintained as goals change state, so the
+"ready" set is simply ``state = 'pending' AND pending_deps = 0`` behind a
+partial index, and claiming the next ready goal is one ``UPDATE ...
+RETURNING`` statement — no process-wide lock and no full backlog scan.
+
+Claims carry heartbeat and expiry timestamps; a claim whose worker stopped
+heartbeating becomes claimable again once it expires.
+
+``current.json`` (schema 4/5) remains the import/export format; see
+:func:`goal_to_dict` and :func:`goal_from_dict`.
+"""
+
+import contextlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from sunwell.features.backlog.goals import Goal, GoalScope
+
+BACKLOG_DB_NAME = "backlog.db"
+
+DEFAULT_CLAIM_TTL = 300.0
+"""Seconds a claim stays valid without a heartbeat."""
+
+GoalState = Literal["pending", "claimed", "completed", "blocked"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    priority REAL NOT NULL,
+    state TEXT NOT NULL,
+    blocked_reason TEXT,
+    pending_deps INTEGER NOT NULL DEFAULT 0,
+    claimed_by INTEGER,
+    claimed_at REAL,
+    heartbeat_at REAL,
+    expires_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_goals_state ON goals(state);
+CREATE INDEX IF NOT EXISTS idx_goals_ready ON goals(priority DESC, seq)
+    WHERE state = 'pending' AND pending_deps = 0;
+CREATE INDEX IF NOT EXISTS idx_goals_expiry ON goals(expires_at) WHERE state = 'claimed';
+
+CREATE TABLE IF NOT EXISTS goal_deps (
+    goal_id TEXT NOT NULL,
+    requires TEXT NOT NULL,
+    PRIMARY KEY (goal_id, requires)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_goal_deps_requires ON goal_deps(requires);
+
+CREATE TABLE IF NOT EXISTS backlog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_GOAL_COLUMNS = "id, data, state, blocked_reason, claimed_by, heartbeat_at"
+
+# Recount unfinished requirements for the goals listed in :ids (a JSON array).
+# Requirements naming goals that don't exist count as satisfied.
+_RECOUNT_SQL = """
+UPDATE goals SET pending_deps = (
+    SELECT COUNT(*) FROM goal_deps d JOIN goals r ON r.id = d.requires
+    WHERE d.goal_id = goals.id AND r.state != 'completed'
+)
+WHERE id IN (SELECT value FROM json_each(:ids))
+"""
+
+# Goals whose counters depend on the state or existence of the goals in :ids
+_DEPENDENTS_SQL = """
+SELECT DISTINCT goal_id FROM goal_deps
+WHERE requires IN (SELECT value FROM json_each(:ids))
+"""
+
+_CLAIM_NEXT_SQL = f"""
+UPDATE goals
+SET state = 'claimed', claimed_by = :worker, claimed_at = :now,
+    heartbeat_at = :now, expires_at = :expires
+WHERE id = (
+    SELECT id FROM goals
+    WHERE (
+        (state = 'pending' AND pending_deps = 0)
+        OR (state = 'claimed' AND expires_at < :now AND pending_deps = 0)
+    )
+    AND id NOT IN (SELECT value FROM json_each(:exclude))
+    ORDER BY priority DESC, seq
+    LIMIT 1
+)
+RETURNING {_GOAL_COLUMNS}
+"""
+
+_RELEASE_SET = """
+state = CASE WHEN state = 'claimed' THEN 'pending' ELSE state END,
+claimed_by = NULL, claimed_at = NULL, heartbeat_at = NULL, expires_at = NULL
+"""
+
+# A goal that is finished (or reopened) no longer belongs to any worker
+_SET_STATE_SQL = """
+UPDATE goals
+SET state = ?, blocked_reason = ?,
+    claimed_by = NULL, claimed_at = NULL, heartbeat_at = NULL, expires_at = NULL
+WHERE id = ?
+"""
+
+
+# =============================================================================
+# JSON (current.json) format
+# =============================================================================
+
+
+def goal_to_dict(goal: Goal) -> dict[str, Any]:
+    """Serialize a goal to its ``current.json`` representation."""
+    return {
+        "id": goal.id,
+        "title": goal.title,
+        "description": goal.description,
+        "source_signals": list(goal.source_signals),
+        "priority": goal.priority,
+        "estimated_complexity": goal.estimated_complexity,
+        "requires": sorted(goal.requires),
+        "category": goal.category,
+        "auto_approvable": goal.auto_approvable,
+        "scope": {
+            "max_files": goal.scope.max_files,
+            "max_lines_changed": goal.scope.max_lines_changed,
+            "allowed_paths": sorted(str(p) for p in goal.scope.allowed_paths),
+            "forbidden_paths": sorted(str(p) for p in goal.scope.forbidden_paths),
+        },
+        "external_ref": goal.external_ref,  # RFC-049
+        "claimed_by": goal.claimed_by,  # RFC-051
+        "claimed_at": goal.claimed_at.isoformat() if goal.claimed_at else None,  # RFC-051
+        # RFC-067: Integration-aware DAG fields
+        "produces": list(goal.produces),
+        "integrations": list(goal.integrations),
+        "verification_checks": list(goal.verification_checks),
+        "task_type": goal.task_type,
+        # RFC-115: Hierarchy fields
+        "goal_type": goal.goal_type,
+        "parent_goal_id": goal.parent_goal_id,
+        "milestone_produces": list(goal.milestone_produces),
+        "milestone_index": goal.milestone_index,
+    }
+
+
+def goal_data(goal: Goal) -> dict[str, Any]:
+    """The stored ``data`` column of a goal: its JSON form without the claim."""
+    data = goal_to_dict(goal)
+    del data["claimed_by"], data["claimed_at"]
+    return data
+
+
+def goal_from_dict(data: dict[str, Any]) -> Goal:
+    """Rebuild a goal from :func:`goal_to_dict` output (any schema version).
+
+    Raises:
+        KeyError: If a required field is missing
+    """
+    scope_data = data.get("scope", {})
+    scope = GoalScope(
+        max_files=scope_data.get("max_files", 5),
+        max_lines_changed=scope_data.get("max_lines_changed", 500),
+        allowed_paths=frozenset(Path(p) for p in scope_data.get("allowed_paths", ())),
+        forbidden_paths=frozenset(Path(p) for p in scope_data.get("forbidden_paths", ())),
+    )
+
+    # RFC-051: Parse claimed_at timestamp
+    claimed_at = None
+    if data.get("claimed_at"):
+        with contextlib.suppress(ValueError, TypeError):
+            claimed_at = datetime.fromisoformat(data["claimed_at"])
+
+    return Goal(
+        id=data["id"],
+        title=data["title"],
+        description=data["description"],
+        source_signals=tuple(data.get("source_signals", [])),
+        priority=data["priority"],
+        estimated_complexity=data["estimated_complexity"],
+        requires=frozenset(data.get("requires", [])),
+        category=data["category"],
+        auto_approvable=data.get("auto_approvable", False),
+        scope=scope,
+        external_ref=data.get("external_ref"),  # RFC-049
+        claimed_by=data.get("claimed_by"),  # RFC-051
+        claimed_at=claimed_at,  # RFC-051
+        produces=tuple(data.get("produces", [])),
+        integrations=tuple(data.get("integrations", [])),
+        verification_checks=tuple(data.get("verification_checks", [])),
+        task_type=data.get("task_type", "create"),
+        # RFC-115: Hierarchy fields
+        goal_type=data.get("goal_type", "task"),
+        parent_goal_id=data.get("parent_goal_id"),
+        milestone_produces=tuple(data.get("milestone_produces", [])),
+        milestone_index=data.get("milestone_index"),
+    )
+
+
+# =============================================================================
+# SQLite store
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class StoredGoal:
+    """A goal together with its backlog state."""
+
+    goal: Goal
+    """The goal; ``claimed_by``/``claimed_at`` reflect the claim columns."""
+
+    state: GoalState
+
+    blocked_reason: str | None = None
+
+
+@dataclass(slots=True)
+class BacklogStore:
+    """WAL-mode SQLite storage for one project's backlog.
+
+    One connection per store, shared across threads under a lock. Bulk
+    changes go through :meth:`write`; claims, heartbeats and expiry are
+    single atomic statements that are safe to race between processes.
+    """
+
+    path: Path
+    """Database file."""
+
+    _conn: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: single statements are their own transactions, and
+        # multi-statement writes open BEGIN IMMEDIATE explicitly.
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write lock for a multi-statement transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def data_version(self) -> int:
+        """Counter that changes whenever another connection commits."""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def is_empty(self) -> bool:
+        """True if the store has never been written."""
+        with self._lock:
+            return (
+                self._conn.execute("SELECT 1 FROM goals LIMIT 1").fetchone() is None
+                and self._conn.execute("SELECT 1 FROM backlog_meta LIMIT 1").fetchone() is None
+            )
+
+    def load(self) -> tuple[list[StoredGoal], dict[str, Any]]:
+        """Read every goal (in insertion order) and the backlog metadata."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_GOAL_COLUMNS} FROM goals ORDER BY seq"
+            ).fetchall()
+            meta = {
+                key: json.loads(value)
+                for key, value in self._conn.execute("SELECT key, value FROM backlog_meta")
+            }
+        return [_stored(row) for row in rows], meta
+
+    def get(self, goal_id: str) -> StoredGoal | None:
+        """Read one goal."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_GOAL_COLUMNS} FROM goals WHERE id = ?", (goal_id,)
+            ).fetchone()
+        return _stored(row) if row else None
+
+    def ready(self, limit: int | None = None) -> list[Goal]:
+        """Pending goals whose requirements are all completed, best first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT {_GOAL_COLUMNS} FROM goals
+                WHERE state = 'pending' AND pending_deps = 0
+                ORDER BY priority DESC, seq LIMIT ?
+                """,
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [_stored(row).goal for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Bulk writes
+    # -------------------------------------------------------------------------
+
+    def write(
+        self,
+        upserts: Iterable[StoredGoal] = (),
+        deletes: Collection[str] = (),
+        meta: dict[str, Any] | None = None,
+        transitions: Iterable[StoredGoal] = (),
+    ) -> None:
+        """Apply goal upserts, state changes, deletions and metadata in one transaction.
+
+        New goals are inserted with their state and claim. For goals already
+        in the store only the data and priority are updated: state and claim
+        columns belong to other workers as much as to us, so they change only
+        through ``transitions`` and the atomic claim operations.
+        ``transitions`` sets each goal's state and blocked reason and drops
+        its claim. Dependency counters of everything touched, and of
+        everything that requires it, are brought up to date.
+        """
+        now = time.time()
+        goal_rows = []
+        dep_rows = []
+        for stored in upserts:
+            goal = stored.goal
+            heartbeat = goal.claimed_at.timestamp() if goal.claimed_at else None
+            if goal.claimed_by is not None and heartbeat is None:
+                heartbeat = now
+            goal_rows.append((
+                goal.id,
+                json.dumps(goal_data(goal)),
+                goal.priority,
+                stored.state,
+                stored.blocked_reason,
+                goal.claimed_by,
+                heartbeat,
+                heartbeat,
+                heartbeat + DEFAULT_CLAIM_TTL if heartbeat is not None else None,
+            ))
+            dep_rows.extend((goal.id, dep) for dep in goal.requires)
+        state_rows = [
+            (stored.state, stored.blocked_reason, stored.goal.id) for stored in transitions
+        ]
+
+        changed = [row[0] for row in goal_rows] + list(deletes)
+        if not changed and not state_rows and not meta:
+            return
+
+        with self._transaction() as conn:
+            if deletes:
+                conn.executemany("DELETE FROM goals WHERE id = ?", ((d,) for d in deletes))
+            if changed:
+                conn.executemany(
+                    "DELETE FROM goal_deps WHERE goal_id = ?", ((c,) for c in changed)
+                )
+            if goal_rows:
+                seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM goals").fetchone()[0]
+                conn.executemany(
+                    """
+                    INSERT INTO goals (
+                        id, seq, data, priority, state, blocked_reason,
+                        claimed_by, claimed_at, heartbeat_at, expires_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        data = excluded.data,
+                        priority = excluded.priority
+                    """,
+                    (
+                        (row[0], seq + i, *row[1:])
+                        for i, row in enumerate(goal_rows, start=1)
+                    ),
+                )
+            if dep_rows:
+                conn.executemany("INSERT OR IGNORE INTO goal_deps VALUES (?, ?)", dep_rows)
+            if state_rows:
+                conn.executemany(_SET_STATE_SQL, state_rows)
+            if changed or state_rows:
+                self._recount(conn, changed + [row[2] for row in state_rows])
+            for key, value in (meta or {}).items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO backlog_meta VALUES (?, ?)", (key, json.dumps(value))
+                )
+
+    @staticmethod
+    def _recount(conn: sqlite3.Connection, goal_ids: list[str]) -> None:
+        """Refresh ``pending_deps`` for ``goal_ids`` and their dependents."""
+        ids = json.dumps(goal_ids)
+        dependents = [row[0] for row in conn.execute(_DEPENDENTS_SQL, {"ids": ids})]
+        conn.execute(_RECOUNT_SQL, {"ids": json.dumps(goal_ids + dependents)})
+
+    # -------------------------------------------------------------------------
+    # Atomic claim operations
+    # -------------------------------------------------------------------------
+
+    def claim_next(
+        self,
+        worker_id: int,
+        *,
+        exclude: Collection[str] = (),
+        ttl: float = DEFAULT_CLAIM_TTL,
+    ) -> Goal | None:
+        """Atomically claim the best ready goal.
+
+        Ready goals are pending with every requirement completed, plus
+        claimed goals whose claim expired. Highest priority wins, then
+        insertion order.
+
+        Args:
+            worker_id: Claiming worker
+            exclude: Goal IDs to skip (e.g. rejected for file conflicts)
+            ttl: Seconds the claim lives without a heartbeat
+
+        Returns:
+            The claimed goal, or None if nothing is ready
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                _CLAIM_NEXT_SQL,
+                {
+                    "worker": worker_id,
+                    "now": now,
+                    "expires": now + ttl,
+                    "exclude": json.dumps(list(exclude)),
+                },
+            ).fetchone()
+        return _stored(row).goal if row else None
+
+    def claim(
+        self, goal_id: str, worker_id: int, *, ttl: float = DEFAULT_CLAIM_TTL
+    ) -> Goal | None:
+        """Atomically claim a specific goal if nobody holds it.
+
+        Returns:
+            The claimed goal, or None if it is missing or already claimed
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                UPDATE goals
+                SET state = CASE WHEN state = 'pending' THEN 'claimed' ELSE state END,
+                    claimed_by = ?, claimed_at = ?, heartbeat_at = ?, expires_at = ?
+                WHERE id = ? AND claimed_by IS NULL
+                RETURNING {_GOAL_COLUMNS}
+                """,
+                (worker_id, now, now, now + ttl, goal_id),
+            ).fetchone()
+        return _stored(row).goal if row else None
+
+    def release(self, goal_id: str) -> StoredGoal | None:
+        """Drop the claim on a goal, returning it to pending if unfinished."""
+        with self._lock:
+            row = self._conn.execute(
+                f"UPDATE goals SET {_RELEASE_SET} WHERE id = ? RETURNING {_GOAL_COLUMNS}",
+                (goal_id,),
+            ).fetchone()
+        return _stored(row) if row else None
+
+    def heartbeat(
+        self, goal_id: str, worker_id: int, *, ttl: float = DEFAULT_CLAIM_TTL
+    ) -> Goal | None:
+        """Extend a claim held by ``worker_id``.
+
+        Returns:
+            The goal with its refreshed heartbeat, or None if the worker does
+            not hold the claim
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                UPDATE goals SET heartbeat_at = ?, expires_at = ?
+                WHERE id = ? AND claimed_by = ?
+                RETURNING {_GOAL_COLUMNS}
+                """,
+                (now, now + ttl, goal_id, worker_id),
+            ).fetchone()
+        return _stored(row).goal if row else None
+
+    def expire(self, timeout_seconds: float) -> list[StoredGoal]:
+        """Release every claim not heartbeated within ``timeout_seconds``."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                UPDATE goals SET {_RELEASE_SET}
+                WHERE claimed_by IS NOT NULL AND heartbeat_at < ?
+                RETURNING {_GOAL_COLUMNS}
+                """,
+                (time.time() - timeout_seconds,),
+            ).fetchall()
+        return [_stored(row) for row in rows]
+
+
+def _stored(row: tuple) -> StoredGoal:
+    """Build a StoredGoal from a ``_GOAL_COLUMNS`` row."""
+    goal_id, data, state, blocked_reason, claimed_by, heartbeat_at = row
+    fields = json.loads(data)
+    fields["id"] = goal_id
+    fields["claimed_by"] = claimed_by
+    if heartbeat_at is not None:
+        # claimed_at doubles as the heartbeat timestamp (RFC-051)
+        fields["claimed_at"] = datetime.fromtimestamp(heartbeat_at).isoformat()
+    return StoredGoal(goal=goal_from_dict(fields), state=state, blocked_reason=blocked_reason)
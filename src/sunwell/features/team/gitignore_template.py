@@ -31,6 +31,8 @@ sessions/
 # Embeddings cache - can be regenerated
 *.npz
 *_embeddings.json
+*.f32
+*.f32.ids
 
 # Python cache
 __pycache__/
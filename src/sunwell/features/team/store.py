@@ -14,6 +14,7 @@ Storage format:
 """
 
 import subprocess
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
 from fnmatch import fnmatch
@@ -22,13 +23,13 @@ from typing import TYPE_CHECKING
 
 from sunwell.foundation.utils import (
     compute_short_hash,
-    cosine_similarity,
     safe_json_dumps,
     safe_jsonl_append,
     safe_jsonl_load,
     safe_yaml_dump,
     safe_yaml_load,
 )
+from sunwell.knowledge.embedding.vectors import VectorFile
 
 if TYPE_CHECKING:
     from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
@@ -123,7 +124,8 @@ class TeamKnowledgeStore:
         # In-memory cache
         self._decisions: dict[str, TeamDecision] = {}
         self._failures: dict[str, TeamFailure] = {}
-        self._embeddings: dict[str, list[float]] = {}
+        # Local, regenerable vectors (gitignored); read on first semantic search
+        self._embeddings = VectorFile(self.team_dir / "decisions_embeddings.f32")
 
         # Track last known commit for change detection
         self._last_known_commit: str | None = None
@@ -185,6 +187,10 @@ class TeamKnowledgeStore:
         safe_jsonl_append(decision.to_dict(), self._decisions_path)
         self._decisions[decision.id] = decision
 
+        # Embedding generation is optional
+        with suppress(Exception):
+            await self._embed_decisions([decision])
+
         if auto_commit:
             await self._commit(
                 f"sunwell: record decision — {decision.question[:50]}",
@@ -294,42 +300,38 @@ class TeamKnowledgeStore:
         Returns:
             List of relevant decisions sorted by relevance
         """
-        if not self._embedder or not self._embeddings:
+        if not self._embedder:
             # Fall back to keyword search
             return self._keyword_search_decisions(query, top_k)
 
         try:
+            # Decisions pulled from teammates arrive without local vectors
+            await self._embed_decisions(
+                [d for d in self._decisions.values() if d.id not in self._embeddings]
+            )
+            if not self._embeddings:
+                return self._keyword_search_decisions(query, top_k)
+
             # Embed query
             result = await self._embedder.embed([query])
-            query_vec = result.vectors[0].tolist()
-
-            # Build superseded set once before loop
-            superseded_ids = {d.supersedes for d in self._decisions.values() if d.supersedes}
-
-            # Calculate similarities
-            scores: list[tuple[TeamDecision, float]] = []
-            for decision_id, decision_embedding in self._embeddings.items():
-                if decision_id not in self._decisions:
-                    continue
 
-                decision = self._decisions[decision_id]
-
-                # Skip superseded decisions
-                if decision.id in superseded_ids:
-                    continue
-
-                # Calculate cosine similarity
-                similarity = cosine_similarity(query_vec, decision_embedding)
-                scores.append((decision, similarity))
-
-            # Sort by score and return top_k
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return [d for d, _ in scores[:top_k]]
+            # Skip superseded decisions and vectors of decisions no longer loaded
+            skip = {d.supersedes for d in self._decisions.values() if d.supersedes}
+            skip.update(i for i in self._embeddings.ids() if i not in self._decisions)
+            hits = self._embeddings.search(result.vectors[0], top_k, exclude=skip)
+            return [self._decisions[i] for i, _ in hits]
 
         except Exception:
             # Fall back to keyword search on error
             return self._keyword_search_decisions(query, top_k)
 
+    async def _embed_decisions(self, decisions: list[TeamDecision]) -> None:
+        """Store embeddings for decisions (no-op without an embedder)."""
+        if not self._embedder or not decisions:
+            return
+        result = await self._embedder.embed([d.to_text() for d in decisions])
+        self._embeddings.put_many([d.id for d in decisions], result.vectors)
+
     def _keyword_search_decisions(self, query: str, top_k: int) -> list[TeamDecision]:
         """Fallback keyword search when embeddings unavailable."""
         query_lower = query.lower()
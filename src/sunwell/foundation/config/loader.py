@@ -135,7 +135,11 @@ def _apply_env_overrides(config_dict: dict) -> dict:
     known_sections = {
         "binding": {"default"},
         "simulacrum": {"spawn", "lifecycle", "base_path"},
-        "embedding": {"prefer_local", "ollama_model", "ollama_url", "fallback_to_hash"},
+        "embedding": {
+            "prefer_local", "ollama_model", "ollama_url", "fallback_to_hash",
+            "index_backend", "ann_threshold", "ann_nprobe",
+            "cache_enabled", "cache_path", "cache_max_mb",
+        },
         "model": {"default_provider", "default_model", "smart_routing"},
         "naaru": {
             "name", "title", "voice", "wisdom", "router",
@@ -148,6 +152,8 @@ def _apply_env_overrides(config_dict: dict) -> dict:
     # Known keys that contain underscores (to avoid splitting them)
     compound_keys = {
         "base_path", "prefer_local", "ollama_model", "ollama_url", "fallback_to_hash",
+        "index_backend", "ann_threshold", "ann_nprobe",
+        "cache_enabled", "cache_path", "cache_max_mb",
         "default_provider", "default_model", "smart_routing", "novelty_threshold",
         "min_queries_before_spawn", "domain_coherence_threshold", "max_simulacrums",
         "auto_name", "stale_days", "archive_days", "min_useful_nodes",
@@ -510,6 +516,19 @@ embedding:
   # Fall back to hash embeddings if no provider available
   fallback_to_hash: true
 
+  # Vector index: flat (exact), ivf (approximate), or auto
+  # (exact until ann_threshold vectors, then IVF)
+  index_backend: "auto"
+  ann_threshold: 20000
+
+  # IVF lists probed per query (higher = better recall, slower)
+  ann_nprobe: 8
+
+  # On-disk embedding cache shared by every process (LRU-evicted above cache_max_mb)
+  cache_enabled: true
+  cache_path: "~/.sunwell/cache/embeddings.db"
+  cache_max_mb: 512
+
 # Model defaults
 model:
   # Default provider (ollama, openai, anthropic)
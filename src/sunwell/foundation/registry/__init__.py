@@ -1,5 +1,6 @@
 """Sunwell Registry - Layered lens resolution."""
 
+from sunwell.foundation.registry.cache import LensCache
 from sunwell.foundation.registry.layered import LayeredLensRegistry, LensEntry
 
-__all__ = ["LayeredLensRegistry", "LensEntry"]
+__all__ = ["LayeredLensRegistry", "LensCache", "LensEntry"]
@@ -0,0 +1,312 @@
+"""Compiled lens cache for fast registry startup.
+
+Parsing lens YAML, resolving permission presets and loading skill includes
+dominates the startup of short ``sunwell`` invocations. The cache keeps every
+lens it has parsed in a WAL-mode SQLite database, pickled fully resolved,
+next to the name, metadata and router shortcuts the registry indexes by.
+Building a registry from the cache only stats files and reads those small
+index columns; a lens itself is unpickled on first use.
+
+An entry is valid while the lens file and every file it was built from (skill
+includes, the presets file) keep their mtime and size, and while the cache
+version, the Sunwell version and the Python version match. Includes and the
+presets file are searched for relative to the working directory too, so an
+entry also records which files those lookups found and is stale once they
+find others (or a presets file where there was none). Stale entries are
+recompiled from YAML and replaced.
+"""
+
+import functools
+import json
+import logging
+import pickle
+import sqlite3
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sunwell.foundation.core.lens import Lens, LensMetadata
+from sunwell.foundation.schema.loader import LensDependencies, LensLoader
+from sunwell.foundation.schema.loader.parsers import find_skill_include
+from sunwell.foundation.schema.loader.presets import find_presets_file
+from sunwell.foundation.utils import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+"""Bump when LensLoader output or the entry format changes."""
+
+LENS_PATTERNS = ("*.lens", "*.lens.yaml")
+"""File patterns loaded from each lens directory."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lenses (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    version TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    dependencies TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    shortcuts TEXT NOT NULL,
+    lens BLOB NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_lenses_directory ON lenses(directory);
+"""
+
+_Stamp = tuple[int, int]
+"""(mtime_ns, size) of a file."""
+
+
+@functools.cache
+def _version() -> str:
+    """Everything besides file stamps that a cached entry depends on."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("sunwell")
+    except PackageNotFoundError:
+        package_version = "dev"
+    python = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return f"{CACHE_VERSION}:{package_version}:{python}"
+
+
+def _stamp(path: Path) -> _Stamp | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _presets_path() -> str | None:
+    """Where the presets file is found from the current working directory."""
+    path = find_presets_file()
+    return str(path.absolute()) if path is not None else None
+
+
+def _resolves_same(
+    lens_dir: Path, dependencies: dict, presets_path: Callable[[], str | None]
+) -> bool:
+    """Check that the entry's include and presets lookups find the same files."""
+    if "presets" in dependencies and dependencies["presets"] != presets_path():
+        return False
+    for ref, resolved in dependencies["includes"]:
+        try:
+            if str(find_skill_include(ref, lens_dir).absolute()) != resolved:
+                return False
+        except ValueError:
+            return False
+    return True
+
+
+def _is_fresh(
+    stamp: _Stamp | None,
+    row: tuple,
+    lens_dir: Path,
+    presets_path: Callable[[], str | None],
+) -> bool:
+    """Check an entry's version, lens file stamp and dependencies."""
+    version, mtime_ns, size, dependencies = row[:4]
+    if version != _version() or stamp != (mtime_ns, size):
+        return False
+    dependencies = json.loads(dependencies)
+    return _resolves_same(lens_dir, dependencies, presets_path) and all(
+        _stamp(Path(dep_path)) == (dep_mtime_ns, dep_size)
+        for dep_path, dep_mtime_ns, dep_size in dependencies["files"]
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledLens:
+    """Index record for one lens file, available without unpickling the lens."""
+
+    path: Path
+    metadata: LensMetadata
+    shortcuts: dict[str, str]
+
+    lens: Lens | None = None
+    """The parsed lens, when this lookup had to (re)compile it."""
+
+
+@dataclass
+class LensCache:
+    """Persistent cache of compiled lenses.
+
+    Usage:
+        cache = LensCache()  # ~/.sunwell/cache/lenses.db
+        compiled, errors = cache.index(Path("lenses"))
+        lens = cache.load(compiled[0].path)
+
+    Cache failures (e.g. a read-only home directory) are logged and fall
+    back to parsing the YAML.
+    """
+
+    path: Path = field(
+        default_factory=lambda: Path.home() / ".sunwell" / "cache" / "lenses.db"
+    )
+    """SQLite database shared by every process using this path."""
+
+    _loader: LensLoader = field(default_factory=LensLoader, init=False, repr=False)
+    _db: SQLiteDatabase = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._db = SQLiteDatabase(self.path, SCHEMA)
+
+    def index(
+        self, lenses_dir: Path
+    ) -> tuple[list[CompiledLens], list[tuple[Path, Exception]]]:
+        """Index every lens file in a directory, compiling stale ones.
+
+        Args:
+            lenses_dir: Directory holding ``*.lens`` / ``*.lens.yaml`` files
+
+        Returns:
+            Tuple of (compiled lenses in load order, (path, error) for each
+            file that failed to load)
+        """
+        lenses_dir = lenses_dir.absolute()
+        lens_paths = [p for pattern in LENS_PATTERNS for p in lenses_dir.glob(pattern)]
+
+        rows: dict[str, tuple] = {}
+        try:
+            with self._db.connect() as conn:
+                for row in conn.execute(
+                    "SELECT path, version, mtime_ns, size, dependencies, metadata, "
+                    "shortcuts FROM lenses WHERE directory = ?",
+                    (str(lenses_dir),),
+                ):
+                    rows[row[0]] = row[1:]
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Lens cache unavailable (%s): %s", self.path, e)
+
+        compiled: list[CompiledLens] = []
+        errors: list[tuple[Path, Exception]] = []
+        stale: list[tuple[CompiledLens, _Stamp | None, LensDependencies]] = []
+        presets_path = functools.cache(_presets_path)
+        for lens_path in lens_paths:
+            stamp = _stamp(lens_path)
+            row = rows.pop(str(lens_path), None)
+            if row is not None and _is_fresh(stamp, row, lenses_dir, presets_path):
+                try:
+                    metadata = pickle.loads(row[4])
+                except Exception as e:
+                    logger.debug("Discarding cached lens %s: %s", lens_path, e)
+                else:
+                    compiled.append(CompiledLens(lens_path, metadata, json.loads(row[5])))
+                    continue
+
+            try:
+                lens, dependencies = self._loader.load_with_dependencies(lens_path)
+            except Exception as e:
+                errors.append((lens_path, e))
+                continue
+            record = CompiledLens(
+                lens_path,
+                lens.metadata,
+                dict(lens.router.shortcuts) if lens.router else {},
+                lens,
+            )
+            compiled.append(record)
+            stale.append((record, stamp, dependencies))
+
+        if stale or rows:
+            self._store(lenses_dir, stale, removed=list(rows))
+        return compiled, errors
+
+    def load(self, lens_path: Path) -> Lens:
+        """Load one lens, from the cache if its entry is still fresh.
+
+        Raises:
+            SunwellError: If the lens has to be recompiled and fails to load
+        """
+        lens_path = lens_path.absolute()
+        stamp = _stamp(lens_path)
+        try:
+            with self._db.connect() as conn:
+                row = conn.execute(
+                    "SELECT version, mtime_ns, size, dependencies, lens "
+                    "FROM lenses WHERE path = ?",
+                    (str(lens_path),),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Lens cache unavailable (%s): %s", self.path, e)
+            row = None
+
+        if row is not None and _is_fresh(stamp, row, lens_path.parent, _presets_path):
+            try:
+                return pickle.loads(row[4])
+            except Exception as e:
+                # Written by an incompatible build; recompile below
+                logger.debug("Discarding cached lens %s: %s", lens_path, e)
+
+        lens, dependencies = self._loader.load_with_dependencies(lens_path)
+        record = CompiledLens(
+            lens_path,
+            lens.metadata,
+            dict(lens.router.shortcuts) if lens.router else {},
+            lens,
+        )
+        self._store(lens_path.parent, [(record, stamp, dependencies)])
+        return lens
+
+    def _store(
+        self,
+        lenses_dir: Path,
+        compiled: Sequence[tuple[CompiledLens, _Stamp | None, LensDependencies]],
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Write fresh entries and drop entries for files that are gone."""
+        entries = []
+        for record, stamp, dependencies in compiled:
+            if stamp is None:
+                continue
+            dep_stamps = []
+            for dep_path in dependencies.files:
+                dep_path = dep_path.absolute()
+                dep_stamp = _stamp(dep_path)
+                if dep_stamp is None:
+                    break
+                dep_stamps.append([str(dep_path), *dep_stamp])
+            else:
+                resolved = {
+                    "files": dep_stamps,
+                    "includes": [
+                        [ref, str(path.absolute())] for ref, path in dependencies.includes
+                    ],
+                }
+                if dependencies.uses_presets:
+                    presets = dependencies.presets
+                    resolved["presets"] = str(presets.absolute()) if presets else None
+                try:
+                    payload = pickle.dumps(record.lens, protocol=pickle.HIGHEST_PROTOCOL)
+                    metadata = pickle.dumps(record.metadata, protocol=pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    logger.debug("Not caching lens %s: %s", record.path, e)
+                    continue
+                entries.append((
+                    str(record.path),
+                    str(lenses_dir),
+                    _version(),
+                    *stamp,
+                    json.dumps(resolved),
+                    metadata,
+                    json.dumps(record.shortcuts),
+                    payload,
+                ))
+
+        try:
+            with self._db.connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO lenses (path, directory, version, mtime_ns, "
+                    "size, dependencies, metadata, shortcuts, lens) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    entries,
+                )
+                conn.executemany(
+                    "DELETE FROM lenses WHERE path = ?", [(path,) for path in removed]
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not update lens cache (%s): %s", self.path, e)
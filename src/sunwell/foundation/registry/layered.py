@@ -17,7 +17,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from sunwell.foundation.core.lens import Lens
+    from sunwell.foundation.core.lens import Lens, LensMetadata
+    from sunwell.foundation.registry.cache import LensCache
 
 # Layer priority (higher number = higher priority)
 LAYER_PRIORITY = {
@@ -27,24 +28,67 @@ LAYER_PRIORITY = {
 }
 
 
-@dataclass
+@dataclass(init=False, eq=False)
 class LensEntry:
-    """Tracks where a lens came from."""
+    """Tracks where a lens came from.
+
+    Entries indexed from the compiled lens cache hold only the lens metadata
+    and router shortcuts; the full lens is loaded on first access to ``lens``.
+    """
 
-    lens: Lens
     layer: str  # "local", "installed", "builtin"
     source_path: Path  # Path to the lens file
-    collection: str | None = None  # Collection name for installed lenses
+    collection: str | None  # Collection name for installed lenses
+    metadata: LensMetadata
+    shortcuts: dict[str, str]  # Router shortcuts (shortcut -> skill name)
+
+    _lens: Lens | None = field(default=None, repr=False)
+    _cache: LensCache | None = field(default=None, repr=False)
+
+    def __init__(
+        self,
+        lens: Lens | None = None,
+        layer: str = "builtin",
+        source_path: Path | None = None,
+        collection: str | None = None,
+        *,
+        metadata: LensMetadata | None = None,
+        shortcuts: dict[str, str] | None = None,
+        cache: LensCache | None = None,
+    ) -> None:
+        if lens is None and (metadata is None or cache is None or source_path is None):
+            raise ValueError("LensEntry needs a lens, or metadata and a cache to load it from")
+        self.layer = layer
+        self.source_path = source_path if source_path is not None else lens.source_path
+        self.collection = collection
+        self.metadata = metadata if metadata is not None else lens.metadata
+        if shortcuts is None:
+            shortcuts = dict(lens.router.shortcuts) if lens.router else {}
+        self.shortcuts = shortcuts
+        self._lens = lens
+        self._cache = cache
+
+    @property
+    def name(self) -> str:
+        """Lens name."""
+        return self.metadata.name
+
+    @property
+    def lens(self) -> Lens:
+        """The full lens, loaded from the cache on first access."""
+        if self._lens is None:
+            self._lens = self._cache.load(self.source_path)
+        return self._lens
 
     @property
     def qualified_name(self) -> str:
         """Get fully qualified name for this lens entry."""
         if self.layer == "local":
-            return f"local::{self.lens.metadata.name}"
+            return f"local::{self.name}"
         elif self.layer == "installed" and self.collection:
-            return f"{self.collection}::{self.lens.metadata.name}"
+            return f"{self.collection}::{self.name}"
         else:
-            return f"builtin::{self.lens.metadata.name}"
+            return f"builtin::{self.name}"
 
     @property
     def display_source(self) -> str:
@@ -80,12 +124,16 @@ class LayeredLensRegistry:
     # Track which shortcuts have been warned about (session-level)
     _warned_shortcuts: set[str] = field(default_factory=set)
 
+    # Compiled lens cache used by _load_layer
+    cache: LensCache | None = None
+
     @classmethod
     def build(
         cls,
         local_dir: Path | None = None,
         installed_dir: Path | None = None,
         builtin_dir: Path | None = None,
+        cache: LensCache | None = None,
     ) -> LayeredLensRegistry:
         """Build a layered registry from multiple lens directories.
 
@@ -93,11 +141,12 @@ class LayeredLensRegistry:
             local_dir: Path to local .sunwell/lenses/ directory
             installed_dir: Path to installed ~/.sunwell/lenses/ directory
             builtin_dir: Path to built-in lenses directory
+            cache: Compiled lens cache (default: ~/.sunwell/cache/lenses.db)
 
         Returns:
             LayeredLensRegistry with all lenses indexed
         """
-        registry = cls()
+        registry = cls(cache=cache)
         registry.layers = {"local": [], "installed": [], "builtin": []}
 
         # Load layers in priority order (lowest first, so higher can override)
@@ -138,46 +187,47 @@ class LayeredLensRegistry:
     def _load_layer(
         self, lenses_dir: Path, layer: str, collection: str | None
     ) -> None:
-        """Load lenses from a directory into a specific layer."""
-        from sunwell.foundation.schema.loader import LensLoader
-
-        loader = LensLoader()
-
-        # Load .lens and .lens.yaml files
-        for ext in ["*.lens", "*.lens.yaml"]:
-            for lens_path in lenses_dir.glob(ext):
-                try:
-                    lens = loader.load(lens_path)
-                    if not lens:
-                        continue
-
-                    entry = LensEntry(
-                        lens=lens,
-                        layer=layer,
-                        source_path=lens_path,
-                        collection=collection,
-                    )
-
-                    # Add to layer
-                    self.layers[layer].append(entry)
-
-                    # Update resolved (last one wins due to load order)
-                    self.resolved[lens.metadata.name] = entry
-
-                    # Index shortcuts from lens router
-                    if lens.router and lens.router.shortcuts:
-                        for shortcut, skill_name in lens.router.shortcuts.items():
-                            if shortcut not in self.shortcut_entries:
-                                self.shortcut_entries[shortcut] = []
-                            self.shortcut_entries[shortcut].append(entry)
-                            # Winner is the one from highest priority layer
-                            self.shortcuts[shortcut] = lens.metadata.name
-
-                except Exception as e:
-                    print(
-                        f"Warning: Failed to load lens {lens_path}: {e}",
-                        file=sys.stderr,
-                    )
+        """Load lenses from a directory into a specific layer.
+
+        Lenses are indexed through the compiled lens cache, so files that
+        haven't changed are neither parsed nor unpickled here.
+        """
+        from sunwell.foundation.registry.cache import LensCache
+
+        if self.cache is None:
+            self.cache = LensCache()
+        compiled, errors = self.cache.index(lenses_dir)
+
+        for lens_path, e in errors:
+            print(
+                f"Warning: Failed to load lens {lens_path}: {e}",
+                file=sys.stderr,
+            )
+
+        for record in compiled:
+            entry = LensEntry(
+                lens=record.lens,
+                layer=layer,
+                source_path=record.path,
+                collection=collection,
+                metadata=record.metadata,
+                shortcuts=record.shortcuts,
+                cache=self.cache,
+            )
+
+            # Add to layer
+            self.layers[layer].append(entry)
+
+            # Update resolved (last one wins due to load order)
+            self.resolved[entry.name] = entry
+
+            # Index shortcuts from lens router
+            for shortcut in entry.shortcuts:
+                if shortcut not in self.shortcut_entries:
+                    self.shortcut_entries[shortcut] = []
+                self.shortcut_entries[shortcut].append(entry)
+                # Winner is the one from highest priority layer
+                self.shortcuts[shortcut] = entry.name
 
     @property
     def lenses(self) -> dict[str, Lens]:
@@ -217,7 +267,7 @@ class LayeredLensRegistry:
 
         # Find entries matching both qualifier and lens name
         for entry in self.resolved.values():
-            if entry.lens.metadata.name.lower() != lens_name.lower():
+            if entry.name.lower() != lens_name.lower():
                 continue
 
             if qualifier_lower == entry.layer:
@@ -228,7 +278,7 @@ class LayeredLensRegistry:
         # Also check all layers (not just resolved winners)
         for layer_entries in self.layers.values():
             for entry in layer_entries:
-                if entry.lens.metadata.name.lower() != lens_name.lower():
+                if entry.name.lower() != lens_name.lower():
                     continue
 
                 if qualifier_lower == entry.layer:
@@ -270,8 +320,8 @@ class LayeredLensRegistry:
 
         # Get skill name from shortcut
         skill_name = None
-        if entry and entry.lens.router and entry.lens.router.shortcuts:
-            skill_name = entry.lens.router.shortcuts.get(shortcut)
+        if entry:
+            skill_name = entry.shortcuts.get(shortcut)
 
         return entry.lens if entry else None, skill_name
 
@@ -311,7 +361,7 @@ class LayeredLensRegistry:
                 entry
                 for layer_entries in self.layers.values()
                 for entry in layer_entries
-                if entry.lens.metadata.name == name and entry != winner
+                if entry.name == name and entry is not winner
             ]
 
             if all_entries:
@@ -340,7 +390,7 @@ class LayeredLensRegistry:
 
         return (
             f"Shortcut collision: {shortcut}\n"
-            f"  Using: {winner.display_source}:{winner.lens.metadata.name}\n"
+            f"  Using: {winner.display_source}:{winner.name}\n"
             f"  Also available: {', '.join(other_qualifiers)}\n"
             f"  Tip: Use qualified name (e.g., builtin::coder) to specify"
         )
@@ -1,5 +1,5 @@
 """Lens loader package - modular schema loading."""
 
-from sunwell.foundation.schema.loader.loader import LensLoader
+from sunwell.foundation.schema.loader.loader import LensDependencies, LensLoader
 
-__all__ = ["LensLoader"]
+__all__ = ["LensDependencies", "LensLoader"]
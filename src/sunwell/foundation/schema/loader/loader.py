@@ -1,5 +1,6 @@
 """Main LensLoader class that coordinates all parsers."""
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +9,7 @@ from sunwell.foundation.schema.models.types import LensReference
 from sunwell.foundation.core.lens import Lens
 from sunwell.foundation.errors import ErrorCode, lens_error
 from sunwell.foundation.schema.loader.parsers import (
+    find_skill_include,
     parse_affordances,
     parse_anti_heuristics,
     parse_communication,
@@ -31,22 +33,55 @@ from sunwell.foundation.schema.loader.parsers import (
     parse_tool_profile,
     parse_workflows,
 )
-from sunwell.foundation.schema.loader.presets import load_presets, resolve_preset
+from sunwell.foundation.schema.loader.presets import (
+    find_presets_file,
+    read_presets,
+    resolve_preset,
+)
 from sunwell.foundation.utils import safe_yaml_load, safe_yaml_loads
 
 
+@dataclass(frozen=True, slots=True)
+class LensDependencies:
+    """What a lens was built from besides its own file.
+
+    Skill includes and the presets file are searched for next to the lens,
+    in the package and in the working directory, so loading the same lens
+    from elsewhere can pick up different files.
+    """
+
+    includes: tuple[tuple[str, Path], ...] = ()
+    """(include reference, file it resolved to) for each included skill."""
+
+    uses_presets: bool = False
+    """Whether the lens has skills, and so depends on the presets file."""
+
+    presets: Path | None = None
+    """Presets file the skills were resolved against (None if none was found)."""
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        """Every file the lens was built from."""
+        files = [path for _, path in self.includes]
+        if self.presets is not None:
+            files.append(self.presets)
+        return tuple(files)
+
+
 class LensLoader:
     """Load lens definitions from files."""
 
     def __init__(self, fount_client: FountProtocol | None = None):
         self.fount = fount_client
         self._presets: dict[str, dict] | None = None  # Lazy-loaded presets
+        self._presets_path: Path | None = None
 
     def _load_presets(self) -> dict[str, dict]:
         """Load permission presets from YAML (RFC-092)."""
         if self._presets is not None:
             return self._presets
-        self._presets = load_presets()
+        self._presets_path = find_presets_file()
+        self._presets = read_presets(self._presets_path)
         return self._presets
 
     def _resolve_preset(self, skill_data: dict) -> dict:
@@ -57,7 +92,37 @@ class LensLoader:
     def load(self, path: Path | str) -> Lens:
         """Load a lens from a YAML file."""
         path = Path(path)
+        return self._parse_lens(self._read(path), source_path=path)
+
+    def load_with_dependencies(self, path: Path | str) -> tuple[Lens, LensDependencies]:
+        """Load a lens and report the files the result was built from.
+
+        These are the skill files it includes and, if it defines skills, the
+        permission presets file, together with the references that located
+        them. The compiled lens cache uses them to tell when a cached lens
+        is stale.
+        """
+        path = Path(path)
+        data = self._read(path)
+        skills_data = data["lens"].get("skills") or []
+        presets_path = find_presets_file() if skills_data else None
+        if skills_data and self._presets is not None and presets_path != self._presets_path:
+            self._presets = None  # The working directory now finds other presets
+        lens = self._parse_lens(data, source_path=path)
 
+        includes = tuple(
+            (skill_data["include"], find_skill_include(skill_data["include"], path.parent))
+            for skill_data in skills_data
+            if "include" in skill_data
+        )
+        return lens, LensDependencies(
+            includes=includes,
+            uses_presets=bool(skills_data),
+            presets=presets_path,
+        )
+
+    def _read(self, path: Path) -> dict[str, Any]:
+        """Read raw lens YAML, raising lens errors for missing/invalid files."""
         if not path.exists():
             raise lens_error(
                 code=ErrorCode.LENS_NOT_FOUND,
@@ -75,9 +140,7 @@ class LensLoader:
                 detail=str(e),
                 cause=e,
             ) from e
-
-        lens = self._parse_lens(data, source_path=path)
-        return lens
+        return data
 
     def resolve_lens_path(self, ref: str) -> Path | None:
         """Resolve a lens reference to an actual file path (RFC-131).
@@ -16,6 +16,7 @@ from sunwell.foundation.schema.loader.parsers.routing import (
     parse_router,
 )
 from sunwell.foundation.schema.loader.parsers.skills import (
+    find_skill_include,
     load_skill_include,
     parse_skill,
     parse_skill_retry,
@@ -57,6 +58,7 @@ __all__ = [
     # Skills
     "parse_skills",
     "load_skill_include",
+    "find_skill_include",
     "parse_skill",
     "parse_skill_retry",
     # Spellbook
@@ -48,25 +48,13 @@ def parse_skills(
     return tuple(skills)
 
 
-def load_skill_include(
-    include_ref: str,
-    base_path: Path | None,
-    parse_skill_fn,
-) -> list[Skill]:
-    """Load skills from an external file.
+def find_skill_include(include_ref: str, base_path: Path | None) -> Path:
+    """Resolve the file an include directive points to.
 
-    Supports:
-    - "core-skills.yaml" - load all skills from file
-    - "core-skills.yaml::skill-name" - load specific skill by name
-    - "core-skills.yaml::skill1,skill2" - load multiple specific skills
+    Raises:
+        ValueError: If the file is not found in any search location
     """
-    # Parse include reference
-    if "::" in include_ref:
-        file_path, skill_filter = include_ref.split("::", 1)
-        skill_names = {s.strip() for s in skill_filter.split(",")}
-    else:
-        file_path = include_ref
-        skill_names = None  # Load all
+    file_path = include_ref.split("::", 1)[0]
 
     # Resolve path relative to base_path (lens directory) or skills directory
     search_paths = []
@@ -88,17 +76,36 @@ def load_skill_include(
     search_paths.append(Path.cwd() / "skills" / file_path)
 
     # Find the file
-    skill_file = None
     for p in search_paths:
         if p.exists():
-            skill_file = p
-            break
+            return p
 
-    if not skill_file:
-        raise ValueError(
-            f"Skill include not found: {include_ref}. "
-            f"Searched: {[str(p) for p in search_paths]}"
-        )
+    raise ValueError(
+        f"Skill include not found: {include_ref}. "
+        f"Searched: {[str(p) for p in search_paths]}"
+    )
+
+
+def load_skill_include(
+    include_ref: str,
+    base_path: Path | None,
+    parse_skill_fn,
+) -> list[Skill]:
+    """Load skills from an external file.
+
+    Supports:
+    - "core-skills.yaml" - load all skills from file
+    - "core-skills.yaml::skill-name" - load specific skill by name
+    - "core-skills.yaml::skill1,skill2" - load multiple specific skills
+    """
+    # Parse include reference
+    if "::" in include_ref:
+        skill_filter = include_ref.split("::", 1)[1]
+        skill_names = {s.strip() for s in skill_filter.split(",")}
+    else:
+        skill_names = None  # Load all
+
+    skill_file = find_skill_include(include_ref, base_path)
 
     # Load and parse the skill file
     skill_data = safe_yaml_load(skill_file)
@@ -5,11 +5,10 @@ from pathlib import Path
 import yaml
 
 
-def load_presets() -> dict[str, dict]:
-    """Load permission presets from YAML (RFC-092).
+def find_presets_file() -> Path | None:
+    """Locate permission-presets.yaml (RFC-092).
 
-    Presets are loaded lazily and cached. Searches for permission-presets.yaml
-    in standard locations:
+    Searches in standard locations:
     1. Package skills directory
     2. Current working directory skills/
     """
@@ -30,14 +29,29 @@ def load_presets() -> dict[str, dict]:
     search_paths.append(Path.cwd() / "skills" / "permission-presets.yaml")
     search_paths.append(Path.cwd() / "permission-presets.yaml")
 
-    # Find and load the file
     for path in search_paths:
         if path.exists():
-            data = yaml.safe_load(path.read_text())
-            return data.get("presets", {}) if data else {}
+            return path
+    return None
+
+
+def load_presets() -> dict[str, dict]:
+    """Load permission presets from YAML (RFC-092).
+
+    Presets are loaded lazily and cached. See :func:`find_presets_file`
+    for the search order.
+    """
+    return read_presets(find_presets_file())
+
+
+def read_presets(path: Path | None) -> dict[str, dict]:
+    """Read the presets from a located presets file (None reads as empty)."""
+    if path is None:
+        # No presets file found - return empty dict
+        return {}
 
-    # No presets file found - return empty dict
-    return {}
+    data = yaml.safe_load(path.read_text())
+    return data.get("presets", {}) if data else {}
 
 
 def resolve_preset(skill_data: dict, presets: dict[str, dict]) -> dict:
@@ -127,6 +127,28 @@ class EmbeddingConfig:
     fallback_to_hash: bool = True
     """Fall back to hash embeddings if no provider available."""
 
+    index_backend: str = "auto"
+    """Vector index backend: "flat" (exact), "ivf" (approximate), or "auto".
+
+    "auto" searches exactly until a corpus reaches ``ann_threshold`` vectors,
+    then switches to the IVF approximate index.
+    """
+
+    ann_threshold: int = 20_000
+    """Corpus size at which "auto" switches to approximate search."""
+
+    ann_nprobe: int = 8
+    """IVF lists probed per query (higher = better recall, slower)."""
+
+    cache_enabled: bool = True
+    """Cache embeddings on disk, keyed by model and text hash."""
+
+    cache_path: str = "~/.sunwell/cache/embeddings.db"
+    """Embedding cache database, shared by every process."""
+
+    cache_max_mb: int = 512
+    """Evict least recently used embeddings above this size."""
+
 
 @dataclass(frozen=True, slots=True)
 class BindingConfig:
@@ -9,6 +9,7 @@ Provides generic utilities used across domains:
 - Math (cosine_similarity)
 - Path operations (normalize_path, sanitize_filename, ensure_dir, relative_to_cwd)
 - Serialization (safe_json_loads, safe_json_dumps, safe_yaml_load, safe_yaml_dump)
+- SQLite (SQLiteDatabase)
 - Timestamps (absolute_timestamp, format_for_summary)
 """
 
@@ -37,6 +38,7 @@ from sunwell.foundation.utils.serialization import (
     safe_yaml_load,
     safe_yaml_loads,
 )
+from sunwell.foundation.utils.sqlite import SQLiteDatabase
 from sunwell.foundation.utils.strings import slugify
 from sunwell.foundation.utils.timestamps import (
     absolute_timestamp,
@@ -73,6 +75,8 @@ __all__ = [
     "safe_yaml_loads",
     "safe_yaml_dump",
     "safe_yaml_dumps",
+    # SQLite utilities
+    "SQLiteDatabase",
     # Timestamp utilities
     "absolute_timestamp",
     "absolute_timestamp_full",
@@ -0,0 +1,76 @@
+"""Lazily created SQLite databases shared between processes.
+
+Caches and stores that persist to SQLite share one pattern: nothing touches
+the disk until the first operation, which creates the directory, switches
+the file to WAL mode and applies the schema (once per process, under a
+lock). After that, every operation opens its own short-lived connection
+with ``synchronous=NORMAL`` and commits when it finishes, so any number of
+threads and processes can use the same file.
+"""
+
+import contextlib
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class SQLiteDatabase:
+    """A WAL-mode SQLite file, initialized on first use.
+
+    Example:
+        >>> db = SQLiteDatabase(cache_dir / "lenses.db", SCHEMA)
+        >>> with db.connect() as conn:
+        ...     conn.execute("DELETE FROM lenses")
+    """
+
+    path: Path
+    """Database file (its directory is created on first use)."""
+
+    schema: str
+    """Idempotent DDL script run when the file is first opened."""
+
+    on_create: Callable[[sqlite3.Connection], None] | None = None
+    """Called once after the schema, in its own transaction (e.g. migrations)."""
+
+    timeout: float = 30.0
+    """Seconds to wait for another connection's write lock."""
+
+    _initialized: bool = field(default=False, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def initialized(self) -> bool:
+        """Whether this process has opened (and so created) the database."""
+        return self._initialized
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one operation, committing when it succeeds."""
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._create()
+                    self._initialized = True
+
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.schema)
+            if self.on_create is not None:
+                with conn:
+                    self.on_create(conn)
+        finally:
+            conn.close()
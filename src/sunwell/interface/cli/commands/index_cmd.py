@@ -280,3 +280,49 @@ def clear() -> None:
         console.print("[green]✓[/green] Index cache cleared")
     else:
         console.print("[yellow]No index cache found[/yellow]")
+
+
+@index.command()
+@click.option("--json", "json_output", is_flag=True, help="JSON output")
+@click.option("--clear", "clear_cache", is_flag=True, help="Remove all cached embeddings")
+def embeddings(json_output: bool, clear_cache: bool) -> None:
+    """Show embedding cache hit rate and bytes saved."""
+    from sunwell.knowledge.embedding import get_embedding_cache
+
+    cache = get_embedding_cache()
+    if cache is None:
+        if json_output:
+            print(json.dumps({"enabled": False}))
+        else:
+            console.print("[yellow]Embedding cache is disabled (embedding.cache_enabled)[/yellow]")
+        return
+
+    if clear_cache:
+        cache.clear()
+        if not json_output:
+            console.print("[green]✓[/green] Embedding cache cleared")
+            return
+
+    report = cache.report()
+
+    if json_output:
+        print(json.dumps({"enabled": True, **report.to_dict()}))
+        return
+
+    console.print("[bold]Embedding Cache[/bold]")
+    console.print(f"  Path: {report.path}")
+    console.print(f"  Entries: {report.entries}")
+    console.print(
+        f"  Size: {report.total_bytes / 1024 / 1024:.1f} / "
+        f"{report.max_bytes / 1024 / 1024:.0f} MB"
+    )
+    console.print(f"  Hit rate: {report.hit_rate:.0%} ({report.hits} hits, {report.misses} misses)")
+    console.print(f"  Bytes saved: {report.bytes_saved / 1024 / 1024:.1f} MB")
+
+    if report.models:
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Model")
+        table.add_column("Entries", justify="right")
+        for model, count in sorted(report.models.items()):
+            table.add_row(model, str(count))
+        console.print(table)
@@ -249,25 +249,23 @@ def patterns(project_root: str) -> None:
 
 @intel.command()
 @click.option("--project-root", type=click.Path(exists=True), default=".")
-@click.option("--force", is_flag=True, help="Force full scan even if graph exists")
+@click.option("--force", is_flag=True, help="Reparse every file instead of only changed ones")
 def scan(project_root: str, force: bool) -> None:
-    """Force full codebase scan to rebuild codebase graph."""
+    """Scan the codebase and update the codebase graph."""
     project_path = Path(project_root)
 
     async def _scan() -> None:
         intelligence = ProjectIntelligence(project_root=project_path)
         context = await intelligence.load()
 
-        graph_path = context.decisions.base_path / "codebase" / "graph.pickle"
-        if graph_path.exists() and not force:
-            console.print("[yellow]Codebase graph already exists. Use --force to rebuild.[/yellow]")
-            return
-
         console.print("[bold]Scanning codebase...[/bold]")
         from sunwell.knowledge import CodebaseAnalyzer
 
+        # The stored graph caches per-file results; only changed files are reparsed
         analyzer = CodebaseAnalyzer()
-        graph = await analyzer.full_scan(project_path)
+        graph = await analyzer.full_scan(
+            project_path, graph=None if force else context.codebase
+        )
 
         # Save graph
         graph.save(base_path=context.decisions.base_path)
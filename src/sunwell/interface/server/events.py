@@ -5,12 +5,33 @@ subscribers. Enables Studio Observatory to see CLI-triggered runs.
 """
 
 import asyncio
-from dataclasses import dataclass
+import contextlib
+import json
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import WebSocket
 
+OverflowPolicy = Literal["drop_oldest", "coalesce", "disconnect"]
+"""What happens when a subscriber's queue is full:
+
+- ``drop_oldest``: discard the oldest queued event
+- ``coalesce``: replace the queued progress event of the same run/type/task
+  (falls back to ``drop_oldest`` when there is none, or for other events)
+- ``disconnect``: close the subscriber's connection
+"""
+
+PROGRESS_EVENT_TYPES = frozenset({
+    "task_progress",
+    "fix_progress",
+    "plan_discovery_progress",
+    "model_tokens",
+    "model_heartbeat",
+})
+"""Snapshot-style events where only the latest value matters to a viewer."""
+
 
 @dataclass(frozen=True, slots=True)
 class BusEvent:
@@ -43,21 +64,96 @@ class BusEvent:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class _Queued:
+    """An encoded event waiting in a subscriber's queue."""
+
+    payload: str
+    coalesce_key: tuple[str, str, Any] | None = None
+
+
 @dataclass(slots=True)
 class Subscriber:
-    """WebSocket subscriber with optional project filter."""
+    """WebSocket subscriber with optional project filter.
+
+    Each subscriber owns a bounded queue drained by its own writer task, so
+    a slow connection only ever delays itself.
+    """
 
     websocket: WebSocket
     project_filter: str | None = None
+    overflow: OverflowPolicy = "coalesce"
+    queue_size: int = 256
+
+    queue: deque[_Queued] = field(default_factory=deque, repr=False)
+    ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    idle: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    writer: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    # Metrics
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+
+    def __post_init__(self) -> None:
+        self.idle.set()
+
+    def enqueue(self, item: _Queued) -> bool:
+        """Queue an encoded event, applying the overflow policy.
+
+        Returns:
+            False if the subscriber must be disconnected
+        """
+        if len(self.queue) >= self.queue_size:
+            if self.overflow == "disconnect":
+                return False
+            if not self._coalesce(item):
+                self.queue.popleft()
+                self.dropped += 1
+        self.queue.append(item)
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self.idle.clear()
+        self.ready.set()
+        return True
+
+    def _coalesce(self, item: _Queued) -> bool:
+        """Drop a queued event superseded by ``item``, if the policy allows."""
+        if self.overflow != "coalesce" or item.coalesce_key is None:
+            return False
+        for queued in self.queue:
+            if queued.coalesce_key == item.coalesce_key:
+                # Remove rather than replace in place, so ordering relative
+                # to events queued in between is preserved
+                self.queue.remove(queued)
+                self.coalesced += 1
+                return True
+        return False
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth and delivery counters."""
+        return {
+            "project_filter": self.project_filter,
+            "overflow": self.overflow,
+            "queue_depth": len(self.queue),
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
 
 
 class EventBus:
     """Global event bus for all connected clients.
 
-    Thread-safe broadcasting to WebSocket subscribers with:
+    Fan-out to WebSocket subscribers with:
     - Project-based filtering
     - Connection limits (prevents resource exhaustion)
-    - Backpressure handling (slow consumers dropped)
+    - Per-subscriber bounded queues and writer tasks: producers never wait
+      on the network, and a slow consumer can't delay anyone else
+    - Serialize-once: each event is JSON-encoded once, not once per socket
+    - Configurable overflow policy (see :data:`OverflowPolicy`); consumers
+      that take longer than SEND_TIMEOUT to accept a message are dropped
 
     Usage:
         bus = EventBus()
@@ -65,7 +161,7 @@ class EventBus:
         # Subscribe (in WebSocket handler)
         await bus.subscribe(websocket, project_filter="proj-123")
 
-        # Broadcast (from run execution)
+        # Broadcast (from run execution); returns without waiting on sockets
         await bus.broadcast(BusEvent(...))
 
         # Cleanup
@@ -74,21 +170,40 @@ class EventBus:
 
     MAX_SUBSCRIBERS = 100
     SEND_TIMEOUT = 1.0  # Seconds before dropping slow consumer
+    QUEUE_SIZE = 256  # Events buffered per subscriber
+    DISCONNECT_CODE = 1013  # "Try again later", sent under the disconnect policy
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy = "coalesce",
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            queue_size: Events buffered per subscriber (default QUEUE_SIZE)
+            overflow: Default overflow policy for subscribers
+        """
+        self.queue_size = queue_size or self.QUEUE_SIZE
+        self.overflow: OverflowPolicy = overflow
         self._subscribers: dict[WebSocket, Subscriber] = {}
         self._lock = asyncio.Lock()
+        self._closing: set[asyncio.Task[None]] = set()
+        self.disconnected = 0
+        """Subscribers dropped for being slow, dead or overflowing."""
 
     async def subscribe(
         self,
         ws: WebSocket,
         project_filter: str | None = None,
+        overflow: OverflowPolicy | None = None,
     ) -> bool:
         """Add subscriber.
 
         Args:
             ws: WebSocket connection
             project_filter: Optional project ID to filter events
+            overflow: Overflow policy for this subscriber (default: the bus's)
 
         Returns:
             True if subscribed, False if at capacity
@@ -96,41 +211,123 @@ class EventBus:
         async with self._lock:
             if len(self._subscribers) >= self.MAX_SUBSCRIBERS:
                 return False
-            self._subscribers[ws] = Subscriber(ws, project_filter)
+            sub = Subscriber(
+                ws,
+                project_filter,
+                overflow=overflow or self.overflow,
+                queue_size=self.queue_size,
+            )
+            sub.writer = asyncio.create_task(self._write_loop(sub))
+            self._subscribers[ws] = sub
             return True
 
     async def unsubscribe(self, ws: WebSocket) -> None:
         """Remove subscriber."""
         async with self._lock:
-            self._subscribers.pop(ws, None)
+            sub = self._subscribers.get(ws)
+            if sub is not None:
+                self._remove(sub)
 
     async def broadcast(self, event: BusEvent) -> None:
-        """Send event to all matching subscribers.
+        """Queue event for all matching subscribers.
 
         Events are filtered by project_id if subscriber has a filter set.
-        Slow consumers (>1s to accept) are dropped to prevent backpressure.
+        Never waits on the network: delivery happens in each subscriber's
+        writer task.
         """
-        async with self._lock:
-            to_remove: list[WebSocket] = []
+        self.publish(event)
+
+    def publish(self, event: BusEvent) -> None:
+        """Synchronous form of :meth:`broadcast`."""
+        item: _Queued | None = None
+        for sub in list(self._subscribers.values()):
+            # Skip if project filter doesn't match
+            if sub.project_filter and event.project_id != sub.project_filter:
+                continue
 
-            for ws, sub in self._subscribers.items():
-                # Skip if project filter doesn't match
-                if sub.project_filter and event.project_id != sub.project_filter:
+            if item is None:
+                item = _Queued(
+                    payload=json.dumps(event.to_dict(), default=str),
+                    coalesce_key=(
+                        (event.run_id, event.type, event.data.get("task_id"))
+                        if event.type in PROGRESS_EVENT_TYPES
+                        else None
+                    ),
+                )
+            if not sub.enqueue(item):
+                self._remove(sub, close=True)
+
+    async def _write_loop(self, sub: Subscriber) -> None:
+        """Drain one subscriber's queue to its socket."""
+        try:
+            while True:
+                if not sub.queue:
+                    sub.idle.set()
+                    sub.ready.clear()
+                    await sub.ready.wait()
                     continue
+                item = sub.queue.popleft()
+                await asyncio.wait_for(
+                    sub.websocket.send_text(item.payload),
+                    timeout=self.SEND_TIMEOUT,
+                )
+                sub.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Slow (timed out) or dead consumer
+            self._remove(sub)
+
+    def _remove(self, sub: Subscriber, *, close: bool = False) -> None:
+        if self._subscribers.get(sub.websocket) is not sub:
+            return
+        del self._subscribers[sub.websocket]
+        sub.queue.clear()
+        sub.idle.set()
+        if sub.writer is not None and sub.writer is not asyncio.current_task():
+            sub.writer.cancel()
+        if close:
+            self.disconnected += 1
+            task = asyncio.get_running_loop().create_task(self._close(sub.websocket))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        elif sub.writer is asyncio.current_task():
+            self.disconnected += 1
 
-                try:
-                    await asyncio.wait_for(
-                        ws.send_json(event.to_dict()),
-                        timeout=self.SEND_TIMEOUT,
-                    )
-                except TimeoutError:
-                    to_remove.append(ws)
-                except Exception:
-                    to_remove.append(ws)
-
-            # Drop slow/dead consumers
-            for ws in to_remove:
-                self._subscribers.pop(ws, None)
+    async def _close(self, ws: WebSocket) -> None:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                ws.close(code=self.DISCONNECT_CODE, reason="Event queue overflow"),
+                timeout=self.SEND_TIMEOUT,
+            )
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every subscriber's queue has been written out.
+
+        Args:
+            timeout: Give up after this many seconds
+
+        Returns:
+            True if all queues drained in time
+        """
+        waits = [sub.idle.wait() for sub in list(self._subscribers.values())]
+        try:
+            await asyncio.wait_for(asyncio.gather(*waits), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        """Per-subscriber queue depth and drop counts."""
+        subs = list(self._subscribers.values())
+        return {
+            "subscribers": len(subs),
+            "disconnected": self.disconnected,
+            "queued": sum(len(sub.queue) for sub in subs),
+            "dropped": sum(sub.dropped for sub in subs),
+            "coalesced": sum(sub.coalesced for sub in subs),
+            "per_subscriber": [sub.metrics() for sub in subs],
+        }
 
     @property
     def subscriber_count(self) -> int:
@@ -128,7 +128,7 @@ async def get_run_history(
             source=run.source,
             started_at=run.started_at,
             completed_at=run.completed_at,
-            event_count=len(run.events),
+            event_count=run.event_count,
             workspace=run.workspace,
             lens=run.lens,
             model=run.model,
@@ -193,7 +193,7 @@ async def stream_events(websocket: WebSocket, run_id: str) -> None:
         try:
             async for event in _execute_agent(run):
                 event_dict = event if isinstance(event, dict) else _event_to_dict(event)
-                run.events.append(event_dict)
+                _run_manager.record_event(run, event_dict)
                 await websocket.send_json(event_dict)
 
                 if run.is_cancelled:
@@ -208,7 +208,7 @@ async def stream_events(websocket: WebSocket, run_id: str) -> None:
             pass  # Client disconnected, run continues buffering
         except Exception as e:
             error_event = {"type": "error", "data": {"message": str(e)}}
-            run.events.append(error_event)
+            _run_manager.record_event(run, error_event)
             _run_manager.complete_run(run.run_id, "error")
             with contextlib.suppress(Exception):
                 await websocket.send_json(error_event)
@@ -245,6 +245,12 @@ async def global_events(websocket: WebSocket, project_id: str | None = None) ->
         await _event_bus.unsubscribe(websocket)
 
 
+@router.get("/events/metrics")
+async def get_event_metrics() -> dict[str, Any]:
+    """Event stream queue depth and drop counts, per subscriber."""
+    return _event_bus.metrics()
+
+
 @router.get("/runs")
 async def list_runs(
     project_id: str | None = None,
@@ -289,7 +295,7 @@ async def list_runs(
                     source=r.source,
                     started_at=r.started_at,
                     completed_at=r.completed_at,
-                    event_count=len(r.events),
+                    event_count=r.event_count,
                 ))
 
     # Sort by started_at descending and limit
@@ -298,21 +304,32 @@ async def list_runs(
 
 
 @router.get("/run/{run_id}/events")
-async def get_run_events(run_id: str) -> RunEventsResponse:
-    """Get all events for a run (RFC-112 Observatory).
+async def get_run_events(
+    run_id: str,
+    since: int = 0,
+    limit: int | None = None,
+) -> RunEventsResponse:
+    """Get events for a run (RFC-112 Observatory).
 
     First checks active runs in memory, then falls back to persistent storage.
+    Pass ``since`` (a sequence number, e.g. the previous ``next_seq``) and
+    ``limit`` to page through long runs.
     """
     # Check active runs first
     run = _run_manager.get_run(run_id)
     if run:
-        return RunEventsResponse(run_id=run_id, events=run.events)
+        end = None if limit is None else since + limit
+        events = run.events[since:end]
+        return RunEventsResponse(run_id=run_id, events=events, next_seq=since + len(events))
 
     # Fall back to persistent storage
     store = get_run_store()
-    events = store.get_events(run_id)
-    if events:
-        return RunEventsResponse(run_id=run_id, events=list(events))
+    events = store.get_events(run_id, since=since, limit=limit)
+    if events or store.has_run(run_id):
+        # An empty page of a known run means the caller has caught up
+        return RunEventsResponse(
+            run_id=run_id, events=list(events), next_seq=since + len(events)
+        )
 
     return RunEventsResponse(run_id=run_id, events=[], error="Run not found")
 
@@ -339,22 +356,13 @@ async def get_observatory_data(run_id: str) -> dict[str, Any]:
     run = _run_manager.get_run(run_id)
     if run:
         # Import here to avoid circular imports
-        from sunwell.interface.server.run_store import StoredRun, _extract_observatory_snapshot
+        from sunwell.interface.server.run_store import (
+            _extract_observatory_snapshot,
+            _stored_run_from,
+        )
 
         # Build a temporary StoredRun from active run
-        temp_run = StoredRun(
-            run_id=run.run_id,
-            goal=run.goal,
-            status=run.status,
-            source=run.source,
-            started_at=run.started_at.isoformat() if run.started_at else "",
-            completed_at=run.completed_at.isoformat() if run.completed_at else None,
-            workspace=run.workspace,
-            project_id=run.project_id,
-            lens=run.lens,
-            model=run.model,
-            events=tuple(run.events),
-        )
+        temp_run = _stored_run_from(run, tuple(run.events))
         snapshot = _extract_observatory_snapshot(temp_run)
         return snapshot.to_dict()
 
@@ -65,4 +65,5 @@ class RunEventsResponse(CamelModel):
 
     run_id: str
     events: list[dict[str, str | int | float | bool | None]]
+    next_seq: int = 0  # Pass as ``since`` to fetch the next page
     error: str | None = None
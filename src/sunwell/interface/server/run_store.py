@@ -1,32 +1,85 @@
 """Persistent run storage for Observatory (RFC-112 Observatory Maturation).
 
 Persists runs and their events to disk so they can be viewed later in
-the Observatory. Each run is stored as a JSON file with all its events.
+the Observatory. Run metadata lives in a SQLite catalog, so history
+listings and cleanup are indexed queries that never touch event data.
+Events are appended to per-run JSONL segments as they arrive, so a run is
+never rewritten as a whole and can be paged by sequence number.
 
 Storage structure:
     ~/.sunwell/runs/
-        {run_id}.json  - Run metadata + events
+        runs.db                             - Run catalog (metadata, snapshots)
+        events/{run_id}/{first_seq}.jsonl   - Append-only event segments
 
 Features:
-- Automatic persistence when runs complete
-- Load historical runs on demand
-- Compute Observatory visualization data from events
+- Incremental persistence while runs execute, finalized when they complete
+- Load historical runs (or pages of their events) on demand
+- Observatory visualization data computed once, when the run completes
 - Thread-safe file operations
+- Legacy ``{run_id}.json`` files are imported into the catalog on startup
 """
 
+import contextlib
 import json
 import logging
+import shutil
+import sqlite3
 import threading
+import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 logger = logging.getLogger(__name__)
 
 # Default storage location
 DEFAULT_RUNS_DIR = Path.home() / ".sunwell" / "runs"
 
+RUNS_DB_NAME = "runs.db"
+
+SEGMENT_EVENTS = 1000
+"""Events per segment file; a new segment starts after this many."""
+
+CATALOG_SYNC_EVENTS = 100
+"""Appended events after which a running run's catalog row is updated..."""
+
+CATALOG_SYNC_SECONDS = 1.0
+"""...or seconds since its last update, whichever comes first."""
+
+WRITER_IDLE_SECONDS = 300.0
+"""Segment writers unused this long are closed (their run may be abandoned)."""
+
+_TERMINAL_STATUSES = frozenset({"complete", "error", "cancelled"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    goal TEXT NOT NULL,
+    status TEXT NOT NULL,
+    source TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    completed_at TEXT,
+    workspace TEXT,
+    project_id TEXT,
+    lens TEXT,
+    model TEXT,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    snapshot TEXT,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_project ON runs(project_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_updated ON runs(updated_at);
+"""
+
+_RUN_COLUMNS = (
+    "run_id, goal, status, source, started_at, completed_at, "
+    "workspace, project_id, lens, model, event_count"
+)
+
 
 @dataclass(frozen=True, slots=True)
 class StoredRun:
@@ -43,6 +96,12 @@ class StoredRun:
     lens: str | None
     model: str | None
     events: tuple[dict[str, Any], ...]
+    event_count: int | None = None
+    """Total events in the run (``events`` is empty in catalog listings)."""
+
+    def __post_init__(self) -> None:
+        if self.event_count is None:
+            object.__setattr__(self, "event_count", len(self.events))
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for JSON storage."""
@@ -112,6 +171,37 @@ class ObservatorySnapshot:
             "convergence_status": self.convergence_status,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ObservatorySnapshot:
+        """Deserialize from :meth:`to_dict` output."""
+        return cls(
+            run_id=data["run_id"],
+            resonance_iterations=tuple(data.get("resonance_iterations", [])),
+            prism_candidates=tuple(data.get("prism_candidates", [])),
+            selected_candidate=data.get("selected_candidate"),
+            tasks=tuple(data.get("tasks", [])),
+            learnings=tuple(data.get("learnings", [])),
+            convergence_iterations=tuple(data.get("convergence_iterations", [])),
+            convergence_status=data.get("convergence_status"),
+        )
+
+
+def _stored_run_from(run: Any, events: tuple[dict[str, Any], ...] = ()) -> StoredRun:
+    """Convert a RunState (or anything shaped like one) to a StoredRun."""
+    return StoredRun(
+        run_id=run.run_id,
+        goal=run.goal,
+        status=run.status,
+        source=run.source,
+        started_at=run.started_at.isoformat() if run.started_at else "",
+        completed_at=run.completed_at.isoformat() if run.completed_at else None,
+        workspace=run.workspace,
+        project_id=run.project_id,
+        lens=run.lens,
+        model=run.model,
+        events=events,
+    )
+
 
 def _extract_observatory_snapshot(run: StoredRun) -> ObservatorySnapshot:
     """Extract Observatory visualization data from run events.
@@ -237,18 +327,116 @@ def _extract_observatory_snapshot(run: StoredRun) -> ObservatorySnapshot:
     )
 
 
+def _segment_path(events_dir: Path, first_seq: int) -> Path:
+    return events_dir / f"{first_seq:08d}.jsonl"
+
+
+def _segments(events_dir: Path) -> list[tuple[int, Path]]:
+    """Segment files of a run as ``(first_seq, path)``, in sequence order."""
+    if not events_dir.is_dir():
+        return []
+    segments: list[tuple[int, Path]] = []
+    for path in events_dir.glob("*.jsonl"):
+        with contextlib.suppress(ValueError):
+            segments.append((int(path.stem), path))
+    segments.sort()
+    return segments
+
+
+def _read_segment(path: Path) -> list[dict[str, Any]]:
+    """Events in one segment.
+
+    A torn final line (an append in progress, or a crash mid-write) is skipped.
+    """
+    events: list[dict[str, Any]] = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            events.append(json.loads(line))
+    return events
+
+
+class _SegmentWriter:
+    """Append handle for the newest event segment of one run."""
+
+    def __init__(self, events_dir: Path) -> None:
+        self._dir = events_dir
+        self._file: IO[str] | None = None
+        self._segment_events = 0
+        self.next_seq = 0
+        """Sequence number the next appended event gets."""
+
+        segments = _segments(events_dir)
+        if segments:
+            first_seq, path = segments[-1]
+            self._segment_events = self._repair(path)
+            self.next_seq = first_seq + self._segment_events
+            self._file = path.open("a", encoding="utf-8")
+
+        self.used_at = time.monotonic()
+        """When events were last appended."""
+        self.synced_seq = self.next_seq
+        """Event count last written to the run's catalog row."""
+        self.synced_at = self.used_at
+
+    @staticmethod
+    def _repair(path: Path) -> int:
+        """Drop a torn final line so appends start on a line boundary.
+
+        Returns:
+            Number of complete events in the segment
+        """
+        data = path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            data = data[: data.rfind(b"\n") + 1]
+            with path.open("r+b") as f:
+                f.truncate(len(data))
+        return data.count(b"\n")
+
+    def append(self, events: Iterable[dict[str, Any]]) -> None:
+        """Append events, starting a new segment every SEGMENT_EVENTS."""
+        for event in events:
+            f = self._file
+            if f is None or self._segment_events >= SEGMENT_EVENTS:
+                f = self._start_segment()
+            f.write(json.dumps(event, separators=(",", ":"), default=str) + "\n")
+            self._segment_events += 1
+            self.next_seq += 1
+        if self._file is not None:
+            self._file.flush()
+        self.used_at = time.monotonic()
+
+    def _start_segment(self) -> IO[str]:
+        self.close()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._file = _segment_path(self._dir, self.next_seq).open("a", encoding="utf-8")
+        self._segment_events = 0
+        return self._file
+
+    def close(self) -> None:
+        """Close the open segment."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class RunStore:
     """Persistent storage for runs and their events.
 
-    Thread-safe file-based storage that:
-    - Saves completed runs automatically
-    - Loads historical runs on demand
-    - Computes Observatory visualization snapshots
+    Thread-safe storage that:
+    - Appends events to a run's segments while it executes, updating its
+      catalog row every CATALOG_SYNC_EVENTS events or CATALOG_SYNC_SECONDS
+    - Saves completed runs (metadata and Observatory snapshot) automatically
+    - Lists and cleans up runs from an indexed catalog
+    - Loads historical runs, or pages of their events, on demand
 
     Example:
         >>> store = RunStore()
+        >>> store.append_events(run_state, [event])  # As events arrive
         >>> store.save_run(run_state)  # After run completes
         >>> runs = store.list_runs(limit=20)
+        >>> page = store.get_events("run-123", since=500, limit=100)
         >>> snapshot = store.get_observatory_snapshot("run-123")
     """
 
@@ -259,49 +447,193 @@ class RunStore:
             runs_dir: Directory for run storage. Defaults to ~/.sunwell/runs/
         """
         self._runs_dir = runs_dir or DEFAULT_RUNS_DIR
+        self._db_path = self._runs_dir / RUNS_DB_NAME
+        # Lock order: _lock (writers) before _db_lock (the connection)
         self._lock = threading.Lock()
-        self._ensure_dir()
+        self._db_lock = threading.Lock()
+        self._writers: dict[str, _SegmentWriter] = {}
+        self._conn = self._open_catalog()
+        self._import_legacy_runs()
 
-    def _ensure_dir(self) -> None:
-        """Create storage directory if it doesn't exist."""
+    def _open_catalog(self) -> sqlite3.Connection:
+        """Create the storage directory and catalog, returning the connection."""
         self._runs_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """The store's connection, in a transaction that commits on exit."""
+        with self._db_lock, self._conn:
+            yield self._conn
+
+    def _events_dir(self, run_id: str) -> Path:
+        """Get the directory holding a run's event segments."""
+        return self._runs_dir / "events" / run_id
+
+    def _upsert_run(
+        self,
+        conn: sqlite3.Connection,
+        run: StoredRun,
+        event_count: int,
+        snapshot: ObservatorySnapshot | None = None,
+        updated_at: float | None = None,
+    ) -> None:
+        conn.execute(
+            f"INSERT INTO runs ({_RUN_COLUMNS}, snapshot, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(run_id) DO UPDATE SET "
+            "goal = excluded.goal, status = excluded.status, source = excluded.source, "
+            "started_at = excluded.started_at, completed_at = excluded.completed_at, "
+            "workspace = excluded.workspace, project_id = excluded.project_id, "
+            "lens = excluded.lens, model = excluded.model, "
+            "event_count = excluded.event_count, "
+            "snapshot = COALESCE(excluded.snapshot, runs.snapshot), "
+            "updated_at = excluded.updated_at",
+            (
+                run.run_id,
+                run.goal,
+                run.status,
+                run.source,
+                run.started_at,
+                run.completed_at,
+                run.workspace,
+                run.project_id,
+                run.lens,
+                run.model,
+                event_count,
+                json.dumps(snapshot.to_dict(), default=str) if snapshot else None,
+                updated_at if updated_at is not None else time.time(),
+            ),
+        )
+
+    def _writer(self, conn: sqlite3.Connection, run: Any) -> _SegmentWriter:
+        """Get the open segment writer for a run, registering the run if new.
 
-    def _run_path(self, run_id: str) -> Path:
-        """Get path for a run's JSON file."""
-        return self._runs_dir / f"{run_id}.json"
+        Must be called with ``self._lock`` held.
+        """
+        writer = self._writers.get(run.run_id)
+        if writer is None:
+            writer = _SegmentWriter(self._events_dir(run.run_id))
+            if not conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run.run_id,)).fetchone():
+                self._upsert_run(conn, _stored_run_from(run), writer.next_seq)
+            self._writers[run.run_id] = writer
+        return writer
+
+    @staticmethod
+    def _sync_catalog(conn: sqlite3.Connection, run_id: str, writer: _SegmentWriter) -> None:
+        """Write a running run's event count to its catalog row."""
+        # updated_at is when the last event arrived, not when it was synced
+        appended_at = time.time() - (time.monotonic() - writer.used_at)
+        conn.execute(
+            "UPDATE runs SET event_count = ?, updated_at = ? WHERE run_id = ?",
+            (writer.next_seq, appended_at, run_id),
+        )
+        writer.synced_seq = writer.next_seq
+        writer.synced_at = time.monotonic()
+
+    def _close_idle_writers(self, conn: sqlite3.Connection) -> None:
+        """Close writers of runs that stopped appending. Must hold ``self._lock``.
+
+        A run that crashed or was abandoned never reaches a terminal status,
+        so without this its segment stays open and cleanup skips it forever.
+        """
+        now = time.monotonic()
+        for run_id, writer in list(self._writers.items()):
+            if now - writer.used_at >= WRITER_IDLE_SECONDS:
+                if writer.synced_seq != writer.next_seq:
+                    self._sync_catalog(conn, run_id, writer)
+                writer.close()
+                del self._writers[run_id]
+
+    def append_events(self, run: Any, events: Iterable[dict[str, Any]]) -> None:
+        """Append events to a run's stored event log as they arrive.
+
+        The run is registered in the catalog on its first append, so it can
+        be recovered (status "running") if the server stops before it
+        completes. Events are written to the run's segment immediately; its
+        catalog ``event_count`` and ``updated_at`` are updated every
+        CATALOG_SYNC_EVENTS events or CATALOG_SYNC_SECONDS, and
+        :meth:`list_runs` reports the live count in between.
+
+        Args:
+            run: RunState object from RunManager
+            events: New events, in order
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                writer = self._writer(conn, run)
+                writer.append(events)
+                if (
+                    writer.next_seq - writer.synced_seq >= CATALOG_SYNC_EVENTS
+                    or writer.used_at - writer.synced_at >= CATALOG_SYNC_SECONDS
+                ):
+                    self._sync_catalog(conn, run.run_id, writer)
+                    self._close_idle_writers(conn)
+        except Exception as e:
+            logger.error(f"Failed to append events for run {run.run_id}: {e}")
 
     def save_run(self, run: Any) -> None:
-        """Save a run to disk.
+        """Save a run's metadata, writing any events not yet appended.
+
+        For a finished run, the Observatory snapshot is computed here once
+        and stored with the run.
 
         Args:
             run: RunState object from RunManager
         """
         try:
-            # Convert RunState to StoredRun format
-            stored = StoredRun(
-                run_id=run.run_id,
-                goal=run.goal,
-                status=run.status,
-                source=run.source,
-                started_at=run.started_at.isoformat() if run.started_at else "",
-                completed_at=run.completed_at.isoformat() if run.completed_at else None,
-                workspace=run.workspace,
-                project_id=run.project_id,
-                lens=run.lens,
-                model=run.model,
-                events=tuple(run.events),
-            )
+            events = tuple(run.events)
+            stored = _stored_run_from(run, events)
+            finished = run.status in _TERMINAL_STATUSES
+            snapshot = _extract_observatory_snapshot(stored) if finished else None
 
             with self._lock:
-                path = self._run_path(run.run_id)
-                path.write_text(json.dumps(stored.to_dict(), indent=2))
-                logger.debug(f"Saved run {run.run_id} to {path}")
+                with self._connect() as conn:
+                    writer = self._writer(conn, run)
+                    writer.append(events[writer.next_seq :])
+                    self._upsert_run(conn, stored, writer.next_seq, snapshot)
+                writer.synced_seq = writer.next_seq
+                writer.synced_at = writer.used_at
+                if finished:
+                    self._writers.pop(run.run_id).close()
+                logger.debug(f"Saved run {run.run_id} to {self._events_dir(run.run_id)}")
 
         except Exception as e:
             logger.error(f"Failed to save run {run.run_id}: {e}")
 
+    @staticmethod
+    def _row_to_run(row: tuple[Any, ...], events: tuple[dict[str, Any], ...] = ()) -> StoredRun:
+        return StoredRun(
+            run_id=row[0],
+            goal=row[1],
+            status=row[2],
+            source=row[3],
+            started_at=row[4],
+            completed_at=row[5],
+            workspace=row[6],
+            project_id=row[7],
+            lens=row[8],
+            model=row[9],
+            events=events,
+            event_count=len(events) if events else row[10],
+        )
+
+    def has_run(self, run_id: str) -> bool:
+        """Check whether a run is in the catalog."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to look up run {run_id}: {e}")
+            return False
+        return row is not None
+
     def load_run(self, run_id: str) -> StoredRun | None:
-        """Load a run from disk.
+        """Load a run with all its events.
 
         Args:
             run_id: The run ID to load.
@@ -310,13 +642,13 @@ class RunStore:
             StoredRun or None if not found.
         """
         try:
-            path = self._run_path(run_id)
-            if not path.exists():
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"SELECT {_RUN_COLUMNS} FROM runs WHERE run_id = ?", (run_id,)
+                ).fetchone()
+            if row is None:
                 return None
-
-            with self._lock:
-                data = json.loads(path.read_text())
-                return StoredRun.from_dict(data)
+            return self._row_to_run(row, tuple(self.get_events(run_id)))
 
         except Exception as e:
             logger.error(f"Failed to load run {run_id}: {e}")
@@ -329,6 +661,10 @@ class RunStore:
     ) -> list[StoredRun]:
         """List stored runs, most recent first.
 
+        Reads only the catalog (plus the live event counts of runs still
+        appending): the returned runs carry ``event_count`` but no events
+        (use :meth:`load_run` or :meth:`get_events` for those).
+
         Args:
             limit: Maximum number of runs to return.
             project_id: Optional filter by project.
@@ -336,67 +672,95 @@ class RunStore:
         Returns:
             List of StoredRun objects.
         """
-        runs: list[StoredRun] = []
-
         try:
-            with self._lock:
-                # Get all run files sorted by modification time (newest first)
-                files = sorted(
-                    self._runs_dir.glob("*.json"),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True,
-                )
-
-                for path in files[:limit * 2]:  # Read extra in case of filtering
-                    try:
-                        data = json.loads(path.read_text())
-                        run = StoredRun.from_dict(data)
-
-                        # Apply project filter
-                        if project_id and run.project_id != project_id:
-                            continue
-
-                        runs.append(run)
-                        if len(runs) >= limit:
-                            break
-
-                    except Exception as e:
-                        logger.warning(f"Failed to load run from {path}: {e}")
-                        continue
-
+            with self._connect() as conn:
+                if project_id:
+                    rows = conn.execute(
+                        f"SELECT {_RUN_COLUMNS} FROM runs WHERE project_id = ? "
+                        "ORDER BY started_at DESC LIMIT ?",
+                        (project_id, limit),
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        f"SELECT {_RUN_COLUMNS} FROM runs ORDER BY started_at DESC LIMIT ?",
+                        (limit,),
+                    ).fetchall()
         except Exception as e:
             logger.error(f"Failed to list runs: {e}")
+            return []
 
-        return runs
+        with self._lock:
+            appended = {run_id: writer.next_seq for run_id, writer in self._writers.items()}
+        return [self._row_to_run((*row[:10], appended.get(row[0], row[10]))) for row in rows]
 
-    def get_events(self, run_id: str) -> list[dict[str, Any]]:
-        """Get all events for a run.
+    def get_events(
+        self,
+        run_id: str,
+        since: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get a run's events, optionally one page at a time.
+
+        Events are numbered from 0 in the order they were recorded. Only the
+        segments overlapping the requested range are read.
 
         Args:
             run_id: The run ID.
+            since: Sequence number of the first event to return.
+            limit: Maximum number of events to return (None = all).
 
         Returns:
             List of event dicts.
         """
-        run = self.load_run(run_id)
-        if run is None:
-            return []
-        return list(run.events)
+        events: list[dict[str, Any]] = []
+        segments = _segments(self._events_dir(run_id))
+        for i, (first_seq, path) in enumerate(segments):
+            if i + 1 < len(segments) and segments[i + 1][0] <= since:
+                continue
+            segment = _read_segment(path)
+            events.extend(segment[max(since - first_seq, 0) :])
+            if limit is not None and len(events) >= limit:
+                return events[:limit]
+        return events
 
     def get_observatory_snapshot(self, run_id: str) -> ObservatorySnapshot | None:
         """Get pre-computed Observatory visualization data for a run.
 
+        Snapshots of finished runs are stored when the run is saved; for
+        anything else the snapshot is derived from the stored events.
+
         Args:
             run_id: The run ID.
 
         Returns:
             ObservatorySnapshot or None if run not found.
         """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT snapshot FROM runs WHERE run_id = ?", (run_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            if row[0] is not None:
+                return ObservatorySnapshot.from_dict(json.loads(row[0]))
+        except Exception as e:
+            logger.error(f"Failed to load snapshot for run {run_id}: {e}")
+
         run = self.load_run(run_id)
         if run is None:
             return None
         return _extract_observatory_snapshot(run)
 
+    def _delete(self, conn: sqlite3.Connection, run_ids: list[str]) -> None:
+        """Delete runs from the catalog and disk. Must hold ``self._lock``."""
+        conn.executemany("DELETE FROM runs WHERE run_id = ?", ((r,) for r in run_ids))
+        for run_id in run_ids:
+            writer = self._writers.pop(run_id, None)
+            if writer is not None:
+                writer.close()
+            shutil.rmtree(self._events_dir(run_id), ignore_errors=True)
+
     def delete_run(self, run_id: str) -> bool:
         """Delete a stored run.
 
@@ -407,13 +771,14 @@ class RunStore:
             True if deleted, False if not found.
         """
         try:
-            path = self._run_path(run_id)
-            if path.exists():
-                with self._lock:
-                    path.unlink()
-                    logger.debug(f"Deleted run {run_id}")
-                return True
-            return False
+            with self._lock, self._connect() as conn:
+                if not conn.execute(
+                    "SELECT 1 FROM runs WHERE run_id = ?", (run_id,)
+                ).fetchone():
+                    return False
+                self._delete(conn, [run_id])
+                logger.debug(f"Deleted run {run_id}")
+            return True
         except Exception as e:
             logger.error(f"Failed to delete run {run_id}: {e}")
             return False
@@ -421,6 +786,9 @@ class RunStore:
     def cleanup_old_runs(self, max_age_days: int = 30, max_runs: int = 500) -> int:
         """Clean up old runs to prevent unbounded growth.
 
+        Runs still receiving events are never deleted; runs whose writer
+        has been idle for WRITER_IDLE_SECONDS no longer count as receiving.
+
         Args:
             max_age_days: Delete runs older than this.
             max_runs: Keep at most this many runs.
@@ -432,24 +800,17 @@ class RunStore:
         cutoff = datetime.now(UTC).timestamp() - (max_age_days * 86400)
 
         try:
-            with self._lock:
-                files = sorted(
-                    self._runs_dir.glob("*.json"),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True,
-                )
-
-                for i, path in enumerate(files):
-                    # Delete if over max_runs limit
-                    if i >= max_runs:
-                        path.unlink()
-                        deleted += 1
-                        continue
-
-                    # Delete if too old
-                    if path.stat().st_mtime < cutoff:
-                        path.unlink()
-                        deleted += 1
+            with self._lock, self._connect() as conn:
+                self._close_idle_writers(conn)
+                rows = conn.execute(
+                    "SELECT run_id FROM runs WHERE updated_at < ? "
+                    "UNION SELECT run_id FROM "
+                    "(SELECT run_id FROM runs ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                    (cutoff, max_runs),
+                ).fetchall()
+                expired = [run_id for (run_id,) in rows if run_id not in self._writers]
+                self._delete(conn, expired)
+                deleted = len(expired)
 
         except Exception as e:
             logger.error(f"Failed to cleanup runs: {e}")
@@ -459,6 +820,36 @@ class RunStore:
 
         return deleted
 
+    def _import_legacy_runs(self) -> None:
+        """Move runs stored as ``{run_id}.json`` into the catalog and segments."""
+        imported = 0
+        for path in self._runs_dir.glob("*.json"):
+            try:
+                run = StoredRun.from_dict(json.loads(path.read_text()))
+                events_dir = self._events_dir(run.run_id)
+                shutil.rmtree(events_dir, ignore_errors=True)
+                writer = _SegmentWriter(events_dir)
+                try:
+                    writer.append(run.events)
+                finally:
+                    writer.close()
+                snapshot = (
+                    _extract_observatory_snapshot(run)
+                    if run.status in _TERMINAL_STATUSES
+                    else None
+                )
+                with self._connect() as conn:
+                    self._upsert_run(
+                        conn, run, len(run.events), snapshot, updated_at=path.stat().st_mtime
+                    )
+                path.unlink()
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Failed to import run from {path}: {e}")
+
+        if imported:
+            logger.info(f"Imported {imported} runs into {self._db_path}")
+
 
 # Global instance
 _run_store: RunStore | None = None
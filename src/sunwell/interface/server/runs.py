@@ -5,7 +5,7 @@ Tracks active agent runs with:
 - Cancellation support
 - Thread-safe access
 - Source tracking for CLI/Studio visibility (RFC-119)
-- Automatic persistence to RunStore (RFC-112 Observatory)
+- Incremental persistence to RunStore (RFC-112 Observatory)
 """
 
 import logging
@@ -154,6 +154,18 @@ class RunManager:
         """
         return list(self._runs.values())
 
+    def record_event(self, run: RunState, event: dict[str, Any]) -> None:
+        """Buffer an event and append it to the run's persisted event log.
+
+        Args:
+            run: The run the event belongs to.
+            event: The event dict.
+        """
+        run.events.append(event)
+        store = self._get_store()
+        if store:
+            store.append_events(run, (event,))
+
     def _get_store(self) -> RunStore | None:
         """Get the run store, lazily initializing from global if needed."""
         if self._run_store is None:
@@ -34,6 +34,7 @@ from sunwell.knowledge.codebase.codebase import (
     CodeLocation,
     CodePath,
     EdgeType,
+    FileAnalysis,
     NodeType,
     StructuralEdge,
     StructuralNode,
@@ -77,6 +78,7 @@ __all__ = [
     "CodebaseAnalyzer",
     "CodeLocation",
     "CodePath",
+    "FileAnalysis",
     # Structural Graph Types
     "NodeType",
     "EdgeType",
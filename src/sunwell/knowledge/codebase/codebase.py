@@ -7,14 +7,25 @@ Enhanced with structural graph for task decomposition and goal analysis.
 
 
 import ast
+import asyncio
+import math
 import pickle
-from collections import deque
-from dataclasses import dataclass, field
+import sqlite3
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sunwell.knowledge.utils import extract_class_defs, is_python_file, parse_python_file
+from sunwell.foundation.threading import cpu_count, is_free_threaded
+from sunwell.foundation.utils import compute_hash
+from sunwell.knowledge.codebase.graph_store import (
+    LEGACY_PICKLE_NAME,
+    CodebaseGraphStore,
+)
+from sunwell.knowledge.utils import extract_class_defs, is_python_file
 
 if TYPE_CHECKING:
     from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
@@ -113,11 +124,51 @@ class CodePath:
     latency_p50: float | None = None  # Median latency if available
 
 
+@dataclass(frozen=True, slots=True)
+class FileAnalysis:
+    """Everything the analyzer extracts from one Python file.
+
+    The unit of caching and persistence: an analysis is reused for as long
+    as the file's content hash is unchanged, and is merged into or removed
+    from a CodebaseGraph as a whole.
+    """
+
+    file_path: Path
+    module_name: str
+    content_hash: str  # Empty if the file couldn't be read
+    imports: tuple[str, ...] = ()
+    calls: tuple[tuple[str, tuple[str, ...]], ...] = ()  # (function, called names)
+    classes: tuple[tuple[str, tuple[str, ...]], ...] = ()  # (class, base names)
+    nodes: tuple[StructuralNode, ...] = ()  # Includes placeholder nodes it references
+    edges: tuple[StructuralEdge, ...] = ()
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the file parsed (a parsed file always has a module node)."""
+        return bool(self.nodes)
+
+
+GRAPH_FORMAT_VERSION = 1
+"""Bump when FileAnalysis or the metadata layout changes; older stores are rebuilt."""
+
+# Graph-level fields persisted as metadata rows (everything else is per file)
+_META_FIELDS = (
+    "concept_clusters",
+    "similar_functions",
+    "hot_paths",
+    "error_prone",
+    "file_ownership",
+    "change_frequency",
+    "coupling_scores",
+)
+
+
 @dataclass(slots=True)
 class CodebaseGraph:
     """Semantic understanding of a codebase.
 
-    Storage: `.sunwell/intelligence/codebase/graph.pickle`
+    Storage: `.sunwell/intelligence/codebase/graph.db` (one row per file,
+    see :mod:`sunwell.knowledge.codebase.graph_store`)
     """
 
     # === Static Analysis (built from AST) ===
@@ -176,6 +227,19 @@ class CodebaseGraph:
     file_to_nodes: dict[Path, set[str]] = field(default_factory=dict)
     """Map files to their nodes for incremental updates. {file_path: {node_ids}}"""
 
+    # === Per-file analyses (for incremental scans and persistence) ===
+
+    file_analyses: dict[Path, FileAnalysis] = field(default_factory=dict)
+    """Analyzer output per file, reused while the file's content hash is unchanged."""
+
+    _dirty_files: set[Path] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _removed_files: set[Path] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _store_path: Path | None = field(default=None, init=False, repr=False, compare=False)
+
     # === Structural Graph Methods ===
 
     def add_structural_node(self, node: StructuralNode) -> None:
@@ -248,38 +312,76 @@ class CodebaseGraph:
 
     def remove_file_nodes(self, file_path: Path) -> None:
         """Remove all nodes and edges from a file (for incremental updates)."""
-        if file_path not in self.file_to_nodes:
+        node_ids = self.file_to_nodes.pop(file_path, None)
+        if not node_ids:
             return
 
-        node_ids = self.file_to_nodes[file_path].copy()
+        # Collect neighbours first so each neighbour's edge list is filtered
+        # once, not once per removed node (placeholders can have huge fan-in).
+        targets: set[str] = set()
+        sources: set[str] = set()
         for node_id in node_ids:
-            # Remove from nodes
-            if node_id in self.structural_nodes:
-                del self.structural_nodes[node_id]
-
-            # Remove outgoing edges
-            if node_id in self.structural_edges_out:
-                for target_id, _ in self.structural_edges_out[node_id]:
-                    if target_id in self.structural_edges_in:
-                        self.structural_edges_in[target_id] = [
-                            (s, e)
-                            for s, e in self.structural_edges_in[target_id]
-                            if s != node_id
-                        ]
-                del self.structural_edges_out[node_id]
-
-            # Remove incoming edges
-            if node_id in self.structural_edges_in:
-                for source_id, _ in self.structural_edges_in[node_id]:
-                    if source_id in self.structural_edges_out:
-                        self.structural_edges_out[source_id] = [
-                            (t, e)
-                            for t, e in self.structural_edges_out[source_id]
-                            if t != node_id
-                        ]
-                del self.structural_edges_in[node_id]
-
-        del self.file_to_nodes[file_path]
+            self.structural_nodes.pop(node_id, None)
+            targets.update(t for t, _ in self.structural_edges_out.pop(node_id, ()))
+            sources.update(s for s, _ in self.structural_edges_in.pop(node_id, ()))
+
+        for target_id in targets - node_ids:
+            if target_id in self.structural_edges_in:
+                self.structural_edges_in[target_id] = [
+                    (s, e)
+                    for s, e in self.structural_edges_in[target_id]
+                    if s not in node_ids
+                ]
+        for source_id in sources - node_ids:
+            if source_id in self.structural_edges_out:
+                self.structural_edges_out[source_id] = [
+                    (t, e)
+                    for t, e in self.structural_edges_out[source_id]
+                    if t not in node_ids
+                ]
+
+    # === Per-file Analyses ===
+
+    def add_file(self, analysis: FileAnalysis) -> None:
+        """Merge a file's analysis, replacing whatever the file contributed before."""
+        self.remove_file(analysis.file_path)
+        self._merge_file(analysis)
+        self._removed_files.discard(analysis.file_path)
+        self._dirty_files.add(analysis.file_path)
+
+    def remove_file(self, file_path: Path) -> None:
+        """Remove a file's nodes, edges and legacy graph entries."""
+        self.remove_file_nodes(file_path)
+        old = self.file_analyses.pop(file_path, None)
+        if old is None:
+            return
+        if old.parsed:
+            self.import_graph.pop(old.module_name, None)
+        for func, _ in old.calls:
+            self.call_graph.pop(func, None)
+        for class_name, _ in old.classes:
+            self.class_hierarchy.pop(class_name, None)
+        self._dirty_files.discard(file_path)
+        self._removed_files.add(file_path)
+
+    def _merge_file(self, analysis: FileAnalysis) -> None:
+        for node in analysis.nodes:
+            # Placeholders (external bases, unresolved calls) are shared by files
+            if node.file_path is None and node.id in self.structural_nodes:
+                continue
+            self.add_structural_node(node)
+        for edge in analysis.edges:
+            self.add_structural_edge(edge)
+
+        if analysis.parsed:
+            self.import_graph[analysis.module_name] = list(analysis.imports)
+        # Assign rather than extend: a graph migrated from the legacy pickle
+        # has these entries without a file analysis to remove them first
+        for func, called in analysis.calls:
+            self.call_graph[func] = list(called)
+        for class_name, bases in analysis.classes:
+            self.class_hierarchy[class_name] = list(bases)
+        self.file_analyses[analysis.file_path] = analysis
 
     def structural_stats(self) -> dict[str, int]:
         """Return statistics about the structural graph."""
@@ -306,23 +408,134 @@ class CodebaseGraph:
         }
 
     def save(self, base_path: Path) -> None:
-        """Save codebase graph to disk."""
-        graph_path = base_path / "codebase" / "graph.pickle"
-        graph_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(graph_path, "wb") as f:
-            pickle.dump(self, f)
+        """Save codebase graph to disk.
+
+        When the graph was loaded from (or last saved to) the same location,
+        only files added, changed or removed since then are written.
+        """
+        store = CodebaseGraphStore.for_base_path(base_path)
+        full = self._store_path != store.path
+        if full:
+            analyses: Iterable[FileAnalysis] = self.file_analyses.values()
+        else:
+            analyses = [
+                self.file_analyses[p] for p in self._dirty_files if p in self.file_analyses
+            ]
+
+        store.write(
+            (
+                (a.file_path, a.module_name, a.content_hash, _dumps(a))
+                for a in analyses
+            ),
+            removed=() if full else self._removed_files,
+            meta=self._meta_blobs(),
+            replace=full,
+        )
+        self._dirty_files.clear()
+        self._removed_files.clear()
+        self._store_path = store.path
+        if full:
+            (base_path / "codebase" / LEGACY_PICKLE_NAME).unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, base_path: Path, files: Iterable[Path] | None = None) -> CodebaseGraph:
+        """Load codebase graph from disk.
+
+        Args:
+            base_path: Intelligence directory (e.g. `.sunwell/intelligence`)
+            files: Only load these files' analyses; graph-level data is always
+                loaded. Saving a partially loaded graph updates just its files.
+
+        Returns:
+            The stored graph, or an empty graph if none is stored
+        """
+        store = CodebaseGraphStore.for_base_path(base_path)
+        if not store.exists():
+            return cls._load_legacy(base_path / "codebase" / LEGACY_PICKLE_NAME)
+
+        try:
+            meta = {key: pickle.loads(blob) for key, blob in store.load_meta().items()}
+            if meta.get("format_version") != GRAPH_FORMAT_VERSION:
+                return cls()
+            analyses = [pickle.loads(blob) for blob in store.load_files(files)]
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError):
+            return cls()
+
+        graph = cls()
+        for analysis in analyses:
+            graph._merge_file(analysis)
+        for name in _META_FIELDS:
+            if name in meta:
+                setattr(graph, name, meta[name])
+        graph._restore_loose(meta.get("loose", {}))
+        graph._store_path = store.path
+        return graph
 
     @classmethod
-    def load(cls, base_path: Path) -> CodebaseGraph:
-        """Load codebase graph from disk."""
-        graph_path = base_path / "codebase" / "graph.pickle"
-        if graph_path.exists():
-            try:
-                with open(graph_path, "rb") as f:
-                    return pickle.load(f)
-            except (pickle.PickleError, OSError):
-                pass
-        return cls()
+    def _load_legacy(cls, pickle_path: Path) -> CodebaseGraph:
+        """Load a graph saved as a single pickle by earlier versions."""
+        if not pickle_path.exists():
+            return cls()
+        try:
+            with open(pickle_path, "rb") as f:
+                old = pickle.load(f)
+        except (pickle.PickleError, OSError, EOFError, AttributeError):
+            return cls()
+        # Copy field by field: the pickle predates fields added since
+        graph = cls()
+        for f in fields(cls):
+            if f.init and hasattr(old, f.name):
+                setattr(graph, f.name, getattr(old, f.name))
+        return graph
+
+    def _meta_blobs(self) -> dict[str, bytes]:
+        blobs = {name: _dumps(getattr(self, name)) for name in _META_FIELDS}
+        blobs["loose"] = _dumps(self._loose_state())
+        blobs["format_version"] = _dumps(GRAPH_FORMAT_VERSION)
+        return blobs
+
+    def _loose_state(self) -> dict[str, Any]:
+        """Graph content not produced by any file analysis.
+
+        E.g. nodes from ``populate_from_scan``, nodes added by hand, or a graph
+        migrated from the legacy pickle. Persisted as metadata so that a
+        round trip through :meth:`save`/:meth:`load` doesn't lose it.
+        """
+        analysed: set[str] = set()
+        functions: set[str] = set()
+        classes: set[str] = set()
+        modules: set[str] = set()
+        for analysis in self.file_analyses.values():
+            analysed.update(n.id for n in analysis.nodes)
+            functions.update(func for func, _ in analysis.calls)
+            classes.update(name for name, _ in analysis.classes)
+            if analysis.parsed:
+                modules.add(analysis.module_name)
+
+        nodes = [n for i, n in self.structural_nodes.items() if i not in analysed]
+        return {
+            "nodes": nodes,
+            "edges": [
+                edge
+                for node in nodes
+                for _, edge in self.structural_edges_out.get(node.id, ())
+            ],
+            "call_graph": {k: v for k, v in self.call_graph.items() if k not in functions},
+            "import_graph": {k: v for k, v in self.import_graph.items() if k not in modules},
+            "class_hierarchy": {
+                k: v for k, v in self.class_hierarchy.items() if k not in classes
+            },
+        }
+
+    def _restore_loose(self, loose: dict[str, Any]) -> None:
+        for node in loose.get("nodes", ()):
+            if node.id not in self.structural_nodes:
+                self.add_structural_node(node)
+        for edge in loose.get("edges", ()):
+            self.add_structural_edge(edge)
+        for name in ("call_graph", "import_graph", "class_hierarchy"):
+            for key, value in loose.get(name, {}).items():
+                getattr(self, name).setdefault(key, value)
 
     def populate_from_scan(
         self,
@@ -398,11 +611,22 @@ class CodebaseGraph:
         return nodes_added
 
 
+_PARALLEL_MIN_FILES = 64
+"""Below this many files to parse, a worker pool costs more than it saves."""
+
+_BATCHES_PER_WORKER = 4
+
+
 class CodebaseAnalyzer:
     """Builds and maintains the codebase graph.
 
     Builds both the legacy simple graphs (call_graph, import_graph, class_hierarchy)
     and the new structural graph with full metadata for task analysis.
+
+    Files are analyzed independently (see :meth:`analyze_file`), sharded
+    across a process pool, or a thread pool on free-threaded builds. Each
+    result is kept in the graph keyed by the file's content hash, so a rescan
+    only reparses files whose content changed.
     """
 
     def __init__(
@@ -419,64 +643,147 @@ class CodebaseAnalyzer:
         self._current_module_id: str | None = None
         self._root: Path | None = None
 
-    async def full_scan(self, root: Path) -> CodebaseGraph:
-        """Full codebase scan. Run once on first use or after major changes.
+    async def full_scan(
+        self,
+        root: Path,
+        graph: CodebaseGraph | None = None,
+    ) -> CodebaseGraph:
+        """Full codebase scan.
 
-        Builds both legacy graphs and the new structural graph.
+        Builds both legacy graphs and the new structural graph. Given the
+        graph from a previous scan, updates it in place: files whose content
+        hash is unchanged are not reparsed, and deleted files are removed.
 
         Args:
             root: Project root directory
+            graph: Graph from a previous scan to update (default: new graph)
 
         Returns:
             CodebaseGraph with static analysis results
         """
-        graph = CodebaseGraph()
+        if graph is None:
+            graph = CodebaseGraph()
         self._root = root
 
         # Find all Python files
-        python_files = list(root.rglob("*.py"))
-        python_files = [f for f in python_files if not self._should_skip(f)]
+        python_files = [f for f in root.rglob("*.py") if not self._should_skip(f)]
 
-        # Build both legacy and structural graphs
-        for file_path in python_files:
-            tree = parse_python_file(file_path)
-            if tree is None:
-                continue
+        jobs = [self._job(file_path, root, graph) for file_path in python_files]
+        for analysis in await self._analyze_files(jobs):
+            if analysis is not None:
+                graph.add_file(analysis)
 
-            try:
-                content = file_path.read_text()
-                lines = content.split("\n")
-            except (OSError, UnicodeDecodeError):
-                lines = []
+        # Files analyzed by a previous scan that no longer exist
+        for file_path in set(graph.file_analyses).difference(python_files):
+            graph.remove_file(file_path)
 
-            # Extract imports
-            module_name = self._get_module_name(file_path, root)
-            imports = self._extract_imports(tree)
-            graph.import_graph[module_name] = imports
+        return graph
 
-            # Extract function calls (legacy)
-            calls = self._extract_calls(tree, module_name)
-            for func, called_funcs in calls.items():
-                if func not in graph.call_graph:
-                    graph.call_graph[func] = []
-                graph.call_graph[func].extend(called_funcs)
+    def analyze_file(
+        self,
+        file_path: Path,
+        module_name: str,
+        previous_hash: str | None = None,
+    ) -> FileAnalysis | None:
+        """Extract one file's imports, calls, classes and structural graph.
 
-            # Extract class hierarchy (legacy)
-            classes = self._extract_classes(tree, module_name)
-            for class_name, bases in classes.items():
-                graph.class_hierarchy[class_name] = bases
+        Args:
+            file_path: Python file
+            module_name: Dotted module name used by the legacy graphs
+            previous_hash: Content hash of an earlier analysis of this file
 
-            # Build structural graph with full metadata
-            self._build_structural_graph(file_path, tree, lines, graph, module_name)
+        Returns:
+            The file's analysis, or None if its content hash equals
+            ``previous_hash``. Files that can't be read or parsed yield an
+            analysis without nodes.
+        """
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return FileAnalysis(file_path, module_name, content_hash="")
+
+        content_hash = compute_hash(data)
+        if content_hash == previous_hash:
+            return None
+
+        try:
+            content = data.decode("utf-8")
+            tree = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            return FileAnalysis(file_path, module_name, content_hash)
+
+        # Universal newlines, as read_text() would give
+        lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        sink = _FileSink()
+        self._build_structural_graph(file_path, tree, lines, sink, module_name)
+
+        return FileAnalysis(
+            file_path=file_path,
+            module_name=module_name,
+            content_hash=content_hash,
+            imports=tuple(self._extract_imports(tree)),
+            calls=tuple(
+                (func, tuple(called))
+                for func, called in self._extract_calls(tree, module_name).items()
+            ),
+            classes=tuple(
+                (name, tuple(bases))
+                for name, bases in self._extract_classes(tree, module_name).items()
+            ),
+            nodes=tuple(sink.structural_nodes.values()),
+            edges=tuple(sink.edges),
+        )
 
-        return graph
+    def _job(
+        self, file_path: Path, root: Path, graph: CodebaseGraph
+    ) -> tuple[Path, str, str | None]:
+        """Analysis job for a file, carrying the hash of its cached analysis."""
+        module_name = self._get_module_name(file_path, root)
+        cached = graph.file_analyses.get(file_path)
+        if cached is None or cached.module_name != module_name:
+            return file_path, module_name, None
+        return file_path, module_name, cached.content_hash
+
+    async def _analyze_files(
+        self, jobs: list[tuple[Path, str, str | None]]
+    ) -> list[FileAnalysis | None]:
+        """Run analysis jobs, in parallel when there are enough of them.
+
+        Results are in job order. Uses processes unless the interpreter is
+        free-threaded, in which case threads parse in parallel without the
+        pickling overhead.
+        """
+        workers = min(cpu_count(), len(jobs) // _PARALLEL_MIN_FILES)
+        if workers <= 1:
+            return _analyze_batch(jobs)
+
+        size = math.ceil(len(jobs) / (workers * _BATCHES_PER_WORKER))
+        batches = [jobs[i : i + size] for i in range(0, len(jobs), size)]
+
+        pool: Executor
+        if is_free_threaded():
+            pool = ThreadPoolExecutor(max_workers=workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+
+        loop = asyncio.get_running_loop()
+        try:
+            with pool:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _analyze_batch, b) for b in batches)
+                )
+        except (BrokenProcessPool, OSError):
+            # No usable worker processes (sandbox, resource limits): parse inline
+            return _analyze_batch(jobs)
+
+        return [analysis for batch in results for analysis in batch]
 
     def _build_structural_graph(
         self,
         file_path: Path,
         tree: ast.Module,
         lines: list[str],
-        graph: CodebaseGraph,
+        sink: _FileSink,
         module_name: str,
     ) -> None:
         """Build structural graph with full metadata from AST.
@@ -497,34 +804,34 @@ class CodebaseAnalyzer:
             line=1,
             end_line=len(lines),
         )
-        graph.add_structural_node(module_node)
+        sink.add_structural_node(module_node)
 
         # Process top-level statements
         for node in tree.body:
-            self._process_ast_node(node, graph, lines, self._current_module_id, None)
+            self._process_ast_node(node, sink, lines, self._current_module_id, None)
 
     def _process_ast_node(
         self,
         node: ast.AST,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         lines: list[str],
         parent_id: str,
         parent_class_id: str | None,
     ) -> None:
-        """Process an AST node and add to structural graph."""
+        """Process an AST node and add to structural sink."""
         if isinstance(node, ast.ClassDef):
-            self._process_class_def(node, graph, lines, parent_id)
+            self._process_class_def(node, sink, lines, parent_id)
         elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            self._process_function_def(node, graph, lines, parent_id, parent_class_id)
+            self._process_function_def(node, sink, lines, parent_id, parent_class_id)
         elif isinstance(node, (ast.Import, ast.ImportFrom)):
-            self._process_import_node(node, graph, parent_id)
+            self._process_import_node(node, sink, parent_id)
         elif isinstance(node, ast.Assign):
-            self._process_assignment(node, graph, lines, parent_id)
+            self._process_assignment(node, sink, lines, parent_id)
 
     def _process_class_def(
         self,
         node: ast.ClassDef,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         lines: list[str],
         parent_id: str,
     ) -> None:
@@ -540,10 +847,10 @@ class CodebaseAnalyzer:
             signature=lines[node.lineno - 1].strip() if node.lineno <= len(lines) else None,
             docstring=ast.get_docstring(node),
         )
-        graph.add_structural_node(class_node)
+        sink.add_structural_node(class_node)
 
         # CONTAINS edge from parent
-        graph.add_structural_edge(
+        sink.add_structural_edge(
             StructuralEdge(
                 source_id=parent_id,
                 target_id=class_id,
@@ -558,15 +865,15 @@ class CodebaseAnalyzer:
             if base_name:
                 # Create placeholder node for base (may be external)
                 base_id = f"class:{base_name}:external"
-                if base_id not in graph.structural_nodes:
-                    graph.add_structural_node(
+                if base_id not in sink.structural_nodes:
+                    sink.add_structural_node(
                         StructuralNode(
                             id=base_id,
                             node_type=NodeType.CLASS,
                             name=base_name,
                         )
                     )
-                graph.add_structural_edge(
+                sink.add_structural_edge(
                     StructuralEdge(
                         source_id=class_id,
                         target_id=base_id,
@@ -577,12 +884,12 @@ class CodebaseAnalyzer:
 
         # Process class body
         for item in node.body:
-            self._process_ast_node(item, graph, lines, class_id, class_id)
+            self._process_ast_node(item, sink, lines, class_id, class_id)
 
     def _process_function_def(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         lines: list[str],
         parent_id: str,
         parent_class_id: str | None,
@@ -605,11 +912,11 @@ class CodebaseAnalyzer:
             signature=self._extract_function_signature(node, lines),
             docstring=ast.get_docstring(node),
         )
-        graph.add_structural_node(func_node)
+        sink.add_structural_node(func_node)
 
         # CONTAINS or DEFINES edge
         if is_method and parent_class_id:
-            graph.add_structural_edge(
+            sink.add_structural_edge(
                 StructuralEdge(
                     source_id=parent_class_id,
                     target_id=func_id,
@@ -618,7 +925,7 @@ class CodebaseAnalyzer:
                 )
             )
         else:
-            graph.add_structural_edge(
+            sink.add_structural_edge(
                 StructuralEdge(
                     source_id=parent_id,
                     target_id=func_id,
@@ -628,12 +935,12 @@ class CodebaseAnalyzer:
             )
 
         # Extract CALLS edges from function body
-        self._extract_calls_from_function(node, graph, func_id)
+        self._extract_calls_from_function(node, sink, func_id)
 
     def _process_import_node(
         self,
         node: ast.Import | ast.ImportFrom,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         parent_id: str,
     ) -> None:
         """Process import statements."""
@@ -641,15 +948,15 @@ class CodebaseAnalyzer:
             for alias in node.names:
                 module_name = alias.name
                 target_id = f"module:{module_name}:external"
-                if target_id not in graph.structural_nodes:
-                    graph.add_structural_node(
+                if target_id not in sink.structural_nodes:
+                    sink.add_structural_node(
                         StructuralNode(
                             id=target_id,
                             node_type=NodeType.MODULE,
                             name=module_name,
                         )
                     )
-                graph.add_structural_edge(
+                sink.add_structural_edge(
                     StructuralEdge(
                         source_id=parent_id,
                         target_id=target_id,
@@ -659,15 +966,15 @@ class CodebaseAnalyzer:
                 )
         elif isinstance(node, ast.ImportFrom) and node.module:
             target_id = f"module:{node.module}:external"
-            if target_id not in graph.structural_nodes:
-                graph.add_structural_node(
+            if target_id not in sink.structural_nodes:
+                sink.add_structural_node(
                     StructuralNode(
                         id=target_id,
                         node_type=NodeType.MODULE,
                         name=node.module,
                     )
                 )
-            graph.add_structural_edge(
+            sink.add_structural_edge(
                 StructuralEdge(
                     source_id=parent_id,
                     target_id=target_id,
@@ -679,7 +986,7 @@ class CodebaseAnalyzer:
     def _process_assignment(
         self,
         node: ast.Assign,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         lines: list[str],
         parent_id: str,
     ) -> None:
@@ -694,8 +1001,8 @@ class CodebaseAnalyzer:
                     file_path=self._current_file,
                     line=node.lineno,
                 )
-                graph.add_structural_node(var_node)
-                graph.add_structural_edge(
+                sink.add_structural_node(var_node)
+                sink.add_structural_edge(
                     StructuralEdge(
                         source_id=parent_id,
                         target_id=var_id,
@@ -707,7 +1014,7 @@ class CodebaseAnalyzer:
     def _extract_calls_from_function(
         self,
         func_node: ast.FunctionDef | ast.AsyncFunctionDef,
-        graph: CodebaseGraph,
+        sink: _FileSink,
         func_id: str,
     ) -> None:
         """Extract function calls from a function body."""
@@ -717,15 +1024,15 @@ class CodebaseAnalyzer:
                 if call_name:
                     # Create placeholder for called function
                     target_id = f"func:{call_name}:unknown"
-                    if target_id not in graph.structural_nodes:
-                        graph.add_structural_node(
+                    if target_id not in sink.structural_nodes:
+                        sink.add_structural_node(
                             StructuralNode(
                                 id=target_id,
                                 node_type=NodeType.FUNCTION,
                                 name=call_name,
                             )
                         )
-                    graph.add_structural_edge(
+                    sink.add_structural_edge(
                         StructuralEdge(
                             source_id=func_id,
                             target_id=target_id,
@@ -833,7 +1140,8 @@ class CodebaseAnalyzer:
     ) -> CodebaseGraph:
         """Update graph incrementally after file changes.
 
-        Removes old nodes/edges for changed files and rebuilds them.
+        Replaces each changed file's nodes, edges and legacy graph entries
+        with a fresh analysis; deleted files are removed.
 
         Args:
             changed_files: List of files that changed
@@ -845,37 +1153,19 @@ class CodebaseAnalyzer:
         """
         self._root = root
 
-        # Re-scan changed files and update graph
+        jobs = []
         for file_path in changed_files:
             if not is_python_file(file_path):
                 continue
-
-            # Remove old structural graph data for this file
-            graph.remove_file_nodes(file_path)
-
-            tree = parse_python_file(file_path)
-            if tree is None:
+            if not file_path.exists():
+                graph.remove_file(file_path)
                 continue
+            jobs.append(self._job(file_path, root, graph))
 
-            try:
-                content = file_path.read_text()
-                lines = content.split("\n")
-            except (OSError, UnicodeDecodeError):
-                lines = []
-
-            module_name = self._get_module_name(file_path, root)
-
-            # Update imports (legacy)
-            imports = self._extract_imports(tree)
-            graph.import_graph[module_name] = imports
-
-            # Update calls (legacy)
-            calls = self._extract_calls(tree, module_name)
-            for func, called_funcs in calls.items():
-                graph.call_graph[func] = called_funcs
-
-            # Rebuild structural graph for this file
-            self._build_structural_graph(file_path, tree, lines, graph, module_name)
+        # Re-analyze changed files (unchanged content is skipped) and merge
+        for analysis in await self._analyze_files(jobs):
+            if analysis is not None:
+                graph.add_file(analysis)
 
         return graph
 
@@ -915,3 +1205,32 @@ class CodebaseAnalyzer:
                     graph.error_prone.append(location)
 
         return graph
+
+
+# =============================================================================
+# Per-file Extraction (runs in worker processes or threads)
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _FileSink:
+    """Collects one file's structural nodes and edges during extraction."""
+
+    structural_nodes: dict[str, StructuralNode] = field(default_factory=dict)
+    edges: list[StructuralEdge] = field(default_factory=list)
+
+    def add_structural_node(self, node: StructuralNode) -> None:
+        self.structural_nodes[node.id] = node
+
+    def add_structural_edge(self, edge: StructuralEdge) -> None:
+        self.edges.append(edge)
+
+
+def _analyze_batch(jobs: list[tuple[Path, str, str | None]]) -> list[FileAnalysis | None]:
+    """Analyze ``(file, module_name, previous_hash)`` jobs; picklable for process pools."""
+    analyzer = CodebaseAnalyzer()
+    return [analyzer.analyze_file(*job) for job in jobs]
+
+
+def _dumps(obj: object) -> bytes:
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
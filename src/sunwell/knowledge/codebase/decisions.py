@@ -11,12 +11,13 @@ RFC-050 adds:
 
 import hashlib
 import json
-import math
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from sunwell.knowledge.embedding.vectors import VectorFile
+
 if TYPE_CHECKING:
     from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
 
@@ -30,17 +31,6 @@ _MUTUALLY_EXCLUSIVE_PAIRS: frozenset[tuple[str, str]] = frozenset([
 ])
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    dot = sum(x * y for x, y in zip(a, b, strict=True))
-    mag_a = math.sqrt(sum(x * x for x in a))
-    mag_b = math.sqrt(sum(x * x for x in b))
-
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-
-    return dot / (mag_a * mag_b)
-
 # RFC-050: Decision sources
 DecisionSource = Literal["conversation", "bootstrap"]
 
@@ -192,12 +182,16 @@ class DecisionMemory:
         """
         self.base_path = Path(base_path)
         self.decisions_path = self.base_path / "decisions.jsonl"
-        self.embeddings_path = self.base_path / "decisions_embeddings.json"
+        self.embeddings_path = self.base_path / "decisions_embeddings.f32"
         self._embedder = embedder
 
         # In-memory cache
         self._decisions: dict[str, Decision] = {}
-        self._embeddings: dict[str, list[float]] = {}
+        # Read on first semantic search, not at startup
+        self._embeddings = VectorFile(
+            self.embeddings_path,
+            legacy_json=self.base_path / "decisions_embeddings.json",
+        )
 
         # Ensure directory exists
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -222,24 +216,11 @@ class DecisionMemory:
                 except (json.JSONDecodeError, KeyError, ValueError):
                     continue
 
-        # Load embeddings if available
-        if self.embeddings_path.exists():
-            try:
-                with open(self.embeddings_path) as f:
-                    self._embeddings = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._embeddings = {}
-
     def _save_decision(self, decision: Decision) -> None:
         """Append decision to JSONL file."""
         with open(self.decisions_path, "a") as f:
             f.write(json.dumps(decision.to_dict()) + "\n")
 
-    def _save_embeddings(self) -> None:
-        """Save embeddings to JSON file."""
-        with open(self.embeddings_path, "w") as f:
-            json.dump(self._embeddings, f)
-
     def _generate_id(
         self,
         category: str,
@@ -328,8 +309,7 @@ class DecisionMemory:
             try:
                 text = decision.to_text()
                 result = await self._embedder.embed([text])
-                self._embeddings[decision.id] = result.vectors[0].tolist()
-                self._save_embeddings()
+                self._embeddings.put(decision.id, result.vectors[0])
             except Exception:
                 # Embedding generation is optional
                 pass
@@ -456,27 +436,12 @@ class DecisionMemory:
         try:
             # Embed query
             result = await self._embedder.embed([query])
-            query_vec = result.vectors[0].tolist()
-
-            # Calculate similarities
-            scores: list[tuple[Decision, float]] = []
-            for decision_id, decision_embedding in self._embeddings.items():
-                if decision_id not in self._decisions:
-                    continue
-
-                decision = self._decisions[decision_id]
-
-                # Skip superseded decisions
-                if decision.supersedes:
-                    continue
-
-                # Calculate cosine similarity
-                similarity = _cosine_similarity(query_vec, decision_embedding)
-                scores.append((decision, similarity))
 
-            # Sort by score and return top_k
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return [d for d, _ in scores[:top_k]]
+            # Skip superseded decisions and vectors of decisions no longer loaded
+            skip = {d.id for d in self._decisions.values() if d.supersedes}
+            skip.update(i for i in self._embeddings.ids() if i not in self._decisions)
+            hits = self._embeddings.search(result.vectors[0], top_k, exclude=skip)
+            return [self._decisions[i] for i, _ in hits]
 
         except Exception:
             # Fall back to keyword search on error
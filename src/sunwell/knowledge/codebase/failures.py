@@ -6,28 +6,17 @@ Remember what didn't work and why. Prevents repeating the same mistakes.
 
 import hashlib
 import json
-import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from sunwell.knowledge.embedding.vectors import VectorFile
+
 if TYPE_CHECKING:
     from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    dot = sum(x * y for x, y in zip(a, b, strict=True))
-    mag_a = math.sqrt(sum(x * x for x in a))
-    mag_b = math.sqrt(sum(x * x for x in b))
-
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-
-    return dot / (mag_a * mag_b)
-
-
 @dataclass(frozen=True, slots=True)
 class FailedApproach:
     """An approach that was tried and failed."""
@@ -126,12 +115,16 @@ class FailureMemory:
         """
         self.base_path = Path(base_path)
         self.failures_path = self.base_path / "failures.jsonl"
-        self.embeddings_path = self.base_path / "failures_embeddings.json"
+        self.embeddings_path = self.base_path / "failures_embeddings.f32"
         self._embedder = embedder
 
         # In-memory cache
         self._failures: dict[str, FailedApproach] = {}
-        self._embeddings: dict[str, list[float]] = {}
+        # Read on first semantic search, not at startup
+        self._embeddings = VectorFile(
+            self.embeddings_path,
+            legacy_json=self.base_path / "failures_embeddings.json",
+        )
 
         # Ensure directory exists
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -156,24 +149,11 @@ class FailureMemory:
                 except (json.JSONDecodeError, KeyError, ValueError):
                     continue
 
-        # Load embeddings if available
-        if self.embeddings_path.exists():
-            try:
-                with open(self.embeddings_path) as f:
-                    self._embeddings = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._embeddings = {}
-
     def _save_failure(self, failure: FailedApproach) -> None:
         """Append failure to JSONL file."""
         with open(self.failures_path, "a") as f:
             f.write(json.dumps(failure.to_dict()) + "\n")
 
-    def _save_embeddings(self) -> None:
-        """Save embeddings to JSON file."""
-        with open(self.embeddings_path, "w") as f:
-            json.dump(self._embeddings, f)
-
     def _generate_id(self, description: str, error_message: str) -> str:
         """Generate unique ID for failure."""
         content = f"{description}:{error_message}"
@@ -231,8 +211,7 @@ class FailureMemory:
             try:
                 text = failure.to_text()
                 result = await self._embedder.embed([text])
-                self._embeddings[failure.id] = result.vectors[0].tolist()
-                self._save_embeddings()
+                self._embeddings.put(failure.id, result.vectors[0])
             except Exception:
                 # Embedding generation is optional
                 pass
@@ -251,17 +230,10 @@ class FailureMemory:
         try:
             query_text = f"{description} {error_message}"
             result = await self._embedder.embed([query_text])
-            query_vec = result.vectors[0].tolist()
 
-            scores: list[tuple[str, float]] = []
-            for failure_id, failure_embedding in self._embeddings.items():
-                similarity = _cosine_similarity(query_vec, failure_embedding)
-                if similarity > 0.7:  # Threshold for similarity
-                    scores.append((failure_id, similarity))
-
-            # Sort by score and return top 3
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return [fid for fid, _ in scores[:3]]
+            # Top 3 above the similarity threshold
+            hits = self._embeddings.search(result.vectors[0], 3, threshold=0.7)
+            return [fid for fid, _ in hits]
 
         except Exception:
             return []
@@ -287,24 +259,13 @@ class FailureMemory:
         try:
             # Embed query
             result = await self._embedder.embed([proposed_approach])
-            query_vec = result.vectors[0].tolist()
-
-            # Calculate similarities
-            scores: list[tuple[FailedApproach, float]] = []
-            for failure_id, failure_embedding in self._embeddings.items():
-                if failure_id not in self._failures:
-                    continue
-
-                failure = self._failures[failure_id]
-
-                # Calculate cosine similarity
-                similarity = _cosine_similarity(query_vec, failure_embedding)
-                if similarity > 0.6:  # Threshold
-                    scores.append((failure, similarity))
 
-            # Sort by score and return top_k
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return [f for f, _ in scores[:top_k]]
+            # Vectors of failures no longer loaded must not take result slots
+            stale = {i for i in self._embeddings.ids() if i not in self._failures}
+            hits = self._embeddings.search(
+                result.vectors[0], top_k, threshold=0.6, exclude=stale
+            )
+            return [self._failures[i] for i, _ in hits]
 
         except Exception:
             # Fall back to keyword search on error
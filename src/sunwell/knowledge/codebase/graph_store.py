@@ -0,0 +1,123 @@
+"""Per-file persistence for CodebaseGraph (RFC-045).
+
+The graph is stored as one SQLite row per analyzed file plus a handful of
+graph-level metadata rows, instead of one monolithic pickle. Saving after
+an incremental scan rewrites only the files that changed, and callers can
+read content hashes (for change detection) or a subset of files without
+deserializing the whole graph.
+
+Rows hold opaque pickled blobs; :class:`CodebaseGraph` decides what goes in
+them.
+
+Storage: ``.sunwell/intelligence/codebase/graph.db``
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from sunwell.foundation.utils import SQLiteDatabase
+
+GRAPH_DB_NAME = "graph.db"
+
+LEGACY_PICKLE_NAME = "graph.pickle"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    module TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    analysis BLOB NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS graph_meta (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class CodebaseGraphStore:
+    """SQLite store of per-file analyses and graph-level metadata."""
+
+    def __init__(self, path: Path) -> None:
+        """Create a handle; the database is created on the first read or write.
+
+        Args:
+            path: Database file, usually ``<base>/codebase/graph.db``
+        """
+        self.path = path
+        self._db = SQLiteDatabase(path, SCHEMA)
+
+    @classmethod
+    def for_base_path(cls, base_path: Path) -> CodebaseGraphStore:
+        """Store for an intelligence directory."""
+        return cls(base_path / "codebase" / GRAPH_DB_NAME)
+
+    def exists(self) -> bool:
+        """Whether the database file exists."""
+        return self.path.exists()
+
+    def file_hashes(self) -> dict[Path, str]:
+        """Content hash of every stored file, without loading analyses."""
+        with self._db.connect() as conn:
+            rows = conn.execute("SELECT path, content_hash FROM files").fetchall()
+        return {Path(path): content_hash for path, content_hash in rows}
+
+    def load_files(self, paths: Iterable[Path] | None = None) -> list[bytes]:
+        """Stored analyses, in path order.
+
+        Args:
+            paths: Only load these files (default: all files)
+        """
+        with self._db.connect() as conn:
+            if paths is None:
+                rows = conn.execute("SELECT analysis FROM files ORDER BY path").fetchall()
+            else:
+                keys = sorted({str(p) for p in paths})
+                rows = [
+                    row
+                    for key in keys
+                    for row in conn.execute(
+                        "SELECT analysis FROM files WHERE path = ?", (key,)
+                    )
+                ]
+        return [blob for (blob,) in rows]
+
+    def load_meta(self) -> dict[str, bytes]:
+        """All graph-level metadata blobs."""
+        with self._db.connect() as conn:
+            rows = conn.execute("SELECT key, value FROM graph_meta").fetchall()
+        return dict(rows)
+
+    def write(
+        self,
+        files: Iterable[tuple[Path, str, str, bytes]],
+        removed: Iterable[Path] = (),
+        meta: dict[str, bytes] | None = None,
+        *,
+        replace: bool = False,
+    ) -> None:
+        """Write changes in one transaction.
+
+        Args:
+            files: ``(path, module, content_hash, analysis)`` rows to upsert
+            removed: Files to delete
+            meta: Metadata rows to replace
+            replace: Delete every stored file first (full rewrite)
+        """
+        with self._db.connect() as conn:
+            if replace:
+                conn.execute("DELETE FROM files")
+            conn.executemany(
+                "DELETE FROM files WHERE path = ?", ((str(p),) for p in removed)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (path, module, content_hash, analysis) "
+                "VALUES (?, ?, ?, ?)",
+                ((str(p), module, h, blob) for p, module, h, blob in files),
+            )
+            if meta:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO graph_meta (key, value) VALUES (?, ?)",
+                    meta.items(),
+                )
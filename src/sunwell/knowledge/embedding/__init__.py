@@ -1,19 +1,46 @@
 """Embedding and vector search for expertise retrieval."""
 
+from pathlib import Path
+
+from sunwell.knowledge.embedding.cache import (
+    CachedEmbedding,
+    EmbeddingCache,
+    EmbeddingCacheReport,
+    get_embedding_cache,
+    with_embedding_cache,
+)
 from sunwell.knowledge.embedding.index import InMemoryIndex, SearchResult
+from sunwell.knowledge.embedding.ivf import IVFIndex
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix
 from sunwell.knowledge.embedding.ollama import MODEL_DIMENSIONS, OllamaEmbedding
-from sunwell.knowledge.embedding.protocol import EmbeddingProtocol, EmbeddingResult
+from sunwell.knowledge.embedding.protocol import (
+    EmbeddingProtocol,
+    EmbeddingResult,
+    VectorIndexProtocol,
+)
 from sunwell.knowledge.embedding.simple import HashEmbedding, TFIDFEmbedding
+from sunwell.knowledge.embedding.vectors import VectorFile
 
 __all__ = [
+    "CachedEmbedding",
+    "EmbeddingCache",
+    "EmbeddingCacheReport",
     "EmbeddingProtocol",
     "EmbeddingResult",
+    "EmbeddingMatrix",
     "InMemoryIndex",
+    "IVFIndex",
     "SearchResult",
+    "VectorIndexProtocol",
     "HashEmbedding",
     "TFIDFEmbedding",
     "OllamaEmbedding",
+    "VectorFile",
     "create_embedder",
+    "create_vector_index",
+    "get_embedding_cache",
+    "load_vector_index",
+    "with_embedding_cache",
 ]
 
 
@@ -24,7 +51,8 @@ def create_embedder(
     """Create the best available embedder.
 
     Checks for local Ollama embedding models first, falls back to HashEmbedding
-    for development/testing if none available.
+    for development/testing if none available. Ollama embeddings go through
+    the shared on-disk EmbeddingCache unless ``embedding.cache_enabled`` is off.
 
     Args:
         prefer_local: If True, prefer Ollama over cloud APIs (default: True)
@@ -43,7 +71,9 @@ def create_embedder(
     if prefer_local:
         ollama_model = _detect_ollama_embedding_model()
         if ollama_model:
-            return OllamaEmbedding(model=ollama_model)
+            return with_embedding_cache(
+                OllamaEmbedding(model=ollama_model), get_embedding_cache()
+            )
 
     if fallback:
         return HashEmbedding()
@@ -79,3 +109,53 @@ def _detect_ollama_embedding_model() -> str | None:
         return None
     except Exception:
         return None
+
+
+def create_vector_index(
+    dimensions: int,
+    backend: str | None = None,
+) -> VectorIndexProtocol:
+    """Create a vector index using the configured backend.
+
+    Backends (``embedding.index_backend`` in config):
+    - "flat": InMemoryIndex, always exact
+    - "ivf": IVFIndex, approximate as soon as there is enough data to train
+    - "auto": IVFIndex that stays exact until ``embedding.ann_threshold``
+      vectors, then trains its quantizer and becomes approximate
+
+    Args:
+        dimensions: Embedding dimensions.
+        backend: Override the configured backend.
+
+    Returns:
+        An index implementing VectorIndexProtocol.
+    """
+    from sunwell.foundation.config import get_config
+
+    config = get_config().embedding
+    backend = backend or config.index_backend
+
+    if backend == "flat":
+        return InMemoryIndex(_dimensions=dimensions)
+    if backend == "ivf":
+        return IVFIndex(_dimensions=dimensions, nprobe=config.ann_nprobe)
+    if backend == "auto":
+        return IVFIndex(
+            _dimensions=dimensions,
+            nprobe=config.ann_nprobe,
+            min_train_size=config.ann_threshold,
+        )
+    raise ValueError(f"Unknown vector index backend: {backend!r}")
+
+
+def load_vector_index(path: str | Path) -> VectorIndexProtocol | None:
+    """Load a vector index saved by either backend.
+
+    Returns:
+        The loaded index, or None if nothing is saved at ``path``.
+    """
+    if IVFIndex.exists(path):
+        return IVFIndex.load(path)
+    if (Path(path) / "metadata.json").exists():
+        return InMemoryIndex.load(path)
+    return None
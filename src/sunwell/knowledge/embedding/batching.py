@@ -0,0 +1,198 @@
+"""Micro-batching of embedding requests across concurrent callers.
+
+Parallel tasks that each embed a query would otherwise send one small HTTP
+request apiece, and a large embed call would send its batches one after
+another. EmbeddingBatcher collects requests from every coroutine for a few
+milliseconds (or until enough text is queued to fill the server), packs the
+distinct texts into size-bounded batches, sends the batches concurrently up
+to the server's parallelism, and gives each caller the rows for its texts.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_WINDOW_SECONDS = 0.002
+"""How long to wait for other callers before dispatching."""
+
+EmbedBatchFn = Callable[[list[str]], Awaitable[NDArray[np.float32]]]
+"""Embeds one batch of texts with one request, returning one row per text."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Request:
+    texts: tuple[str, ...]
+    future: asyncio.Future[NDArray[np.float32]]
+
+
+def pack_batches(texts: Sequence[str], max_chars: int) -> Iterator[tuple[int, int]]:
+    """Split texts into consecutive ``[start, end)`` runs of at most ``max_chars``.
+
+    A single text longer than ``max_chars`` gets a batch of its own.
+    """
+    start = 0
+    chars = 0
+    for i, text in enumerate(texts):
+        if i > start and chars + len(text) > max_chars:
+            yield start, i
+            start, chars = i, 0
+        chars += len(text)
+    if start < len(texts):
+        yield start, len(texts)
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embed calls into shared, concurrently sent batches.
+
+    Usage:
+        batcher = EmbeddingBatcher(post_batch, max_batch_chars=4000, max_concurrent=4)
+        vectors = await batcher.embed(["query"])  # shares a request with other callers
+
+    Must be used from a single event loop.
+    """
+
+    __slots__ = (
+        "max_batch_chars",
+        "max_pending_chars",
+        "window_seconds",
+        "_embed_batch",
+        "_semaphore",
+        "_pending",
+        "_pending_chars",
+        "_flush_handle",
+        "_dispatches",
+    )
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFn,
+        *,
+        max_batch_chars: int,
+        max_concurrent: int,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+    ):
+        """Create a batcher.
+
+        Args:
+            embed_batch: Sends one batch to the embedding server
+            max_batch_chars: Character budget per request
+            max_concurrent: Requests in flight at once (server parallelism)
+            window_seconds: How long the first queued request waits for company
+        """
+        self._embed_batch = embed_batch
+        self.max_batch_chars = max_batch_chars
+        self.window_seconds = window_seconds
+        # Dispatch without waiting once there is enough text to fill every slot
+        self.max_pending_chars = max_batch_chars * max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pending: list[_Request] = []
+        self._pending_chars = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """Embed texts together with whatever other callers queued meanwhile.
+
+        Returns:
+            One row per text, in order
+        """
+        loop = asyncio.get_running_loop()
+        request = _Request(tuple(texts), loop.create_future())
+        self._pending.append(request)
+        self._pending_chars += sum(len(t) for t in request.texts)
+
+        if self._pending_chars >= self.max_pending_chars:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await request.future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        requests, self._pending, self._pending_chars = self._pending, [], 0
+        if requests:
+            task = asyncio.ensure_future(self._dispatch(requests))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _send(self, texts: list[str]) -> NDArray[np.float32]:
+        async with self._semaphore:
+            return await self._embed_batch(texts)
+
+    async def _dispatch(self, requests: list[_Request]) -> None:
+        try:
+            # Identical texts from different callers are embedded once
+            rows: dict[str, int] = {}
+            for request in requests:
+                for text in request.texts:
+                    rows.setdefault(text, len(rows))
+            unique = list(rows)
+
+            spans = list(pack_batches(unique, self.max_batch_chars))
+            results = await asyncio.gather(
+                *(self._send(unique[start:end]) for start, end in spans),
+                return_exceptions=True,
+            )
+            vectors = _assemble(len(unique), spans, results)
+
+            for request in requests:
+                if request.future.done():
+                    continue  # Caller went away
+                positions = [rows[t] for t in request.texts]
+                error = _first_error(positions, spans, results)
+                if error is None:
+                    request.future.set_result(vectors[positions])
+                elif isinstance(error, asyncio.CancelledError):
+                    request.future.cancel()
+                else:
+                    request.future.set_exception(error)
+        except BaseException:
+            for request in requests:
+                if not request.future.done():
+                    request.future.cancel()
+            raise
+
+    async def aclose(self) -> None:
+        """Cancel queued and in-flight requests."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for request in self._pending:
+            request.future.cancel()
+        self._pending, self._pending_chars = [], 0
+        tasks = list(self._dispatches)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _assemble(
+    count: int,
+    spans: list[tuple[int, int]],
+    results: list[NDArray[np.float32] | BaseException],
+) -> NDArray[np.float32]:
+    """Stack successful batch results into one matrix (failed rows stay zero)."""
+    dims = next((r.shape[1] for r in results if not isinstance(r, BaseException)), 0)
+    vectors = np.zeros((count, dims), dtype=np.float32)
+    for (start, end), result in zip(spans, results, strict=True):
+        if not isinstance(result, BaseException):
+            vectors[start:end] = result
+    return vectors
+
+
+def _first_error(
+    positions: list[int],
+    spans: list[tuple[int, int]],
+    results: list[NDArray[np.float32] | BaseException],
+) -> BaseException | None:
+    """The error of the first failed batch holding any of ``positions``."""
+    for (start, end), result in zip(spans, results, strict=True):
+        if isinstance(result, BaseException) and any(start <= p < end for p in positions):
+            return result
+    return None
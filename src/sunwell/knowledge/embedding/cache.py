@@ -0,0 +1,439 @@
+"""Persistent, content-addressed embedding cache.
+
+Embedding the same text twice gives the same vector, yet indexing, memory
+and tool selection re-embed identical strings on every run. EmbeddingCache
+stores float32 vectors keyed by (model, hash of normalized text) in a
+WAL-mode SQLite database that any number of processes can read at once.
+When the stored vectors exceed ``max_bytes``, the least recently used ones
+are evicted. Lookups only read: their hit counters and LRU refreshes are
+buffered and written together every few seconds.
+
+CachedEmbedding wraps any EmbeddingProtocol. A batch is looked up in one
+query and only the misses are sent to the wrapped embedder.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sunwell.foundation.utils import SQLiteDatabase
+from sunwell.knowledge.embedding.protocol import EmbeddingProtocol, EmbeddingResult
+
+KEY_VERSION = 1
+"""Bump when text normalization changes."""
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+"""Evict least recently used vectors above this total size."""
+
+_EVICT_TARGET = 0.9
+"""Evict down to this fraction of ``max_bytes`` so eviction isn't run on every put."""
+
+_TOUCH_INTERVAL = 60.0
+"""Seconds before a hit refreshes an entry's LRU position again (saves writes)."""
+
+_FLUSH_INTERVAL = 5.0
+"""Seconds lookup counters and LRU refreshes are buffered before being written."""
+
+_FLUSH_KEYS = 1000
+"""Buffered LRU refreshes that trigger a write before ``_FLUSH_INTERVAL``."""
+
+_SQL_BATCH = 500
+"""Keys per IN (...) query, below SQLite's bound-parameter limit."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    key TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (model, key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings(accessed_at);
+
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO cache_meta (key, value) VALUES
+    ('total_bytes', 0), ('hits', 0), ('misses', 0), ('bytes_saved', 0);
+
+CREATE TRIGGER IF NOT EXISTS embeddings_insert AFTER INSERT ON embeddings BEGIN
+    UPDATE cache_meta SET value = value + length(NEW.vector) WHERE key = 'total_bytes';
+END;
+
+CREATE TRIGGER IF NOT EXISTS embeddings_delete AFTER DELETE ON embeddings BEGIN
+    UPDATE cache_meta SET value = value - length(OLD.vector) WHERE key = 'total_bytes';
+END;
+"""
+
+
+def text_key(text: str) -> str:
+    """Content hash of a text after Unicode and whitespace-edge normalization."""
+    normalized = unicodedata.normalize("NFC", text).strip()
+    return hashlib.sha256(f"{KEY_VERSION}\0{normalized}".encode()).hexdigest()
+
+
+def _default_model_id(embedder: EmbeddingProtocol) -> str:
+    model = getattr(embedder, "model", None)
+    name = type(embedder).__name__
+    return f"{name}/{model}" if model else name
+
+
+@dataclass(slots=True)
+class EmbeddingCacheStats:
+    """Lookup statistics for one EmbeddingCache instance (this process only)."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    """Vector bytes served from the cache instead of the embedder."""
+
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Hits as a fraction of lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class _PendingLookups:
+    """Lookup side effects not yet written to the database."""
+
+    touched: dict[str, set[str]] = field(default_factory=dict)
+    """Keys hit per model, whose LRU position needs refreshing."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    since: float = field(default_factory=time.time)
+
+    @property
+    def touched_count(self) -> int:
+        return sum(len(keys) for keys in self.touched.values())
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingCacheReport:
+    """Lifetime totals for a cache file, across every process that used it."""
+
+    path: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    bytes_saved: int
+    models: Mapping[str, int]
+    """Entry count per embedding model."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Hits as a fraction of lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON-friendly representation."""
+        return {
+            "path": str(self.path),
+            "entries": self.entries,
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "bytes_saved": self.bytes_saved,
+            "models": dict(self.models),
+        }
+
+
+@dataclass(slots=True)
+class EmbeddingCache:
+    """Persistent store of embedding vectors shared across processes.
+
+    Usage:
+        cache = EmbeddingCache()  # ~/.sunwell/cache/embeddings.db
+        embedder = CachedEmbedding(OllamaEmbedding(), cache)
+    """
+
+    path: Path = field(
+        default_factory=lambda: Path.home() / ".sunwell" / "cache" / "embeddings.db"
+    )
+    """SQLite database shared by every process using this path."""
+
+    max_bytes: int = DEFAULT_MAX_BYTES
+    """Total vector size above which LRU entries are evicted."""
+
+    stats: EmbeddingCacheStats = field(default_factory=EmbeddingCacheStats)
+
+    _db: SQLiteDatabase = field(init=False, repr=False)
+    _pending: _PendingLookups = field(default_factory=_PendingLookups, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._db = SQLiteDatabase(self.path, SCHEMA)
+
+    def get_many(self, model: str, keys: Sequence[str]) -> dict[str, NDArray[np.float32]]:
+        """Look up vectors.
+
+        The lookup only reads. Hit/miss counters and the LRU refresh of hits
+        are buffered and written by a later lookup, :meth:`put_many`,
+        :meth:`report` or :meth:`flush`.
+
+        Args:
+            model: Embedding model id
+            keys: Text keys (see :func:`text_key`)
+
+        Returns:
+            Vectors for the keys that were found
+        """
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, NDArray[np.float32]] = {}
+        with self._db.connect() as conn:
+            for start in range(0, len(unique), _SQL_BATCH):
+                batch = unique[start : start + _SQL_BATCH]
+                marks = ",".join("?" * len(batch))
+                for key, blob in conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({marks})",
+                    (model, *batch),
+                ):
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+
+        saved = sum(v.nbytes for v in found.values())
+        with self._lock:
+            pending = self._pending
+            pending.touched.setdefault(model, set()).update(found)
+            pending.hits += len(found)
+            pending.misses += len(unique) - len(found)
+            pending.bytes_saved += saved
+            due = (
+                pending.touched_count >= _FLUSH_KEYS
+                or time.time() - pending.since >= _FLUSH_INTERVAL
+            )
+        if due:
+            self.flush()
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(unique) - len(found)
+        self.stats.bytes_saved += saved
+        return found
+
+    def flush(self) -> None:
+        """Write buffered lookup counters and LRU refreshes."""
+        with self._db.connect() as conn:
+            self._flush(conn)
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, _PendingLookups()
+        if not (pending.hits or pending.misses):
+            return
+
+        now = time.time()
+        for model, touched in pending.touched.items():
+            keys = list(touched)
+            for start in range(0, len(keys), _SQL_BATCH):
+                batch = keys[start : start + _SQL_BATCH]
+                marks = ",".join("?" * len(batch))
+                conn.execute(
+                    f"UPDATE embeddings SET accessed_at = ? "
+                    f"WHERE model = ? AND key IN ({marks}) AND accessed_at < ?",
+                    (now, model, *batch, now - _TOUCH_INTERVAL),
+                )
+        conn.executemany(
+            "UPDATE cache_meta SET value = value + ? WHERE key = ?",
+            (
+                (pending.hits, "hits"),
+                (pending.misses, "misses"),
+                (pending.bytes_saved, "bytes_saved"),
+            ),
+        )
+
+    def put_many(self, model: str, vectors: Mapping[str, NDArray[np.float32]]) -> None:
+        """Store vectors, evicting LRU entries if over budget.
+
+        Args:
+            model: Embedding model id
+            vectors: Vector per text key
+        """
+        if not vectors:
+            return
+        now = time.time()
+        rows = [
+            (model, key, np.ascontiguousarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in vectors.items()
+        ]
+        with self._db.connect() as conn:
+            # Refresh LRU positions first so eviction sees recent hits
+            self._flush(conn)
+            conn.executemany(
+                "DELETE FROM embeddings WHERE model = ? AND key = ?",
+                [(model, key) for key in vectors],
+            )
+            conn.executemany(
+                "INSERT INTO embeddings (model, key, vector, accessed_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if self._meta(conn, "total_bytes") > self.max_bytes:
+                self.stats.evictions += self._evict(conn)
+        self.stats.stores += len(rows)
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> int:
+        row = conn.execute("SELECT value FROM cache_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Drop LRU entries until under the target size."""
+        excess = self._meta(conn, "total_bytes") - int(self.max_bytes * _EVICT_TARGET)
+        rows: list[tuple[str, str]] = []
+        # Walk the LRU index only as far as needed to cover the excess
+        for model, key, size in conn.execute(
+            "SELECT model, key, length(vector) FROM embeddings ORDER BY accessed_at"
+        ):
+            if excess <= 0:
+                break
+            rows.append((model, key))
+            excess -= size
+        conn.executemany("DELETE FROM embeddings WHERE model = ? AND key = ?", rows)
+        return len(rows)
+
+    def report(self) -> EmbeddingCacheReport:
+        """Lifetime hit rate, bytes saved and size of this cache file."""
+        with self._db.connect() as conn:
+            self._flush(conn)
+            models = dict(
+                conn.execute("SELECT model, COUNT(*) FROM embeddings GROUP BY model")
+            )
+            return EmbeddingCacheReport(
+                path=self.path,
+                entries=sum(models.values()),
+                total_bytes=self._meta(conn, "total_bytes"),
+                max_bytes=self.max_bytes,
+                hits=self._meta(conn, "hits"),
+                misses=self._meta(conn, "misses"),
+                bytes_saved=self._meta(conn, "bytes_saved"),
+                models=models,
+            )
+
+    def clear(self) -> None:
+        """Remove every entry and reset the lifetime counters."""
+        with self._lock:
+            self._pending = _PendingLookups()
+        with self._db.connect() as conn:
+            conn.execute("DELETE FROM embeddings")
+            conn.execute(
+                "UPDATE cache_meta SET value = 0 WHERE key IN ('hits', 'misses', 'bytes_saved')"
+            )
+
+    def __len__(self) -> int:
+        with self._db.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+@dataclass(slots=True)
+class CachedEmbedding:
+    """Wraps an embedder so previously seen texts are served from an EmbeddingCache.
+
+    Implements EmbeddingProtocol. Only deterministic embedders should be
+    wrapped: TFIDFEmbedding builds its vocabulary from each batch, so its
+    vectors depend on the other texts.
+
+    Usage:
+        embedder = CachedEmbedding(OllamaEmbedding(model="all-minilm"), EmbeddingCache())
+        result = await embedder.embed(texts)  # only unseen texts reach Ollama
+    """
+
+    inner: EmbeddingProtocol
+    cache: EmbeddingCache
+    model_id: str = ""
+    """Cache namespace; defaults to the embedder class and its ``model``."""
+
+    def __post_init__(self) -> None:
+        if not self.model_id:
+            self.model_id = _default_model_id(self.inner)
+
+    @property
+    def dimensions(self) -> int:
+        """Delegate to inner embedder."""
+        return self.inner.dimensions
+
+    async def embed(self, texts: Sequence[str]) -> EmbeddingResult:
+        """Embed texts, sending only cache misses to the inner embedder."""
+        if not texts:
+            return await self.inner.embed(texts)
+
+        keys = [text_key(t) for t in texts]
+        vectors = await asyncio.to_thread(self.cache.get_many, self.model_id, keys)
+
+        # Each distinct missing text is embedded once, even if repeated in the batch
+        missing = {k: t for k, t in zip(keys, texts, strict=True) if k not in vectors}
+        if missing:
+            result = await self.inner.embed(list(missing.values()))
+            embedded = dict(zip(missing, result.vectors, strict=True))
+            await asyncio.to_thread(self.cache.put_many, self.model_id, embedded)
+            vectors.update(embedded)
+
+        stacked = np.stack([vectors[k] for k in keys]).astype(np.float32, copy=False)
+        return EmbeddingResult(
+            vectors=stacked,
+            model=self.model_id,
+            dimensions=stacked.shape[1],
+        )
+
+    async def embed_single(self, text: str) -> NDArray[np.float32]:
+        """Embed a single text. Convenience method."""
+        result = await self.embed([text])
+        return result.vectors[0]
+
+    async def close(self) -> None:
+        """Write buffered cache statistics and close the inner embedder."""
+        await asyncio.to_thread(self.cache.flush)
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            await close()
+
+
+_default_cache: EmbeddingCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """The process-wide cache from ``embedding.cache_*`` config, or None if disabled."""
+    global _default_cache
+    from sunwell.foundation.config import get_config
+
+    config = get_config().embedding
+    if not config.cache_enabled:
+        return None
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = EmbeddingCache(
+                    path=Path(config.cache_path).expanduser(),
+                    max_bytes=config.cache_max_mb * 1024 * 1024,
+                )
+    return _default_cache
+
+
+def with_embedding_cache(
+    embedder: EmbeddingProtocol,
+    cache: EmbeddingCache | None,
+) -> EmbeddingProtocol:
+    """Wrap ``embedder`` in a CachedEmbedding when a cache is given."""
+    if cache is None or isinstance(embedder, CachedEmbedding):
+        return embedder
+    return CachedEmbedding(embedder, cache)
@@ -8,6 +8,7 @@ from pathlib import Path
 import numpy as np
 from numpy.typing import NDArray
 
+from sunwell.knowledge.embedding.matrix import top_k_indices
 from sunwell.knowledge.embedding.protocol import SearchResult
 
 
@@ -20,10 +21,13 @@ class InMemoryIndex:
     - Small lenses (< 1000 components)
     - Scenarios where persistence isn't critical
 
-    For production with larger lenses, consider FAISS.
+    For larger corpora, use IVFIndex (or create_vector_index(), which switches
+    to it past the configured ann_threshold).
 
     Performance notes:
     - Vectors stored in list, materialized to array lazily on search (O(n) add, not O(n²))
+    - Rows normalized once per materialization, not on every search
+    - Top-k via argpartition (O(n)) instead of a full argsort
     - O(1) id lookups via _id_to_idx mapping
     """
 
@@ -33,6 +37,8 @@ class InMemoryIndex:
     _vectors_list: list[NDArray[np.float32]] = field(default_factory=list, init=False)
     # Materialized array (built lazily on search)
     _vectors_array: NDArray[np.float32] | None = field(default=None, init=False)
+    # Row-normalized copy of _vectors_array used for cosine search
+    _normalized: NDArray[np.float32] | None = field(default=None, init=False)
     # Dirty flag for lazy materialization
     _dirty: bool = field(default=False, init=False)
     # Core data
@@ -57,6 +63,7 @@ class InMemoryIndex:
             self._vectors_array = np.vstack(self._vectors_list)
         else:
             self._vectors_array = None
+        self._normalized = None
         self._dirty = False
 
     def add(
@@ -109,25 +116,23 @@ class InMemoryIndex:
         if self._vectors_array is None:
             return []
 
-        # Normalize for cosine similarity
+        # Normalize stored rows once (cached until the next mutation)
+        if self._normalized is None:
+            norms = np.linalg.norm(self._vectors_array, axis=1, keepdims=True) + 1e-10
+            self._normalized = (self._vectors_array / norms).astype(np.float32, copy=False)
         query_norm = query_vector / (np.linalg.norm(query_vector) + 1e-10)
-        norms = np.linalg.norm(self._vectors_array, axis=1, keepdims=True) + 1e-10
-        vectors_norm = self._vectors_array / norms
 
         # Compute similarities
-        similarities = np.dot(vectors_norm, query_norm)
+        similarities = np.dot(self._normalized, query_norm)
 
         # Get top-k indices
         if threshold is not None:
-            mask = similarities >= threshold
-            indices = np.where(mask)[0]
+            indices = np.where(similarities >= threshold)[0]
             if len(indices) == 0:
                 return []
-            # Sort by similarity descending, take top_k
-            sorted_idx = np.argsort(similarities[indices])[::-1][:top_k]
-            indices = indices[sorted_idx]
+            indices = indices[top_k_indices(similarities[indices], top_k)]
         else:
-            indices = np.argsort(similarities)[::-1][:top_k]
+            indices = top_k_indices(similarities, top_k)
 
         return [
             SearchResult(
@@ -157,6 +162,7 @@ class InMemoryIndex:
         self._materialize()
         if self._vectors_array is not None:
             self._vectors_array = np.delete(self._vectors_array, idx, axis=0)
+            self._normalized = None
             if len(self._vectors_array) == 0:
                 self._vectors_array = None
             # Rebuild vectors_list from array
@@ -171,6 +177,7 @@ class InMemoryIndex:
     def clear(self) -> None:
         """Remove all vectors from the index."""
         self._vectors_array = None
+        self._normalized = None
         self._vectors_list.clear()
         self._dirty = False
         self._ids.clear()
@@ -0,0 +1,402 @@
+"""Approximate nearest-neighbour vector index (IVF-Flat) in pure NumPy.
+
+An inverted-file index partitions vectors into ``nlist`` clusters with
+spherical k-means. A query scores the cluster centroids, then only the
+vectors in the ``nprobe`` closest clusters. ``nprobe`` is the
+recall/latency knob: ``nprobe == nlist`` is an exact search.
+
+Lifecycle:
+- Below ``min_train_size`` vectors the index is untrained and searches
+  exactly, so small corpora pay nothing for approximation
+- Once the corpus reaches ``min_train_size`` the quantizer trains on a
+  sample; new vectors are assigned to their nearest list incrementally
+- When the corpus grows ``retrain_factor``× past its training size the
+  quantizer retrains so lists stay balanced
+- Deletes are tombstones; once they exceed ``compact_ratio`` of the rows
+  the storage is compacted and lists are rebuilt
+
+Storage is an EmbeddingMatrix, so it can also be layered over a matrix owned
+by someone else (see CodebaseIndex) via :meth:`IVFIndex.over`.
+"""
+
+import json
+import math
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix, normalize_rows, top_k_indices
+from sunwell.knowledge.embedding.protocol import SearchResult
+
+# Rows per block when assigning vectors to lists (bounds temp memory)
+_ASSIGN_BLOCK = 8192
+# Training sample size per list (k-means cost is sample × nlist × dims)
+_TRAIN_POINTS_PER_LIST = 40
+_KMEANS_ITERATIONS = 8
+_META_FILE = "ivf.json"
+
+
+def _nearest_centroid(
+    vectors: NDArray[np.float32],
+    centroids: NDArray[np.float32],
+) -> NDArray[np.int32]:
+    """Index of the most similar centroid for each (normalized) row."""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_BLOCK):
+        block = vectors[start : start + _ASSIGN_BLOCK]
+        out[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def spherical_kmeans(
+    vectors: NDArray[np.float32],
+    k: int,
+    *,
+    iterations: int = _KMEANS_ITERATIONS,
+    seed: int = 0,
+) -> NDArray[np.float32]:
+    """Cluster unit vectors by cosine similarity.
+
+    Empty clusters are re-seeded from random points each iteration.
+
+    Returns:
+        A (k, dims) array of unit-length centroids.
+    """
+    rng = np.random.default_rng(seed)
+    k = min(k, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = _nearest_centroid(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        empty = np.bincount(assign, minlength=k) == 0
+        if empty.any():
+            sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()))]
+        centroids = normalize_rows(sums)
+    return centroids
+
+
+@dataclass(slots=True)
+class IVFIndex:
+    """Inverted-file approximate nearest-neighbour index.
+
+    Implements VectorIndexProtocol. Scores are cosine similarities.
+
+    Example:
+        >>> index = IVFIndex(_dimensions=384, nprobe=8)
+        >>> index.add_batch(ids, vectors)
+        >>> index.search(query, top_k=10)
+    """
+
+    _dimensions: int
+
+    nprobe: int = 8
+    """Lists scanned per query. Higher = better recall, slower."""
+
+    nlist: int | None = None
+    """Number of lists. None = ~sqrt(corpus size) at training time."""
+
+    min_train_size: int = 1024
+    """Below this many vectors, search is exact and no quantizer is trained."""
+
+    retrain_factor: float = 4.0
+    """Retrain once the corpus is this many times the training size."""
+
+    compact_ratio: float = 0.25
+    """Compact storage once this fraction of rows are tombstones."""
+
+    seed: int = 0
+
+    _vectors: EmbeddingMatrix = field(init=False, repr=False)
+    _metadata: dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+    _centroids: NDArray[np.float32] | None = field(default=None, init=False, repr=False)
+    _lists: list[list[int]] = field(default_factory=list, init=False, repr=False)
+    _list_arrays: dict[int, NDArray[np.intp]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _row_list: list[int] = field(default_factory=list, init=False, repr=False)
+    _stale_rows: set[int] = field(default_factory=set, init=False, repr=False)
+    _synced_generation: int = field(default=-1, init=False, repr=False)
+    _trained_size: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._vectors = EmbeddingMatrix(dimensions=self._dimensions)
+
+    @classmethod
+    def over(
+        cls,
+        vectors: EmbeddingMatrix,
+        *,
+        centroids: NDArray[np.float32] | None = None,
+        **kwargs: object,
+    ) -> IVFIndex:
+        """Build an index over an existing matrix without copying it.
+
+        The owner may keep adding, discarding and compacting rows; the index
+        catches up on the next search. A previously trained quantizer can be
+        passed in to skip k-means.
+        """
+        index = cls(_dimensions=vectors.dimensions, **kwargs)  # type: ignore[arg-type]
+        index._vectors = vectors
+        if centroids is not None:
+            index._set_centroids(np.asarray(centroids, dtype=np.float32))
+            index._trained_size = vectors.count
+        return index
+
+    # ── VectorIndexProtocol ──────────────────────────────────────────────────
+
+    @property
+    def dimensions(self) -> int:
+        return self._vectors.dimensions or self._dimensions
+
+    @property
+    def count(self) -> int:
+        return self._vectors.count
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether searches are approximate (quantizer trained)."""
+        return self._centroids is not None
+
+    @property
+    def centroids(self) -> NDArray[np.float32] | None:
+        """Trained quantizer centroids (None while searching exactly)."""
+        return self._centroids
+
+    def add(
+        self,
+        id: str,
+        vector: NDArray[np.float32],
+        metadata: dict | None = None,
+    ) -> None:
+        """Add (or replace) a single vector."""
+        self.add_batch([id], np.asarray(vector).reshape(1, -1), [metadata or {}])
+
+    def add_batch(
+        self,
+        ids: Sequence[str],
+        vectors: NDArray[np.float32],
+        metadata: Sequence[dict] | None = None,
+    ) -> None:
+        """Add (or replace) many vectors. Assignment to lists is deferred."""
+        if vectors.shape[1] != self.dimensions:
+            raise ValueError(f"Expected {self.dimensions} dims, got {vectors.shape[1]}")
+        if self._centroids is not None:
+            for id_ in ids:
+                row = self._vectors.row_of(id_)
+                if row is not None:
+                    self._stale_rows.add(row)
+        self._vectors.add_batch(ids, vectors)
+        for i, id_ in enumerate(ids):
+            self._metadata[id_] = metadata[i] if metadata else {}
+
+    def search(
+        self,
+        query_vector: NDArray[np.float32],
+        top_k: int = 5,
+        threshold: float | None = None,
+        *,
+        nprobe: int | None = None,
+    ) -> list[SearchResult]:
+        """Approximate top-k search by cosine similarity."""
+        return [
+            SearchResult(id=id_, score=score, metadata=self._metadata.get(id_, {}))
+            for id_, score in self.search_ids(query_vector, top_k, threshold, nprobe=nprobe)
+        ]
+
+    def delete(self, id: str) -> bool:
+        """Tombstone a vector; compacts once tombstones pass compact_ratio."""
+        if not self._vectors.discard(id):
+            return False
+        self._metadata.pop(id, None)
+        if self._vectors.tombstones > self.compact_ratio * max(self._vectors.size, 1):
+            self._vectors.compact()
+        return True
+
+    def clear(self) -> None:
+        """Remove all vectors and the trained quantizer."""
+        self._vectors.clear()
+        self._metadata.clear()
+        self._centroids = None
+        self._lists = []
+        self._list_arrays.clear()
+        self._row_list = []
+        self._stale_rows.clear()
+        self._trained_size = 0
+        self._synced_generation = self._vectors.generation
+
+    # ── Search ───────────────────────────────────────────────────────────────
+
+    def search_ids(
+        self,
+        query_vector: NDArray[np.floating] | Sequence[float],
+        top_k: int = 5,
+        threshold: float | None = None,
+        *,
+        nprobe: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Top-k (id, score) pairs without building SearchResult objects."""
+        self._sync()
+        if self._centroids is None:
+            return self._vectors.search(query_vector, top_k, threshold)
+
+        query = normalize_rows(query_vector)[0]
+        probes = top_k_indices(self._centroids @ query, nprobe or self.nprobe)
+        rows = np.concatenate([self._list_array(int(p)) for p in probes])
+        if rows.size == 0:
+            return []
+
+        sims = self._vectors.take(rows) @ query
+        # Tombstones score 0.0; over-fetch so they cannot crowd out live rows
+        fetch = top_k + min(self._vectors.tombstones, rows.size)
+        results: list[tuple[str, float]] = []
+        for i in top_k_indices(sims, fetch):
+            score = float(sims[i])
+            if threshold is not None and score < threshold:
+                break
+            id_ = self._vectors.id_at(int(rows[i]))
+            if id_ is not None:
+                results.append((id_, score))
+                if len(results) >= top_k:
+                    break
+        return results
+
+    # ── Quantizer maintenance ────────────────────────────────────────────────
+
+    def train(self) -> None:
+        """(Re)train the quantizer on a sample of the current vectors."""
+        self._vectors.compact()
+        data = self._vectors.matrix
+        n = len(data)
+        if n == 0:
+            return
+        nlist = self.nlist or int(math.sqrt(n))
+        nlist = max(1, min(nlist, n))
+        sample_size = min(n, nlist * _TRAIN_POINTS_PER_LIST)
+        rng = np.random.default_rng(self.seed)
+        sample = data[rng.choice(n, size=sample_size, replace=False)]
+        self._set_centroids(spherical_kmeans(sample, nlist, seed=self.seed))
+        self._trained_size = n
+
+    def _set_centroids(self, centroids: NDArray[np.float32]) -> None:
+        self._centroids = centroids
+        self._lists = [[] for _ in range(len(centroids))]
+        self._list_arrays.clear()
+        self._row_list = []
+        self._stale_rows.clear()
+        self._synced_generation = self._vectors.generation
+        self._assign_new_rows()
+
+    def _sync(self) -> None:
+        """Bring lists up to date with the underlying matrix."""
+        count = self._vectors.count
+        if self._centroids is None:
+            if count >= self.min_train_size:
+                self.train()
+            return
+        if count > self.retrain_factor * max(self._trained_size, 1):
+            self.train()
+            return
+        if self._vectors.generation != self._synced_generation:
+            # Rows were renumbered (compaction): reassign everything
+            self._set_centroids(self._centroids)
+            return
+        if self._stale_rows:
+            self._reassign_stale()
+        self._assign_new_rows()
+
+    def _assign_new_rows(self) -> None:
+        assert self._centroids is not None
+        start = len(self._row_list)
+        end = self._vectors.size
+        if end <= start:
+            return
+        rows = np.arange(start, end, dtype=np.intp)
+        assign = _nearest_centroid(self._vectors.take(rows), self._centroids)
+        self._row_list.extend(assign.tolist())
+        for row, lst in zip(rows.tolist(), assign.tolist(), strict=True):
+            self._lists[lst].append(row)
+            self._list_arrays.pop(lst, None)
+
+    def _reassign_stale(self) -> None:
+        assert self._centroids is not None
+        rows = np.fromiter(sorted(self._stale_rows), dtype=np.intp)
+        self._stale_rows.clear()
+        assign = _nearest_centroid(self._vectors.take(rows), self._centroids)
+        for row, new in zip(rows.tolist(), assign.tolist(), strict=True):
+            old = self._row_list[row]
+            if old == new:
+                continue
+            self._lists[old].remove(row)
+            self._lists[new].append(row)
+            self._row_list[row] = new
+            self._list_arrays.pop(old, None)
+            self._list_arrays.pop(new, None)
+
+    def _list_array(self, lst: int) -> NDArray[np.intp]:
+        arr = self._list_arrays.get(lst)
+        if arr is None:
+            arr = np.asarray(self._lists[lst], dtype=np.intp)
+            self._list_arrays[lst] = arr
+        return arr
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self, path: str | Path) -> None:
+        """Persist vectors, quantizer and metadata to a directory."""
+        p = Path(path)
+        p.mkdir(parents=True, exist_ok=True)
+        self._vectors.save(p / "vectors.npy")
+        if self._centroids is not None:
+            np.save(p / "centroids.npy", self._centroids)
+        else:
+            # A stale quantizer would otherwise be loaded onto the untrained index
+            (p / "centroids.npy").unlink(missing_ok=True)
+        meta = {
+            "dims": self.dimensions,
+            "nprobe": self.nprobe,
+            "nlist": self.nlist,
+            "min_train_size": self.min_train_size,
+            "retrain_factor": self.retrain_factor,
+            "compact_ratio": self.compact_ratio,
+            "seed": self.seed,
+            "trained_size": self._trained_size,
+            "metadata": self._metadata,
+        }
+        tmp = p / f"{_META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, p / _META_FILE)
+
+    @classmethod
+    def load(cls, path: str | Path) -> IVFIndex:
+        """Load an index written by :meth:`save` (vectors are memory-mapped)."""
+        p = Path(path)
+        meta = json.loads((p / _META_FILE).read_text(encoding="utf-8"))
+        index = cls(
+            _dimensions=meta["dims"],
+            nprobe=meta["nprobe"],
+            nlist=meta["nlist"],
+            min_train_size=meta["min_train_size"],
+            # Missing from indexes saved before these were persisted
+            **{
+                name: meta[name]
+                for name in ("retrain_factor", "compact_ratio", "seed")
+                if name in meta
+            },
+        )
+        index._vectors = EmbeddingMatrix.load(p / "vectors.npy")
+        index._metadata = meta["metadata"]
+        centroids_path = p / "centroids.npy"
+        if centroids_path.exists():
+            index._set_centroids(np.load(centroids_path))
+            index._trained_size = meta["trained_size"]
+        return index
+
+    @staticmethod
+    def exists(path: str | Path) -> bool:
+        """Whether an IVF index has been saved at ``path``."""
+        return (Path(path) / _META_FILE).exists()
@@ -0,0 +1,405 @@
+"""Contiguous float32 embedding matrix with memory-mapped persistence.
+
+Stores L2-normalized vectors as rows of a single float32 array so that
+cosine similarity against every stored vector is one matrix-vector product.
+
+Performance notes:
+- Rows are normalized once on insert, never on query
+- Capacity grows geometrically (amortized O(1) append)
+- Deletes are tombstones (O(1)); compaction happens on save or on demand
+- Top-k uses argpartition (O(n)) and only sorts the k winners
+- Saved matrices are plain .npy files loaded with mmap_mode="r", so startup
+  maps the file instead of decoding it; the first mutation copies into RAM
+- Row views (EmbeddingRowView) let objects that expect a per-item vector
+  share the matrix instead of holding their own boxed floats
+"""
+
+import json
+import os
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+_EPS = 1e-10
+_MIN_CAPACITY = 64
+
+
+def normalize_rows(vectors: NDArray[np.floating] | Sequence[float]) -> NDArray[np.float32]:
+    """L2-normalize vectors row-wise as float32.
+
+    Zero vectors stay zero (their similarity to anything is 0.0).
+
+    Args:
+        vectors: A single vector (1-D) or a batch of vectors (2-D).
+
+    Returns:
+        A 2-D float32 array of unit-length rows.
+    """
+    arr = np.asarray(vectors, dtype=np.float32)
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    return arr / np.maximum(norms, _EPS)
+
+
+def top_k_indices(scores: NDArray[np.floating], k: int) -> NDArray[np.intp]:
+    """Indices of the k highest scores, best first.
+
+    Uses argpartition so only the k winners are sorted: O(n + k log k).
+    """
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(scores, n - k)[n - k:] if k < n else np.arange(n)
+    order = np.argsort(-scores[candidates], kind="stable")
+    return candidates[order]
+
+
+class EmbeddingRowView(Sequence[float]):
+    """Read-only, lazily resolved view of one row of an :class:`EmbeddingMatrix`.
+
+    Stands in for a ``tuple[float, ...]`` embedding without boxing every
+    float: the row is looked up by id on each access, so it stays valid
+    across compaction and reflects the vector currently stored for the id.
+    A view whose id has been discarded is empty (and therefore falsy).
+    """
+
+    __slots__ = ("_matrix", "_id")
+
+    def __init__(self, matrix: EmbeddingMatrix, id: str) -> None:
+        self._matrix = matrix
+        self._id = id
+
+    def _row(self) -> NDArray[np.float32]:
+        row = self._matrix.get(self._id)
+        return row if row is not None else np.zeros(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._matrix.dimensions if self._id in self._matrix else 0
+
+    def __getitem__(self, index):  # type: ignore[override]
+        item = self._row()[index]
+        return float(item) if np.ndim(item) == 0 else tuple(item.tolist())
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._row().tolist())
+
+    def __array__(self, dtype=None, copy=None) -> NDArray[np.float32]:
+        row = self._row()
+        return row if dtype is None else row.astype(dtype, copy=False)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EmbeddingRowView):
+            return self._matrix is other._matrix and self._id == other._id
+        if isinstance(other, (tuple, list)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._matrix), self._id))
+
+    def __repr__(self) -> str:
+        return f"EmbeddingRowView(id={self._id!r}, dims={len(self)})"
+
+
+def _ids_path(path: Path) -> Path:
+    """Sidecar path holding the row → id mapping for a saved matrix."""
+    return path.with_name(path.name + ".ids.json")
+
+
+@dataclass(slots=True)
+class EmbeddingMatrix:
+    """Id-addressed, pre-normalized float32 embedding rows.
+
+    Example:
+        >>> m = EmbeddingMatrix(dimensions=3)
+        >>> m.add("a", np.array([1.0, 0.0, 0.0]))
+        >>> m.search(np.array([1.0, 0.0, 0.0]), top_k=1)
+        [('a', 1.0)]
+    """
+
+    dimensions: int = 0
+    """Vector width. 0 means "infer from the first vector added"."""
+
+    _data: NDArray[np.float32] | None = field(default=None, init=False, repr=False)
+    _size: int = field(default=0, init=False)
+    _row_ids: list[str | None] = field(default_factory=list, init=False, repr=False)
+    _id_to_row: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+
+    # ── Introspection ────────────────────────────────────────────────────────
+
+    @property
+    def count(self) -> int:
+        """Number of live vectors."""
+        return len(self._id_to_row)
+
+    @property
+    def size(self) -> int:
+        """Number of occupied rows, including tombstones."""
+        return self._size
+
+    @property
+    def generation(self) -> int:
+        """Incremented whenever row numbers change (compaction or clear)."""
+        return self._generation
+
+    @property
+    def tombstones(self) -> int:
+        """Number of deleted rows still occupying space."""
+        return self._size - len(self._id_to_row)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the occupied part of the matrix."""
+        return self._size * self.dimensions * 4
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._id_to_row
+
+    def ids(self) -> Iterator[str]:
+        """Iterate live ids in row order."""
+        for id_ in self._row_ids:
+            if id_ is not None:
+                yield id_
+
+    def row_of(self, id: str) -> int | None:
+        """Row index of an id, or None if absent."""
+        return self._id_to_row.get(id)
+
+    def id_at(self, row: int) -> str | None:
+        """Id stored at a row, or None for a tombstone."""
+        return self._row_ids[row]
+
+    def get(self, id: str) -> NDArray[np.float32] | None:
+        """The normalized vector for an id (read-only view), or None."""
+        row = self._id_to_row.get(id)
+        if row is None or self._data is None:
+            return None
+        view = self._data[row]
+        view.flags.writeable = False
+        return view
+
+    def view(self, id: str) -> EmbeddingRowView:
+        """A lazy sequence view of the vector stored for ``id``."""
+        return EmbeddingRowView(self, id)
+
+    @property
+    def matrix(self) -> NDArray[np.float32]:
+        """Occupied rows, including tombstones."""
+        if self._data is None:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return self._data[: self._size]
+
+    # ── Mutation ─────────────────────────────────────────────────────────────
+
+    def add(self, id: str, vector: NDArray[np.floating] | Sequence[float]) -> None:
+        """Insert or replace a single vector."""
+        self.add_batch([id], normalize_rows(vector), normalized=True)
+
+    def add_batch(
+        self,
+        ids: Sequence[str],
+        vectors: NDArray[np.floating],
+        *,
+        normalized: bool = False,
+    ) -> None:
+        """Insert or replace many vectors at once.
+
+        Args:
+            ids: One id per row of ``vectors``.
+            vectors: Array of shape (len(ids), dimensions).
+            normalized: Skip normalization if rows are already unit-length.
+        """
+        if not ids:
+            return
+        rows = vectors if normalized else normalize_rows(vectors)
+        rows = np.asarray(rows, dtype=np.float32)
+        if rows.ndim != 2 or rows.shape[0] != len(ids):
+            raise ValueError(f"Expected {len(ids)} vectors, got shape {rows.shape}")
+        if self.dimensions == 0:
+            self.dimensions = int(rows.shape[1])
+        if rows.shape[1] != self.dimensions:
+            raise ValueError(f"Expected {self.dimensions} dims, got {rows.shape[1]}")
+
+        self._ensure_capacity(self._size + len(ids))
+        assert self._data is not None
+
+        for id_, row_vec in zip(ids, rows, strict=True):
+            row = self._id_to_row.get(id_)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self._row_ids.append(id_)
+                self._id_to_row[id_] = row
+            self._data[row] = row_vec
+
+    def discard(self, id: str) -> bool:
+        """Delete a vector by id (tombstone). Returns True if it existed."""
+        row = self._id_to_row.pop(id, None)
+        if row is None:
+            return False
+        self._row_ids[row] = None
+        if self._data is not None:
+            self._writable()
+            self._data[row] = 0.0
+        return True
+
+    def clear(self) -> None:
+        """Remove all vectors."""
+        self._data = None
+        self._size = 0
+        self._row_ids.clear()
+        self._id_to_row.clear()
+        self._generation += 1
+
+    def compact(self) -> None:
+        """Drop tombstoned rows so the matrix is dense again."""
+        if self.tombstones == 0 or self._data is None:
+            return
+        live_rows = np.fromiter(self._id_to_row.values(), dtype=np.intp)
+        live_rows.sort()
+        data = np.ascontiguousarray(self._data[live_rows])
+        self._row_ids = [self._row_ids[r] for r in live_rows]
+        self._id_to_row = {id_: i for i, id_ in enumerate(self._row_ids) if id_ is not None}
+        self._data = data
+        self._size = len(self._row_ids)
+        self._generation += 1
+
+    def _writable(self) -> None:
+        """Copy a read-only (memory-mapped) matrix into RAM before mutating."""
+        if self._data is not None and not self._data.flags.writeable:
+            self._data = np.array(self._data[: self._size], dtype=np.float32)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        if self._data is not None and self._data.flags.writeable and len(self._data) >= needed:
+            return
+        capacity = max(_MIN_CAPACITY, needed)
+        if self._data is not None and len(self._data) < needed:
+            capacity = max(capacity, len(self._data) * 2)
+        data = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        if self._data is not None and self._size:
+            data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def take(self, rows: NDArray[np.intp]) -> NDArray[np.float32]:
+        """Gather rows by index (tombstones come back as zero vectors)."""
+        if self._data is None:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return self._data[rows]
+
+    # ── Search ───────────────────────────────────────────────────────────────
+
+    def scores(self, query_vector: NDArray[np.floating] | Sequence[float]) -> NDArray[np.float32]:
+        """Cosine similarity of the query against every occupied row.
+
+        Tombstoned rows score -inf so they never rank.
+        """
+        if self._data is None or self._size == 0:
+            return np.zeros(0, dtype=np.float32)
+        query = normalize_rows(query_vector)[0]
+        if query.shape[0] != self.dimensions:
+            raise ValueError(f"Expected {self.dimensions} dims, got {query.shape[0]}")
+        sims = self._data[: self._size] @ query
+        if self.tombstones:
+            dead = np.fromiter(
+                (id_ is None for id_ in self._row_ids), dtype=bool, count=self._size
+            )
+            sims[dead] = -np.inf
+        return sims
+
+    def search(
+        self,
+        query_vector: NDArray[np.floating] | Sequence[float],
+        top_k: int = 5,
+        threshold: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """Top-k (id, cosine similarity) pairs, best first."""
+        sims = self.scores(query_vector)
+        if sims.size == 0:
+            return []
+        results: list[tuple[str, float]] = []
+        for row in top_k_indices(sims, top_k):
+            score = float(sims[row])
+            if threshold is not None and score < threshold:
+                break
+            id_ = self._row_ids[row]
+            if id_ is not None:
+                results.append((id_, score))
+        return results
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self, path: str | Path) -> None:
+        """Write the matrix as ``path`` (.npy) plus a ``path.ids.json`` sidecar.
+
+        Both files are written atomically (temp file + rename).
+        """
+        self.compact()
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = p.with_name(p.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.matrix))
+        os.replace(tmp, p)
+
+        ids_tmp = p.with_name(p.name + ".ids.tmp")
+        ids_tmp.write_text(
+            json.dumps({"dims": self.dimensions, "ids": list(self.ids())}),
+            encoding="utf-8",
+        )
+        os.replace(ids_tmp, _ids_path(p))
+
+    @classmethod
+    def load(cls, path: str | Path, *, mmap: bool = True) -> EmbeddingMatrix:
+        """Load a matrix written by :meth:`save`.
+
+        Args:
+            path: The .npy file.
+            mmap: Map the file read-only instead of reading it into memory.
+
+        Raises:
+            FileNotFoundError: If either file is missing.
+            ValueError: If the id sidecar does not match the matrix.
+        """
+        p = Path(path)
+        meta = json.loads(_ids_path(p).read_text(encoding="utf-8"))
+        data = np.load(p, mmap_mode="r" if mmap else None, allow_pickle=False)
+        ids: list[str] = meta["ids"]
+        if data.ndim != 2 or data.shape[0] != len(ids) or data.dtype != np.float32:
+            raise ValueError(f"Corrupt embedding matrix at {p}: {data.shape} vs {len(ids)} ids")
+
+        return cls.from_rows(data, ids)
+
+    @classmethod
+    def from_rows(cls, data: NDArray[np.float32], ids: Sequence[str]) -> EmbeddingMatrix:
+        """Wrap already-normalized rows (e.g. a memory map) without copying.
+
+        When an id appears more than once its last row wins; earlier rows
+        become tombstones (left as they are, but never ranked).
+
+        Raises:
+            ValueError: If ``data`` is not a float32 matrix with one row per id.
+        """
+        if data.ndim != 2 or data.shape[0] != len(ids) or data.dtype != np.float32:
+            raise ValueError(f"Expected float32 ({len(ids)}, dims) rows, got {data.shape}")
+        id_to_row = {id_: i for i, id_ in enumerate(ids)}
+        matrix = cls(dimensions=int(data.shape[1]))
+        matrix._data = data
+        matrix._size = len(ids)
+        matrix._row_ids = [id_ if id_to_row[id_] == i else None for i, id_ in enumerate(ids)]
+        matrix._id_to_row = id_to_row
+        return matrix
+
+    @staticmethod
+    def exists(path: str | Path) -> bool:
+        """Whether a saved matrix (and its id sidecar) exists at ``path``."""
+        p = Path(path)
+        return p.exists() and _ids_path(p).exists()
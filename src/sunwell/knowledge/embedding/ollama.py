@@ -7,9 +7,15 @@ Recommended models:
 - all-minilm (384 dims, fast, good quality)
 - embeddinggemma (768 dims, Google)
 - qwen3-embedding (1024 dims, high quality)
+
+Concurrent embed calls are coalesced by an EmbeddingBatcher, and the
+resulting batches are sent concurrently up to the server's parallelism
+(``ollama.num_parallel`` config, else OLLAMA_NUM_PARALLEL, else 4).
 """
 
 
+import asyncio
+import os
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -18,6 +24,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from sunwell.foundation.errors import ErrorCode, SunwellError
+from sunwell.knowledge.embedding.batching import DEFAULT_WINDOW_SECONDS, EmbeddingBatcher
 from sunwell.knowledge.embedding.protocol import EmbeddingResult
 
 if TYPE_CHECKING:
@@ -38,6 +45,22 @@ MODEL_DIMENSIONS: dict[str, int] = {
     "qwen3-embedding:latest": 1024,
 }
 
+DEFAULT_NUM_PARALLEL = 4
+"""Ollama's own default for parallel requests per model."""
+
+
+def _server_parallelism() -> int:
+    """Parallel requests the Ollama server accepts per model."""
+    from sunwell.foundation.config import get_config
+
+    configured = get_config().ollama.num_parallel
+    if configured:
+        return configured
+    try:
+        return int(os.environ.get("OLLAMA_NUM_PARALLEL", "")) or DEFAULT_NUM_PARALLEL
+    except ValueError:
+        return DEFAULT_NUM_PARALLEL
+
 
 @dataclass(slots=True)
 class OllamaEmbedding:
@@ -60,8 +83,12 @@ class OllamaEmbedding:
     base_url: str = "http://localhost:11434"
     max_chars_per_text: int = 512  # Truncate long texts to ~128 tokens (safer for small models)
     max_batch_chars: int = 4000  # Batch if total chars exceed this (conservative)
+    max_concurrent: int | None = None  # Requests in flight (None = server parallelism)
+    coalesce_window: float = DEFAULT_WINDOW_SECONDS  # Wait this long for other callers
     _dimensions: int | None = field(default=None, init=False)
     _client: httpx.AsyncClient | None = field(default=None, init=False)
+    _batcher: EmbeddingBatcher | None = field(default=None, init=False)
+    _batcher_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False)
 
     @property
     def dimensions(self) -> int:
@@ -88,6 +115,19 @@ class OllamaEmbedding:
             self._client = httpx.AsyncClient(timeout=60.0)
         return self._client
 
+    def _get_batcher(self) -> EmbeddingBatcher:
+        """Get or create the batcher for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._batcher_loop is not loop:
+            self._batcher = EmbeddingBatcher(
+                self._post_batch,
+                max_batch_chars=self.max_batch_chars,
+                max_concurrent=self.max_concurrent or _server_parallelism(),
+                window_seconds=self.coalesce_window,
+            )
+            self._batcher_loop = loop
+        return self._batcher
+
     async def embed(
         self,
         texts: Sequence[str],
@@ -116,12 +156,19 @@ class OllamaEmbedding:
             for t in texts
         ]
 
-        # Check if we need to batch
-        total_chars = sum(len(t) for t in truncated)
-        if total_chars > self.max_batch_chars:
-            return await self._embed_batched(truncated)
+        # Shares requests with concurrent callers; large inputs fan out in parallel
+        vectors = await self._get_batcher().embed(truncated)
 
-        return await self._embed_single_batch(truncated)
+        return EmbeddingResult(
+            vectors=vectors,
+            model=f"ollama/{self.model}",
+            dimensions=vectors.shape[1],
+        )
+
+    async def _post_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        """Send one batch to Ollama (called by the batcher)."""
+        result = await self._embed_single_batch(texts)
+        return result.vectors
 
     async def _embed_single_batch(
         self,
@@ -187,42 +234,6 @@ class OllamaEmbedding:
             dimensions=self._dimensions,
         )
 
-    async def _embed_batched(
-        self,
-        texts: list[str],
-    ) -> EmbeddingResult:
-        """Embed texts in batches to avoid context length limits."""
-        all_vectors = []
-        batch: list[str] = []
-        batch_chars = 0
-
-        for text in texts:
-            text_chars = len(text)
-
-            # If adding this text would exceed limit, process current batch
-            if batch and batch_chars + text_chars > self.max_batch_chars:
-                result = await self._embed_single_batch(batch)
-                all_vectors.append(result.vectors)
-                batch = []
-                batch_chars = 0
-
-            batch.append(text)
-            batch_chars += text_chars
-
-        # Process final batch
-        if batch:
-            result = await self._embed_single_batch(batch)
-            all_vectors.append(result.vectors)
-
-        # Concatenate all vectors
-        vectors = np.vstack(all_vectors)
-
-        return EmbeddingResult(
-            vectors=vectors,
-            model=f"ollama/{self.model}",
-            dimensions=vectors.shape[1],
-        )
-
     async def embed_single(self, text: str) -> NDArray[np.float32]:
         """Embed a single text. Convenience method.
 
@@ -236,7 +247,11 @@ class OllamaEmbedding:
         return result.vectors[0]
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Cancel pending requests and close the HTTP client."""
+        if self._batcher is not None:
+            await self._batcher.aclose()
+            self._batcher = None
+            self._batcher_loop = None
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -3,6 +3,7 @@
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 import numpy as np
@@ -56,8 +57,8 @@ class VectorIndexProtocol(Protocol):
     """Protocol for vector index backends.
 
     Implementations:
-    - InMemoryIndex: NumPy-based, for development/small lenses
-    - FAISSIndex: For large-scale production
+    - InMemoryIndex: NumPy-based exact search, for development/small lenses
+    - IVFIndex: NumPy-based approximate search for large corpora
     """
 
     @property
@@ -104,3 +105,7 @@ class VectorIndexProtocol(Protocol):
     def clear(self) -> None:
         """Remove all vectors from the index."""
         ...
+
+    def save(self, path: str | Path) -> None:
+        """Persist the index to a directory (read back by ``load_vector_index``)."""
+        ...
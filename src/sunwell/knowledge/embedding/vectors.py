@@ -0,0 +1,217 @@
+"""Append-only float32 vector file with an id log.
+
+Intelligence stores (decisions, failures, team knowledge) record one
+embedding at a time and search all of them at query time. Keeping them in a
+JSON map of floats meant rewriting the whole file on every insert and
+parsing it on every startup. VectorFile instead keeps two files:
+
+- ``<path>``: raw L2-normalized float32 rows, appended in write order
+- ``<path>.ids``: a JSON header line, then one id per row
+
+Writing a vector appends one row to each file. When an id is written again
+its latest row wins. Once dead rows outnumber live ones, both files are
+rewritten compactly.
+
+Nothing is read until the first lookup. At that point the rows are
+memory-mapped into an :class:`EmbeddingMatrix`, so search is a single
+matrix-vector product and top-k uses argpartition.
+
+Example:
+    >>> vectors = VectorFile(base / "decisions_embeddings.f32")
+    >>> vectors.put("d1", np.array([1.0, 0.0]))
+    >>> vectors.search(np.array([1.0, 0.1]), top_k=1)
+    [('d1', 0.995...)]
+"""
+
+import json
+import os
+from collections.abc import Collection, Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix, normalize_rows
+
+_FORMAT_VERSION = 1
+
+_MIN_COMPACT_ROWS = 64
+"""Never compact files smaller than this; the dead rows cost next to nothing."""
+
+
+def _ids_path(path: Path) -> Path:
+    """Id log that accompanies a vector file."""
+    return path.with_name(path.name + ".ids")
+
+
+class VectorFile:
+    """Lazily loaded, append-only id → vector store backed by two flat files.
+
+    Ids must not contain newlines. The store is not safe to write from
+    several processes at once; each intelligence store owns its file.
+    """
+
+    __slots__ = ("path", "legacy_json", "_matrix", "_file_rows")
+
+    def __init__(self, path: str | Path, *, legacy_json: str | Path | None = None):
+        """Point at a vector file (nothing is read yet).
+
+        Args:
+            path: Vector file; the id log lives next to it as ``<path>.ids``
+            legacy_json: ``{id: [floats]}`` file from the old storage format,
+                imported and removed on first load
+        """
+        self.path = Path(path)
+        self.legacy_json = Path(legacy_json) if legacy_json is not None else None
+        self._matrix: EmbeddingMatrix | None = None
+        # Rows present in both files; 0 forces the next write to rewrite them
+        self._file_rows = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the files have been read yet."""
+        return self._matrix is not None
+
+    @property
+    def dimensions(self) -> int:
+        """Vector width (0 while empty)."""
+        return self._load().dimensions
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._load()
+
+    def ids(self) -> Iterator[str]:
+        """Iterate the stored ids."""
+        return self._load().ids()
+
+    def get(self, id: str) -> NDArray[np.float32] | None:
+        """The normalized vector stored for an id, or None."""
+        return self._load().get(id)
+
+    # ── Writing ──────────────────────────────────────────────────────────────
+
+    def put(self, id: str, vector: NDArray[np.floating] | Sequence[float]) -> None:
+        """Store (or replace) one vector."""
+        self.put_many([id], normalize_rows(vector))
+
+    def put_many(self, ids: Sequence[str], vectors: NDArray[np.floating]) -> None:
+        """Store (or replace) one vector per id by appending them.
+
+        Raises:
+            ValueError: If an id contains a newline or the vectors do not
+                match the stored width
+        """
+        if not ids:
+            return
+        if any("\n" in id_ for id_ in ids):
+            raise ValueError("Vector ids cannot contain newlines")
+        rows = normalize_rows(vectors)
+        matrix = self._load()
+        matrix.add_batch(ids, rows, normalized=True)
+
+        if self._file_rows == 0 or self._file_rows >= max(_MIN_COMPACT_ROWS, 2 * len(matrix)):
+            self._rewrite(matrix)
+            return
+
+        # Vectors first: a crash before the ids are written leaves only an
+        # unreferenced tail, which the next load detects and rewrites
+        with open(self.path, "ab") as f:
+            f.write(rows.tobytes())
+        with open(_ids_path(self.path), "a", encoding="utf-8") as f:
+            f.write("".join(f"{id_}\n" for id_ in ids))
+        self._file_rows += len(ids)
+
+    def _rewrite(self, matrix: EmbeddingMatrix) -> None:
+        """Replace both files with the live rows only."""
+        matrix.compact()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        ids_path = _ids_path(self.path)
+        # Without an id log the vectors are ignored, so a crash part-way
+        # through loses embeddings (they are regenerable) but never pairs
+        # an id with another id's vector
+        ids_path.unlink(missing_ok=True)
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_bytes(np.ascontiguousarray(matrix.matrix).tobytes())
+        os.replace(tmp, self.path)
+
+        ids_tmp = ids_path.with_name(ids_path.name + ".tmp")
+        header = json.dumps({"version": _FORMAT_VERSION, "dims": matrix.dimensions})
+        ids_tmp.write_text(
+            header + "\n" + "".join(f"{id_}\n" for id_ in matrix.ids()),
+            encoding="utf-8",
+        )
+        os.replace(ids_tmp, ids_path)
+        self._file_rows = matrix.size
+
+    # ── Search ───────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query_vector: NDArray[np.floating] | Sequence[float],
+        top_k: int = 5,
+        *,
+        threshold: float | None = None,
+        exclude: Collection[str] = (),
+    ) -> list[tuple[str, float]]:
+        """Top-k (id, cosine similarity) pairs, best first.
+
+        Args:
+            query_vector: Query embedding (need not be normalized)
+            top_k: Maximum number of results
+            threshold: Drop results scoring below this
+            exclude: Ids that must not be returned
+        """
+        matrix = self._load()
+        if not len(matrix):
+            return []
+        hits = matrix.search(query_vector, top_k + len(exclude), threshold)
+        return [(id_, score) for id_, score in hits if id_ not in exclude][:top_k]
+
+    # ── Loading ──────────────────────────────────────────────────────────────
+
+    def _load(self) -> EmbeddingMatrix:
+        if self._matrix is not None:
+            return self._matrix
+        self._matrix, self._file_rows = _read(self.path)
+        if self.legacy_json is not None and self.legacy_json.exists():
+            self._import_legacy(self.legacy_json)
+        return self._matrix
+
+    def _import_legacy(self, legacy_json: Path) -> None:
+        """Move vectors from the old JSON format into this file."""
+        try:
+            legacy = json.loads(legacy_json.read_text(encoding="utf-8"))
+            # Anything already in the vector file is newer than the JSON
+            fresh = {id_: vec for id_, vec in legacy.items() if id_ not in self}
+            if fresh:
+                self.put_many(list(fresh), np.asarray(list(fresh.values()), dtype=np.float32))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return  # Unreadable legacy file: leave it alone, start fresh
+        legacy_json.unlink(missing_ok=True)
+
+
+def _read(path: Path) -> tuple[EmbeddingMatrix, int]:
+    """Map a vector file, returning the matrix and the consistent row count."""
+    try:
+        with open(_ids_path(path), encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            ids = f.read().splitlines()
+        dims = int(header["dims"])
+        size = path.stat().st_size
+    except (OSError, ValueError, KeyError, TypeError):
+        return EmbeddingMatrix(), 0
+
+    row_bytes = dims * 4
+    rows = min(len(ids), size // row_bytes) if dims else 0
+    if rows == 0:
+        return EmbeddingMatrix(dimensions=dims), 0
+
+    data = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, dims))
+    matrix = EmbeddingMatrix.from_rows(data, ids[:rows])
+    # A torn append (one file longer than the other) is repaired on next write
+    consistent = rows == len(ids) and rows * row_bytes == size
+    return matrix, rows if consistent else 0
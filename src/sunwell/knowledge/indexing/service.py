@@ -11,8 +11,9 @@ Supports tiered indexing for multi-project workspaces:
 
 import asyncio
 import hashlib
-import pickle
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,12 +23,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from sunwell.foundation.threading import WorkloadType, optimal_workers
 from sunwell.foundation.utils import safe_json_dumps, safe_json_loads
 from sunwell.knowledge.indexing.chunkers import ChunkerRegistry
 from sunwell.knowledge.indexing.metrics import IndexMetrics
 from sunwell.knowledge.indexing.priority import get_priority_files
 from sunwell.knowledge.indexing.project_type import ProjectType, detect_project_type
-from sunwell.knowledge.workspace.indexer import CodebaseIndex, CodeChunk, ScoredChunk
+from sunwell.knowledge.workspace.indexer import (
+    CodebaseIndex,
+    CodeChunk,
+    FileStamp,
+    ScoredChunk,
+)
 from sunwell.knowledge.workspace.types import IndexTier
 
 
@@ -96,6 +103,10 @@ class IndexingService:
     - AST-aware chunking (Python)
     - Graceful fallback (grep when no embeddings)
     - File watching (incremental updates)
+    - Pipelined build: files are read and chunked on a thread pool while
+      the previous batch is being embedded
+    - Content-hash reuse: unchanged chunks are never re-embedded, and a
+      stale cache is refreshed by re-chunking only files whose stamp changed
     - Tiered indexing (L0-L3) for multi-project scalability
 
     Index Tiers:
@@ -119,6 +130,8 @@ class IndexingService:
     debounce_ms: int = 500
     max_file_size: int = 100_000
     priority_file_limit: int = 200
+    embed_batch_size: int = 500
+    """Chunks per embedding request during full indexing."""
 
     # Supported extensions (code + prose + scripts + docs)
     index_extensions: frozenset[str] = field(
@@ -235,8 +248,12 @@ class IndexingService:
                 self._update_status(state=IndexState.READY)
                 self._ready.set()
                 self._metrics.record_cache_hit()
+            elif self._embedder:
+                # Cache stale: serve it while re-indexing only changed files
+                self._metrics.record_cache_miss()
+                self._ready.set()
+                asyncio.create_task(self._refresh_stale_files())
             else:
-                # Cache stale, rebuild
                 self._metrics.record_cache_miss()
                 asyncio.create_task(self._background_index())
         else:
@@ -302,20 +319,12 @@ class IndexingService:
 
         # Embed query
         result = await self._embedder.embed([text])
-        query_vector = result.vectors[0].tolist()
-
-        # Search
-        scores: list[tuple[CodeChunk, float]] = []
-        for chunk in self._index.chunks:
-            chunk_embedding = self._index.embeddings.get(chunk.id)
-            if chunk_embedding:
-                score = self._cosine_similarity(query_vector, chunk_embedding)
-                if score >= threshold:
-                    scores.append((chunk, score))
 
-        # Sort by score and take top_k
-        scores.sort(key=lambda x: x[1], reverse=True)
-        results = [ScoredChunk(chunk=c, score=s) for c, s in scores[:top_k]]
+        # Search: one matrix-vector product + argpartition top-k
+        results = [
+            ScoredChunk(chunk=c, score=s)
+            for c, s in self._index.search(result.vectors[0], top_k=top_k, threshold=threshold)
+        ]
 
         # Record metrics
         elapsed_ms = int((time.perf_counter() - start) * 1000)
@@ -391,40 +400,12 @@ class IndexingService:
         Only indexes public APIs, exports, and type definitions.
         """
         # Only index code files (not docs, prose, etc.)
-        signature_files = [
-            f for f in self._iter_indexable_files()
-            if f.suffix in self.signature_extensions
-        ]
-
+        signature_files = list(self._tier_files())
         if not signature_files:
             return
 
-        total = len(signature_files)
-        chunks: list[CodeChunk] = []
-
-        for i, file_path in enumerate(signature_files):
-            try:
-                rel_path = file_path.relative_to(self.workspace_root)
-            except ValueError:
-                rel_path = file_path
-
-            self._update_status(
-                progress=int((i / total) * 100),
-                current_file=str(rel_path),
-            )
-
-            # Use signature-only chunking (public functions, classes, exports)
-            file_chunks = self._chunk_file_signatures(file_path)
-            chunks.extend(file_chunks)
-
-            # Batch embed every 100 chunks for L1 (smaller batches than L2)
-            if len(chunks) >= 100:
-                await self._embed_chunks(chunks)
-                chunks = []
-
-        # Embed final batch
-        if chunks and self._embedder:
-            await self._embed_chunks(chunks)
+        # Smaller embedding batches than L2
+        await self._index_files(signature_files, batch_size=100, progress=(0, 100))
 
     def _chunk_file_signatures(self, file_path: Path) -> list[CodeChunk]:
         """Extract only public signatures from a file.
@@ -463,26 +444,8 @@ class IndexingService:
         if not priority_files:
             return
 
-        total = len(priority_files)
-        chunks: list[CodeChunk] = []
-
-        for i, file_path in enumerate(priority_files):
-            try:
-                rel_path = file_path.relative_to(self.workspace_root)
-            except ValueError:
-                rel_path = file_path
-
-            self._update_status(
-                progress=int((i / total) * 50),  # 0-50% for priority
-                current_file=str(rel_path),
-            )
-
-            file_chunks = self._chunk_file(file_path)
-            chunks.extend(file_chunks)
-
-        # Embed priority chunks
-        if chunks and self._embedder:
-            await self._embed_chunks(chunks)
+        # 0-50% for priority
+        await self._index_files(priority_files, progress=(0, 50))
 
     async def _index_remaining_files(self) -> None:
         """Index remaining files in background."""
@@ -499,31 +462,119 @@ class IndexingService:
         if not remaining:
             return
 
-        total = len(remaining)
-        chunks: list[CodeChunk] = []
+        # 50-100% for remaining
+        await self._index_files(remaining, progress=(50, 50))
 
-        for i, file_path in enumerate(remaining):
-            try:
-                rel_path = file_path.relative_to(self.workspace_root)
-            except ValueError:
-                rel_path = file_path
+    async def _index_files(
+        self,
+        files: list[Path],
+        *,
+        batch_size: int | None = None,
+        progress: tuple[int, int] | None = None,
+    ) -> None:
+        """Chunk and embed files as a pipeline.
+
+        Files are chunked on a thread pool (see :meth:`_chunk_files`) while
+        the previous batch is being embedded; at most one embedding request
+        is in flight. Each file's chunks replace whatever the index held
+        for it, and chunks whose content is already embedded are added
+        immediately without a model call.
 
-            self._update_status(
-                progress=50 + int((i / total) * 50),  # 50-100% for remaining
-                current_file=str(rel_path),
-            )
+        Args:
+            files: Files to (re)index.
+            batch_size: Chunks per embedding request (default: embed_batch_size).
+            progress: (start, span) percentage to report, or None for silent.
+        """
+        if not self._embedder:
+            return
+        if self._index is None:
+            self._index = self._configure_index(CodebaseIndex())
+        index = self._index
+        batch_size = batch_size or self.embed_batch_size
+        signatures_only = self.tier == IndexTier.L1_SIGNATURES
+
+        total = len(files)
+        pending: list[CodeChunk] = []
+        stamps: list[tuple[Path, FileStamp]] = []
+        in_flight: asyncio.Task | None = None
+
+        i = 0
+        async for file_path, stamp, chunks in self._chunk_files(files, signatures_only):
+            if progress is not None:
+                start, span = progress
+                self._update_status(
+                    progress=start + int((i / total) * span),
+                    current_file=str(self._relative(file_path)),
+                )
+            i += 1
+            if stamp is None:
+                # Vanished (or unreadable) since it was listed
+                index.remove_file(file_path)
+                continue
 
-            file_chunks = self._chunk_file(file_path)
-            chunks.extend(file_chunks)
+            pending.extend(index.replace_file(file_path, chunks))
+            stamps.append((file_path, stamp))
 
-            # Batch embed every 500 chunks to show progress
-            if len(chunks) >= 500:
-                await self._embed_chunks(chunks)
-                chunks = []
+            if len(pending) >= batch_size:
+                if in_flight is not None:
+                    await in_flight
+                in_flight = asyncio.create_task(self._embed_chunks(pending, stamps))
+                pending, stamps = [], []
 
-        # Embed final batch
-        if chunks and self._embedder:
-            await self._embed_chunks(chunks)
+        if in_flight is not None:
+            await in_flight
+        await self._embed_chunks(pending, stamps)
+
+    async def _chunk_files(
+        self,
+        files: Iterable[Path],
+        signatures_only: bool = False,
+    ) -> AsyncIterator[tuple[Path, FileStamp | None, list[CodeChunk]]]:
+        """Read and chunk files on a thread pool, yielding results in order.
+
+        Only a bounded window of files is in flight, so chunking runs ahead
+        of (and concurrently with) embedding without holding every file's
+        chunks in memory. AST parsing holds the GIL, but reading does not,
+        and under free-threaded Python the chunkers run truly in parallel.
+        """
+        loop = asyncio.get_running_loop()
+        workers = optimal_workers(WorkloadType.CPU_BOUND)
+        remaining = iter(files)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            window: deque[asyncio.Future] = deque()
+
+            def submit() -> None:
+                path = next(remaining, None)
+                if path is not None:
+                    window.append(
+                        loop.run_in_executor(pool, self._read_and_chunk, path, signatures_only)
+                    )
+
+            for _ in range(workers * 4):
+                submit()
+            while window:
+                result = await window.popleft()
+                submit()
+                yield result
+
+    def _read_and_chunk(
+        self,
+        file_path: Path,
+        signatures_only: bool = False,
+    ) -> tuple[Path, FileStamp | None, list[CodeChunk]]:
+        """Stamp and chunk one file (runs on the chunking pool)."""
+        stamp = _file_stamp(file_path)
+        if stamp is None:
+            return file_path, None, []
+        if signatures_only:
+            return file_path, stamp, self._chunk_file_signatures(file_path)
+        return file_path, stamp, self._chunk_file(file_path)
+
+    def _relative(self, file_path: Path) -> Path:
+        try:
+            return file_path.relative_to(self.workspace_root)
+        except ValueError:
+            return file_path
 
     def _chunk_file(self, file_path: Path) -> list[CodeChunk]:
         """Chunk a file using the appropriate content-aware chunker.
@@ -536,44 +587,62 @@ class IndexingService:
         """
         return self._chunker_registry.chunk_file(file_path, self._project_type)
 
-    async def _embed_chunks(self, chunks: list[CodeChunk]) -> None:
-        """Embed chunks and add to index."""
+    async def _embed_chunks(
+        self,
+        chunks: list[CodeChunk],
+        stamps: list[tuple[Path, FileStamp]] | None = None,
+    ) -> None:
+        """Embed chunks and add to index.
+
+        Chunks whose content is already embedded are added without a model
+        call, and identical chunks are embedded once. ``stamps`` are
+        recorded only after the embeddings land, so an interrupted batch is
+        picked up again by the next stale-cache refresh.
+        """
         import time
 
-        if not self._embedder or not chunks:
+        if not self._embedder:
             return
 
-        embed_start = time.perf_counter()
-
-        # Use embedding-optimized text for Python chunks
-        texts: list[str] = []
-        for c in chunks:
-            if hasattr(c, "to_embedding_text"):
-                texts.append(c.to_embedding_text())
-            else:
-                texts.append(c.content)
-
-        result = await self._embedder.embed(texts)
+        if self._index is None:
+            self._index = self._configure_index(CodebaseIndex())
+        index = self._index
+
+        missing = index.add_cached(chunks)
+        unique: dict[str, CodeChunk] = {}
+        for c in missing:
+            unique.setdefault(c.id, c)
+
+        if unique:
+            embed_start = time.perf_counter()
+
+            # Use embedding-optimized text for Python chunks
+            texts: list[str] = []
+            for c in unique.values():
+                if hasattr(c, "to_embedding_text"):
+                    texts.append(c.to_embedding_text())
+                else:
+                    texts.append(c.content)
 
-        # Track embedding time
-        self._metrics.embedding_time_ms += int(
-            (time.perf_counter() - embed_start) * 1000
-        )
+            result = await self._embedder.embed(texts)
 
-        if self._index is None:
-            self._index = CodebaseIndex()
+            # Track embedding time
+            self._metrics.embedding_time_ms += int(
+                (time.perf_counter() - embed_start) * 1000
+            )
 
-        for chunk, vector in zip(chunks, result.vectors, strict=True):
-            self._index.chunks.append(chunk)
-            self._index.embeddings[chunk.id] = vector.tolist()
+            embedded = list(unique.values())
+            index.add_batch(embedded, result.vectors)
+            first = {id(c) for c in embedded}
+            index.add_cached([c for c in missing if id(c) not in first])
 
-        # Update file count (unique files)
-        unique_files = {c.file_path for c in self._index.chunks}
-        self._index.file_count = len(unique_files)
+        for file_path, stamp in stamps or ():
+            index.stamp_file(file_path, stamp)
 
+        index.file_count = len(index.files)
         self._update_status(
-            chunk_count=len(self._index.chunks),
-            file_count=self._index.file_count,
+            chunk_count=index.chunk_count,
+            file_count=index.file_count,
         )
 
     async def _watch_files(self) -> None:
@@ -635,29 +704,67 @@ class IndexingService:
         self._update_status(state=prev_state, last_updated=datetime.now())
 
     async def _update_files(self, paths: list[Path]) -> None:
-        """Incrementally update index for changed files."""
+        """Incrementally update index for changed files.
+
+        Costs O(chunks in the changed files): unchanged chunks keep their
+        embeddings, and the save appends to the on-disk log.
+        """
         if not self._index or not self._embedder:
             return
 
+        existing: list[Path] = []
         for path in paths:
-            # Remove old chunks for this file
-            self._index.chunks = [
-                c for c in self._index.chunks if c.file_path != path
-            ]
-            # Remove old embeddings
-            for chunk_id in list(self._index.embeddings.keys()):
-                # Chunk IDs include file info, so we filter
-                if not any(c.id == chunk_id for c in self._index.chunks):
-                    del self._index.embeddings[chunk_id]
-
-            # Re-chunk and embed if file exists
             if path.exists():
-                chunks = self._chunk_file(path)
-                if chunks:
-                    await self._embed_chunks(chunks)
+                existing.append(path)
+            else:
+                self._index.remove_file(path)
 
+        await self._index_files(existing)
+        self._index.file_count = len(self._index.files)
+        self._update_status(
+            chunk_count=self._index.chunk_count,
+            file_count=self._index.file_count,
+        )
         await self._save_cache()
 
+    async def _refresh_stale_files(self) -> None:
+        """Bring a stale cached index up to date.
+
+        Only files whose (mtime, size) stamp differs from the one recorded
+        at indexing time are re-chunked, and files that disappeared are
+        dropped; the cached index keeps serving queries meanwhile.
+        """
+        if not self._index:
+            return
+        self._update_status(state=IndexState.UPDATING)
+        try:
+            current = {
+                path: stamp
+                for path in self._tier_files()
+                if (stamp := _file_stamp(path)) is not None
+            }
+            stamps = self._index.file_stamps
+            changed = [p for p, stamp in current.items() if stamps.get(p) != stamp]
+            removed = [p for p in {*self._index.files, *stamps} if p not in current]
+            await self._update_files(changed + removed)
+            self._update_status(state=IndexState.READY, last_updated=datetime.now())
+        except Exception as e:
+            self._update_status(state=IndexState.ERROR, error=str(e))
+            self._metrics.record_error(str(e))
+
+    @staticmethod
+    def _configure_index(index: CodebaseIndex) -> CodebaseIndex:
+        """Apply the configured vector index backend (exact vs. IVF) to an index."""
+        from sunwell.foundation.config import get_config
+
+        config = get_config().embedding
+        if config.index_backend == "ivf":
+            index.ann_threshold = 0
+        elif config.index_backend == "auto":
+            index.ann_threshold = config.ann_threshold
+        index.ann_nprobe = config.ann_nprobe
+        return index
+
     async def _create_embedder(self) -> EmbeddingProtocol | None:
         """Create embedder with graceful fallback."""
         try:
@@ -667,6 +774,12 @@ class IndexingService:
         except Exception:
             return None
 
+    def _tier_files(self) -> Iterator[Path]:
+        """Indexable files for the current tier (code only for L1)."""
+        for path in self._iter_indexable_files():
+            if self.tier != IndexTier.L1_SIGNATURES or path.suffix in self.signature_extensions:
+                yield path
+
     def _iter_indexable_files(self) -> Iterator[Path]:
         """Iterate over files to index."""
         ignore_dirs = {
@@ -690,16 +803,19 @@ class IndexingService:
                         continue
 
     async def _load_cached_index(self) -> bool:
-        """Try to load index from cache."""
-        cache_file = self.cache_dir / "index.pickle"
+        """Try to load index from cache.
+
+        The embedding matrix is memory-mapped, not decoded, so this is cheap
+        even for very large indexes. Caches written in an older format are
+        treated as missing and rebuilt.
+        """
         meta_file = self.cache_dir / "meta.json"
 
-        if not cache_file.exists() or not meta_file.exists():
+        if not CodebaseIndex.exists(self.cache_dir) or not meta_file.exists():
             return False
 
         try:
-            with open(cache_file, "rb") as f:
-                self._index = pickle.load(f)
+            self._index = self._configure_index(CodebaseIndex.load(self.cache_dir))
 
             meta = safe_json_loads(meta_file.read_text())
             self._update_status(
@@ -737,34 +853,28 @@ class IndexingService:
         return hashlib.md5("\n".join(mtimes).encode()).hexdigest()
 
     async def _save_cache(self) -> None:
-        """Save index to cache."""
+        """Save index to cache (appending to its log when possible)."""
         if not self._index:
             return
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save index
-        with open(self.cache_dir / "index.pickle", "wb") as f:
-            pickle.dump(self._index, f)
+        # Save chunks + memory-mappable embedding matrix
+        self._index.save(self.cache_dir)
 
         # Save metadata
         meta = {
             "content_hash": self._compute_content_hash(),
-            "chunk_count": len(self._index.chunks),
+            "chunk_count": self._index.chunk_count,
             "file_count": self._index.file_count,
             "updated_at": datetime.now().isoformat(),
             "project_type": self._project_type.value,
         }
         (self.cache_dir / "meta.json").write_text(safe_json_dumps(meta, indent=2))
 
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot = sum(x * y for x, y in zip(a, b, strict=False))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
 
-        return dot / (norm_a * norm_b)
+def _file_stamp(path: Path) -> FileStamp | None:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
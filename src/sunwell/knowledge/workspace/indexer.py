@@ -5,24 +5,32 @@ Performance optimizations:
 - Parallel file processing for free-threaded Python 3.14
 - Incremental indexing (only re-embed changed content)
 - Adaptive worker count based on GIL state
+- Embeddings in a pre-normalized float32 matrix (one matvec per query)
 """
 
 
 import asyncio
 import fnmatch
 import hashlib
+import os
+import pickle
 import re
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 from sunwell.foundation.threading import (
     WorkloadType,
     optimal_workers,
 )
+from sunwell.knowledge.embedding.ivf import IVFIndex
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix
 from sunwell.knowledge.utils import extract_class_defs, extract_function_defs, parse_python_file
 
 if TYPE_CHECKING:
@@ -70,6 +78,35 @@ class CodeChunk:
     _content_hash: str | None = field(default=None, compare=False)
     """Cached content hash for O(1) lookups."""
 
+    @property
+    def id(self) -> str:
+        """Content-addressable identifier for O(1) deduplication."""
+        if self._content_hash:
+            return self._content_hash
+        return _content_hash(self.content)
+
+    def __hash__(self) -> int:
+        """Hash based on content, enabling set operations."""
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        """Equal if content hash matches (even across files)."""
+        if isinstance(other, CodeChunk):
+            return self.id == other.id
+        return False
+
+    @property
+    def reference(self) -> str:
+        """Human-readable reference."""
+        if self.name:
+            return f"{self.file_path}:{self.start_line} ({self.name})"
+        return f"{self.file_path}:{self.start_line}-{self.end_line}"
+
+    def to_context(self) -> str:
+        """Format chunk for inclusion in prompt context."""
+        header = f"# {self.reference}"
+        return f"{header}\n```\n{self.content}\n```"
+
 
 @dataclass(frozen=True, slots=True)
 class ScoredChunk:
@@ -111,44 +148,53 @@ class ScoredChunk:
         return self.chunk.name
 
     @property
-    def id(self) -> str:
-        """Content-addressable identifier for O(1) deduplication."""
-        if self._content_hash:
-            return self._content_hash
-        return _content_hash(self.content)
+    def reference(self) -> str:
+        return self.chunk.reference
 
-    def __hash__(self) -> int:
-        """Hash based on content, enabling set operations."""
-        return hash(self.id)
+    def to_context(self) -> str:
+        return self.chunk.to_context()
 
-    def __eq__(self, other: object) -> bool:
-        """Equal if content hash matches (even across files)."""
-        if isinstance(other, CodeChunk):
-            return self.id == other.id
-        return False
 
-    @property
-    def reference(self) -> str:
-        """Human-readable reference."""
-        if self.name:
-            return f"{self.file_path}:{self.start_line} ({self.name})"
-        return f"{self.file_path}:{self.start_line}-{self.end_line}"
+# Bumped whenever the on-disk layout written by CodebaseIndex.save changes
+_INDEX_FORMAT_VERSION = 2
+_INDEX_FILE = "index.pickle"
+_VECTORS_FILE = "index.vectors.npy"
+_CENTROIDS_FILE = "index.centroids.npy"
+_LOG_FILE = "index.log"
 
-    def to_context(self) -> str:
-        """Format chunk for inclusion in prompt context."""
-        header = f"# {self.reference}"
-        return f"{header}\n```\n{self.content}\n```"
+# A log smaller than this never forces a snapshot, however small the snapshot
+_MIN_LOG_COMPACT_BYTES = 1 << 20
+
+FileStamp = tuple[int, int]
+"""(mtime_ns, size) of a source file when it was indexed."""
 
 
 @dataclass(slots=True)
 class CodebaseIndex:
-    """Index of codebase chunks for retrieval."""
-
-    chunks: list[CodeChunk] = field(default_factory=list)
-    """All indexed chunks."""
+    """Index of codebase chunks for retrieval.
+
+    Embeddings live in a contiguous, pre-normalized float32 matrix keyed by
+    chunk ID, so a query is one matrix-vector product plus an argpartition
+    top-k instead of a Python loop over every chunk. Chunks with identical
+    content share an ID and therefore a single matrix row.
+
+    Chunks are grouped by file, and each ID keeps the list of chunks that
+    use it, so replacing or removing a file costs O(chunks in that file).
+    Because rows are content-addressed, :meth:`replace_file` reuses the
+    embedding of every chunk whose text did not change.
+
+    Persistence is a snapshot plus an append-only log: ``index.pickle``
+    holds the chunks, ``index.vectors.npy`` the matrix (memory-mapped on
+    load) and ``index.log`` the files and vectors changed since the
+    snapshot. The log is folded into a new snapshot once it outgrows it.
+
+    When ``ann_threshold`` is set and the index holds at least that many
+    vectors, searches go through an IVF approximate index layered over the
+    same matrix; its trained centroids are saved alongside the matrix.
+    """
 
-    embeddings: dict[str, list[float]] = field(default_factory=dict)
-    """Chunk ID -> embedding vector."""
+    vectors: EmbeddingMatrix = field(default_factory=EmbeddingMatrix)
+    """Chunk ID -> normalized embedding row."""
 
     file_count: int = 0
     """Number of files indexed."""
@@ -156,6 +202,339 @@ class CodebaseIndex:
     total_lines: int = 0
     """Total lines of code indexed."""
 
+    ann_threshold: int | None = None
+    """Vector count at which search becomes approximate (None = always exact)."""
+
+    ann_nprobe: int = 8
+    """IVF lists probed per approximate query."""
+
+    _files: dict[Path, list[CodeChunk]] = field(default_factory=dict, init=False, repr=False)
+    """File -> its chunks, in insertion order."""
+
+    _by_id: dict[str, list[CodeChunk]] = field(default_factory=dict, init=False, repr=False)
+    """Chunk ID -> every chunk with that content (an ID is live while non-empty)."""
+
+    _stamps: dict[Path, FileStamp] = field(default_factory=dict, init=False, repr=False)
+    """File -> stamp it was indexed at, when the indexer recorded one."""
+
+    _chunk_count: int = field(default=0, init=False, repr=False)
+    _flat: list[CodeChunk] | None = field(default=None, init=False, repr=False)
+    """Lazy flattened view of ``_files``, rebuilt after mutation."""
+
+    _synced_dir: Path | None = field(default=None, init=False, repr=False)
+    """Directory whose snapshot + log matches this index up to the dirty sets."""
+
+    _dirty_files: set[Path] = field(default_factory=set, init=False, repr=False)
+    _unsaved_ids: dict[str, None] = field(default_factory=dict, init=False, repr=False)
+    _dropped_ids: set[str] = field(default_factory=set, init=False, repr=False)
+
+    _ann: IVFIndex | None = field(default=None, init=False, repr=False)
+    """Approximate index over ``vectors`` (built once ann_threshold is reached)."""
+
+    _saved_centroids: NDArray[np.float32] | None = field(default=None, init=False, repr=False)
+    """Quantizer loaded from disk, reused instead of retraining."""
+
+    # ── Introspection ────────────────────────────────────────────────────────
+
+    @property
+    def chunks(self) -> list[CodeChunk]:
+        """All indexed chunks, grouped by file (treat as read-only)."""
+        if self._flat is None:
+            self._flat = [c for file_chunks in self._files.values() for c in file_chunks]
+        return self._flat
+
+    @property
+    def chunk_count(self) -> int:
+        """Number of indexed chunks (without materializing :attr:`chunks`)."""
+        return self._chunk_count
+
+    @property
+    def files(self) -> Mapping[Path, Sequence[CodeChunk]]:
+        """File -> its chunks (files without chunks are absent)."""
+        return MappingProxyType(self._files)
+
+    @property
+    def file_stamps(self) -> Mapping[Path, FileStamp]:
+        """File -> (mtime_ns, size) recorded when it was last indexed."""
+        return MappingProxyType(self._stamps)
+
+    # ── Mutation ─────────────────────────────────────────────────────────────
+
+    def add_batch(self, chunks: Sequence[CodeChunk], vectors: NDArray[np.floating]) -> None:
+        """Append chunks with their (unnormalized) embedding vectors."""
+        if not chunks:
+            return
+        ids = [c.id for c in chunks]
+        self.vectors.add_batch(ids, vectors)
+        self._unsaved_ids.update(dict.fromkeys(ids))
+        self._dropped_ids.difference_update(ids)
+        self._insert(chunks)
+
+    def add_cached(self, chunks: Sequence[CodeChunk]) -> list[CodeChunk]:
+        """Add the chunks whose content is already embedded.
+
+        Returns:
+            The chunks that still need an embedding (not added); pass them
+            to :meth:`add_batch` once embedded.
+        """
+        known: list[CodeChunk] = []
+        missing: list[CodeChunk] = []
+        for c in chunks:
+            (known if c.id in self.vectors else missing).append(c)
+        self._insert(known)
+        return missing
+
+    def replace_file(
+        self,
+        file_path: Path,
+        chunks: Sequence[CodeChunk],
+        stamp: FileStamp | None = None,
+    ) -> list[CodeChunk]:
+        """Swap a file's chunks for a fresh chunking of it.
+
+        Chunks whose content is already embedded (anywhere in the index,
+        including the file's previous chunks) are reused; embeddings no
+        longer referenced afterwards are dropped.
+
+        Returns:
+            The chunks that still need an embedding, as for :meth:`add_cached`.
+        """
+        old = self._detach(file_path)
+        missing = self.add_cached(chunks)
+        if stamp is not None:
+            self._stamps[file_path] = stamp
+        self._drop_orphans({c.id for c in old})
+        return missing
+
+    def stamp_file(self, file_path: Path, stamp: FileStamp) -> None:
+        """Record the (mtime_ns, size) a file was indexed at."""
+        self._stamps[file_path] = stamp
+        self._dirty_files.add(file_path)
+
+    def remove_file(self, file_path: Path) -> int:
+        """Remove every chunk of a file and drop embeddings no longer referenced.
+
+        Returns:
+            Number of chunks removed.
+        """
+        self._stamps.pop(file_path, None)
+        old = self._detach(file_path)
+        self._drop_orphans({c.id for c in old})
+        return len(old)
+
+    def _insert(self, chunks: Sequence[CodeChunk]) -> None:
+        for c in chunks:
+            self._files.setdefault(c.file_path, []).append(c)
+            self._by_id.setdefault(c.id, []).append(c)
+            self._dirty_files.add(c.file_path)
+        if chunks:
+            self._chunk_count += len(chunks)
+            self._flat = None
+
+    def _detach(self, file_path: Path) -> list[CodeChunk]:
+        """Unlink a file's chunks, leaving their embeddings in place."""
+        self._dirty_files.add(file_path)
+        old = self._files.pop(file_path, [])
+        for c in old:
+            same = self._by_id.get(c.id)
+            if same is None:
+                continue
+            same[:] = [other for other in same if other is not c]
+            if not same:
+                del self._by_id[c.id]
+        if old:
+            self._chunk_count -= len(old)
+            self._flat = None
+        return old
+
+    def _drop_orphans(self, chunk_ids: set[str]) -> None:
+        for chunk_id in chunk_ids:
+            if chunk_id not in self._by_id and self.vectors.discard(chunk_id):
+                self._unsaved_ids.pop(chunk_id, None)
+                self._dropped_ids.add(chunk_id)
+
+    # ── Search ───────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query_vector: NDArray[np.floating],
+        top_k: int = 10,
+        threshold: float | None = None,
+    ) -> list[tuple[CodeChunk, float]]:
+        """Find the chunks most similar to a query vector.
+
+        Args:
+            query_vector: Raw query embedding (normalized here).
+            top_k: Maximum chunks to return.
+            threshold: Minimum cosine similarity.
+
+        Returns:
+            (chunk, score) pairs, highest score first.
+        """
+        if not self._by_id or self.vectors.count == 0:
+            return []
+        ann = self._approximate_index()
+        hits = (
+            ann.search_ids(query_vector, top_k, threshold)
+            if ann is not None
+            else self.vectors.search(query_vector, top_k, threshold)
+        )
+        results: list[tuple[CodeChunk, float]] = []
+        for chunk_id, score in hits:
+            for chunk in self._by_id.get(chunk_id, ()):
+                results.append((chunk, score))
+                if len(results) >= top_k:
+                    return results
+        return results
+
+    def _approximate_index(self) -> IVFIndex | None:
+        if self.ann_threshold is None or self.vectors.count < self.ann_threshold:
+            return None
+        if self._ann is None:
+            self._ann = IVFIndex.over(
+                self.vectors,
+                centroids=self._saved_centroids,
+                nprobe=self.ann_nprobe,
+                min_train_size=self.ann_threshold,
+            )
+            self._saved_centroids = None
+        return self._ann
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self, directory: Path) -> None:
+        """Persist the index to ``directory``.
+
+        If the directory already holds this index's snapshot, only the files
+        and vectors changed since the last save are appended to the log;
+        otherwise (or once the log outgrows the snapshot) a full snapshot is
+        written and the log is reset.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        if self._synced_dir == directory and not self._log_needs_compaction(directory):
+            self._append_log(directory)
+        else:
+            self._write_snapshot(directory)
+        centroids = self._ann.centroids if self._ann is not None else self._saved_centroids
+        if centroids is not None:
+            np.save(directory / _CENTROIDS_FILE, centroids)
+        else:
+            (directory / _CENTROIDS_FILE).unlink(missing_ok=True)
+        self._synced_dir = directory
+        self._dirty_files.clear()
+        self._unsaved_ids.clear()
+        self._dropped_ids.clear()
+
+    def _write_snapshot(self, directory: Path) -> None:
+        # Drop the log first: a crash then leaves an older but consistent
+        # snapshot, never new log records replayed over a newer snapshot.
+        (directory / _LOG_FILE).unlink(missing_ok=True)
+        self.vectors.save(directory / _VECTORS_FILE)
+        state = {
+            "version": _INDEX_FORMAT_VERSION,
+            "chunks": self.chunks,
+            "stamps": dict(self._stamps),
+            "file_count": self.file_count,
+            "total_lines": self.total_lines,
+        }
+        tmp = directory / f"{_INDEX_FILE}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, directory / _INDEX_FILE)
+
+    def _append_log(self, directory: Path) -> None:
+        records: list[tuple] = []
+        live = [chunk_id for chunk_id in self._unsaved_ids if chunk_id in self.vectors]
+        if live:
+            rows = np.fromiter((self.vectors.row_of(i) for i in live), dtype=np.intp)
+            records.append(("vectors", live, self.vectors.take(rows)))
+        for path in self._dirty_files:
+            records.append(("file", path, self._files.get(path, []), self._stamps.get(path)))
+        if self._dropped_ids:
+            records.append(("drop", sorted(self._dropped_ids)))
+        if not records:
+            return
+        records.append(("meta", self.file_count, self.total_lines))
+        with open(directory / _LOG_FILE, "ab") as f:
+            for record in records:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _log_needs_compaction(directory: Path) -> bool:
+        try:
+            log_bytes = (directory / _LOG_FILE).stat().st_size
+            snapshot_bytes = (directory / _INDEX_FILE).stat().st_size + (
+                directory / _VECTORS_FILE
+            ).stat().st_size
+        except OSError:
+            return not (directory / _INDEX_FILE).exists()
+        return log_bytes > max(snapshot_bytes, _MIN_LOG_COMPACT_BYTES)
+
+    def _replay_log(self, path: Path) -> bool:
+        """Apply log records; returns False if the log ends in a torn write."""
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    return True
+                except (pickle.UnpicklingError, ValueError, AttributeError, IndexError):
+                    return False
+                kind = record[0]
+                if kind == "vectors":
+                    self.vectors.add_batch(record[1], record[2], normalized=True)
+                elif kind == "file":
+                    _, file_path, file_chunks, stamp = record
+                    self._detach(file_path)
+                    self._insert(file_chunks)
+                    if stamp is None:
+                        self._stamps.pop(file_path, None)
+                    else:
+                        self._stamps[file_path] = stamp
+                elif kind == "drop":
+                    for chunk_id in record[1]:
+                        if chunk_id not in self._by_id:
+                            self.vectors.discard(chunk_id)
+                elif kind == "meta":
+                    self.file_count, self.total_lines = record[1], record[2]
+
+    @classmethod
+    def load(cls, directory: Path, *, mmap: bool = True) -> CodebaseIndex:
+        """Load an index written by :meth:`save` (snapshot plus log).
+
+        Raises:
+            FileNotFoundError: If the index or its vector sidecar is missing.
+            ValueError: If the index was written in an older format.
+        """
+        with open(directory / _INDEX_FILE, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, dict) or state.get("version") != _INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format in {directory}")
+        index = cls(
+            vectors=EmbeddingMatrix.load(directory / _VECTORS_FILE, mmap=mmap),
+            file_count=state["file_count"],
+            total_lines=state["total_lines"],
+        )
+        index._insert(state["chunks"])
+        index._stamps.update(state.get("stamps", {}))
+        centroids_path = directory / _CENTROIDS_FILE
+        if centroids_path.exists():
+            index._saved_centroids = np.load(centroids_path)
+
+        log_path = directory / _LOG_FILE
+        intact = not log_path.exists() or index._replay_log(log_path)
+        index._dirty_files.clear()
+        # A torn log tail cannot be appended to: the next save re-snapshots
+        index._synced_dir = directory if intact else None
+        return index
+
+    @staticmethod
+    def exists(directory: Path) -> bool:
+        """Whether a saved index (and its vector sidecar) exists."""
+        return (directory / _INDEX_FILE).exists() and EmbeddingMatrix.exists(
+            directory / _VECTORS_FILE
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class RetrievedContext:
@@ -257,7 +636,6 @@ class CodebaseIndexer:
                 re.compile(fnmatch.translate(p)) for p in include_patterns
             )
         self._index: CodebaseIndex | None = None
-        self._vector_index: dict[str, list[float]] = {}
 
     async def index_workspace(self, workspace: Workspace) -> CodebaseIndex:
         """Index all code files in workspace with PARALLEL processing.
@@ -303,24 +681,13 @@ class CodebaseIndexer:
         file_count = len([cl for cl in chunk_lists if cl])
         total_lines = sum(c.end_line - c.start_line + 1 for c in chunks)
 
+        self._index = CodebaseIndex(file_count=file_count, total_lines=total_lines)
+
         # Create embeddings for unique chunks only (dedup saves API calls)
         if chunks:
             texts = [f"{c.name or ''}\n{c.content}" for c in chunks]
             result = await self.embedder.embed(texts)
-
-            embedding_dict = {
-                chunk.id: result.vectors[i].tolist()
-                for i, chunk in enumerate(chunks)
-            }
-        else:
-            embedding_dict = {}
-
-        self._index = CodebaseIndex(
-            chunks=chunks,
-            embeddings=embedding_dict,
-            file_count=file_count,
-            total_lines=total_lines,
-        )
+            self._index.add_batch(chunks, result.vectors)
 
         return self._index
 
@@ -343,22 +710,9 @@ class CodebaseIndexer:
         if not self._index or not self._index.chunks:
             return RetrievedContext(chunks=(), relevance_scores=MappingProxyType({}))
 
-        # Embed query
+        # Embed query and score every chunk with one matrix-vector product
         result = await self.embedder.embed([query])
-        query_embedding = result.vectors[0].tolist()
-
-        # Calculate similarity scores
-        scores: list[tuple[CodeChunk, float]] = []
-        for chunk in self._index.chunks:
-            chunk_embedding = self._index.embeddings.get(chunk.id)
-            if chunk_embedding:
-                score = self._cosine_similarity(query_embedding, chunk_embedding)
-                if score >= threshold:
-                    scores.append((chunk, score))
-
-        # Sort by score and take top_k
-        scores.sort(key=lambda x: x[1], reverse=True)
-        top_chunks = scores[:top_k]
+        top_chunks = self._index.search(result.vectors[0], top_k=top_k, threshold=threshold)
 
         return RetrievedContext(
             chunks=tuple(c for c, _ in top_chunks),
@@ -546,18 +900,6 @@ class CodebaseIndexer:
 
         return chunks
 
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot = sum(x * y for x, y in zip(a, b, strict=False))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot / (norm_a * norm_b)
-
 
 def _get_language(path: Path) -> str:
     """Get language identifier for a file."""
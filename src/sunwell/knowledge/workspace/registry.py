@@ -196,7 +196,10 @@ class WorkspaceRegistry:
         from sunwell.knowledge.workspace.workspace_index import WorkspaceSignatureIndex
 
         index = WorkspaceSignatureIndex(ws)
-        return await index.scan_all()
+        try:
+            return await index.scan_all()
+        finally:
+            index.close()
 
     def trigger_l1_indexing_background(self, workspace_id: str) -> None:
         """Trigger L1 indexing in the background.
@@ -215,7 +218,10 @@ class WorkspaceRegistry:
             try:
                 from sunwell.knowledge.workspace.workspace_index import WorkspaceSignatureIndex
                 index = WorkspaceSignatureIndex(ws)
-                stats = await index.scan_all()
+                try:
+                    stats = await index.scan_all()
+                finally:
+                    index.close()
                 logger.info(f"L1 indexing complete for {workspace_id}: {sum(stats.values())} signatures")
             except Exception as e:
                 logger.warning(f"Background L1 indexing failed for {workspace_id}: {e}")
@@ -4,16 +4,23 @@ Aggregates lightweight signatures across all projects in a workspace.
 Used for fast cross-project awareness without full indexing overhead.
 
 Storage: ~/.sunwell/workspaces/{workspace_id}/index/signatures.db
+
+Search runs in SQLite: an FTS5 table over name, name words (camelCase and
+snake_case split), signature and docstring is ranked with bm25, and exact
+or substring name matches are boosted in the same query. Rescans skip files
+whose content hash has not changed since the last scan.
 """
 
 import asyncio
 import logging
+import re
 import sqlite3
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from sunwell.foundation.utils import compute_file_hash
 from sunwell.knowledge.indexing.signature_extractor import Signature, SignatureExtractor
 from sunwell.knowledge.workspace.types import (
     Workspace,
@@ -29,6 +36,74 @@ __all__ = [
 ]
 
 
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    docstring TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_project ON signatures(project_id);
+CREATE INDEX IF NOT EXISTS idx_name ON signatures(name);
+CREATE INDEX IF NOT EXISTS idx_kind ON signatures(kind);
+CREATE INDEX IF NOT EXISTS idx_project_file ON signatures(project_id, file_path);
+
+-- Content hash of every scanned file, so rescans skip unchanged files
+CREATE TABLE IF NOT EXISTS files (
+    project_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (project_id, file_path)
+);
+"""
+
+# Full-text index over signatures (rowid = signatures.id). Kept in sync
+# explicitly by _store_signatures/_clear_project rather than by triggers,
+# because the name-words column needs a Python function.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE signatures_fts USING fts5(
+    name, words, signature, docstring
+)
+"""
+
+# bm25 column weights: name, name words, signature, docstring
+_BM25_WEIGHTS = "10.0, 5.0, 2.0, 1.0"
+
+_NAME_WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+_QUERY_TERM = re.compile(r"\w+")
+
+
+def _name_words(name: str) -> str:
+    """Split an identifier into lowercase words (getUserByID → get user by id)."""
+    return " ".join(w.lower() for w in _NAME_WORD.findall(name))
+
+
+def _fts_query(query: str) -> str:
+    """FTS5 query matching any query term or name word as a prefix."""
+    terms: dict[str, None] = {}
+    for term in _QUERY_TERM.findall(query):
+        terms[term.lower()] = None
+        for word in _name_words(term).split():
+            terms[word] = None
+    return " OR ".join(f'"{term}"*' for term in terms)
+
+
+def _row_to_signature(row: sqlite3.Row) -> Signature:
+    return Signature(
+        name=row["name"],
+        kind=row["kind"],
+        signature=row["signature"],
+        file_path=Path(row["file_path"]),
+        line=row["line"],
+        docstring=row["docstring"],
+    )
+
+
 def get_workspace_index_dir(workspace_id: str) -> Path:
     """Get the index directory for a workspace.
 
@@ -59,7 +134,8 @@ class WorkspaceSignatureIndex:
     """Cross-project L1 signature index.
 
     Aggregates signatures from all projects in a workspace for fast
-    cross-project awareness. Uses SQLite for efficient persistent storage.
+    cross-project awareness. Uses SQLite for efficient persistent storage,
+    through one long-lived connection shared by all calls.
 
     Example:
         >>> index = WorkspaceSignatureIndex(workspace)
@@ -67,6 +143,7 @@ class WorkspaceSignatureIndex:
         >>> matches = await index.search("authentication", top_k=10)
         >>> for match in matches:
         ...     print(f"[{match.project_id}] {match.signature.name}")
+        >>> index.close()
     """
 
     workspace: Workspace
@@ -76,6 +153,8 @@ class WorkspaceSignatureIndex:
     _db_path: Path = field(init=False)
     _extractor: SignatureExtractor = field(init=False)
     _lock: threading.Lock = field(init=False)
+    _conn: sqlite3.Connection = field(init=False)
+    _fts: bool = field(default=False, init=False)
     _initialized: bool = field(default=False, init=False)
 
     def __post_init__(self) -> None:
@@ -86,37 +165,46 @@ class WorkspaceSignatureIndex:
         self._init_db()
 
     def _init_db(self) -> None:
-        """Initialize SQLite database."""
+        """Open the shared connection and create the schema."""
         with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
-            try:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS signatures (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        project_id TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        kind TEXT NOT NULL,
-                        signature TEXT NOT NULL,
-                        file_path TEXT NOT NULL,
-                        line INTEGER NOT NULL,
-                        docstring TEXT,
-                        indexed_at TEXT NOT NULL
-                    )
-                """)
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_project ON signatures(project_id)
-                """)
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_name ON signatures(name)
-                """)
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.create_function("name_words", 1, _name_words, deterministic=True)
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._fts = self._init_fts(conn)
+
+        self._initialized = True
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 table, indexing signatures stored before it existed.
+
+        Returns:
+            False if this SQLite build lacks FTS5 (search then scans rows).
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'signatures_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            with conn:
+                conn.execute(FTS_SCHEMA)
                 conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_kind ON signatures(kind)
+                    INSERT INTO signatures_fts (rowid, name, words, signature, docstring)
+                    SELECT id, name, name_words(name), signature, docstring FROM signatures
                 """)
-                conn.commit()
-            finally:
-                conn.close()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, signature search will scan rows: {e}")
+            return False
+        return True
 
-        self._initialized = True
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     async def scan_all(self) -> dict[str, int]:
         """Scan all projects and build the index.
@@ -135,44 +223,90 @@ class WorkspaceSignatureIndex:
     async def scan_project(self, project: WorkspaceProject) -> int:
         """Scan a single project for signatures.
 
+        Only files added or changed since the last scan are re-extracted;
+        signatures of deleted files are dropped.
+
         Args:
             project: Project to scan.
 
         Returns:
-            Number of signatures extracted.
+            Number of signatures indexed for the project.
         """
-        # Clear existing signatures for this project
-        await asyncio.to_thread(self._clear_project, project.id)
-
         # Find source files
         source_files = await asyncio.to_thread(self._find_source_files, project.path)
+        changed, removed = await asyncio.to_thread(
+            self._changed_files, project.id, source_files
+        )
 
         # Extract signatures
-        signatures: list[tuple[str, Signature]] = []
-        for file_path in source_files:
+        extracted: dict[Path, tuple[str, list[Signature]]] = {}
+        for file_path, content_hash in changed.items():
             try:
                 file_sigs = await asyncio.to_thread(self._extractor.extract, file_path)
-                for sig in file_sigs:
-                    signatures.append((project.id, sig))
+                extracted[file_path] = (content_hash, file_sigs)
             except Exception as e:
                 logger.debug(f"Failed to extract signatures from {file_path}: {e}")
 
         # Store signatures
-        if signatures:
-            await asyncio.to_thread(self._store_signatures, signatures)
+        if extracted or removed:
+            await asyncio.to_thread(self._store_signatures, project.id, extracted, removed)
+
+        count = await asyncio.to_thread(self._count_project, project.id)
+        logger.info(
+            f"Indexed {count} signatures for {project.id} "
+            f"({len(extracted)} files updated, {len(removed)} removed, "
+            f"{len(source_files) - len(changed)} unchanged)"
+        )
+        return count
 
-        logger.info(f"Indexed {len(signatures)} signatures for {project.id}")
-        return len(signatures)
+    def _changed_files(
+        self,
+        project_id: str,
+        source_files: list[Path],
+    ) -> tuple[dict[Path, str], list[str]]:
+        """Compare files against their stored content hashes.
 
-    def _clear_project(self, project_id: str) -> None:
-        """Clear signatures for a project."""
+        Returns:
+            (new or changed file -> content hash, paths no longer present)
+        """
         with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
+            stored = dict(
+                self._conn.execute(
+                    "SELECT file_path, content_hash FROM files WHERE project_id = ?",
+                    (project_id,),
+                ).fetchall()
+            )
+        if not stored:
+            # Rows from before hashes were tracked cannot be matched to files
+            self._clear_project(project_id)
+
+        changed: dict[Path, str] = {}
+        for file_path in source_files:
+            key = str(file_path)
+            known = stored.pop(key, None)
             try:
-                conn.execute("DELETE FROM signatures WHERE project_id = ?", (project_id,))
-                conn.commit()
-            finally:
-                conn.close()
+                content_hash = compute_file_hash(file_path)
+            except OSError:
+                continue
+            if content_hash != known:
+                changed[file_path] = content_hash
+
+        # Anything left was indexed before but is gone now
+        return changed, list(stored)
+
+    def _clear_project(self, project_id: str) -> None:
+        """Clear signatures for a project."""
+        with self._lock, self._conn as conn:
+            if self._fts:
+                conn.execute(
+                    """
+                    DELETE FROM signatures_fts WHERE rowid IN
+                        (SELECT id FROM signatures WHERE project_id = ?)
+                    """,
+                    (project_id,),
+                )
+            conn.execute("DELETE FROM signatures WHERE project_id = ?", (project_id,))
+            conn.execute("DELETE FROM files WHERE project_id = ?", (project_id,))
 
     def _find_source_files(self, root: Path) -> list[Path]:
         """Find source files to index."""
@@ -191,36 +325,83 @@ class WorkspaceSignatureIndex:
 
         return files
 
-    def _store_signatures(self, signatures: list[tuple[str, Signature]]) -> None:
-        """Store signatures in database."""
+    def _store_signatures(
+        self,
+        project_id: str,
+        files: dict[Path, tuple[str, list[Signature]]],
+        removed: list[str] | None = None,
+    ) -> None:
+        """Replace the stored signatures of changed and removed files.
+
+        Args:
+            project_id: Project the files belong to.
+            files: File -> (content hash, its extracted signatures).
+            removed: Files whose signatures should be dropped.
+        """
         now = datetime.now().isoformat()
+        stale = [(project_id, str(path)) for path in files] + [
+            (project_id, path) for path in removed or []
+        ]
 
-        with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
-            try:
+        with self._lock, self._conn as conn:
+            if self._fts:
                 conn.executemany(
                     """
-                    INSERT INTO signatures 
-                    (project_id, name, kind, signature, file_path, line, docstring, indexed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    DELETE FROM signatures_fts WHERE rowid IN
+                        (SELECT id FROM signatures WHERE project_id = ? AND file_path = ?)
                     """,
-                    [
-                        (
-                            project_id,
-                            sig.name,
-                            sig.kind,
-                            sig.signature,
-                            str(sig.file_path),
-                            sig.line,
-                            sig.docstring,
-                            now,
-                        )
-                        for project_id, sig in signatures
-                    ],
+                    stale,
                 )
-                conn.commit()
-            finally:
-                conn.close()
+            conn.executemany(
+                "DELETE FROM signatures WHERE project_id = ? AND file_path = ?", stale
+            )
+            conn.executemany(
+                "DELETE FROM files WHERE project_id = ? AND file_path = ?", stale
+            )
+
+            # AUTOINCREMENT ids only grow, so new rows are those above this
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM signatures").fetchone()[0]
+            conn.executemany(
+                """
+                INSERT INTO signatures
+                (project_id, name, kind, signature, file_path, line, docstring, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        project_id,
+                        sig.name,
+                        sig.kind,
+                        sig.signature,
+                        str(sig.file_path),
+                        sig.line,
+                        sig.docstring,
+                        now,
+                    )
+                    for file_sigs in (sigs for _, sigs in files.values())
+                    for sig in file_sigs
+                ],
+            )
+            if self._fts:
+                conn.execute(
+                    """
+                    INSERT INTO signatures_fts (rowid, name, words, signature, docstring)
+                    SELECT id, name, name_words(name), signature, docstring
+                    FROM signatures WHERE id > ?
+                    """,
+                    (last_id,),
+                )
+            conn.executemany(
+                "INSERT INTO files (project_id, file_path, content_hash) VALUES (?, ?, ?)",
+                [(project_id, str(path), digest) for path, (digest, _) in files.items()],
+            )
+
+    def _count_project(self, project_id: str) -> int:
+        """Number of signatures stored for a project."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM signatures WHERE project_id = ?", (project_id,)
+            ).fetchone()[0]
 
     async def search(
         self,
@@ -230,7 +411,7 @@ class WorkspaceSignatureIndex:
     ) -> list[SignatureMatch]:
         """Search for signatures matching query.
 
-        Uses simple text matching on name, signature, and docstring.
+        Uses full-text matching on name, signature, and docstring.
         For semantic search, use the full WorkspaceSearch.
 
         Args:
@@ -251,30 +432,80 @@ class WorkspaceSignatureIndex:
         top_k: int,
         project_ids: list[str] | None,
     ) -> list[SignatureMatch]:
-        """Synchronous search implementation."""
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
+        """Synchronous search implementation.
+
+        Scores: 1.0 for an exact name match, 0.8 when the name contains the
+        query, otherwise bm25 relevance scaled into (0, 0.6).
+        """
+        if not self._fts:
+            return self._scan_search(query, top_k, project_ids)
+
+        match = _fts_query(query)
+        if not match:
+            return []
 
+        params: dict[str, object] = {
+            "query": query.strip().lower(),
+            "match": match,
+            "top_k": top_k,
+        }
+        project_filter = ""
+        if project_ids:
+            placeholders = ",".join(f":p{i}" for i in range(len(project_ids)))
+            project_filter = f"WHERE s.project_id IN ({placeholders})"
+            params.update({f"p{i}": pid for i, pid in enumerate(project_ids)})
+
+        sql = f"""
+            SELECT s.project_id, s.name, s.kind, s.signature, s.file_path, s.line,
+                   s.docstring,
+                   CASE
+                       WHEN lower(s.name) = :query THEN 1.0
+                       WHEN instr(lower(s.name), :query) > 0 THEN 0.8
+                       ELSE 0.6 * -m.rank / (1.0 - m.rank)
+                   END AS score
+            FROM (
+                SELECT rowid, bm25(signatures_fts, {_BM25_WEIGHTS}) AS rank
+                FROM signatures_fts WHERE signatures_fts MATCH :match
+            ) AS m
+            JOIN signatures AS s ON s.id = m.rowid
+            {project_filter}
+            ORDER BY score DESC, m.rank
+            LIMIT :top_k
+        """
         with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
-            conn.row_factory = sqlite3.Row
-            try:
-                # Build SQL query
-                sql = """
-                    SELECT project_id, name, kind, signature, file_path, line, docstring
-                    FROM signatures
-                """
-                params: list = []
+            rows = self._conn.execute(sql, params).fetchall()
 
-                if project_ids:
-                    placeholders = ",".join("?" for _ in project_ids)
-                    sql += f" WHERE project_id IN ({placeholders})"
-                    params.extend(project_ids)
+        return [
+            SignatureMatch(
+                project_id=row["project_id"],
+                signature=_row_to_signature(row),
+                score=row["score"],
+            )
+            for row in rows
+        ]
+
+    def _scan_search(
+        self,
+        query: str,
+        top_k: int,
+        project_ids: list[str] | None,
+    ) -> list[SignatureMatch]:
+        """Score every row in Python (used only when FTS5 is unavailable)."""
+        query_lower = query.lower()
+        query_words = set(query_lower.split())
 
-                cursor = conn.execute(sql, params)
-                rows = cursor.fetchall()
-            finally:
-                conn.close()
+        sql = """
+            SELECT project_id, name, kind, signature, file_path, line, docstring
+            FROM signatures
+        """
+        params: list = []
+        if project_ids:
+            placeholders = ",".join("?" for _ in project_ids)
+            sql += f" WHERE project_id IN ({placeholders})"
+            params.extend(project_ids)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
 
         # Score and sort results
         matches: list[SignatureMatch] = []
@@ -300,19 +531,10 @@ class WorkspaceSignatureIndex:
                 else:
                     continue  # No match
 
-            sig = Signature(
-                name=row["name"],
-                kind=row["kind"],
-                signature=row["signature"],
-                file_path=Path(row["file_path"]),
-                line=row["line"],
-                docstring=row["docstring"],
-            )
-
             matches.append(
                 SignatureMatch(
                     project_id=row["project_id"],
-                    signature=sig,
+                    signature=_row_to_signature(row),
                     score=score,
                 )
             )
@@ -335,31 +557,15 @@ class WorkspaceSignatureIndex:
     def _get_project_signatures_sync(self, project_id: str) -> list[Signature]:
         """Synchronous get project signatures."""
         with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
-            conn.row_factory = sqlite3.Row
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT name, kind, signature, file_path, line, docstring
-                    FROM signatures WHERE project_id = ?
-                    """,
-                    (project_id,),
-                )
-                rows = cursor.fetchall()
-            finally:
-                conn.close()
+            rows = self._conn.execute(
+                """
+                SELECT name, kind, signature, file_path, line, docstring
+                FROM signatures WHERE project_id = ?
+                """,
+                (project_id,),
+            ).fetchall()
 
-        return [
-            Signature(
-                name=row["name"],
-                kind=row["kind"],
-                signature=row["signature"],
-                file_path=Path(row["file_path"]),
-                line=row["line"],
-                docstring=row["docstring"],
-            )
-            for row in rows
-        ]
+        return [_row_to_signature(row) for row in rows]
 
     def get_stats(self) -> dict[str, int]:
         """Get index statistics.
@@ -368,19 +574,17 @@ class WorkspaceSignatureIndex:
             Dict with total_signatures, project_count, etc.
         """
         with self._lock:
-            conn = sqlite3.connect(str(self._db_path))
-            try:
-                total = conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
-                projects = conn.execute(
-                    "SELECT COUNT(DISTINCT project_id) FROM signatures"
-                ).fetchone()[0]
-                by_kind = dict(
-                    conn.execute(
-                        "SELECT kind, COUNT(*) FROM signatures GROUP BY kind"
-                    ).fetchall()
-                )
-            finally:
-                conn.close()
+            conn = self._conn
+            total = conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+            projects = conn.execute(
+                "SELECT COUNT(DISTINCT project_id) FROM signatures"
+            ).fetchone()[0]
+            by_kind = {
+                row[0]: row[1]
+                for row in conn.execute(
+                    "SELECT kind, COUNT(*) FROM signatures GROUP BY kind"
+                ).fetchall()
+            }
 
         return {
             "total_signatures": total,
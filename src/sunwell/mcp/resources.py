@@ -238,10 +238,10 @@ Tools returning large injectable content support `include_context=False`:
             lenses = []
             for entry in registry.all_entries():
                 lenses.append(omit_empty({
-                    "name": entry.lens.metadata.name,
-                    "domain": entry.lens.metadata.domain,
+                    "name": entry.metadata.name,
+                    "domain": entry.metadata.domain,
                     "layer": entry.layer,
-                    "description": truncate(entry.lens.metadata.description, 120),
+                    "description": truncate(entry.metadata.description, 120),
                 }))
 
             return mcp_json({"lenses": lenses, "total": len(lenses)}, "compact")
@@ -264,7 +264,7 @@ Tools returning large injectable content support `include_context=False`:
                 registry = LayeredLensRegistry.from_discovery()
 
             lenses = [
-                {"name": e.lens.metadata.name, "domain": e.lens.metadata.domain}
+                {"name": e.metadata.name, "domain": e.metadata.domain}
                 for e in registry.all_entries()
             ]
 
@@ -299,7 +299,7 @@ Tools returning large injectable content support `include_context=False`:
             collisions = {}
             for shortcut, entries in registry.get_collisions().items():
                 collisions[shortcut] = [
-                    {"lens": e.lens.metadata.name, "layer": e.layer}
+                    {"lens": e.metadata.name, "layer": e.layer}
                     for e in entries
                 ]
 
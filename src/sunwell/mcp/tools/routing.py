@@ -193,9 +193,7 @@ def register_routing_tools(mcp: FastMCP, lenses_dir: str | None = None) -> None:
         for shortcut, lens_name in registry.shortcuts.items():
             # Get skill name from the lens's router
             entry = registry.get_entry(lens_name)
-            skill_name = None
-            if entry and entry.lens.router and entry.lens.router.shortcuts:
-                skill_name = entry.lens.router.shortcuts.get(shortcut)
+            skill_name = entry.shortcuts.get(shortcut) if entry else None
             result[shortcut] = omit_empty({
                 "lens": lens_name,
                 "skill": skill_name,
@@ -237,7 +235,7 @@ def register_routing_tools(mcp: FastMCP, lenses_dir: str | None = None) -> None:
         for shortcut, entries in registry.get_collisions().items():
             collisions[shortcut] = [
                 {
-                    "lens": e.lens.metadata.name,
+                    "lens": e.name,
                     "layer": e.layer,
                     "qualified": e.qualified_name,
                 }
@@ -158,7 +158,7 @@ class EmbeddingWorker:
         learnings_to_embed: list[tuple[str, str]] = []
         for learning_id in batch:
             learning = self.dag.learnings.get(learning_id)
-            if learning and learning.embedding is None:
+            if learning and learning_id not in self.dag.embeddings:
                 learnings_to_embed.append((learning_id, learning.fact))
 
         if not learnings_to_embed:
@@ -169,13 +169,11 @@ class EmbeddingWorker:
             texts = [fact for _, fact in learnings_to_embed]
             result = await self.embedder.embed(texts)
 
-            # Update learnings with embeddings
-            for i, (learning_id, _) in enumerate(learnings_to_embed):
-                learning = self.dag.learnings.get(learning_id)
-                if learning:
-                    embedding = tuple(result.vectors[i].tolist())
-                    updated = learning.with_embedding(embedding)
-                    self.dag.learnings[learning_id] = updated
+            # Store vectors in the DAG's embedding matrix (learnings get row views)
+            self.dag.set_embeddings(
+                [learning_id for learning_id, _ in learnings_to_embed],
+                result.vectors,
+            )
 
             logger.debug("Computed embeddings for %d learnings", len(learnings_to_embed))
             return len(learnings_to_embed)
@@ -103,9 +103,50 @@ CREATE TABLE IF NOT EXISTS bm25_metadata (
     key TEXT PRIMARY KEY,
     value REAL NOT NULL
 );
+
+-- Per-document token counts (BM25 length normalization)
+CREATE TABLE IF NOT EXISTS bm25_doc_length (
+    learning_id TEXT PRIMARY KEY,
+    length INTEGER NOT NULL,
+    FOREIGN KEY (learning_id) REFERENCES learnings(id)
+);
+
+-- Per-term document frequency, maintained incrementally on add
+CREATE TABLE IF NOT EXISTS bm25_terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+);
+"""
+
+# BM25 metadata keys. total_length lets avg_doc_length be updated incrementally;
+# its absence marks an index built before doc lengths were persisted.
+_BM25_TOTAL_DOCS = "total_docs"
+_BM25_TOTAL_LENGTH = "total_length"
+_BM25_AVG_DOC_LENGTH = "avg_doc_length"
+
+# Single grouped statement that scores every candidate document.
+# {terms} is a VALUES list of (term, idf) pairs bound as parameters.
+_BM25_QUERY_SQL = """
+WITH q(term, idf) AS (VALUES {terms})
+SELECT p.learning_id AS learning_id,
+       SUM(
+           q.idf * p.term_frequency * (:k1 + 1.0)
+           / (p.term_frequency + :k1 * (1.0 - :b + :b * d.length / :avg_doc_length))
+       ) AS score
+FROM q
+JOIN bm25_index p ON p.term = q.term
+JOIN bm25_doc_length d ON d.learning_id = p.learning_id
+GROUP BY p.learning_id
+ORDER BY score DESC, p.learning_id
+LIMIT :limit
 """
 
 
+def _tokenize(text: str) -> list[str]:
+    """BM25 tokenizer (lowercase, whitespace split)."""
+    return text.lower().split()
+
+
 @dataclass(slots=True)
 class LearningCache:
     """SQLite-backed cache for learning queries.
@@ -169,6 +210,7 @@ class LearningCache:
             return
 
         conn.executescript(SCHEMA)
+        self._migrate_bm25(conn)
         conn.commit()
         self._initialized = True
 
@@ -186,7 +228,7 @@ class LearningCache:
             try:
                 self._ensure_schema(conn)
 
-                conn.execute(
+                cursor = conn.execute(
                     """
                     INSERT OR IGNORE INTO learnings
                     (id, fact, category, confidence, timestamp, source_file, source_line)
@@ -202,7 +244,11 @@ class LearningCache:
                         learning.source_line,
                     ),
                 )
-                added = conn.total_changes > 0
+                # total_changes also counts the schema/migration writes made on
+                # this connection, so only the INSERT's own rowcount is reliable
+                added = cursor.rowcount > 0
+                if added:
+                    self._bm25_index_documents(conn, [(learning.id, learning.fact)])
                 conn.commit()
                 return added
             finally:
@@ -239,6 +285,13 @@ class LearningCache:
                     for l in learnings
                 ]
 
+                # New rows get rowids above the current maximum, so the rows this
+                # batch inserted (duplicates are ignored) can be read back in one
+                # query. IMMEDIATE keeps other writers out in between.
+                conn.execute("BEGIN IMMEDIATE")
+                last_rowid = conn.execute(
+                    "SELECT COALESCE(MAX(rowid), 0) FROM learnings"
+                ).fetchone()[0]
                 conn.executemany(
                     """
                     INSERT OR IGNORE INTO learnings
@@ -247,9 +300,17 @@ class LearningCache:
                     """,
                     data,
                 )
-                added = conn.total_changes
+                inserted = [
+                    (row[0], row[1])
+                    for row in conn.execute(
+                        "SELECT id, fact FROM learnings WHERE rowid > ? ORDER BY rowid",
+                        (last_rowid,),
+                    )
+                ]
+
+                self._bm25_index_documents(conn, inserted)
                 conn.commit()
-                return added
+                return len(inserted)
             finally:
                 conn.close()
 
@@ -478,6 +539,7 @@ class LearningCache:
 
                 # Clear existing data
                 conn.execute("DELETE FROM learnings")
+                self._bm25_clear(conn)
                 conn.commit()
 
                 if not journal.exists():
@@ -509,6 +571,7 @@ class LearningCache:
                     """,
                     data,
                 )
+                self._bm25_index_documents(conn, [(row[0], row[1]) for row in data])
                 conn.commit()
                 return len(data)
             finally:
@@ -622,7 +685,7 @@ class LearningCache:
             try:
                 self._ensure_schema(conn)
 
-                conn.execute(
+                cursor = conn.execute(
                     """
                     INSERT OR IGNORE INTO entities
                     (entity_id, canonical_name, entity_type, aliases, first_seen)
@@ -636,7 +699,7 @@ class LearningCache:
                         datetime.now().isoformat(),
                     ),
                 )
-                added = conn.total_changes > 0
+                added = cursor.rowcount > 0
                 conn.commit()
                 return added
             finally:
@@ -665,7 +728,7 @@ class LearningCache:
             try:
                 self._ensure_schema(conn)
 
-                conn.execute(
+                cursor = conn.execute(
                     """
                     INSERT OR IGNORE INTO learning_entities
                     (learning_id, entity_id, mention_text, confidence)
@@ -673,7 +736,7 @@ class LearningCache:
                     """,
                     (learning_id, entity_id, mention_text, confidence),
                 )
-                added = conn.total_changes > 0
+                added = cursor.rowcount > 0
 
                 # Increment mention count
                 if added:
@@ -730,98 +793,40 @@ class LearningCache:
             conn.close()
 
     # === Phase 4: BM25 inverted index methods ===
+    #
+    # Storage:
+    #   bm25_index       (term, learning_id) -> term frequency (postings)
+    #   bm25_doc_length  learning_id -> token count
+    #   bm25_terms       term -> document frequency
+    #   bm25_metadata    total_docs, total_length, avg_doc_length
+    #
+    # All four are maintained incrementally by add()/add_batch(), so queries
+    # never aggregate over postings to recover df or document lengths.
 
     def build_bm25_index(self) -> int:
-        """Build BM25 inverted index from learnings.
+        """Rebuild the BM25 inverted index from all learnings.
 
-        This optimizes BM25 from O(n) to O(log n) by pre-computing
-        term frequencies and storing them in an inverted index.
+        The index is kept up to date on every add, so this is only needed
+        to repair an index or after bulk changes made outside this class.
 
         Returns:
             Number of terms indexed
         """
-        from collections import Counter
-
         with self._lock:
             conn = self._get_connection()
             try:
                 self._ensure_schema(conn)
-
-                # Clear existing index
-                conn.execute("DELETE FROM bm25_index")
-                conn.execute("DELETE FROM bm25_metadata")
-
-                # Get all learnings
-                rows = conn.execute(
-                    "SELECT id, fact FROM learnings"
-                ).fetchall()
-
-                if not rows:
-                    conn.commit()
-                    return 0
-
-                # Build inverted index
-                index_data = []
-                total_tokens = 0
-                doc_lengths = []
-
-                for row in rows:
-                    learning_id = row["id"]
-                    fact = row["fact"]
-
-                    # Tokenize
-                    tokens = fact.lower().split()
-                    doc_lengths.append(len(tokens))
-                    total_tokens += len(tokens)
-
-                    # Count term frequencies
-                    term_freq = Counter(tokens)
-
-                    # Add to index
-                    for term, freq in term_freq.items():
-                        index_data.append((term, learning_id, freq))
-
-                # Insert index data in batch
-                conn.executemany(
-                    """
-                    INSERT INTO bm25_index (term, learning_id, term_frequency)
-                    VALUES (?, ?, ?)
-                    """,
-                    index_data,
-                )
-
-                # Calculate and store metadata
-                avg_doc_length = total_tokens / len(rows) if rows else 0
-                total_docs = len(rows)
-
-                conn.execute(
-                    """
-                    INSERT INTO bm25_metadata (key, value)
-                    VALUES ('avg_doc_length', ?)
-                    """,
-                    (avg_doc_length,),
-                )
-                conn.execute(
-                    """
-                    INSERT INTO bm25_metadata (key, value)
-                    VALUES ('total_docs', ?)
-                    """,
-                    (float(total_docs),),
-                )
-
+                self._bm25_rebuild(conn)
                 conn.commit()
 
-                # Count unique terms
-                unique_terms = conn.execute(
-                    "SELECT COUNT(DISTINCT term) FROM bm25_index"
-                ).fetchone()[0]
-
+                stats = self._bm25_metadata(conn)
+                unique_terms = conn.execute("SELECT COUNT(*) FROM bm25_terms").fetchone()[0]
                 logger.info(
-                    f"Built BM25 index: {unique_terms} terms, "
-                    f"{len(index_data)} entries, "
-                    f"avg_doc_length={avg_doc_length:.1f}"
+                    "Built BM25 index: %d terms, %d docs, avg_doc_length=%.1f",
+                    unique_terms,
+                    int(stats.get(_BM25_TOTAL_DOCS, 0)),
+                    stats.get(_BM25_AVG_DOC_LENGTH, 0.0),
                 )
-
                 return unique_terms
             finally:
                 conn.close()
@@ -836,11 +841,8 @@ class LearningCache:
         try:
             self._ensure_schema(conn)
 
-            count = conn.execute(
-                "SELECT COUNT(*) FROM bm25_index"
-            ).fetchone()[0]
-
-            return count > 0
+            row = conn.execute("SELECT 1 FROM bm25_index LIMIT 1").fetchone()
+            return row is not None
         finally:
             conn.close()
 
@@ -853,8 +855,9 @@ class LearningCache:
     ) -> list[tuple[str, float]]:
         """Fast BM25 query using inverted index.
 
-        This is ~25x faster than the O(n) on-the-fly computation
-        for large learning sets (10k+ learnings).
+        Issues three statements regardless of query length or corpus size:
+        corpus statistics, document frequencies for the query terms, and one
+        grouped scoring query over the postings.
 
         Args:
             query: Query string
@@ -868,100 +871,49 @@ class LearningCache:
         if not query:
             return []
 
+        # Tokenize query (each distinct term contributes once)
+        query_terms = sorted(set(_tokenize(query)))
+        if not query_terms:
+            return []
+
         conn = self._get_connection()
         try:
             self._ensure_schema(conn)
 
-            # Get metadata
-            avg_doc_length_row = conn.execute(
-                "SELECT value FROM bm25_metadata WHERE key = 'avg_doc_length'"
-            ).fetchone()
-            total_docs_row = conn.execute(
-                "SELECT value FROM bm25_metadata WHERE key = 'total_docs'"
-            ).fetchone()
-
-            if not avg_doc_length_row or not total_docs_row:
-                logger.warning("BM25 index metadata missing, index may not be built")
-                return []
-
-            avg_doc_length = avg_doc_length_row[0]
-            total_docs = int(total_docs_row[0])
-
-            # Tokenize query
-            query_terms = query.lower().split()
-            if not query_terms:
+            stats = self._bm25_metadata(conn)
+            total_docs = int(stats.get(_BM25_TOTAL_DOCS, 0))
+            avg_doc_length = stats.get(_BM25_AVG_DOC_LENGTH, 0.0)
+            if total_docs == 0 or avg_doc_length <= 0:
                 return []
 
-            # Calculate IDF for each term
-            # IDF = log((N - df + 0.5) / (df + 0.5))
-            term_idfs = {}
-            for term in set(query_terms):
-                df_row = conn.execute(
-                    """
-                    SELECT COUNT(DISTINCT learning_id)
-                    FROM bm25_index
-                    WHERE term = ?
-                    """,
-                    (term,),
-                ).fetchone()
-                df = df_row[0] if df_row else 0
-
-                if df > 0:
-                    idf = self._calculate_idf(total_docs, df)
-                    term_idfs[term] = idf
-
-            if not term_idfs:
+            placeholders = ",".join("?" * len(query_terms))
+            dfs = conn.execute(
+                f"SELECT term, df FROM bm25_terms WHERE term IN ({placeholders})",
+                query_terms,
+            ).fetchall()
+            if not dfs:
                 return []
 
-            # Get candidate documents and their scores
-            # For each term, get all documents containing it
-            doc_scores: dict[str, float] = {}
-
-            for term in term_idfs:
-                rows = conn.execute(
-                    """
-                    SELECT learning_id, term_frequency
-                    FROM bm25_index
-                    WHERE term = ?
-                    """,
-                    (term,),
-                ).fetchall()
-
-                idf = term_idfs[term]
+            # IDF per matched term, bound into the scoring statement
+            term_params: dict[str, float | str] = {}
+            values: list[str] = []
+            for i, row in enumerate(dfs):
+                term_params[f"t{i}"] = row["term"]
+                term_params[f"i{i}"] = self._calculate_idf(total_docs, row["df"])
+                values.append(f"(:t{i}, :i{i})")
 
-                for row in rows:
-                    learning_id = row["learning_id"]
-                    tf = row["term_frequency"]
-
-                    # Get document length
-                    doc_length_row = conn.execute(
-                        """
-                        SELECT SUM(term_frequency)
-                        FROM bm25_index
-                        WHERE learning_id = ?
-                        """,
-                        (learning_id,),
-                    ).fetchone()
-                    doc_length = doc_length_row[0] if doc_length_row else 0
-
-                    # BM25 formula
-                    numerator = tf * (k1 + 1)
-                    denominator = tf + k1 * (
-                        1 - b + b * doc_length / avg_doc_length
-                    )
-                    term_score = idf * (numerator / denominator)
-
-                    # Accumulate score
-                    doc_scores[learning_id] = doc_scores.get(learning_id, 0.0) + term_score
-
-            # Sort by score and return top-k
-            sorted_docs = sorted(
-                doc_scores.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )
+            rows = conn.execute(
+                _BM25_QUERY_SQL.format(terms=", ".join(values)),
+                {
+                    **term_params,
+                    "k1": k1,
+                    "b": b,
+                    "avg_doc_length": avg_doc_length,
+                    "limit": limit,
+                },
+            ).fetchall()
 
-            return sorted_docs[:limit]
+            return [(row["learning_id"], row["score"]) for row in rows]
         finally:
             conn.close()
 
@@ -982,6 +934,95 @@ class LearningCache:
         denominator = doc_freq + 0.5
         return math.log(numerator / denominator + 1.0)  # Add 1 to avoid log(0)
 
+    @staticmethod
+    def _bm25_metadata(conn: sqlite3.Connection) -> dict[str, float]:
+        """Read BM25 corpus statistics in one statement."""
+        return {
+            row[0]: row[1]
+            for row in conn.execute("SELECT key, value FROM bm25_metadata").fetchall()
+        }
+
+    @staticmethod
+    def _bm25_index_documents(
+        conn: sqlite3.Connection,
+        docs: list[tuple[str, str]],
+    ) -> None:
+        """Add new documents to the BM25 index (caller holds the write lock).
+
+        Updates postings, document lengths, per-term df and corpus totals in
+        the caller's transaction. Documents must not already be indexed.
+        """
+        if not docs:
+            return
+        from collections import Counter
+
+        postings: list[tuple[str, str, int]] = []
+        lengths: list[tuple[str, int]] = []
+        df_delta: Counter[str] = Counter()
+        total_length = 0
+
+        for learning_id, fact in docs:
+            tokens = _tokenize(fact)
+            term_freq = Counter(tokens)
+            postings.extend((term, learning_id, freq) for term, freq in term_freq.items())
+            lengths.append((learning_id, len(tokens)))
+            df_delta.update(term_freq.keys())
+            total_length += len(tokens)
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO bm25_index (term, learning_id, term_frequency) "
+            "VALUES (?, ?, ?)",
+            postings,
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO bm25_doc_length (learning_id, length) VALUES (?, ?)",
+            lengths,
+        )
+        conn.executemany(
+            "INSERT INTO bm25_terms (term, df) VALUES (?, ?) "
+            "ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+            df_delta.items(),
+        )
+        conn.executemany(
+            "INSERT INTO bm25_metadata (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            [(_BM25_TOTAL_DOCS, float(len(docs))), (_BM25_TOTAL_LENGTH, float(total_length))],
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO bm25_metadata (key, value)
+            SELECT ?, l.value / d.value
+            FROM bm25_metadata l, bm25_metadata d
+            WHERE l.key = ? AND d.key = ? AND d.value > 0
+            """,
+            (_BM25_AVG_DOC_LENGTH, _BM25_TOTAL_LENGTH, _BM25_TOTAL_DOCS),
+        )
+
+    @staticmethod
+    def _bm25_clear(conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM bm25_index")
+        conn.execute("DELETE FROM bm25_doc_length")
+        conn.execute("DELETE FROM bm25_terms")
+        conn.execute("DELETE FROM bm25_metadata")
+
+    def _bm25_rebuild(self, conn: sqlite3.Connection) -> None:
+        self._bm25_clear(conn)
+        rows = conn.execute("SELECT id, fact FROM learnings").fetchall()
+        self._bm25_index_documents(conn, [(row[0], row[1]) for row in rows])
+
+    def _migrate_bm25(self, conn: sqlite3.Connection) -> None:
+        """Bring databases written before incremental BM25 up to date.
+
+        Older caches either had no index (built on demand) or an index
+        without persisted document lengths and df. Both are rebuilt once.
+        """
+        has_learnings = conn.execute("SELECT 1 FROM learnings LIMIT 1").fetchone()
+        current = conn.execute(
+            "SELECT 1 FROM bm25_metadata WHERE key = ?", (_BM25_TOTAL_LENGTH,)
+        ).fetchone()
+        if has_learnings and not current:
+            self._bm25_rebuild(conn)
+
     def get_bm25_stats(self) -> dict:
         """Get BM25 index statistics.
 
@@ -999,9 +1040,7 @@ class LearningCache:
                     "total_entries": 0,
                 }
 
-            unique_terms = conn.execute(
-                "SELECT COUNT(DISTINCT term) FROM bm25_index"
-            ).fetchone()[0]
+            unique_terms = conn.execute("SELECT COUNT(*) FROM bm25_terms").fetchone()[0]
 
             total_entries = conn.execute(
                 "SELECT COUNT(*) FROM bm25_index"
@@ -770,18 +770,19 @@ def _sync_journal_to_dag(memory_path: Path, store: SimulacrumStore) -> int:
         dag = store.get_dag()
         existing_ids = set(dag.learnings.keys())
 
-        synced = 0
-        for entry in journal.load_deduplicated().values():
-            if entry.id not in existing_ids:
-                # Convert journal entry to SimLearning
-                sim_learning = SimLearning(
-                    fact=entry.fact,
-                    source_turns=(),
-                    confidence=entry.confidence,
-                    category=_map_category(entry.category),
-                )
-                dag.add_learning(sim_learning)
-                synced += 1
+        # Convert journal entries to SimLearnings and relate them in one pass
+        new_learnings = [
+            SimLearning(
+                fact=entry.fact,
+                source_turns=(),
+                confidence=entry.confidence,
+                category=_map_category(entry.category),
+            )
+            for entry in journal.load_deduplicated().values()
+            if entry.id not in existing_ids
+        ]
+        dag.add_learnings_batch(new_learnings)
+        synced = len(new_learnings)
 
         if synced > 0:
             logger.debug("Synced %d learnings from journal to DAG", synced)
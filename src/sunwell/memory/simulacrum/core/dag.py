@@ -16,22 +16,31 @@ Graph scoring (MIRA-inspired):
 - Learnings form a relationship graph (supports, derives_from, etc.)
 - Inbound references indicate "hub" knowledge
 - Used for importance scoring in retrieval
+
+Learning embeddings live in a side-car float32 matrix (one row per
+learning id) rather than as boxed floats on each Learning; the
+``Learning.embedding`` field holds a lazy view of its row.
 """
 
+import itertools
 import logging
 from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+from numpy.typing import NDArray
+
 from sunwell.foundation.utils import safe_json_dump, safe_json_load
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix, EmbeddingRowView
 
 logger = logging.getLogger(__name__)
 
 from sunwell.memory.simulacrum.core.retrieval.learning_graph import (
     LearningGraph,
+    LearningIndex,
     RelationType,
-    detect_relationships,
 )
 from sunwell.memory.simulacrum.core.turn import (
     Learning,
@@ -41,6 +50,58 @@ from sunwell.memory.simulacrum.core.turn import (
     TurnType,
 )
 
+# Shared across maps so a generation also identifies which map it came from
+_generations = itertools.count()
+
+
+class _LearningMap(dict[str, Learning]):
+    """Dict of learnings that stamps a new generation on every mutation.
+
+    Lets ConversationDAG tell whether its learning index still matches
+    ``learnings`` after direct edits, without comparing contents.
+    """
+
+    __slots__ = ("generation",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.generation = next(_generations)
+
+    def _touch(self) -> None:
+        self.generation = next(_generations)
+
+    def __setitem__(self, key: str, value: Learning) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def pop(self, *args):  # type: ignore[override]
+        self._touch()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, Learning]:
+        self._touch()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def setdefault(self, key: str, default: Learning) -> Learning:  # type: ignore[override]
+        self._touch()
+        return super().setdefault(key, default)
+
 
 @dataclass(slots=True)
 class ConversationDAG:
@@ -60,7 +121,7 @@ class ConversationDAG:
     turns: dict[str, Turn] = field(default_factory=dict)
     """All turns indexed by content-hash ID."""
 
-    learnings: dict[str, Learning] = field(default_factory=dict)
+    learnings: dict[str, Learning] = field(default_factory=_LearningMap)
     """Extracted learnings indexed by ID."""
 
     # Graph structure
@@ -91,6 +152,16 @@ class ConversationDAG:
     learning_graph: LearningGraph = field(default_factory=LearningGraph)
     """Graph of relationships between learnings for importance scoring."""
 
+    _learning_index: LearningIndex = field(default_factory=LearningIndex, repr=False)
+    """Token/source-turn inverted index used to find relationship candidates."""
+
+    _learning_index_generation: int = field(default=-1, repr=False)
+    """Generation of ``learnings`` the index was last synced with."""
+
+    # Canonical embedding store for learnings
+    embeddings: EmbeddingMatrix = field(default_factory=EmbeddingMatrix, repr=False)
+    """Normalized float32 learning embeddings, one row per learning ID."""
+
     def add_turn(self, turn: Turn) -> str:
         """Add a turn to the DAG.
 
@@ -158,16 +229,106 @@ class ConversationDAG:
         Returns:
             The learning's content-addressable ID
         """
-        self.learnings[learning.id] = learning
+        return self.add_learnings_batch([learning], auto_detect_relationships)[0]
 
-        # Auto-detect relationships for graph scoring
-        if auto_detect_relationships and len(self.learnings) > 1:
-            existing = [l for l in self.learnings.values() if l.id != learning.id]
-            edges = detect_relationships(learning, existing)
-            for edge in edges:
-                self.learning_graph.add_edge(edge)
+    def add_learnings_batch(
+        self,
+        learnings: list[Learning],
+        auto_detect_relationships: bool = True,
+    ) -> list[str]:
+        """Add many learnings in one pass.
 
-        return learning.id
+        Equivalent to calling :meth:`add_learning` for each in order: every
+        learning is related to those already in the DAG and to the ones
+        before it in the batch. Candidates come from the inverted index, so
+        the cost scales with shared tokens rather than with DAG size.
+
+        Args:
+            learnings: Learnings to add, in order
+            auto_detect_relationships: If True, detect relationships to existing learnings
+
+        Returns:
+            The learnings' content-addressable IDs, in input order
+        """
+        index = self._synced_learning_index()
+        for learning in learnings:
+            learning = self._attach_embedding(learning)
+            self.learnings[learning.id] = learning
+            index.remove(learning.id)
+
+            # Auto-detect relationships for graph scoring
+            if auto_detect_relationships and len(index):
+                for edge in index.detect(learning, self.learnings):
+                    self.learning_graph.add_edge(edge)
+
+            index.add(learning)
+
+        self._learning_index_generation = self.learnings.generation
+        return [learning.id for learning in learnings]
+
+    def set_embeddings(self, learning_ids: list[str], vectors: NDArray[np.floating]) -> int:
+        """Store embeddings for learnings in the side-car matrix.
+
+        Each learning's ``embedding`` becomes a view of its matrix row.
+        IDs not present in the DAG are skipped.
+
+        Args:
+            learning_ids: Learning IDs, one per row of ``vectors``
+            vectors: Array of shape (len(learning_ids), dims)
+
+        Returns:
+            Number of learnings updated
+        """
+        rows = [i for i, lid in enumerate(learning_ids) if lid in self.learnings]
+        if not rows:
+            return 0
+        ids = [learning_ids[i] for i in rows]
+        self.embeddings.add_batch(ids, np.asarray(vectors)[rows])
+        # Swapping in embedding views leaves the indexed fields unchanged
+        synced = self._learning_index_generation == self._tracked_learnings().generation
+        for lid in ids:
+            self.learnings[lid] = self.learnings[lid].with_embedding(self.embeddings.view(lid))
+        if synced:
+            self._learning_index_generation = self.learnings.generation
+        return len(ids)
+
+    def get_embedding(self, learning_id: str) -> NDArray[np.float32] | None:
+        """The normalized embedding for a learning (read-only), or None."""
+        return self.embeddings.get(learning_id)
+
+    def _attach_embedding(self, learning: Learning) -> Learning:
+        """Move an inline embedding into the matrix and return the learning with a view."""
+        embedding = learning.embedding
+        if isinstance(embedding, EmbeddingRowView):
+            if embedding == self.embeddings.view(learning.id):
+                return learning
+            vector = np.asarray(embedding)
+            if vector.size == 0:
+                return learning.with_embedding(None)
+            self.embeddings.add(learning.id, vector)
+        elif embedding:
+            self.embeddings.add(learning.id, embedding)
+        elif learning.id not in self.embeddings:
+            return learning
+        return learning.with_embedding(self.embeddings.view(learning.id))
+
+    def _tracked_learnings(self) -> _LearningMap:
+        """``learnings`` as a _LearningMap, wrapping a plain dict assigned to it."""
+        learnings = self.learnings
+        if not isinstance(learnings, _LearningMap):
+            learnings = self.learnings = _LearningMap(learnings)
+        return learnings
+
+    def _synced_learning_index(self) -> LearningIndex:
+        """The learning index, rebuilt if ``learnings`` was modified directly."""
+        index = self._learning_index
+        learnings = self._tracked_learnings()
+        if self._learning_index_generation != learnings.generation:
+            index.clear()
+            for learning in learnings.values():
+                index.add(learning)
+            self._learning_index_generation = learnings.generation
+        return index
 
     def find_learning(self, learning_id: str) -> Learning | None:
         """Find a learning by ID.
@@ -200,21 +361,28 @@ class ConversationDAG:
         if old.id not in self.learnings:
             return False
 
+        index = self._synced_learning_index()
+
         # Remove old
         del self.learnings[old.id]
+        index.remove(old.id)
 
         # Add new (may have same or different ID) - skip auto-detect since relationships preserved
+        new = self._attach_embedding(new)
         self.learnings[new.id] = new
+        if old.id != new.id:
+            self.embeddings.discard(old.id)
+        index.remove(new.id)
 
         # If ID changed, update learning graph references
         if old.id != new.id:
             self.learning_graph.remove_learning(old.id)
             # Re-detect relationships for the new learning
-            existing = [l for l in self.learnings.values() if l.id != new.id]
-            edges = detect_relationships(new, existing)
-            for edge in edges:
+            for edge in index.detect(new, self.learnings):
                 self.learning_graph.add_edge(edge)
 
+        index.add(new)
+        self._learning_index_generation = self.learnings.generation
         return True
 
     def get_inbound_link_count(self, learning_id: str) -> int:
@@ -445,7 +613,12 @@ class ConversationDAG:
                     "superseded_by": l.superseded_by,
                     # RFC-122: Extended fields
                     "template_data": self._serialize_template_data(l.template_data),
-                    "embedding": list(l.embedding) if l.embedding else None,
+                    # Embeddings held in the matrix are saved to the side-car file
+                    "embedding": (
+                        None
+                        if isinstance(l.embedding, EmbeddingRowView) or not l.embedding
+                        else list(l.embedding)
+                    ),
                     "use_count": l.use_count,
                     "last_used": l.last_used,
                     # Graph scoring fields
@@ -468,6 +641,20 @@ class ConversationDAG:
 
         if not safe_json_dump(data, path):
             logger.error("Failed to save DAG to %s", path)
+            return
+
+        embeddings_path = self._embeddings_path(path)
+        if self.embeddings.count or EmbeddingMatrix.exists(embeddings_path):
+            try:
+                self.embeddings.save(embeddings_path)
+            except OSError as e:
+                logger.error("Failed to save DAG embeddings to %s: %s", embeddings_path, e)
+
+    @staticmethod
+    def _embeddings_path(path: Path) -> Path:
+        """Side-car matrix file for a DAG saved at ``path``."""
+        path = Path(path)
+        return path.with_name(f"{path.stem}.embeddings.npy")
 
     @classmethod
     def load(cls, path: Path) -> ConversationDAG:
@@ -541,4 +728,14 @@ class ConversationDAG:
             )
             dag.learning_graph.add_edge(edge)
 
+        # Memory-map the embedding side-car; inline (legacy) embeddings move into it
+        embeddings_path = cls._embeddings_path(path)
+        if EmbeddingMatrix.exists(embeddings_path):
+            try:
+                dag.embeddings = EmbeddingMatrix.load(embeddings_path)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable DAG embeddings %s: %s", embeddings_path, e)
+        for lid, learning in dag.learnings.items():
+            dag.learnings[lid] = dag._attach_embedding(learning)
+
         return dag
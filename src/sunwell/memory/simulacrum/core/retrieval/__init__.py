@@ -9,12 +9,14 @@ from sunwell.memory.simulacrum.core.retrieval.importance import (
     compute_behavioral_score,
     compute_graph_score,
     compute_importance,
+    compute_importance_terms,
     compute_temporal_score,
     get_config_for_category,
 )
 from sunwell.memory.simulacrum.core.retrieval.learning_graph import (
     LearningEdge,
     LearningGraph,
+    LearningIndex,
     RelationType,
     detect_relationships,
 )
@@ -27,12 +29,14 @@ __all__ = [
     "ImportanceConfig",
     "LearningEdge",
     "LearningGraph",
+    "LearningIndex",
     "PlanningRetriever",
     "RelationType",
     "SemanticRetriever",
     "compute_behavioral_score",
     "compute_graph_score",
     "compute_importance",
+    "compute_importance_terms",
     "compute_temporal_score",
     "cosine_similarity",
     "detect_relationships",
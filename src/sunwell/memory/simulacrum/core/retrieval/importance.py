@@ -133,32 +133,59 @@ def compute_importance(
     Returns:
         Importance score between 0.0 and 1.0
     """
+    semantic_weight, offset = compute_importance_terms(
+        learning, activity_days, inbound_link_count, config
+    )
+
+    # Semantic score (already computed externally) plus query-independent signals
+    raw_score = semantic_weight * query_similarity + offset
+
+    # Sigmoid normalization to 0-1 range
+    # This prevents any single signal from dominating
+    return 1.0 / (1.0 + math.exp(-raw_score))
+
+
+def compute_importance_terms(
+    learning: Learning,
+    activity_days: int,
+    inbound_link_count: int = 0,
+    config: ImportanceConfig | None = None,
+) -> tuple[float, float]:
+    """Split importance into its query-dependent and query-independent parts.
+
+    ``compute_importance`` is ``sigmoid(weight * query_similarity + offset)``
+    for the returned ``(weight, offset)``, which lets callers score many
+    learnings against one query with array arithmetic.
+
+    Args:
+        learning: The learning to score
+        activity_days: Current cumulative activity day count
+        inbound_link_count: Number of other learnings linking to this one
+        config: Scoring config (defaults to category-specific config)
+
+    Returns:
+        (semantic weight, offset) with the sigmoid center already subtracted
+    """
     if config is None:
         config = get_config_for_category(learning.category)
 
-    # 1. Semantic score (already computed externally)
-    semantic = query_similarity
-
-    # 2. Graph score (hub connectivity)
+    # 1. Graph score (hub connectivity)
     graph = compute_graph_score(inbound_link_count, config)
 
-    # 3. Behavioral score (access patterns + confidence)
+    # 2. Behavioral score (access patterns + confidence)
     behavioral = compute_behavioral_score(learning, activity_days, config)
 
-    # 4. Temporal score (recency + deadline proximity)
+    # 3. Temporal score (recency + deadline proximity)
     temporal = compute_temporal_score(learning, activity_days, config)
 
-    # Combine with weighted sum
-    raw_score = (
-        config.semantic_weight * semantic
-        + config.graph_weight * graph
+    # Weighted sum of the non-semantic signals
+    offset = (
+        config.graph_weight * graph
         + config.behavioral_weight * behavioral
         + config.temporal_weight * temporal
+        - config.sigmoid_center
     )
-
-    # Sigmoid normalization to 0-1 range
-    # This prevents any single signal from dominating
-    return 1.0 / (1.0 + math.exp(-(raw_score - config.sigmoid_center)))
+    return config.semantic_weight, offset
 
 
 def compute_graph_score(
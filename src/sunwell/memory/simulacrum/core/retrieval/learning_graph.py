@@ -18,6 +18,7 @@ Thread-safe for concurrent reads; mutations require lock.
 import logging
 import threading
 from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -300,6 +301,99 @@ class LearningGraph:
         return graph
 
 
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "to", "of",
+    "and", "in", "that", "it", "for", "on", "with", "as", "at", "by", "this", "i",
+})
+"""Words ignored when measuring keyword overlap."""
+
+_CONTRADICTION_MARKERS = frozenset({
+    "but", "however", "instead", "not", "don't", "doesn't", "failed", "wrong",
+})
+"""Words in a new learning that suggest it contradicts an overlapping one."""
+
+
+def _words(fact: str) -> frozenset[str]:
+    return frozenset(fact.lower().split())
+
+
+def _relationship_edges(
+    new_learning: Learning,
+    existing: Learning,
+    *,
+    new_id: str,
+    existing_id: str,
+    shares_source: bool,
+    overlap: int,
+    new_meaningful: int,
+    existing_meaningful: int,
+    has_contradiction_marker: bool,
+    similarity_threshold: float,
+) -> list[LearningEdge]:
+    """Classify the relationship between one pair of learnings.
+
+    Takes precomputed ids and overlap statistics so callers can derive them
+    either from a direct set comparison or from inverted-index posting lists.
+    """
+    # Existing marked as superseded by new
+    if existing.superseded_by == new_id:
+        return [LearningEdge(
+            source_id=new_id,
+            target_id=existing_id,
+            relation_type=RelationType.ELABORATES,
+            weight=1.0,
+        )]
+
+    # Source turn overlap → DERIVES_FROM
+    if shares_source:
+        return [LearningEdge(
+            source_id=new_id,
+            target_id=existing_id,
+            relation_type=RelationType.DERIVES_FROM,
+            weight=0.8,
+        )]
+
+    edges: list[LearningEdge] = []
+
+    # Overlap ratio for similarity and contradiction checks
+    if new_meaningful and existing_meaningful:
+        overlap_ratio = overlap / min(new_meaningful, existing_meaningful)
+    else:
+        overlap_ratio = 0.0
+
+    # Keyword overlap → SUPPORTS (same category) or RELATED
+    if overlap >= 3 and overlap_ratio >= similarity_threshold:
+        if new_learning.category == existing.category:
+            edges.append(LearningEdge(
+                source_id=new_id,
+                target_id=existing_id,
+                relation_type=RelationType.SUPPORTS,
+                weight=overlap_ratio,
+            ))
+        else:
+            edges.append(LearningEdge(
+                source_id=new_id,
+                target_id=existing_id,
+                relation_type=RelationType.RELATED,
+                weight=overlap_ratio * 0.8,
+            ))
+
+    is_contradiction_candidate = (
+        has_contradiction_marker
+        and overlap_ratio >= 0.4
+        and (existing.category == "dead_end" or new_learning.category == "dead_end")
+    )
+    if is_contradiction_candidate:
+        edges.append(LearningEdge(
+            source_id=new_id,
+            target_id=existing_id,
+            relation_type=RelationType.CONTRADICTS,
+            weight=0.7,
+        ))
+
+    return edges
+
+
 def detect_relationships(
     new_learning: Learning,
     existing_learnings: list[Learning],
@@ -313,6 +407,10 @@ def detect_relationships(
     - Category compatibility → SUPPORTS/ELABORATES
     - Contradiction markers → CONTRADICTS
 
+    Compares against every learning in the list. For repeated detection
+    against a growing collection use :class:`LearningIndex`, which yields
+    the same edges from posting lists.
+
     Args:
         new_learning: The newly added learning
         existing_learnings: List of existing learnings to check against
@@ -323,86 +421,188 @@ def detect_relationships(
     """
     edges: list[LearningEdge] = []
 
-    new_words = set(new_learning.fact.lower().split())
+    new_words = _words(new_learning.fact)
+    new_meaningful = new_words - _STOP_WORDS
     new_sources = set(new_learning.source_turns)
+    has_marker = bool(new_words & _CONTRADICTION_MARKERS)
+
+    new_id = new_learning.id
 
     for existing in existing_learnings:
-        if existing.id == new_learning.id:
+        existing_id = existing.id
+        if existing_id == new_id:
             continue
 
-        # Check for supersedes relationship (existing marked as superseded by new)
-        if existing.superseded_by == new_learning.id:
-            edges.append(LearningEdge(
-                source_id=new_learning.id,
-                target_id=existing.id,
-                relation_type=RelationType.ELABORATES,
-                weight=1.0,
-            ))
-            continue
+        existing_meaningful = _words(existing.fact) - _STOP_WORDS
+        edges.extend(_relationship_edges(
+            new_learning,
+            existing,
+            new_id=new_id,
+            existing_id=existing_id,
+            shares_source=bool(new_sources.intersection(existing.source_turns)),
+            overlap=len(new_meaningful & existing_meaningful),
+            new_meaningful=len(new_meaningful),
+            existing_meaningful=len(existing_meaningful),
+            has_contradiction_marker=has_marker,
+            similarity_threshold=similarity_threshold,
+        ))
 
-        # Check for source turn overlap → DERIVES_FROM
-        existing_sources = set(existing.source_turns)
-        if new_sources & existing_sources:
-            edges.append(LearningEdge(
-                source_id=new_learning.id,
-                target_id=existing.id,
-                relation_type=RelationType.DERIVES_FROM,
-                weight=0.8,
-            ))
-            continue
+    return edges
 
-        # Check for keyword overlap → RELATED
-        existing_words = set(existing.fact.lower().split())
-        overlap = new_words & existing_words
-        # Exclude common stop words
-        stop_words = {
-            "the", "a", "an", "is", "are", "was", "were", "be", "to", "of",
-            "and", "in", "that", "it", "for", "on", "with", "as", "at", "by", "this", "i",
-        }
-        meaningful_overlap = overlap - stop_words
-
-        # Compute overlap ratio for similarity and contradiction checks
-        new_meaningful = new_words - stop_words
-        existing_meaningful = existing_words - stop_words
-        if new_meaningful and existing_meaningful:
-            overlap_ratio = len(meaningful_overlap) / min(
-                len(new_meaningful), len(existing_meaningful)
-            )
-        else:
-            overlap_ratio = 0.0
-
-        if len(meaningful_overlap) >= 3 and overlap_ratio >= similarity_threshold:
-            # Same category suggests SUPPORTS, different suggests RELATED
-            if new_learning.category == existing.category:
-                edges.append(LearningEdge(
-                    source_id=new_learning.id,
-                    target_id=existing.id,
-                    relation_type=RelationType.SUPPORTS,
-                    weight=overlap_ratio,
-                ))
-            else:
-                edges.append(LearningEdge(
-                    source_id=new_learning.id,
-                    target_id=existing.id,
-                    relation_type=RelationType.RELATED,
-                    weight=overlap_ratio * 0.8,
-                ))
-
-        # Check for contradiction markers
-        contradiction_markers = {
-            "but", "however", "instead", "not", "don't", "doesn't", "failed", "wrong",
-        }
-        is_contradiction_candidate = (
-            (new_words & contradiction_markers)
-            and overlap_ratio >= 0.4
-            and (existing.category == "dead_end" or new_learning.category == "dead_end")
-        )
-        if is_contradiction_candidate:
-            edges.append(LearningEdge(
-                source_id=new_learning.id,
-                target_id=existing.id,
-                relation_type=RelationType.CONTRADICTS,
-                weight=0.7,
-            ))
 
-    return edges
+@dataclass(slots=True)
+class LearningIndex:
+    """Inverted index over learnings for relationship detection.
+
+    Every relationship :func:`detect_relationships` can emit requires a
+    shared meaningful token, a shared source turn, or a supersession link,
+    so candidates are gathered from posting lists instead of scanning all
+    learnings. Keyword overlap counts fall out of the posting-list walk,
+    so no fact is re-tokenized after it is indexed.
+
+    Not thread-safe; the owning ConversationDAG serializes mutations.
+
+    Example:
+        >>> index = LearningIndex()
+        >>> for learning in learnings:
+        ...     edges = index.detect(learning, by_id)
+        ...     index.add(learning)
+    """
+
+    _by_token: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    """Meaningful token → ids of learnings containing it."""
+
+    _by_source: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    """Source turn id → ids of learnings derived from it."""
+
+    _by_successor: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    """Superseding learning id → ids of learnings it supersedes."""
+
+    _entries: dict[str, tuple[frozenset[str], tuple[str, ...], str | None]] = field(
+        default_factory=dict
+    )
+    """Indexed id → (meaningful tokens, source turns, superseded_by)."""
+
+    _order: dict[str, int] = field(default_factory=dict)
+    """Indexed id → insertion sequence, for deterministic edge order."""
+
+    _next_seq: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, learning_id: object) -> bool:
+        return learning_id in self._entries
+
+    def add(self, learning: Learning) -> None:
+        """Index a learning, replacing any previous entry with the same id."""
+        if learning.id in self._entries:
+            self.remove(learning.id)
+
+        tokens = _words(learning.fact) - _STOP_WORDS
+        for token in tokens:
+            self._by_token[token].add(learning.id)
+        for turn_id in learning.source_turns:
+            self._by_source[turn_id].add(learning.id)
+        if learning.superseded_by:
+            self._by_successor[learning.superseded_by].add(learning.id)
+
+        self._entries[learning.id] = (tokens, learning.source_turns, learning.superseded_by)
+        self._order[learning.id] = self._next_seq
+        self._next_seq += 1
+
+    def remove(self, learning_id: str) -> None:
+        """Drop a learning from every posting list it appears in."""
+        entry = self._entries.pop(learning_id, None)
+        if entry is None:
+            return
+        del self._order[learning_id]
+
+        tokens, source_turns, superseded_by = entry
+        for postings, keys in (
+            (self._by_token, tokens),
+            (self._by_source, source_turns),
+            (self._by_successor, (superseded_by,) if superseded_by else ()),
+        ):
+            for key in keys:
+                ids = postings.get(key)
+                if ids is not None:
+                    ids.discard(learning_id)
+                    if not ids:
+                        del postings[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._by_token.clear()
+        self._by_source.clear()
+        self._by_successor.clear()
+        self._entries.clear()
+        self._order.clear()
+        self._next_seq = 0
+
+    def detect(
+        self,
+        new_learning: Learning,
+        learnings: Mapping[str, Learning],
+        similarity_threshold: float = 0.5,
+    ) -> list[LearningEdge]:
+        """Detect relationships between a learning and the indexed ones.
+
+        Produces the same edges as :func:`detect_relationships` over all
+        indexed learnings, in insertion order.
+
+        Args:
+            new_learning: The learning to relate (may or may not be indexed)
+            learnings: Current learning objects by id (category and
+                supersession are read from here)
+            similarity_threshold: Minimum keyword overlap for RELATED
+
+        Returns:
+            List of detected edges (new_learning as source)
+        """
+        new_words = _words(new_learning.fact)
+        new_meaningful = new_words - _STOP_WORDS
+        has_marker = bool(new_words & _CONTRADICTION_MARKERS)
+
+        overlaps: dict[str, int] = defaultdict(int)
+        for token in new_meaningful:
+            for learning_id in self._by_token.get(token, ()):
+                overlaps[learning_id] += 1
+
+        shared_source: set[str] = set()
+        for turn_id in new_learning.source_turns:
+            shared_source.update(self._by_source.get(turn_id, ()))
+
+        new_id = new_learning.id
+        candidates = shared_source | self._by_successor.get(new_id, set())
+
+        # Keyword-only candidates can still be pruned from the counts alone:
+        # SUPPORTS/RELATED need 3 shared tokens, CONTRADICTS a 0.4 ratio.
+        new_count = len(new_meaningful)
+        for learning_id, overlap in overlaps.items():
+            if overlap >= 3:
+                candidates.add(learning_id)
+            elif has_marker:
+                smaller = min(new_count, len(self._entries[learning_id][0]))
+                if overlap / smaller >= 0.4:
+                    candidates.add(learning_id)
+        candidates.discard(new_id)
+
+        edges: list[LearningEdge] = []
+        for learning_id in sorted(candidates, key=self._order.__getitem__):
+            existing = learnings.get(learning_id)
+            if existing is None:
+                continue
+            edges.extend(_relationship_edges(
+                new_learning,
+                existing,
+                new_id=new_id,
+                existing_id=learning_id,
+                shares_source=learning_id in shared_source,
+                overlap=overlaps.get(learning_id, 0),
+                new_meaningful=new_count,
+                existing_meaningful=len(self._entries[learning_id][0]),
+                has_contradiction_marker=has_marker,
+                similarity_threshold=similarity_threshold,
+            ))
+        return edges
@@ -11,12 +11,17 @@ Extended with MIRA-inspired importance scoring that incorporates:
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 from sunwell.foundation.threading import WorkloadType, optimal_workers, run_parallel
 from sunwell.foundation.types.memory import MemoryRetrievalResult
-from sunwell.memory.simulacrum.core.retrieval.importance import compute_importance
+from sunwell.knowledge.embedding.matrix import EmbeddingRowView
+from sunwell.memory.simulacrum.core.retrieval.importance import compute_importance_terms
 from sunwell.memory.simulacrum.core.retrieval.similarity import (
     bm25_score,
-    hybrid_score,
+    bm25_scores,
+    cosine_similarity,
     normalize_bm25,
 )
 
@@ -112,34 +117,33 @@ class SemanticRetriever:
                 return []
 
             learnings = self._dag.get_active_learnings()
-            scored: list[tuple[Learning, float]] = []
-
-            for learning in learnings:
-                # First compute semantic similarity
-                semantic_score = hybrid_score(
-                    query=query,
-                    document=learning.fact,
-                    query_embedding=query_embedding,
-                    doc_embedding=learning.embedding,
-                    vector_weight=weight,
-                )
-
-                # Get inbound link count from learning graph (hub score)
-                inbound_links = self._dag.get_inbound_link_count(learning.id)
+            if not learnings:
+                return []
 
-                # Use full importance scoring with graph connectivity
-                score = compute_importance(
-                    learning=learning,
-                    query_similarity=semantic_score,
-                    activity_days=activity_days,
-                    inbound_link_count=inbound_links,
+            # Lexical component (BM25, normalized like normalize_bm25)
+            bm25 = bm25_scores(query, [learning.fact for learning in learnings])
+            semantic = np.where(bm25 > 0, np.minimum(1.0, 2 * bm25 / (bm25 + 10.0)), 0.0)
+
+            # Vector component: one matrix product over the DAG's embedding matrix
+            if query_embedding is not None:
+                vector, has_vector = self._vector_scores(learnings, query_embedding)
+                semantic = np.where(has_vector, weight * vector + (1 - weight) * semantic, semantic)
+
+            # Importance: sigmoid(semantic_weight * semantic + offset), where the
+            # offset carries graph connectivity, behavioral and temporal signals
+            terms = np.array([
+                compute_importance_terms(
+                    learning,
+                    activity_days,
+                    self._dag.get_inbound_link_count(learning.id),
                 )
+                for learning in learnings
+            ])
+            scores = 1.0 / (1.0 + np.exp(-(terms[:, 0] * semantic + terms[:, 1])))
 
-                if score > 0.3:
-                    scored.append((learning, score))
-
-            scored.sort(key=lambda x: -x[1])
-            return scored[:limit_per_type]
+            keep = np.flatnonzero(scores > 0.3)
+            ranked = keep[np.argsort(-scores[keep], kind="stable")][:limit_per_type]
+            return [(learnings[i], float(scores[i])) for i in ranked]
 
         def get_episodes() -> list[tuple[Episode, float]]:
             """Retrieve and score episodes using BM25."""
@@ -210,3 +214,36 @@ class SemanticRetriever:
             code_chunks=chunks_result,
             focus_topics=query.split()[:3],
         )
+
+    def _vector_scores(
+        self,
+        learnings: list[Learning],
+        query_embedding: tuple[float, ...],
+    ) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """Cosine similarity of each learning to the query.
+
+        Learnings stored in the DAG's embedding matrix are scored with a
+        single matrix-vector product; inline embeddings (learnings placed in
+        the DAG without going through it) fall back to per-vector scoring.
+
+        Returns:
+            (similarities, mask of learnings that have an embedding)
+        """
+        n = len(learnings)
+        vector = np.zeros(n, dtype=np.float64)
+        has_vector = np.zeros(n, dtype=bool)
+
+        matrix = self._dag.embeddings
+        all_scores = None
+        if matrix.count and matrix.dimensions == len(query_embedding):
+            all_scores = matrix.scores(query_embedding)
+
+        for i, learning in enumerate(learnings):
+            row = matrix.row_of(learning.id) if all_scores is not None else None
+            if row is not None:
+                vector[i] = all_scores[row]
+                has_vector[i] = True
+            elif learning.embedding and not isinstance(learning.embedding, EmbeddingRowView):
+                vector[i] = cosine_similarity(query_embedding, learning.embedding)
+                has_vector[i] = True
+        return vector, has_vector
@@ -3,37 +3,50 @@
 Provides:
 - cosine_similarity: Vector similarity for embeddings
 - bm25_score: BM25 keyword scoring (O(n) on-the-fly)
+- bm25_scores: bm25_score over many documents, as an array
 - bm25_score_fast: BM25 using inverted index (O(log n), Phase 4)
 - hybrid_score: Combines vector + BM25 with configurable weights
 - activity_decay_score: Activity-based decay (inspired by MIRA)
 """
 
 from collections import Counter
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 if TYPE_CHECKING:
     from sunwell.memory.core.learning_cache import LearningCache
 
 
 def cosine_similarity(
-    a: tuple[float, ...],
-    b: tuple[float, ...],
+    a: Sequence[float],
+    b: Sequence[float],
 ) -> float:
     """Compute cosine similarity between two vectors.
 
+    Accepts tuples, arrays, or embedding row views.
+
     Args:
         a: First vector
         b: Second vector
 
     Returns:
         Similarity score between 0.0 and 1.0
+
+    Raises:
+        ValueError: If the vectors have different lengths
     """
-    dot = sum(x * y for x, y in zip(a, b, strict=True))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
+    va = np.asarray(a, dtype=np.float64)
+    vb = np.asarray(b, dtype=np.float64)
+    if va.shape != vb.shape:
+        raise ValueError(f"Vector length mismatch: {va.shape} vs {vb.shape}")
+    norm_a = float(np.linalg.norm(va))
+    norm_b = float(np.linalg.norm(vb))
     if norm_a == 0 or norm_b == 0:
         return 0.0
-    return dot / (norm_a * norm_b)
+    return float(va @ vb) / (norm_a * norm_b)
 
 
 def bm25_score(
@@ -100,6 +113,49 @@ def bm25_score(
     return score
 
 
+def bm25_scores(
+    query: str,
+    documents: Sequence[str],
+    avg_doc_length: float = 100.0,
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> NDArray[np.float64]:
+    """:func:`bm25_score` for each document, as an array.
+
+    Documents sharing no term with the query are skipped without counting
+    their terms.
+
+    Args:
+        query: Query string
+        documents: Document texts to score
+        avg_doc_length: Average document length in corpus (tokens)
+        k1: Term frequency saturation parameter
+        b: Length normalization parameter
+
+    Returns:
+        Array of raw BM25 scores aligned with ``documents``
+    """
+    scores = np.zeros(len(documents), dtype=np.float64)
+    query_terms = query.lower().split() if query else []
+    if not query_terms:
+        return scores
+
+    query_set = frozenset(query_terms)
+    for i, document in enumerate(documents):
+        doc_terms = document.lower().split()
+        if query_set.isdisjoint(doc_terms):
+            continue
+        term_freq = Counter(doc_terms)
+        norm = k1 * (1 - b + b * len(doc_terms) / avg_doc_length)
+        score = 0.0
+        for term in query_terms:
+            tf = term_freq.get(term, 0)
+            if tf:
+                score += tf * (k1 + 1) / (tf + norm)
+        scores[i] = score
+    return scores
+
+
 def normalize_bm25(score: float, max_score: float = 10.0) -> float:
     """Normalize BM25 score to 0.0-1.0 range.
 
@@ -153,8 +209,8 @@ def bm25_score_fast(
 def hybrid_score(
     query: str,
     document: str,
-    query_embedding: tuple[float, ...] | None = None,
-    doc_embedding: tuple[float, ...] | None = None,
+    query_embedding: Sequence[float] | None = None,
+    doc_embedding: Sequence[float] | None = None,
     vector_weight: float = 0.7,
     avg_doc_length: float = 100.0,
     cache: LearningCache | None = None,
@@ -211,7 +267,7 @@ def hybrid_score(
         bm25_normalized = normalize_bm25(bm25)
 
     # If no embeddings, return BM25 only
-    if query_embedding is None or doc_embedding is None:
+    if query_embedding is None or doc_embedding is None or len(doc_embedding) == 0:
         return bm25_normalized
 
     # Compute vector component
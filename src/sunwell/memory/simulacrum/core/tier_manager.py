@@ -1,6 +1,10 @@
-"""Tier management for recent/compressed/archived turn storage."""
+"""Tier management for recent/compressed/archived turn storage.
+
+Compressed and archived shards are indexed by TurnIndex (turn_index.py),
+so single-turn lookups seek directly to the record and text search only
+reads turns whose tokens match the query.
+"""
 
-import gzip
 import json
 import shutil
 from datetime import datetime, timedelta
@@ -8,7 +12,13 @@ from pathlib import Path
 
 from sunwell.memory.simulacrum.core.config import StorageConfig
 from sunwell.memory.simulacrum.core.dag import ConversationDAG
-from sunwell.memory.simulacrum.core.turn import Turn, TurnType
+from sunwell.memory.simulacrum.core.turn import Turn
+from sunwell.memory.simulacrum.core.turn_index import (
+    TurnIndex,
+    archive_suffix,
+    record_to_turn,
+    turn_to_record,
+)
 
 
 class TierManager:
@@ -30,6 +40,8 @@ class TierManager:
         self.base_path = base_path
         self.config = config
         self._hot_dag = hot_dag
+        self._index = TurnIndex(base_path / "turns")
+        self._synced = False
 
     @property
     def hot_path(self) -> Path:
@@ -62,11 +74,15 @@ class TierManager:
             key=lambda t: t.timestamp,
         )
 
-        to_demote = turns_by_time[:len(turns_by_time) - self.config.hot_max_turns]
+        to_demote = [
+            turn
+            for turn in turns_by_time[:len(turns_by_time) - self.config.hot_max_turns]
+            if turn.id not in self._hot_dag.compressed
+        ]
 
-        # Save to compressed storage
+        # Save to compressed storage (one append per date shard)
+        self._save_to_compressed(to_demote)
         for turn in to_demote:
-            self._save_to_compressed(turn)
             # Don't remove from DAG - keep structure, just mark as demoted
             self._hot_dag.compressed.add(turn.id)
 
@@ -74,29 +90,37 @@ class TierManager:
         """Update the hot DAG reference (needed when DAG is replaced)."""
         self._hot_dag = hot_dag
 
-    def _save_to_compressed(self, turn: Turn) -> None:
-        """Save a turn to compressed storage."""
-        # Use date-based sharding for compressed storage
-        date_str = turn.timestamp[:10]  # YYYY-MM-DD
-        shard_path = self.warm_path / f"{date_str}.jsonl"
-
-        with open(shard_path, "a") as f:
-            data = {
-                "id": turn.id,
-                "content": turn.content,
-                "turn_type": turn.turn_type.value,
-                "timestamp": turn.timestamp,
-                "parent_ids": list(turn.parent_ids),
-            }
-            f.write(json.dumps(data) + "\n")
+    def _save_to_compressed(self, turns: list[Turn]) -> None:
+        """Append turns to their date shards in compressed storage."""
+        by_shard: dict[str, list[dict]] = {}
+        for turn in turns:
+            # Use date-based sharding for compressed storage
+            date_str = turn.timestamp[:10]  # YYYY-MM-DD
+            by_shard.setdefault(date_str, []).append(turn_to_record(turn))
+
+        self._ensure_synced()
+        for date_str, records in by_shard.items():
+            self._index.append(self.warm_path / f"{date_str}.jsonl", records)
+
+    def _ensure_synced(self) -> None:
+        """Index shards written before the index existed (once per manager)."""
+        if not self._synced:
+            self._index.sync()
+            self._synced = True
 
     def move_to_archived(self, older_than_hours: int | None = None) -> int:
-        """Archive old compressed storage to archived (further compressed)."""
+        """Archive old compressed storage to archived (further compressed).
+
+        Compressed archives are written as independently compressed frames
+        so archived turns stay retrievable without decompressing the shard.
+        """
         hours = older_than_hours or self.config.warm_max_age_hours
         cutoff = datetime.now() - timedelta(hours=hours)
         moved = 0
+        self._ensure_synced()
+        self.cold_path.mkdir(parents=True, exist_ok=True)
 
-        for shard_file in self.warm_path.glob("*.jsonl"):
+        for shard_file in sorted(self.warm_path.glob("*.jsonl")):
             # Parse date from filename
             try:
                 file_date = datetime.strptime(shard_file.stem, "%Y-%m-%d")
@@ -108,85 +132,95 @@ class TierManager:
                 cold_dest = self.cold_path / shard_file.name
 
                 if self.config.cold_compression:
-                    # Compress with zstd if available
-                    try:
-                        import zstd
-                        with open(shard_file, "rb") as src:
-                            compressed = zstd.compress(src.read())
-                        with open(cold_dest.with_suffix(".jsonl.zst"), "wb") as dst:
-                            dst.write(compressed)
-                    except ImportError:
-                        # Fall back to gzip
-                        with (
-                            open(shard_file, "rb") as src,
-                            gzip.open(cold_dest.with_suffix(".jsonl.gz"), "wb") as dst,
-                        ):
-                            dst.write(src.read())
+                    cold_dest = cold_dest.with_name(shard_file.stem + archive_suffix())
+                    with open(shard_file, "rb") as src:
+                        lines = [line for line in src if line.endswith(b"\n")]
+                    if cold_dest.exists():
+                        # Same day archived before: merge so turns stay indexed
+                        lines = self._archived_lines(cold_dest) + lines
+                    self._index.write_archive(cold_dest, lines)
                 else:
-                    shutil.move(shard_file, cold_dest)
+                    if cold_dest.exists():
+                        with open(shard_file, "rb") as src, open(cold_dest, "ab") as dst:
+                            shutil.copyfileobj(src, dst)
+                    else:
+                        shutil.move(shard_file, cold_dest)
+                    self._index.reindex_shard(cold_dest)
 
                 # Remove original
                 shard_file.unlink(missing_ok=True)
+                self._index.drop_shard(shard_file)
                 moved += 1
 
         return moved
 
+    def _archived_lines(self, archive: Path) -> list[bytes]:
+        """Raw lines of an existing archive, in storage order."""
+        locations = list(self._index.locations_in(archive).values())
+        return [
+            (json.dumps(record) + "\n").encode()
+            for record in self._index.read_many(locations)
+        ]
+
     def retrieve_from_compressed(self, turn_id: str) -> Turn | None:
-        """Retrieve a specific turn from compressed storage."""
-        for shard_file in self.warm_path.glob("*.jsonl"):
-            with open(shard_file) as f:
-                for line in f:
-                    data = json.loads(line)
-                    if data["id"] == turn_id:
-                        return Turn(
-                            content=data["content"],
-                            turn_type=TurnType(data["turn_type"]),
-                            timestamp=data["timestamp"],
-                            parent_ids=tuple(data.get("parent_ids", [])),
-                        )
-        return None
+        """Retrieve a specific turn from compressed or archived storage."""
+        self._ensure_synced()
+        location = self._index.locate(turn_id)
+        if location is None:
+            return None
+        data = self._index.read(location)
+        return record_to_turn(data) if data else None
 
     def search_compressed(self, query: str, limit: int = 10) -> list[Turn]:
-        """Simple text search over compressed storage."""
-        query_lower = query.lower()
-        matches = []
-
-        for shard_file in self.warm_path.glob("*.jsonl"):
-            with open(shard_file) as f:
-                for line in f:
-                    data = json.loads(line)
-                    if query_lower in data["content"].lower():
-                        turn = Turn(
-                            content=data["content"],
-                            turn_type=TurnType(data["turn_type"]),
-                            timestamp=data["timestamp"],
-                            parent_ids=tuple(data.get("parent_ids", [])),
-                        )
-                        matches.append(turn)
-                        if len(matches) >= limit:
-                            return matches
+        """Case-insensitive substring search over compressed and archived turns.
 
+        The token index narrows the search to candidate turns; each candidate
+        is then checked against the full query.
+        """
+        self._ensure_synced()
+        query_lower = query.lower()
+        locations = self._index.candidates(query)
+        if locations is None:
+            locations = self._index.all_locations()
+
+        matches: list[Turn] = []
+        for data in self._index.read_many(locations):
+            if query_lower in data["content"].lower():
+                matches.append(record_to_turn(data))
+                if len(matches) >= limit:
+                    break
         return matches
 
     def cleanup_dead_ends(self, dead_end_ids: set[str]) -> int:
-        """Remove dead end turns from compressed/archived storage."""
+        """Remove dead end turns from compressed storage."""
         if not dead_end_ids:
             return 0
 
+        self._ensure_synced()
         removed = 0
 
-        # Clean compressed storage
-        for shard_file in self.warm_path.glob("*.jsonl"):
+        # Only rewrite compressed shards that actually hold dead ends
+        for shard in sorted(self._index.shards_containing(dead_end_ids)):
+            shard_file = self._index.path_of(shard)
+            if shard_file.parent != self.warm_path or not shard_file.exists():
+                continue
+
             lines_to_keep = []
-            with open(shard_file) as f:
+            removed_ids: set[str] = set()
+            with open(shard_file, "rb") as f:
                 for line in f:
-                    data = json.loads(line)
-                    if data["id"] not in dead_end_ids:
+                    turn_id = json.loads(line)["id"]
+                    if turn_id not in dead_end_ids:
                         lines_to_keep.append(line)
                     else:
+                        removed_ids.add(turn_id)
                         removed += 1
 
-            with open(shard_file, "w") as f:
+            tmp = shard_file.with_name(shard_file.name + ".tmp")
+            with open(tmp, "wb") as f:
                 f.writelines(lines_to_keep)
+            tmp.replace(shard_file)
+            self._index.remove_turns(removed_ids)
+            self._index.reindex_shard(shard_file)
 
         return removed
@@ -12,6 +12,7 @@ for compound learning and knowledge retrieval.
 
 
 import hashlib
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -292,8 +293,12 @@ class Learning:
     """Structural data for template-type learnings."""
 
     # RFC-122: Embedding for semantic retrieval (computed lazily)
-    embedding: tuple[float, ...] | None = None
-    """Pre-computed embedding for fast retrieval."""
+    embedding: Sequence[float] | None = None
+    """Pre-computed embedding for fast retrieval.
+
+    Inside a ConversationDAG this is a lazy view of the DAG's embedding
+    matrix row (normalized), not a tuple of boxed floats.
+    """
 
     # RFC-122: Usage tracking
     use_count: int = 0
@@ -390,7 +395,7 @@ class Learning:
             expires_at=self.expires_at,
         )
 
-    def with_embedding(self, embedding: tuple[float, ...]) -> Self:
+    def with_embedding(self, embedding: Sequence[float] | None) -> Self:
         """Create a new Learning with computed embedding (RFC-122).
 
         Args:
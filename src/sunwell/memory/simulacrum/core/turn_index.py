@@ -0,0 +1,629 @@
+"""Random-access index over compressed and archived turn shards.
+
+Compressed (warm) turns are stored as date-sharded JSONL; archived (cold)
+turns as date-sharded archives made of independently compressed frames.
+This module keeps a SQLite index beside them so a turn can be fetched
+with one seek and a substring search only reads candidate lines.
+
+Storage layout (relative to the ``turns`` directory):
+    compressed/2026-01-15.jsonl       Appendable JSONL, one turn per line
+    archived/2026-01-08.jsonl.gz      Concatenated gzip members (frames)
+    archived/2026-01-08.jsonl.zst     Concatenated zstd frames (if available)
+    archived/2026-01-08.jsonl         Uncompressed (cold_compression=False)
+    turn_index.db                     This index
+
+Index tables:
+    turns    turn_id → (shard, offset, length[, frame_offset, frame_length])
+             For warm and uncompressed shards offset/length are byte ranges
+             in the file. For framed archives frame_offset/frame_length locate
+             the compressed frame and offset/length the line inside it.
+    postings token → turn_id (lowercased word tokens of the content).
+             Turns are content-addressed, so postings never go stale; those
+             of removed turns are simply filtered out by the join on turns.
+    vocab    distinct tokens, scanned for queries starting mid-word
+    shards   shard → bytes indexed, so lines appended by older versions or
+             other processes are picked up incrementally
+
+Both archive codecs write frames that concatenate into a valid stream, so
+``gzip -dc`` / ``zstd -dc`` still decompress a whole archive.
+"""
+
+import gzip
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from sunwell.memory.simulacrum.core.turn import Turn, TurnType
+
+logger = logging.getLogger(__name__)
+
+INDEX_DB_NAME = "turn_index.db"
+
+FRAME_BYTES = 64 * 1024
+"""Uncompressed bytes per archive frame (bounds the cost of one lookup)."""
+
+_TOKEN_RE = re.compile(r"\w+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS turns (
+    turn_id TEXT PRIMARY KEY,
+    shard TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    frame_offset INTEGER,
+    frame_length INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_turns_shard ON turns(shard);
+
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    turn_id TEXT NOT NULL,
+    PRIMARY KEY (token, turn_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS vocab (
+    token TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS shards (
+    shard TEXT PRIMARY KEY,
+    indexed_bytes INTEGER NOT NULL
+);
+"""
+
+
+def tokenize(text: str) -> set[str]:
+    """Lowercased word tokens used for the inverted index."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def turn_to_record(turn: Turn) -> dict:
+    """Serialize a turn for shard storage."""
+    return {
+        "id": turn.id,
+        "content": turn.content,
+        "turn_type": turn.turn_type.value,
+        "timestamp": turn.timestamp,
+        "parent_ids": list(turn.parent_ids),
+    }
+
+
+def record_to_turn(data: dict) -> Turn:
+    """Deserialize a shard record."""
+    return Turn(
+        content=data["content"],
+        turn_type=TurnType(data["turn_type"]),
+        timestamp=data["timestamp"],
+        parent_ids=tuple(data.get("parent_ids", [])),
+    )
+
+
+# =============================================================================
+# Frame codecs
+# =============================================================================
+
+
+def _zstd():
+    try:
+        import zstd
+    except ImportError:
+        return None
+    return zstd
+
+
+def archive_suffix() -> str:
+    """Suffix for new compressed archives (zstd if installed, else gzip)."""
+    return ".jsonl.zst" if _zstd() is not None else ".jsonl.gz"
+
+
+def compress_frame(data: bytes, suffix: str) -> bytes:
+    """Compress one self-contained frame for an archive with ``suffix``."""
+    if suffix.endswith(".zst"):
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("zstd archive requested but zstd is not installed")
+        return zstd.compress(data)
+    return gzip.compress(data, mtime=0)
+
+
+def decompress_frame(data: bytes, suffix: str) -> bytes:
+    """Decompress one frame (or a whole concatenated archive)."""
+    if suffix.endswith(".zst"):
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("zstd is required to read this archive")
+        return zstd.decompress(data)
+    return gzip.decompress(data)
+
+
+def _shard_suffix(shard: str) -> str:
+    name = shard.rsplit("/", 1)[-1]
+    return name[name.index("."):] if "." in name else ""
+
+
+def _is_framed(shard: str) -> bool:
+    return _shard_suffix(shard) in (".jsonl.gz", ".jsonl.zst")
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class TurnLocation:
+    """Where a turn's record lives."""
+
+    shard: str
+    """Shard path relative to the turns directory."""
+
+    offset: int
+    """Byte offset of the line (inside the frame for framed archives)."""
+
+    length: int
+    """Byte length of the line, including the newline."""
+
+    frame_offset: int | None = None
+    """Byte offset of the compressed frame, for framed archives."""
+
+    frame_length: int | None = None
+    """Byte length of the compressed frame, for framed archives."""
+
+
+class TurnIndex:
+    """SQLite offset and token index over turn shards.
+
+    Thread-safe: each call opens its own connection; writes are serialized
+    with a lock (WAL lets readers proceed concurrently).
+    """
+
+    def __init__(self, turns_path: Path) -> None:
+        """Initialize the index.
+
+        Args:
+            turns_path: The ``turns`` directory containing ``compressed/``
+                and ``archived/``
+        """
+        self.turns_path = Path(turns_path)
+        self._db_path = self.turns_path / INDEX_DB_NAME
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    # ── Connection ───────────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        self.turns_path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._initialized:
+            conn.executescript(SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def path_of(self, shard: str) -> Path:
+        """Absolute path of a shard."""
+        return self.turns_path / shard
+
+    def shard_name(self, path: Path) -> str:
+        """Shard key (POSIX path relative to the turns directory)."""
+        return Path(path).relative_to(self.turns_path).as_posix()
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+
+    def append(self, shard_path: Path, records: list[dict]) -> None:
+        """Append records to a JSONL shard and index them."""
+        if not records:
+            return
+        shard = self.shard_name(shard_path)
+        with self._lock:
+            conn = self._connect()
+            try:
+                self._catch_up_locked(conn, shard)
+                shard_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(shard_path, "ab") as f:
+                    offset = f.tell()
+                    entries = []
+                    for record in records:
+                        line = (json.dumps(record) + "\n").encode()
+                        f.write(line)
+                        entries.append((record, TurnLocation(shard, offset, len(line))))
+                        offset += len(line)
+                self._index_locked(conn, entries)
+                self._set_indexed_bytes(conn, shard, offset)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def write_archive(self, archive_path: Path, lines: list[bytes]) -> None:
+        """Write lines as a framed archive and point the index at it.
+
+        Any index entries for the same turns are replaced.
+
+        Args:
+            archive_path: Destination (.jsonl.gz / .jsonl.zst / .jsonl)
+            lines: Raw JSONL lines including trailing newlines
+        """
+        shard = self.shard_name(archive_path)
+        suffix = _shard_suffix(shard)
+        entries: list[tuple[dict, TurnLocation]] = []
+        tmp = archive_path.with_name(archive_path.name + ".tmp")
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(tmp, "wb") as f:
+            if not _is_framed(shard):
+                offset = 0
+                for line in lines:
+                    f.write(line)
+                    entries.append((json.loads(line), TurnLocation(shard, offset, len(line))))
+                    offset += len(line)
+            else:
+                for frame in _frames(lines):
+                    payload = b"".join(frame)
+                    compressed = compress_frame(payload, suffix)
+                    frame_offset = f.tell()
+                    f.write(compressed)
+                    offset = 0
+                    for line in frame:
+                        entries.append((
+                            json.loads(line),
+                            TurnLocation(shard, offset, len(line), frame_offset, len(compressed)),
+                        ))
+                        offset += len(line)
+
+        tmp.replace(archive_path)
+        with self._lock:
+            conn = self._connect()
+            try:
+                self._index_locked(conn, entries)
+                self._set_indexed_bytes(conn, shard, archive_path.stat().st_size)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def drop_shard(self, shard_path: Path) -> None:
+        """Forget a shard's bookkeeping (its turns must be re-pointed or removed)."""
+        shard = self.shard_name(shard_path)
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM shards WHERE shard = ?", (shard,))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def remove_turns(self, turn_ids: Iterable[str]) -> None:
+        """Drop turns from the index (their postings become inert)."""
+        ids = [(tid,) for tid in turn_ids]
+        if not ids:
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany("DELETE FROM turns WHERE turn_id = ?", ids)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def reindex_shard(self, shard_path: Path) -> None:
+        """Re-read a shard from scratch (after it was rewritten in place)."""
+        shard = self.shard_name(shard_path)
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM shards WHERE shard = ?", (shard,))
+                self._catch_up_locked(conn, shard)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _index_locked(
+        self,
+        conn: sqlite3.Connection,
+        entries: list[tuple[dict, TurnLocation]],
+    ) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO turns "
+            "(turn_id, shard, offset, length, frame_offset, frame_length) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    record["id"],
+                    loc.shard,
+                    loc.offset,
+                    loc.length,
+                    loc.frame_offset,
+                    loc.frame_length,
+                )
+                for record, loc in entries
+            ],
+        )
+        postings = sorted(
+            (token, record["id"])
+            for record, _ in entries
+            for token in tokenize(record.get("content", ""))
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO postings (token, turn_id) VALUES (?, ?)", postings
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO vocab (token) VALUES (?)",
+            ((token,) for token in dict.fromkeys(token for token, _ in postings)),
+        )
+
+    @staticmethod
+    def _set_indexed_bytes(conn: sqlite3.Connection, shard: str, size: int) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO shards (shard, indexed_bytes) VALUES (?, ?)",
+            (shard, size),
+        )
+
+    # ── Catch-up (shards written without the index) ──────────────────────────
+
+    def sync(self) -> None:
+        """Index any shard bytes not yet in the index.
+
+        Handles shards written before the index existed and lines appended
+        by other writers. Legacy single-stream archives are rewritten as
+        framed archives so later lookups stay seekable.
+        """
+        shards: list[str] = []
+        for directory, patterns in (
+            ("compressed", ("*.jsonl",)),
+            ("archived", ("*.jsonl", "*.jsonl.gz", "*.jsonl.zst")),
+        ):
+            root = self.turns_path / directory
+            if root.is_dir():
+                for pattern in patterns:
+                    shards.extend(self.shard_name(p) for p in sorted(root.glob(pattern)))
+        if not shards:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                indexed = dict(conn.execute("SELECT shard, indexed_bytes FROM shards"))
+                stale = [
+                    s for s in shards
+                    if indexed.get(s) != self.path_of(s).stat().st_size
+                ]
+                legacy: list[str] = []
+                for shard in stale:
+                    if _is_framed(shard):
+                        legacy.append(shard)
+                    else:
+                        self._catch_up_locked(conn, shard, indexed.get(shard))
+                conn.commit()
+            finally:
+                conn.close()
+
+        for shard in legacy:
+            self._reframe(shard)
+
+    def _catch_up_locked(
+        self,
+        conn: sqlite3.Connection,
+        shard: str,
+        indexed_bytes: int | None = None,
+    ) -> None:
+        """Index the unindexed tail of a JSONL shard."""
+        path = self.path_of(shard)
+        if indexed_bytes is None:
+            row = conn.execute(
+                "SELECT indexed_bytes FROM shards WHERE shard = ?", (shard,)
+            ).fetchone()
+            indexed_bytes = row[0] if row else 0
+        if not path.exists():
+            return
+        size = path.stat().st_size
+        if indexed_bytes > size:
+            # Shard shrank (rewritten elsewhere): re-index from the start
+            conn.execute("DELETE FROM turns WHERE shard = ?", (shard,))
+            indexed_bytes = 0
+        if indexed_bytes == size:
+            return
+
+        entries: list[tuple[dict, TurnLocation]] = []
+        with open(path, "rb") as f:
+            f.seek(indexed_bytes)
+            offset = indexed_bytes
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial trailing write; pick it up next time
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping corrupt line in %s at byte %d", shard, offset)
+                else:
+                    entries.append((record, TurnLocation(shard, offset, len(line))))
+                offset += len(line)
+        self._index_locked(conn, entries)
+        self._set_indexed_bytes(conn, shard, offset)
+
+    def _reframe(self, shard: str) -> None:
+        """Rewrite a single-stream archive as a framed one and index it."""
+        path = self.path_of(shard)
+        try:
+            data = decompress_frame(path.read_bytes(), _shard_suffix(shard))
+        except (OSError, RuntimeError, EOFError) as e:
+            logger.warning("Cannot index archive %s: %s", shard, e)
+            return
+        lines = [line + b"\n" for line in data.split(b"\n") if line.strip()]
+        self.write_archive(path, lines)
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def locate(self, turn_id: str) -> TurnLocation | None:
+        """Where a turn is stored, if indexed."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT shard, offset, length, frame_offset, frame_length "
+                "FROM turns WHERE turn_id = ?",
+                (turn_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return TurnLocation(*row) if row else None
+
+    def read(self, location: TurnLocation) -> dict | None:
+        """Read one record with a single seek (plus one frame decompress)."""
+        path = self.path_of(location.shard)
+        try:
+            with open(path, "rb") as f:
+                if location.frame_offset is None:
+                    f.seek(location.offset)
+                    line = f.read(location.length)
+                else:
+                    f.seek(location.frame_offset)
+                    frame = decompress_frame(
+                        f.read(location.frame_length or 0), _shard_suffix(location.shard)
+                    )
+                    line = frame[location.offset:location.offset + location.length]
+            return json.loads(line)
+        except (OSError, ValueError, RuntimeError, EOFError) as e:
+            logger.warning("Failed to read turn from %s: %s", location.shard, e)
+            return None
+
+    def read_many(self, locations: list[TurnLocation]) -> Iterator[dict]:
+        """Read records in storage order, decompressing each frame once."""
+        frames: dict[tuple[str, int], bytes] = {}
+        for location in sorted(
+            locations, key=lambda loc: (loc.shard, loc.frame_offset or 0, loc.offset)
+        ):
+            if location.frame_offset is None:
+                record = self.read(location)
+            else:
+                key = (location.shard, location.frame_offset)
+                if key not in frames:
+                    frames.clear()
+                    try:
+                        with open(self.path_of(location.shard), "rb") as f:
+                            f.seek(location.frame_offset)
+                            frames[key] = decompress_frame(
+                                f.read(location.frame_length or 0),
+                                _shard_suffix(location.shard),
+                            )
+                    except (OSError, RuntimeError, EOFError) as e:
+                        logger.warning("Failed to read frame from %s: %s", location.shard, e)
+                        continue
+                line = frames[key][location.offset:location.offset + location.length]
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+            if record is not None:
+                yield record
+
+    def locations_in(self, shard_path: Path) -> dict[str, TurnLocation]:
+        """All indexed turns stored in a shard."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT turn_id, shard, offset, length, frame_offset, frame_length "
+                "FROM turns WHERE shard = ?",
+                (self.shard_name(shard_path),),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0]: TurnLocation(*row[1:]) for row in rows}
+
+    def shards_containing(self, turn_ids: Iterable[str]) -> set[str]:
+        """Shards holding any of the given turns."""
+        ids = list(turn_ids)
+        shards: set[str] = set()
+        conn = self._connect()
+        try:
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                shards.update(r[0] for r in conn.execute(
+                    f"SELECT DISTINCT shard FROM turns WHERE turn_id IN ({placeholders})",
+                    batch,
+                ))
+        finally:
+            conn.close()
+        return shards
+
+    def candidates(self, query: str) -> list[TurnLocation] | None:
+        """Turns that may contain ``query`` as a case-insensitive substring.
+
+        Every word token of the query must occur in a matching turn: interior
+        tokens exactly, the last as a word prefix, the first as a word
+        substring (it may start mid-word). Returns None when the query has
+        no word characters and the index cannot narrow the search.
+
+        Results are a superset of the true matches, in storage order.
+        """
+        query_lower = query.lower()
+        tokens = _TOKEN_RE.findall(query_lower)
+        if not tokens:
+            return None
+
+        starts_mid_word = bool(_TOKEN_RE.match(query_lower))
+        ends_mid_word = bool(re.search(r"\w$", query_lower))
+
+        clauses: list[str] = []
+        params: list[str] = []
+        for i, token in enumerate(tokens):
+            first, last = i == 0, i == len(tokens) - 1
+            if first and starts_mid_word:
+                # Could be the tail of a longer word: match within the vocabulary
+                if last and ends_mid_word:
+                    vocab = "SELECT token FROM vocab WHERE instr(token, ?) > 0"
+                else:
+                    vocab = "SELECT token FROM vocab WHERE substr(token, -length(?)) = ?"
+                    params.append(token)
+                params.append(token)
+                clauses.append(f"SELECT turn_id FROM postings WHERE token IN ({vocab})")
+            elif last and ends_mid_word:
+                clauses.append(
+                    "SELECT turn_id FROM postings WHERE token >= ? AND token < ?"
+                )
+                params.extend((token, token + "\U0010ffff"))
+            else:
+                clauses.append("SELECT turn_id FROM postings WHERE token = ?")
+                params.append(token)
+
+        sql = (
+            "SELECT shard, offset, length, frame_offset, frame_length FROM turns "
+            f"WHERE turn_id IN ({' INTERSECT '.join(clauses)}) "
+            "ORDER BY shard, frame_offset, offset"
+        )
+        conn = self._connect()
+        try:
+            return [TurnLocation(*row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def all_locations(self) -> list[TurnLocation]:
+        """Every indexed turn, in storage order."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT shard, offset, length, frame_offset, frame_length FROM turns "
+                "ORDER BY shard, frame_offset, offset"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [TurnLocation(*row) for row in rows]
+
+
+def _frames(lines: list[bytes]) -> Iterator[list[bytes]]:
+    """Group lines into frames of roughly FRAME_BYTES uncompressed."""
+    frame: list[bytes] = []
+    size = 0
+    for line in lines:
+        frame.append(line)
+        size += len(line)
+        if size >= FRAME_BYTES:
+            yield frame
+            frame, size = [], 0
+    if frame:
+        yield frame
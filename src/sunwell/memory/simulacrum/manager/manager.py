@@ -636,15 +636,15 @@ class SimulacrumManager:
         source_dag = source_store.get_dag()
         target_dag = target_store.get_dag()
 
+        # Skip duplicates by fact
+        known_facts = {l.fact for l in target_dag.get_active_learnings()}
+        to_merge = []
         for learning in source_dag.get_active_learnings():
-            # Check for duplicates
-            exists = any(
-                l.fact == learning.fact
-                for l in target_dag.get_active_learnings()
-            )
-            if not exists:
-                target_dag.add_learning(learning)
-                merged_count += 1
+            if learning.fact not in known_facts:
+                known_facts.add(learning.fact)
+                to_merge.append(learning)
+        target_dag.add_learnings_batch(to_merge)
+        merged_count += len(to_merge)
 
         # Save target
         target_store.save_session()
@@ -19,7 +19,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from sunwell.knowledge.embedding.index import InMemoryIndex
+from sunwell.knowledge.embedding import create_vector_index, load_vector_index
 from sunwell.memory.simulacrum.topology.facets import FacetedIndex, FacetQuery
 from sunwell.memory.simulacrum.topology.memory_node import MemoryNode
 from sunwell.memory.simulacrum.topology.spatial import (
@@ -30,7 +30,7 @@ from sunwell.memory.simulacrum.topology.structural import DocumentTree
 from sunwell.memory.simulacrum.topology.topology_base import ConceptGraph, RelationType
 
 if TYPE_CHECKING:
-    from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
+    from sunwell.knowledge.embedding.protocol import EmbeddingProtocol, VectorIndexProtocol
 
 
 @dataclass(slots=True)
@@ -58,15 +58,15 @@ class UnifiedMemoryStore:
     _facet_index: FacetedIndex = field(default_factory=FacetedIndex)
     _document_trees: dict[str, DocumentTree] = field(default_factory=dict)
 
-    # Vector index for semantic search (uses existing InMemoryIndex)
-    _embedding_index: InMemoryIndex | None = field(default=None, init=False)
+    # Vector index for semantic search (backend chosen by embedding.index_backend)
+    _embedding_index: VectorIndexProtocol | None = field(default=None, init=False)
 
     # Optional embedder for query-time embedding
     _embedder: EmbeddingProtocol | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Initialize the embedding index."""
-        self._embedding_index = InMemoryIndex(_dimensions=self.embedding_dims)
+        self._embedding_index = create_vector_index(self.embedding_dims)
 
     def set_embedder(self, embedder: EmbeddingProtocol) -> None:
         """Set the embedder for query-time embedding generation.
@@ -78,7 +78,7 @@ class UnifiedMemoryStore:
         # Reinitialize index if dimensions differ
         if embedder.dimensions != self.embedding_dims:
             self.embedding_dims = embedder.dimensions
-            self._embedding_index = InMemoryIndex(_dimensions=self.embedding_dims)
+            self._embedding_index = create_vector_index(self.embedding_dims)
 
             # Re-index existing nodes with embeddings
             for node in self._nodes.values():
@@ -326,7 +326,7 @@ class UnifiedMemoryStore:
         with open(self.base_path / "graph.json", "w") as f:
             json.dump(self._concept_graph.to_dict(), f, indent=2)
 
-        # Save embedding index (uses InMemoryIndex.save())
+        # Save embedding index (whichever backend is configured)
         if self._embedding_index and self._embedding_index.count > 0:
             self._embedding_index.save(self.base_path / "embeddings")
 
@@ -356,10 +356,10 @@ class UnifiedMemoryStore:
             with open(graph_path) as f:
                 store._concept_graph = ConceptGraph.from_dict(json.load(f))
 
-        # Load embedding index (uses InMemoryIndex.load())
-        embeddings_path = base_path / "embeddings"
-        if (embeddings_path / "metadata.json").exists():
-            store._embedding_index = InMemoryIndex.load(embeddings_path)
+        # Load embedding index (whichever backend saved it)
+        loaded_index = load_vector_index(base_path / "embeddings")
+        if loaded_index is not None:
+            store._embedding_index = loaded_index
 
         return store
 
@@ -14,6 +14,7 @@ from sunwell.models.adapters import (
     OllamaModel,
     OpenAIModel,
 )
+from sunwell.models.cache import CachingModel, ResponseCache, with_response_cache
 from sunwell.models.core.protocol import (
     GenerateOptions,
     GenerateResult,
@@ -60,4 +61,8 @@ __all__ = [
     # Tool emulation (ensures every model is agentic)
     "ToolEmulatorModel",
     "wrap_for_tools",
+    # Response caching
+    "CachingModel",
+    "ResponseCache",
+    "with_response_cache",
 ]
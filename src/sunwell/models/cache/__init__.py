@@ -0,0 +1,33 @@
+"""Persistent, content-addressed caching of model responses.
+
+Wrap a model in CachingModel to answer byte-identical requests from an
+on-disk ResponseCache shared across processes.
+"""
+
+from sunwell.models.cache.model import (
+    CacheEvent,
+    CacheListener,
+    CachingModel,
+    request_key,
+    with_response_cache,
+)
+from sunwell.models.cache.store import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_TTL_SECONDS,
+    CachedPayload,
+    CacheStats,
+    ResponseCache,
+)
+
+__all__ = [
+    "CachingModel",
+    "CacheEvent",
+    "CacheListener",
+    "CacheStats",
+    "CachedPayload",
+    "ResponseCache",
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_TTL_SECONDS",
+    "request_key",
+    "with_response_cache",
+]
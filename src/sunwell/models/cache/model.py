@@ -0,0 +1,278 @@
+"""Caching wrapper for any ModelProtocol.
+
+Byte-identical requests (same model, messages, tools, tool choice and
+generation options) are answered from a persistent :class:`ResponseCache`
+instead of running inference again. Caching is opt-in: only call sites that
+wrap their model in :class:`CachingModel` use it.
+
+Streaming is cached too: a streamed response is recorded chunk by chunk and
+replayed chunk by chunk on a hit. Only streams that run to completion are
+stored.
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sunwell.models.cache.store import ResponseCache
+from sunwell.models.core.protocol import (
+    GenerateOptions,
+    GenerateResult,
+    Message,
+    ModelProtocol,
+    TokenUsage,
+    Tool,
+    ToolCall,
+)
+
+KEY_VERSION = 1
+"""Bump when the request normalization or payload format changes."""
+
+
+# =============================================================================
+# Cache Events
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEvent:
+    """Outcome of one cache lookup, for cost tracking.
+
+    See ``SessionCostTracker.record_cache``.
+    """
+
+    model: str
+    hit: bool
+    operation: Literal["generate", "stream"]
+    size_bytes: int = 0
+    """Payload size (on a hit: bytes not regenerated)."""
+
+    usage: TokenUsage | None = None
+    """Token usage of the cached response (on a hit: tokens saved)."""
+
+
+CacheListener = Callable[[CacheEvent], None]
+
+
+# =============================================================================
+# Request Keys
+# =============================================================================
+
+
+def _message_dict(message: Message) -> dict[str, Any]:
+    return {
+        "role": message.role,
+        "content": message.content,
+        "tool_calls": [
+            {"id": c.id, "name": c.name, "arguments": c.arguments} for c in message.tool_calls
+        ],
+        "tool_call_id": message.tool_call_id,
+    }
+
+
+def _tool_dict(tool: Tool) -> dict[str, Any]:
+    return {"name": tool.name, "description": tool.description, "parameters": tool.parameters}
+
+
+def request_key(
+    model_id: str,
+    prompt: str | tuple[Message, ...],
+    *,
+    operation: Literal["generate", "stream"],
+    tools: tuple[Tool, ...] | None = None,
+    tool_choice: str | dict | None = None,
+    options: GenerateOptions | None = None,
+    namespace: str = "",
+) -> str:
+    """Content hash identifying a model request.
+
+    A string prompt is normalized to a single user message, and JSON
+    arguments and schemas are serialized with sorted keys, so equivalent
+    requests share a key.
+    """
+    messages = (Message(role="user", content=prompt),) if isinstance(prompt, str) else prompt
+    opts = options or GenerateOptions()
+    request = {
+        "v": KEY_VERSION,
+        "namespace": namespace,
+        "model": model_id,
+        "operation": operation,
+        "messages": [_message_dict(m) for m in messages],
+        "tools": [_tool_dict(t) for t in tools or ()],
+        "tool_choice": tool_choice,
+        "options": {
+            "temperature": opts.temperature,
+            "max_tokens": opts.max_tokens,
+            "stop_sequences": list(opts.stop_sequences),
+            "system_prompt": opts.system_prompt,
+            "tools": [_tool_dict(t) for t in opts.tools or ()],
+        },
+    }
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# =============================================================================
+# Payloads
+# =============================================================================
+
+
+def _encode_result(result: GenerateResult) -> bytes:
+    usage = result.usage
+    return json.dumps(
+        {
+            "content": result.content,
+            "model": result.model,
+            "tool_calls": [
+                {"id": c.id, "name": c.name, "arguments": c.arguments} for c in result.tool_calls
+            ],
+            "usage": (
+                [usage.prompt_tokens, usage.completion_tokens, usage.total_tokens]
+                if usage
+                else None
+            ),
+            "finish_reason": result.finish_reason,
+        }
+    ).encode()
+
+
+def _decode_result(payload: bytes) -> GenerateResult:
+    data = json.loads(payload)
+    usage = data["usage"]
+    return GenerateResult(
+        content=data["content"],
+        model=data["model"],
+        tool_calls=tuple(ToolCall(**call) for call in data["tool_calls"]),
+        usage=TokenUsage(*usage) if usage else None,
+        finish_reason=data["finish_reason"],
+    )
+
+
+# =============================================================================
+# Caching Model
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class CachingModel:
+    """Wraps a model so identical requests are served from a ResponseCache.
+
+    Usage:
+        cache = ResponseCache()
+        model = CachingModel(OllamaModel(model="llama3.2:3b"), cache)
+        result = await model.generate(prompt)  # inference
+        result = await model.generate(prompt)  # cache hit, in any process
+
+    Errors and empty responses are never cached.
+    """
+
+    inner_model: object  # The wrapped model (any ModelProtocol)
+    cache: ResponseCache
+    namespace: str = ""
+    """Separates call sites that must not share entries (e.g. prompt versions)."""
+
+    on_event: CacheListener | None = None
+    """Called after every lookup (e.g. ``SessionCostTracker.record_cache``)."""
+
+    @property
+    def model_id(self) -> str:
+        """Delegate to inner model."""
+        return self.inner_model.model_id  # type: ignore
+
+    def _emit(self, event: CacheEvent) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
+
+    async def generate(
+        self,
+        prompt: str | tuple[Message, ...],
+        *,
+        tools: tuple[Tool, ...] | None = None,
+        tool_choice: Literal["auto", "none", "required"] | str | dict | None = None,
+        options: GenerateOptions | None = None,
+    ) -> GenerateResult:
+        """Generate, answering from the cache when the request was seen before."""
+        key = request_key(
+            self.model_id,
+            prompt,
+            operation="generate",
+            tools=tools,
+            tool_choice=tool_choice,
+            options=options,
+            namespace=self.namespace,
+        )
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            result = _decode_result(cached.payload)
+            self._emit(
+                CacheEvent(self.model_id, True, "generate", cached.size, result.usage)
+            )
+            return result
+
+        result = await self.inner_model.generate(  # type: ignore
+            prompt, tools=tools, tool_choice=tool_choice, options=options
+        )
+        payload = _encode_result(result)
+        self._emit(CacheEvent(self.model_id, False, "generate", len(payload), result.usage))
+        if result.content or result.tool_calls:
+            await asyncio.to_thread(self.cache.put, key, result.model, payload)
+        return result
+
+    async def generate_stream(
+        self,
+        prompt: str | tuple[Message, ...],
+        *,
+        tools: tuple[Tool, ...] | None = None,
+        options: GenerateOptions | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream, replaying the recorded chunks when the request was seen before."""
+        key = request_key(
+            self.model_id,
+            prompt,
+            operation="stream",
+            tools=tools,
+            options=options,
+            namespace=self.namespace,
+        )
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            self._emit(CacheEvent(self.model_id, True, "stream", cached.size))
+            for chunk in json.loads(cached.payload):
+                yield chunk
+            return
+
+        chunks: list[str] = []
+        async for chunk in self.inner_model.generate_stream(  # type: ignore
+            prompt, tools=tools, options=options
+        ):
+            chunks.append(chunk)
+            yield chunk
+
+        # Only reached when the consumer read the whole stream
+        payload = json.dumps(chunks).encode()
+        self._emit(CacheEvent(self.model_id, False, "stream", len(payload)))
+        if any(chunks):
+            await asyncio.to_thread(self.cache.put, key, self.model_id, payload)
+
+    async def list_models(self) -> list[str]:
+        """Delegate to inner model."""
+        return await self.inner_model.list_models()  # type: ignore
+
+
+def with_response_cache(
+    model: ModelProtocol,
+    cache: ResponseCache | None,
+    *,
+    namespace: str = "",
+    on_event: CacheListener | None = None,
+) -> ModelProtocol:
+    """Wrap ``model`` in a CachingModel when a cache is given.
+
+    Lets call sites take an optional ``response_cache`` and opt in with one line.
+    """
+    if cache is None or isinstance(model, CachingModel):
+        return model
+    return CachingModel(model, cache, namespace=namespace, on_event=on_event)
@@ -0,0 +1,206 @@
+"""On-disk store for cached LLM responses.
+
+Entries live in a WAL-mode SQLite database, so any number of processes can
+share one cache. Each entry is keyed by a content hash of the request (see
+:func:`sunwell.models.cache.model.request_key`) and expires after a TTL.
+When the stored payloads exceed ``max_bytes``, the least recently used
+entries are evicted. The running total is kept in a metadata row by
+triggers, so eviction never needs a table scan.
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sunwell.foundation.utils import SQLiteDatabase
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+"""Entries older than this are treated as misses."""
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+"""Evict least recently used entries above this total payload size."""
+
+_EVICT_TARGET = 0.9
+"""Evict down to this fraction of ``max_bytes`` so eviction isn't run on every put."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses(expires_at);
+
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO cache_meta (key, value) VALUES ('total_bytes', 0);
+
+CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_meta SET value = value + NEW.size WHERE key = 'total_bytes';
+END;
+
+CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_meta SET value = value - OLD.size WHERE key = 'total_bytes';
+END;
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPayload:
+    """A stored response payload."""
+
+    model: str
+    payload: bytes
+
+    @property
+    def size(self) -> int:
+        """Payload size in bytes."""
+        return len(self.payload)
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Lookup statistics for one ResponseCache instance (this process only)."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    """Payload bytes served from the cache instead of the model."""
+
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Hits as a fraction of lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class ResponseCache:
+    """Persistent, content-addressed cache of model responses.
+
+    Usage:
+        cache = ResponseCache()  # ~/.sunwell/cache/llm_responses.db
+        model = CachingModel(inner_model, cache)
+    """
+
+    path: Path = field(
+        default_factory=lambda: Path.home() / ".sunwell" / "cache" / "llm_responses.db"
+    )
+    """SQLite database shared by every process using this path."""
+
+    ttl_seconds: float | None = DEFAULT_TTL_SECONDS
+    """Entry lifetime (None = never expire)."""
+
+    max_bytes: int = DEFAULT_MAX_BYTES
+    """Total payload size above which LRU entries are evicted."""
+
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    _db: SQLiteDatabase = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._db = SQLiteDatabase(self.path, SCHEMA)
+
+    def get(self, key: str) -> CachedPayload | None:
+        """Look up an entry, refreshing its LRU position on a hit.
+
+        Args:
+            key: Request key
+
+        Returns:
+            The payload, or None if absent or expired
+        """
+        now = time.time()
+        with self._db.connect() as conn:
+            row = conn.execute(
+                "UPDATE responses SET accessed_at = ?, hits = hits + 1 "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?) "
+                "RETURNING model, payload",
+                (now, key, now),
+            ).fetchone()
+
+        if row is None:
+            self.stats.misses += 1
+            return None
+        entry = CachedPayload(model=row[0], payload=row[1])
+        self.stats.hits += 1
+        self.stats.bytes_saved += entry.size
+        return entry
+
+    def put(self, key: str, model: str, payload: bytes) -> None:
+        """Store an entry, evicting expired and LRU entries if over budget.
+
+        Args:
+            key: Request key
+            model: Model that produced the response
+            payload: Serialized response
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._db.connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT INTO responses "
+                "(key, model, payload, size, created_at, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, payload, len(payload), now, now, expires_at),
+            )
+            if self._total_bytes(conn) > self.max_bytes:
+                self.stats.evictions += self._evict(conn, now)
+        self.stats.stores += 1
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM cache_meta WHERE key = 'total_bytes'").fetchone()
+        return row[0] if row else 0
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Drop expired entries, then LRU entries until under the target size."""
+        evicted = conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        ).rowcount
+
+        target = int(self.max_bytes * _EVICT_TARGET)
+        excess = self._total_bytes(conn) - target
+        if excess <= 0:
+            return evicted
+
+        # Walk the LRU index only as far as needed to cover the excess
+        rows: list[tuple[str]] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            rows.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", rows)
+        return evicted + len(rows)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._db.connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._db.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored payloads."""
+        with self._db.connect() as conn:
+            return self._total_bytes(conn)
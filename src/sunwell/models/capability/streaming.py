@@ -7,11 +7,17 @@ Key types:
 - StreamChunkType: Type of content in each chunk
 - StreamChunk: A typed chunk from the stream
 - ToolStreamParser: Incremental parser for tool calls in streams
+
+Tool call arguments are scanned by a resumable tokenizer, so parsing a
+call costs O(total length) however finely the model splits it, and each
+TOOL_ARGS chunk carries only the newly received text.
 """
 
+import json
 import re
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 
 class StreamChunkType(Enum):
@@ -24,7 +30,10 @@ class StreamChunkType(Enum):
     """Beginning of a tool call."""
 
     TOOL_ARGS = "tool_args"
-    """Partial tool call arguments (streaming)."""
+    """New tool call argument text since the previous TOOL_ARGS (streaming)."""
+
+    TOOL_FIELD = "tool_field"
+    """An argument field finished streaming and was decoded."""
 
     TOOL_END = "tool_end"
     """End of a tool call."""
@@ -54,7 +63,16 @@ class StreamChunk:
     """Unique ID for this tool call."""
 
     partial_args: str | None = None
-    """Partial JSON arguments (for TOOL_ARGS chunks)."""
+    """Argument text received since the previous TOOL_ARGS chunk.
+
+    Concatenating every TOOL_ARGS delta of a call yields its raw text.
+    """
+
+    field_name: str | None = None
+    """Argument name (for TOOL_FIELD chunks)."""
+
+    field_value: Any = None
+    """Decoded argument value (for TOOL_FIELD chunks)."""
 
     is_complete: bool = False
     """For TOOL_END: whether arguments are complete and valid."""
@@ -65,22 +83,37 @@ class ToolStreamParser:
 
     Handles incremental JSON parsing for tool call arguments.
     Detects tool call boundaries and emits appropriate chunk types.
+
+    Argument fields are decoded as soon as each one closes (emitted as
+    TOOL_FIELD chunks and kept in :attr:`arguments`), so e.g. the ``path``
+    of a ``write_file`` call is known while its ``content`` still streams.
     """
 
     # Pattern to detect start of JSON tool call
     _TOOL_START_PATTERN = re.compile(r'(\{["\']?tool["\']?:|\{["\']?function["\']?:|```json)')
 
-    # Pattern to extract tool name
-    _TOOL_NAME_PATTERN = re.compile(r'["\']?(?:tool|function)["\']?\s*:\s*["\']([^"\']+)["\']')
+    # Closing fence of a ```json call, possibly split across chunks
+    _FENCE = "```"
 
     def __init__(self) -> None:
         self._buffer = ""
         self._in_tool_call = False
         self._current_tool_id: str | None = None
-        self._current_tool_name: str | None = None
-        self._args_buffer = ""
+        self._scanner = _ToolCallScanner()
+        self._args_parts: list[str] = []
+        self._fenced = False
+        self._strip_fence = False
         self._call_count = 0
 
+    @property
+    def arguments(self) -> dict[str, Any]:
+        """Argument fields decoded so far for the current (or last) call."""
+        return self._scanner.arguments
+
+    @property
+    def _current_tool_name(self) -> str | None:
+        return self._scanner.tool_name
+
     def feed(self, raw_chunk: str) -> list[StreamChunk]:
         """Feed a raw chunk and return typed chunks.
 
@@ -93,134 +126,113 @@ class ToolStreamParser:
         chunks: list[StreamChunk] = []
         self._buffer += raw_chunk
 
-        # Check for tool call start patterns
-        if not self._in_tool_call:
-            match = self._TOOL_START_PATTERN.search(self._buffer)
-            if match:
-                # Emit any text before the tool call
-                text_before = self._buffer[: match.start()]
-                if text_before.strip():
-                    chunks.append(
-                        StreamChunk(
-                            type=StreamChunkType.TEXT,
-                            content=text_before,
-                        )
-                    )
-
-                # Start tool call tracking
-                self._in_tool_call = True
-                self._call_count += 1
-                self._current_tool_id = f"stream_{self._call_count}"
-                self._args_buffer = self._buffer[match.start() :]
-                self._buffer = ""
-
-                chunks.append(
-                    StreamChunk(
-                        type=StreamChunkType.TOOL_START,
-                        tool_call_id=self._current_tool_id,
-                    )
-                )
-            else:
-                # No tool call detected, buffer text for potential partial match
-                # Keep last 20 chars in buffer for pattern matching
-                if len(self._buffer) > 50:
-                    emit = self._buffer[:-20]
-                    self._buffer = self._buffer[-20:]
-                    if emit.strip():
-                        chunks.append(
-                            StreamChunk(
-                                type=StreamChunkType.TEXT,
-                                content=emit,
-                            )
-                        )
+        while True:
+            if not self._in_tool_call and not self._scan_text(chunks):
                 return chunks
 
-        if self._in_tool_call:
-            # Accumulate args
-            self._args_buffer += self._buffer
+            # Scan only the new text of the call
+            text = self._buffer
             self._buffer = ""
-
-            # Try to extract tool name if not yet known
-            if self._current_tool_name is None:
-                name_match = self._TOOL_NAME_PATTERN.search(self._args_buffer)
-                if name_match:
-                    self._current_tool_name = name_match.group(1)
-
-            # Emit partial args
-            if self._args_buffer:
+            end = self._scanner.feed(text)
+            delta = text if end is None else text[:end]
+            if delta:
+                self._args_parts.append(delta)
                 chunks.append(
                     StreamChunk(
                         type=StreamChunkType.TOOL_ARGS,
                         tool_name=self._current_tool_name,
                         tool_call_id=self._current_tool_id,
-                        partial_args=self._args_buffer,
+                        partial_args=delta,
                     )
                 )
-
-            # Check for tool call end
-            # Complete JSON object or code block end
-            stripped = self._args_buffer.rstrip()
-            brace_balance = stripped.count("{") - stripped.count("}")
-
-            if (brace_balance == 0 and stripped.endswith("}")) or stripped.endswith("```"):
-                # Find where the JSON ends
-                end_pos = self._find_json_end(self._args_buffer)
-
+            for name, value in self._scanner.completed:
                 chunks.append(
                     StreamChunk(
-                        type=StreamChunkType.TOOL_END,
+                        type=StreamChunkType.TOOL_FIELD,
                         tool_name=self._current_tool_name,
                         tool_call_id=self._current_tool_id,
-                        is_complete=True,
+                        field_name=name,
+                        field_value=value,
                     )
                 )
+            self._scanner.completed.clear()
 
-                # Keep any text after the tool call for processing
-                remaining_after = self._args_buffer[end_pos:].strip() if end_pos else ""
-
-                # Reset state for potential next tool call
-                self._in_tool_call = False
-                self._current_tool_id = None
-                self._current_tool_name = None
-                self._args_buffer = ""
-
-                # If there's more content, recursively process it
-                if remaining_after:
-                    self._buffer = remaining_after
-                    chunks.extend(self.feed(""))
-
-        return chunks
-
-    def _find_json_end(self, text: str) -> int:
-        """Find the end position of a JSON object in text."""
-        depth = 0
-        in_string = False
-        escape_next = False
-
-        for i, char in enumerate(text):
-            if escape_next:
-                escape_next = False
-                continue
+            if end is None:
+                return chunks
 
-            if char == "\\":
-                escape_next = True
-                continue
+            chunks.append(
+                StreamChunk(
+                    type=StreamChunkType.TOOL_END,
+                    tool_name=self._current_tool_name,
+                    tool_call_id=self._current_tool_id,
+                    is_complete=True,
+                )
+            )
 
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
+            # Reset call state (arguments stay readable until the next call)
+            self._in_tool_call = False
+            self._current_tool_id = None
+            self._args_parts = []
+            self._strip_fence = self._fenced
+            self._fenced = False
+
+            # Keep any text after the tool call for processing
+            self._buffer = text[end:].lstrip()
+            if not self._buffer:
+                return chunks
 
-            if in_string:
-                continue
+    def _scan_text(self, chunks: list[StreamChunk]) -> bool:
+        """Emit text until a tool call starts; returns True if one did."""
+        if self._strip_fence:
+            stripped = self._buffer.lstrip()
+            if stripped.startswith(self._FENCE):
+                self._buffer = stripped[len(self._FENCE) :]
+                self._strip_fence = False
+            elif stripped and not self._FENCE.startswith(stripped):
+                self._strip_fence = False
+
+        match = self._TOOL_START_PATTERN.search(self._buffer)
+        if match:
+            # Emit any text before the tool call
+            text_before = self._buffer[: match.start()]
+            if text_before.strip():
+                chunks.append(
+                    StreamChunk(
+                        type=StreamChunkType.TEXT,
+                        content=text_before,
+                    )
+                )
 
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return i + 1
+            # Start tool call tracking
+            self._in_tool_call = True
+            self._call_count += 1
+            self._current_tool_id = f"stream_{self._call_count}"
+            self._scanner = _ToolCallScanner()
+            self._fenced = match.group(0) == "```json"
+            self._strip_fence = False
+            self._buffer = self._buffer[match.start() :]
 
-        return len(text)
+            chunks.append(
+                StreamChunk(
+                    type=StreamChunkType.TOOL_START,
+                    tool_call_id=self._current_tool_id,
+                )
+            )
+            return True
+
+        # No tool call detected, buffer text for potential partial match
+        # Keep last 20 chars in buffer for pattern matching
+        if len(self._buffer) > 50:
+            emit = self._buffer[:-20]
+            self._buffer = self._buffer[-20:]
+            if emit.strip():
+                chunks.append(
+                    StreamChunk(
+                        type=StreamChunkType.TEXT,
+                        content=emit,
+                    )
+                )
+        return False
 
     def finalize(self) -> list[StreamChunk]:
         """Finalize parsing and emit any remaining content.
@@ -245,7 +257,9 @@ class ToolStreamParser:
             self._in_tool_call = False
 
         # Emit any remaining buffered text
-        remaining = self._buffer + self._args_buffer
+        remaining = "".join(self._args_parts) + self._buffer
+        if self._strip_fence and remaining.strip() == self._FENCE:
+            remaining = ""
         if remaining.strip():
             chunks.append(
                 StreamChunk(
@@ -256,9 +270,10 @@ class ToolStreamParser:
 
         # Reset state
         self._buffer = ""
-        self._args_buffer = ""
+        self._args_parts = []
         self._current_tool_id = None
-        self._current_tool_name = None
+        self._fenced = False
+        self._strip_fence = False
 
         return chunks
 
@@ -267,6 +282,240 @@ class ToolStreamParser:
         self._buffer = ""
         self._in_tool_call = False
         self._current_tool_id = None
-        self._current_tool_name = None
-        self._args_buffer = ""
+        self._scanner = _ToolCallScanner()
+        self._args_parts = []
+        self._fenced = False
+        self._strip_fence = False
         self._call_count = 0
+
+
+class _ToolCallScanner:
+    """Resumable JSON scanner for one streamed tool call.
+
+    Keeps bracket depth, string/escape state and the key path across
+    :meth:`feed` calls, so every character is examined exactly once no
+    matter how the stream is split. String interiors are skipped with a
+    regex search rather than per character.
+
+    Decodes, as soon as each completes:
+    - the tool name (top-level ``tool`` / ``function`` / ``name`` string)
+    - every argument field (direct children of a top-level ``arguments`` /
+      ``args`` / ``parameters`` / ``input`` object), whatever its type
+    """
+
+    __slots__ = (
+        "_stack",
+        "_keys",
+        "_expect_key",
+        "_in_string",
+        "_quote",
+        "_escape",
+        "_key_parts",
+        "_value_parts",
+        "_value_depth",
+        "_value_key",
+        "_started",
+        "tool_name",
+        "arguments",
+        "completed",
+    )
+
+    def __init__(self) -> None:
+        self._stack: list[str] = []
+        self._keys: list[str | None] = []
+        self._expect_key = False
+        self._in_string = False
+        self._quote = '"'
+        self._escape = False
+        self._key_parts: list[str] | None = None
+        self._value_parts: list[str] | None = None
+        self._value_depth = 0
+        self._value_key: str | None = None
+        self._started = False
+        self.tool_name: str | None = None
+        self.arguments: dict[str, Any] = {}
+        self.completed: list[tuple[str, Any]] = []
+        """Argument fields completed since the caller last cleared it."""
+
+    def feed(self, text: str) -> int | None:
+        """Scan more of the call.
+
+        Returns:
+            Index in ``text`` just past the closing brace, or None if the
+            call is still open.
+        """
+        i = 0
+        n = len(text)
+        while i < n:
+            if self._in_string:
+                i = self._scan_string(text, i)
+                continue
+
+            c = text[i]
+            if not self._started:
+                # Skip any prefix such as a ```json fence
+                if c == "{":
+                    self._started = True
+                    self._open(c)
+                i += 1
+                continue
+
+            if c in "\"'":
+                self._in_string = True
+                self._quote = c
+                if (
+                    self._expect_key
+                    and self._value_parts is None
+                    and self._stack[-1] == "{"
+                    and len(self._stack) <= 2
+                ):
+                    self._key_parts = []
+                else:
+                    self._begin_value(string=True)
+                    self._capture(c)
+            elif c in "{[":
+                self._begin_value()
+                self._capture(c)
+                self._open(c)
+            elif c in "}]":
+                self._end_scalar()
+                self._stack.pop()
+                self._keys.pop()
+                self._capture(c)
+                if self._value_parts is not None and len(self._stack) == self._value_depth:
+                    self._finish_value()
+                self._expect_key = False
+                if not self._stack:
+                    return i + 1
+            elif c == ":":
+                self._capture(c)
+                self._expect_key = False
+            elif c == ",":
+                self._end_scalar()
+                self._capture(c)
+                self._expect_key = self._stack[-1] == "{"
+            elif c.isspace():
+                if self._scalar_open():
+                    self._end_scalar()
+                else:
+                    self._capture(c)
+            else:
+                self._begin_value()
+                self._capture(c)
+            i += 1
+        return None
+
+    # ── Strings ──────────────────────────────────────────────────────────────
+
+    def _scan_string(self, text: str, i: int) -> int:
+        if self._escape:
+            self._escape = False
+            self._capture_string(text[i])
+            return i + 1
+        stop = _STRING_STOPS[self._quote].search(text, i)
+        if stop is None:
+            self._capture_string(text[i:])
+            return len(text)
+        j = stop.start()
+        self._capture_string(text[i : j + 1])
+        if text[j] == "\\":
+            self._escape = True
+            return j + 1
+        self._in_string = False
+        if self._key_parts is not None:
+            # Drop the closing quote captured with the key
+            key = "".join(self._key_parts)[:-1]
+            self._keys[-1] = _decode_key(key)
+            self._key_parts = None
+        elif self._value_parts is not None and len(self._stack) == self._value_depth:
+            self._finish_value()
+        return j + 1
+
+    def _capture_string(self, part: str) -> None:
+        if self._key_parts is not None:
+            self._key_parts.append(part)
+        else:
+            self._capture(part)
+
+    # ── Values ───────────────────────────────────────────────────────────────
+
+    def _open(self, bracket: str) -> None:
+        self._stack.append(bracket)
+        self._keys.append(None)
+        self._expect_key = bracket == "{"
+
+    def _field(self, string: bool) -> str | None:
+        """Name of the decoded field a value starting here belongs to."""
+        depth = len(self._stack)
+        if depth == 1:
+            return self._keys[0] if string and self._keys[0] in _NAME_KEYS else None
+        if (
+            depth == 2
+            and self._stack[1] == "{"
+            and self._keys[0] in _ARGUMENT_KEYS
+            and self._keys[1] is not None
+        ):
+            return self._keys[1]
+        return None
+
+    def _begin_value(self, string: bool = False) -> None:
+        if self._value_parts is not None:
+            return
+        field = self._field(string)
+        if field is not None:
+            self._value_parts = []
+            self._value_depth = len(self._stack)
+            self._value_key = field
+
+    def _capture(self, part: str) -> None:
+        if self._value_parts is not None:
+            self._value_parts.append(part)
+
+    def _scalar_open(self) -> bool:
+        return (
+            self._value_parts is not None
+            and len(self._stack) == self._value_depth
+            and bool(self._value_parts)
+            and self._value_parts[0][:1] not in "\"'{["
+        )
+
+    def _end_scalar(self) -> None:
+        if self._scalar_open():
+            self._finish_value()
+
+    def _finish_value(self) -> None:
+        raw = "".join(self._value_parts or ())
+        key = self._value_key
+        self._value_parts = None
+        self._value_key = None
+        value = _decode_value(raw)
+        if self._value_depth == 1:
+            if self.tool_name is None and isinstance(value, str):
+                self.tool_name = value
+        elif key is not None:
+            self.arguments[key] = value
+            self.completed.append((key, value))
+
+
+_NAME_KEYS = frozenset({"tool", "function", "name"})
+_ARGUMENT_KEYS = frozenset({"arguments", "args", "parameters", "input"})
+_STRING_STOPS = {'"': re.compile(r'[\\"]'), "'": re.compile(r"[\\']")}
+
+
+def _decode_key(raw: str) -> str:
+    try:
+        return json.loads(f'"{raw}"', strict=False)
+    except ValueError:
+        return raw
+
+
+def _decode_value(raw: str) -> Any:
+    """Decode a captured JSON value, tolerating single-quoted strings."""
+    try:
+        # strict=False: models often put raw newlines inside strings
+        return json.loads(raw, strict=False)
+    except ValueError:
+        pass
+    if len(raw) >= 2 and raw[0] == raw[-1] == "'":
+        return raw[1:-1]
+    return raw
@@ -30,10 +30,10 @@ import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from sunwell.models import GenerateOptions
+from sunwell.models import GenerateOptions, with_response_cache
 
 if TYPE_CHECKING:
-    from sunwell.models import ModelProtocol
+    from sunwell.models import ModelProtocol, ResponseCache
 
 # Pre-compiled regex patterns
 _MARKDOWN_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
@@ -204,10 +204,10 @@ class FastClassifier:
     temperature: float = 0.1
     """Low temperature for consistent classifications."""
 
-    _cache: dict[str, ClassificationResult] = field(
-        default_factory=dict, repr=False
-    )
-    """Simple cache for repeated classifications."""
+    response_cache: ResponseCache | None = field(default=None, repr=False)
+    """Opt-in persistent response cache: repeated prompts skip inference,
+    across processes. Classifications are low-temperature, so a cached
+    answer is as good as a fresh one."""
 
     async def classify(
         self,
@@ -352,8 +352,11 @@ JSON:"""
         default: Any,
     ) -> ClassificationResult:
         """Execute classification and parse result."""
+        model = with_response_cache(
+            self.model, self.response_cache, namespace="fast_classifier"
+        )
         try:
-            result = await self.model.generate(
+            result = await model.generate(
                 prompt,
                 options=GenerateOptions(temperature=self.temperature),
             )
@@ -44,6 +44,7 @@ from sunwell.planning.routing.types import (
 
 if TYPE_CHECKING:
     from sunwell.foundation.core.lens import Lens
+    from sunwell.models import ResponseCache
     from sunwell.planning.skills.types import Skill
 
 
@@ -138,12 +139,15 @@ class UnifiedRouter:
         - cache_size: LRU cache size (default 1000)
         - temperature: Model temperature (default 0.1 for consistency)
         - available_lenses: Optional list to validate lens selection
+        - response_cache: Optional persistent response cache, so routing
+          prompts seen by earlier processes skip inference
     """
 
     model: ModelProtocol
     cache_size: int = 1000
     temperature: float = 0.1
     available_lenses: list[str] = field(default_factory=list)
+    response_cache: ResponseCache | None = field(default=None, repr=False)
 
     # Private state with thread safety — OrderedDict for O(1) LRU (RFC-094)
     _cache: OrderedDict[int, RoutingDecision] = field(default_factory=OrderedDict, repr=False)
@@ -300,7 +304,7 @@ class UnifiedRouter:
         RFC-022 Enhancement: Also calculates deterministic rubric confidence
         and matches against exemplars for calibration.
         """
-        from sunwell.models import GenerateOptions
+        from sunwell.models import GenerateOptions, with_response_cache
 
         # Step 1: Match exemplar for confidence calibration
         matched_exemplar, exemplar_similarity = match_exemplar(request)
@@ -317,7 +321,10 @@ class UnifiedRouter:
             context=json.dumps(context) if context else "{}",
         )
 
-        result = await self.model.generate(
+        model = with_response_cache(
+            self.model, self.response_cache, namespace="unified_router"
+        )
+        result = await model.generate(
             prompt,
             options=GenerateOptions(temperature=self.temperature),
         )
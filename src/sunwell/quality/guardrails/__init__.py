@@ -49,6 +49,7 @@ from sunwell.quality.guardrails.classifier import (
 )
 from sunwell.quality.guardrails.config import GuardrailConfig, load_config, save_config
 from sunwell.quality.guardrails.escalation import EscalationHandler
+from sunwell.quality.guardrails.patterns import GlobSet, SubstringSet
 from sunwell.quality.guardrails.recovery import GuardrailError, RecoveryManager
 from sunwell.quality.guardrails.scope import ScopeTracker
 from sunwell.quality.guardrails.system import GuardrailSystem, execute_with_guardrails
@@ -86,6 +87,8 @@ __all__ = [
     "ActionClassifier",
     "ActionTaxonomy",
     "SmartActionClassifier",  # RFC-077: LLM fallback
+    "GlobSet",
+    "SubstringSet",
     # Scope
     "ScopeTracker",
     "ScopeLimits",
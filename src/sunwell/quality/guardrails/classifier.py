@@ -6,10 +6,10 @@ RFC-077 adds FastClassifier fallback for edge cases that patterns miss.
 
 import dataclasses
 from collections import Counter
-from fnmatch import fnmatch
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sunwell.quality.guardrails.patterns import GlobSet, SubstringSet
 from sunwell.quality.guardrails.types import (
     Action,
     ActionClassification,
@@ -159,6 +159,17 @@ FORBIDDEN_COMMANDS: tuple[str, ...] = (
     "dd if=/dev/zero",
 )
 
+_FORBIDDEN_COMMANDS = SubstringSet(FORBIDDEN_COMMANDS)
+
+_TEST_PATHS = GlobSet(("tests/**", "test_*.py", "*_test.py", "**/*_test.py", "**/test_*.py"))
+_DOCS_PATHS = GlobSet(("docs/**", "*.md", "*.rst", "README*", "CHANGELOG*"))
+_CONFIG_PATHS = GlobSet(
+    ("*.json", "*.yaml", "*.yml", "*.toml", "pyproject.toml", "*.ini", "*.cfg")
+)
+
+_CLASSIFICATION_CACHE_SIZE = 4096
+"""Memoized classifications kept per classifier before the cache is reset."""
+
 
 # =============================================================================
 # Action Taxonomy
@@ -218,6 +229,11 @@ class ActionClassifier:
     2. Match path against trust zones
     3. Classify action type based on patterns
     4. Default to MODERATE for unknown actions
+
+    Trust zones and forbidden patterns are compiled once (see
+    :class:`GlobSet`), and results are memoized per (action type, path,
+    command) until :meth:`clear_cache` is called, so classifying a whole plan
+    matches each distinct path only once.
     """
 
     def __init__(
@@ -233,10 +249,40 @@ class ActionClassifier:
             trust_zones: Custom trust zones (extends defaults)
             custom_forbidden_patterns: Additional forbidden patterns
         """
+        self._cache: dict[
+            tuple[str, str | None, str | None, TrustLevel], ActionClassification
+        ] = {}
         self.trust_level = trust_level
         self.trust_zones = (trust_zones or ()) + DEFAULT_TRUST_ZONES
         self.forbidden_patterns = FORBIDDEN_PATTERNS + custom_forbidden_patterns
 
+    @property
+    def trust_zones(self) -> tuple[TrustZone, ...]:
+        """Trust zones in match order."""
+        return self._trust_zones
+
+    @trust_zones.setter
+    def trust_zones(self, zones: tuple[TrustZone, ...]) -> None:
+        self._trust_zones = zones
+        # "**/" variant matches the zone in nested directories
+        self._zone_globs = GlobSet((z.pattern, f"**/{z.pattern}") for z in zones)
+        self._cache.clear()
+
+    @property
+    def forbidden_patterns(self) -> tuple[str, ...]:
+        """Forbidden path globs."""
+        return self._forbidden_patterns
+
+    @forbidden_patterns.setter
+    def forbidden_patterns(self, patterns: tuple[str, ...]) -> None:
+        self._forbidden_patterns = patterns
+        self._forbidden_globs = GlobSet(patterns)
+        self._cache.clear()
+
+    def clear_cache(self) -> None:
+        """Forget memoized classifications (e.g. at the end of a plan)."""
+        self._cache.clear()
+
     def classify(self, action: Action) -> ActionClassification:
         """Classify a single action.
 
@@ -246,6 +292,19 @@ class ActionClassifier:
         Returns:
             ActionClassification with risk level and details
         """
+        key = (action.action_type, action.path, action.command, self.trust_level)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        if len(self._cache) >= _CLASSIFICATION_CACHE_SIZE:
+            self._cache.clear()
+        classification = self._classify(action)
+        self._cache[key] = classification
+        return classification
+
+    def _classify(self, action: Action) -> ActionClassification:
+        """Classify an action without the cache."""
         # 1. Check forbidden patterns first (hard-coded protection)
         if self._is_forbidden(action):
             return ActionClassification(
@@ -303,20 +362,14 @@ class ActionClassifier:
         """
         # Check path patterns
         if action.path:
-            for pattern in self.forbidden_patterns:
-                if fnmatch(action.path, pattern):
-                    return True
-                # Also check basename for patterns like ".env"
-                if fnmatch(Path(action.path).name, pattern):
-                    return True
+            if self._forbidden_globs.matches(action.path):
+                return True
+            # Also check basename for patterns like ".env"
+            if self._forbidden_globs.matches(Path(action.path).name):
+                return True
 
         # Check command patterns
-        if action.command:
-            for pattern in FORBIDDEN_COMMANDS:
-                if pattern in action.command:
-                    return True
-
-        return False
+        return bool(action.command) and _FORBIDDEN_COMMANDS.search(action.command) is not None
 
     def _check_trust_zones(self, path: str) -> TrustZone | None:
         """Check if path matches any trust zone.
@@ -324,13 +377,8 @@ class ActionClassifier:
         Returns the first matching zone, or None.
         Zones are checked in order, so more specific zones should come first.
         """
-        for zone in self.trust_zones:
-            if fnmatch(path, zone.pattern):
-                return zone
-            # Also try with ** prefix for nested matching
-            if fnmatch(path, f"**/{zone.pattern}"):
-                return zone
-        return None
+        index = self._zone_globs.first(path)
+        return self._trust_zones[index] if index is not None else None
 
     def _classify_action_type(
         self, action: Action
@@ -426,26 +474,15 @@ class ActionClassifier:
 
     def _is_test_path(self, path: str) -> bool:
         """Check if path is a test file."""
-        patterns = ("tests/**", "test_*.py", "*_test.py", "**/*_test.py", "**/test_*.py")
-        return any(fnmatch(path, p) for p in patterns)
+        return _TEST_PATHS.matches(path)
 
     def _is_docs_path(self, path: str) -> bool:
         """Check if path is documentation."""
-        patterns = ("docs/**", "*.md", "*.rst", "README*", "CHANGELOG*")
-        return any(fnmatch(path, p) for p in patterns)
+        return _DOCS_PATHS.matches(path)
 
     def _is_config_path(self, path: str) -> bool:
         """Check if path is a configuration file."""
-        patterns = (
-            "*.json",
-            "*.yaml",
-            "*.yml",
-            "*.toml",
-            "pyproject.toml",
-            "*.ini",
-            "*.cfg",
-        )
-        return any(fnmatch(path, p) for p in patterns)
+        return _CONFIG_PATHS.matches(path)
 
     def _needs_escalation(self, risk: ActionRisk) -> bool:
         """Determine if risk level needs escalation based on trust level."""
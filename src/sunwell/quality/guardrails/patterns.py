@@ -0,0 +1,87 @@
+"""Compiled matchers for guardrail path and command patterns (RFC-048).
+
+Trust zones, forbidden patterns and forbidden commands are checked on every
+tool action. Instead of calling ``fnmatch`` once per pattern, each pattern
+list is compiled once into a single regex that finds the first matching
+pattern in one pass.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Sequence
+from fnmatch import translate
+
+
+class GlobSet:
+    """An ordered list of glob groups compiled into one regex.
+
+    ``first(name)`` gives the same answer as checking
+    ``any(fnmatch(name, glob) for glob in group)`` for each group in turn and
+    returning the index of the first group that matches.
+
+    Example:
+        zones = GlobSet([("tests/**", "**/tests/**"), ("*.md",)])
+        zones.first("pkg/tests/test_x.py")  # 0
+        zones.first("README.md")  # 1
+        zones.first("src/app.py")  # None
+    """
+
+    __slots__ = ("groups", "_regex")
+
+    def __init__(self, groups: Iterable[str | Sequence[str]]):
+        """Compile glob groups.
+
+        Args:
+            groups: Globs in priority order. A group is either one glob or a
+                sequence of alternative globs that share one index.
+        """
+        self.groups: tuple[tuple[str, ...], ...] = tuple(
+            (group,) if isinstance(group, str) else tuple(group) for group in groups
+        )
+        # Each translated glob carries its own end anchor, so the alternation
+        # is tried in group order and the first alternative to match wins.
+        alternatives = [
+            f"(?P<_{i}>{'|'.join(translate(os.path.normcase(g)) for g in globs)})"
+            for i, globs in enumerate(self.groups)
+            if globs
+        ]
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def first(self, name: str) -> int | None:
+        """Index of the first group with a glob matching ``name``, or None."""
+        if self._regex is None:
+            return None
+        match = self._regex.match(os.path.normcase(name))
+        return int(match.lastgroup[1:]) if match else None
+
+    def matches(self, name: str) -> bool:
+        """Whether any glob matches ``name``."""
+        return self.first(name) is not None
+
+
+class SubstringSet:
+    """Finds any of a set of literal substrings in one scan.
+
+    Equivalent to ``any(s in text for s in substrings)``, with all
+    substrings compiled into a single regex alternation.
+    """
+
+    __slots__ = ("substrings", "_regex")
+
+    def __init__(self, substrings: Iterable[str]):
+        """Compile substrings.
+
+        Args:
+            substrings: Literal strings to search for
+        """
+        self.substrings: tuple[str, ...] = tuple(s for s in substrings if s)
+        # Longest first, so the reported match is the most specific one
+        ordered = sorted(self.substrings, key=len, reverse=True)
+        self._regex = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def search(self, text: str) -> str | None:
+        """Return the first substring found in ``text``, or None."""
+        if self._regex is None:
+            return None
+        match = self._regex.search(text)
+        return match.group() if match else None
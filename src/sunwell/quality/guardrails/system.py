@@ -132,6 +132,7 @@ class GuardrailSystem:
                 start_commit="",
             )
 
+        self.classifier.clear_cache()
         self._session_started = True
         return session
 
@@ -298,6 +299,7 @@ class GuardrailSystem:
     async def cleanup_session(self) -> None:
         """Clean up session after successful completion."""
         await self.recovery.cleanup_session()
+        self.classifier.clear_cache()
         self._session_started = False
 
     def can_continue(self) -> ScopeCheckResult:
@@ -4,10 +4,10 @@ Evaluates paths against trust zones to determine risk overrides.
 """
 
 from dataclasses import dataclass
-from fnmatch import fnmatch
 from pathlib import Path
 
 from sunwell.quality.guardrails.classifier import DEFAULT_TRUST_ZONES
+from sunwell.quality.guardrails.patterns import GlobSet
 from sunwell.quality.guardrails.types import ActionRisk, TrustZone
 
 
@@ -32,6 +32,7 @@ class TrustZoneEvaluator:
         self.zones: tuple[TrustZone, ...] = custom_zones
         if include_defaults:
             self.zones = custom_zones + DEFAULT_TRUST_ZONES
+        self._globs = GlobSet(self._zone_globs(zone.pattern) for zone in self.zones)
 
     def evaluate(self, path: str | Path) -> TrustZoneMatch | None:
         """Evaluate a path against trust zones.
@@ -44,16 +45,23 @@ class TrustZoneEvaluator:
         """
         path_str = str(path)
 
-        for zone in self.zones:
-            if self._matches_pattern(path_str, zone.pattern):
-                return TrustZoneMatch(
-                    path=path_str,
-                    zone=zone,
-                    risk_override=zone.risk_override,
-                    allowed_in_autonomous=zone.allowed_in_autonomous,
-                )
-
-        return None
+        index = self._globs.first(path_str)
+        # Suffixes are matched on the normalized path too (e.g. "a//b", "./a")
+        normalized = "/".join(Path(path_str).parts)
+        if normalized != path_str:
+            other = self._globs.first(normalized)
+            if other is not None and (index is None or other < index):
+                index = other
+
+        if index is None:
+            return None
+        zone = self.zones[index]
+        return TrustZoneMatch(
+            path=path_str,
+            zone=zone,
+            risk_override=zone.risk_override,
+            allowed_in_autonomous=zone.allowed_in_autonomous,
+        )
 
     def evaluate_all(self, paths: list[str | Path]) -> dict[str, TrustZoneMatch | None]:
         """Evaluate multiple paths.
@@ -162,30 +170,21 @@ class TrustZoneEvaluator:
 
         return summary
 
-    def _matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if path matches a glob pattern.
+    @staticmethod
+    def _zone_globs(pattern: str) -> tuple[str, ...]:
+        """Globs a path is matched against for one zone pattern.
 
         Handles various pattern formats:
         - Simple: "*.py"
         - Directory: "tests/**"
         - Nested: "**/auth/**"
-        """
-        # Direct match
-        if fnmatch(path, pattern):
-            return True
 
-        # Try with ** prefix for nested matching
-        if not pattern.startswith("**") and fnmatch(path, f"**/{pattern}"):
-            return True
-
-        # Check if pattern matches any path component
-        path_parts = Path(path).parts
-        for i in range(len(path_parts)):
-            partial = "/".join(path_parts[i:])
-            if fnmatch(partial, pattern):
-                return True
-
-        return False
+        A path also matches when any of its trailing components do; since
+        ``*`` crosses "/", that is what the "**/" variant matches.
+        """
+        if pattern.startswith("**"):
+            return (pattern,)
+        return (pattern, f"**/{pattern}")
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,6 +33,7 @@ from sunwell.quality.security.approval_cache import (
 )
 from sunwell.quality.security.audit import (
     AuditBackend,
+    AuditCheckpoint,
     AuditEntry,
     AuditLogManager,
     LocalAuditLog,
@@ -116,6 +117,7 @@ __all__ = [
     # Audit
     "AuditEntry",
     "AuditBackend",
+    "AuditCheckpoint",
     "AuditLogManager",
     "LocalAuditLog",
     "S3ObjectLockBackend",
@@ -13,14 +13,16 @@ Each entry includes:
 """
 
 
+import bisect
 import hashlib
 import hmac
 import json
-from collections.abc import Iterator
-from dataclasses import asdict, dataclass, field
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal, Protocol
+from typing import Any, BinaryIO, Literal, Protocol
 
 from sunwell.quality.security.analyzer import PermissionScope
 
@@ -131,6 +133,155 @@ class AuditBackend(Protocol):
 # =============================================================================
 
 
+CHECKPOINT_INTERVAL = 1000
+"""Entries between the signed checkpoints LocalAuditLog.append writes."""
+
+
+@dataclass(frozen=True, slots=True)
+class AuditCheckpoint:
+    """Signed record that the chain is intact up to a byte offset.
+
+    Stored in a ``.checkpoints`` sidecar; verification resumes from the
+    newest checkpoint that still matches the log instead of the first entry.
+    """
+
+    entries: int
+    """Number of entries before ``offset``."""
+
+    offset: int
+    """Byte offset just past the last covered entry."""
+
+    chain_hash: str
+    """entry_hash of the last covered entry."""
+
+    signature: str
+    """HMAC signature over the other fields."""
+
+    @property
+    def message(self) -> str:
+        """The signed content."""
+        return f"{self.entries}:{self.offset}:{self.chain_hash}"
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexRow:
+    """Location and filter fields of one log entry."""
+
+    offset: int
+    length: int
+    timestamp: datetime
+    skill_name: str
+    user_id: str
+    action: str
+
+    def encode(self) -> str:
+        """Serialize as one ``.idx`` sidecar line."""
+        return json.dumps([
+            self.offset,
+            self.length,
+            self.timestamp.isoformat(),
+            self.skill_name,
+            self.user_id,
+            self.action,
+        ]) + "\n"
+
+    @classmethod
+    def decode(cls, line: str) -> _IndexRow:
+        """Parse an ``.idx`` sidecar line."""
+        offset, length, timestamp, skill_name, user_id, action = json.loads(line)
+        return cls(
+            offset, length, datetime.fromisoformat(timestamp), skill_name, user_id, action
+        )
+
+
+@dataclass(slots=True)
+class _AuditIndex:
+    """In-memory query index: entry rows plus posting lists per field."""
+
+    rows: list[_IndexRow] = field(default_factory=list)
+    by_skill: dict[str, list[int]] = field(default_factory=dict)
+    by_user: dict[str, list[int]] = field(default_factory=dict)
+    by_action: dict[str, list[int]] = field(default_factory=dict)
+
+    ordered: bool = True
+    """Whether timestamps never decrease (lets ``since`` bisect)."""
+
+    end: int = 0
+    """Log byte offset the index covers."""
+
+    def add(self, row: _IndexRow) -> None:
+        pos = len(self.rows)
+        if self.rows and row.timestamp < self.rows[-1].timestamp:
+            self.ordered = False
+        self.rows.append(row)
+        self.by_skill.setdefault(row.skill_name, []).append(pos)
+        self.by_user.setdefault(row.user_id, []).append(pos)
+        self.by_action.setdefault(row.action, []).append(pos)
+        self.end = row.offset + row.length
+
+    def positions(
+        self,
+        skill_name: str | None,
+        user_id: str | None,
+        action: str | None,
+        since: datetime | None,
+    ) -> Iterator[int]:
+        """Yield row positions matching the filters, in log order."""
+        start = 0
+        if since and self.ordered:
+            start = bisect.bisect_left(self.rows, since, key=lambda row: row.timestamp)
+
+        postings: list[list[int]] = []
+        for value, lookup in (
+            (skill_name, self.by_skill),
+            (user_id, self.by_user),
+            (action, self.by_action),
+        ):
+            if value:
+                if value not in lookup:
+                    return
+                postings.append(lookup[value])
+
+        if postings:
+            # Walk the shortest posting list, checking the other filters per row
+            shortest = min(postings, key=len)
+            candidates: Iterable[int] = shortest[bisect.bisect_left(shortest, start):]
+        else:
+            candidates = range(start, len(self.rows))
+
+        for pos in candidates:
+            row = self.rows[pos]
+            if skill_name and row.skill_name != skill_name:
+                continue
+            if user_id and row.user_id != user_id:
+                continue
+            if action and row.action != action:
+                continue
+            if since and row.timestamp < since:
+                continue
+            yield pos
+
+
+def _read_last_line(path: Path, end: int | None = None, block_size: int = 8192) -> bytes:
+    """Read the last non-blank line ending at or before ``end``, from the back.
+
+    Returns:
+        The line without its newline, or b"" if there is none
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END) if end is None else end
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            tail = (f.read(step) + tail).rstrip()
+            newline = tail.rfind(b"\n")
+            if newline != -1:
+                return tail[newline + 1 :]
+        return tail.strip()
+
+
 class LocalAuditLog:
     """Local file audit log with checksum chain.
 
@@ -139,20 +290,42 @@ class LocalAuditLog:
     - HMAC signature prevents modification without key
     - Integrity verification detects tampering
 
+    Appends are O(1): the last hash is read backwards from the end of the
+    log once and then kept in memory. Two sidecar files sit next to the log:
+    ``.checkpoints`` (signed chain checkpoints, so verification resumes
+    where it last stopped) and ``.idx`` (offsets and filter fields, so
+    queries seek straight to matching entries). Both are rebuilt from the
+    log if missing.
+
     For true immutability, use S3ObjectLockBackend.
     """
 
-    def __init__(self, storage_path: Path, signing_key: bytes):
+    def __init__(
+        self,
+        storage_path: Path,
+        signing_key: bytes,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+    ):
         """Initialize the local audit log.
 
         Args:
             storage_path: Path to the audit log file
             signing_key: HMAC signing key for integrity
+            checkpoint_interval: Entries between signed checkpoints (0 disables)
         """
         self.storage = storage_path
         self.key = signing_key
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint_path = storage_path.with_name(storage_path.name + ".checkpoints")
+        self._index_path = storage_path.with_name(storage_path.name + ".idx")
         self._last_hash = self._get_last_hash()
 
+        # Both computed lazily: counting entries and loading the index are
+        # linear in the log size, and most processes only append.
+        self._entry_count: int | None = None
+        self._index: _AuditIndex | None = None
+        self._index_end: int | None = None
+
     def append(
         self,
         entry_data: dict[str, Any],
@@ -173,37 +346,52 @@ class LocalAuditLog:
             {**entry_data, "previous_hash": self._last_hash}
         )
 
-        # Sign the entry
-        signature = hmac.new(
-            self.key,
-            entry_hash.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-
         # Create entry
         entry = AuditEntry(
             **entry_data,
             previous_hash=self._last_hash,
             entry_hash=entry_hash,
-            signature=signature,
+            signature=self._sign(entry_hash),
         )
 
-        # Atomic append (write to temp, rename)
-        temp_path = self.storage.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            f.write(json.dumps(entry.to_dict(), default=str) + "\n")
+        entry_count = self._count_entries()
+        indexed_to = self._indexed_to()
 
-        # Append to main log
-        with open(self.storage, "a") as f:
-            f.write(json.dumps(entry.to_dict(), default=str) + "\n")
+        # Single write of a complete line, so a crash can't interleave entries
+        line = (json.dumps(entry.to_dict(), default=str) + "\n").encode()
+        with open(self.storage, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        end = offset + len(line)
 
-        temp_path.unlink()
         self._last_hash = entry_hash
+        self._entry_count = entry_count + 1
+
+        # Only extend the index when it is current; otherwise the next
+        # query catches it up from the log.
+        if indexed_to == offset:
+            row = _IndexRow(
+                offset, len(line), entry.timestamp, entry.skill_name, entry.user_id, entry.action
+            )
+            with open(self._index_path, "a") as f:
+                f.write(row.encode())
+            if self._index is not None:
+                self._index.add(row)
+            self._index_end = end
+
+        if self.checkpoint_interval and self._entry_count % self.checkpoint_interval == 0:
+            self._write_checkpoint(self._entry_count, end, entry_hash)
 
         return entry
 
-    def verify_integrity(self) -> tuple[bool, str]:
-        """Verify the entire chain is intact.
+    def verify_integrity(self, full: bool = False) -> tuple[bool, str]:
+        """Verify the chain is intact.
+
+        Resumes from the newest trusted checkpoint unless ``full`` is set,
+        and records a new checkpoint at the end of a successful run.
+
+        Args:
+            full: Re-verify from the first entry
 
         Returns:
             Tuple of (is_valid, message)
@@ -211,38 +399,46 @@ class LocalAuditLog:
         if not self.storage.exists():
             return True, "No audit log exists yet"
 
-        previous_hash = ""
-        line_num = 0
-
-        with open(self.storage) as f:
-            for line in f:
-                line_num += 1
-                if not line.strip():
+        checkpoint = None if full else self._trusted_checkpoint()
+        if checkpoint is not None:
+            offset = checkpoint.offset
+            previous_hash = checkpoint.chain_hash
+            entry_num = checkpoint.entries
+        else:
+            offset, previous_hash, entry_num = 0, "", 0
+
+        with open(self.storage, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                offset += len(raw)
+                if not raw.strip():
                     continue
+                entry_num += 1
 
                 try:
-                    data = json.loads(line)
+                    data = json.loads(raw)
                     entry = AuditEntry.from_dict(data)
-                except (json.JSONDecodeError, KeyError) as e:
-                    return False, f"Invalid entry at line {line_num}: {e}"
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as e:
+                    return False, f"Invalid entry {entry_num}: {e}"
 
                 # Check chain linkage
                 if entry.previous_hash != previous_hash:
-                    return False, f"Chain broken at line {line_num}"
+                    return False, f"Chain broken at entry {entry_num}"
 
                 # Verify signature
-                expected_sig = hmac.new(
-                    self.key,
-                    entry.entry_hash.encode(),
-                    hashlib.sha256,
-                ).hexdigest()
-
-                if entry.signature != expected_sig:
-                    return False, f"Invalid signature at line {line_num}"
+                if not hmac.compare_digest(entry.signature, self._sign(entry.entry_hash)):
+                    return False, f"Invalid signature at entry {entry_num}"
 
                 previous_hash = entry.entry_hash
 
-        return True, f"Verified {line_num} entries"
+        self._entry_count = entry_num
+        if entry_num and (checkpoint is None or entry_num > checkpoint.entries):
+            self._write_checkpoint(entry_num, offset, previous_hash)
+
+        if checkpoint is not None:
+            resumed = entry_num - checkpoint.entries
+            return True, f"Verified {entry_num} entries ({resumed} since checkpoint)"
+        return True, f"Verified {entry_num} entries"
 
     def query(
         self,
@@ -267,26 +463,12 @@ class LocalAuditLog:
         if not self.storage.exists():
             return
 
+        index = self._load_index()
         count = 0
-        with open(self.storage) as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    entry = AuditEntry.from_dict(data)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-                # Apply filters
-                if skill_name and entry.skill_name != skill_name:
-                    continue
-                if user_id and entry.user_id != user_id:
-                    continue
-                if action and entry.action != action:
-                    continue
-                if since and entry.timestamp < since:
+        with open(self.storage, "rb") as f:
+            for pos in index.positions(skill_name, user_id, action, since):
+                entry = self._read_entry(f, index.rows[pos])
+                if entry is None:
                     continue
 
                 yield entry
@@ -306,21 +488,17 @@ class LocalAuditLog:
         """
         entries: list[AuditEntry] = []
 
-        if not self.storage.exists():
+        if not self.storage.exists() or limit <= 0:
             return entries
 
-        with open(self.storage) as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    entries.append(AuditEntry.from_dict(data))
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        index = self._load_index()
+        with open(self.storage, "rb") as f:
+            for row in reversed(index.rows[-limit:]):
+                entry = self._read_entry(f, row)
+                if entry is not None:
+                    entries.append(entry)
 
-        # Return newest first, limited
-        return entries[-limit:][::-1]
+        return entries
 
     def _compute_hash(self, data: dict[str, Any]) -> str:
         """Compute SHA-256 hash of entry data.
@@ -335,6 +513,10 @@ class LocalAuditLog:
         canonical = json.dumps(data, sort_keys=True, default=str)
         return hashlib.sha256(canonical.encode()).hexdigest()
 
+    def _sign(self, message: str) -> str:
+        """HMAC-SHA256 signature of a message with the log's key."""
+        return hmac.new(self.key, message.encode(), hashlib.sha256).hexdigest()
+
     def _get_last_hash(self) -> str:
         """Get hash of last entry (or empty for new log).
 
@@ -344,12 +526,7 @@ class LocalAuditLog:
         if not self.storage.exists():
             return ""
 
-        last_line = ""
-        with open(self.storage) as f:
-            for line in f:
-                if line.strip():
-                    last_line = line
-
+        last_line = _read_last_line(self.storage)
         if not last_line:
             return ""
 
@@ -359,6 +536,155 @@ class LocalAuditLog:
         except json.JSONDecodeError:
             return ""
 
+    def _count_entries(self) -> int:
+        """Number of entries in the log, counted from the last checkpoint."""
+        if self._entry_count is None:
+            count, offset = 0, 0
+            if self.storage.exists():
+                checkpoint = self._trusted_checkpoint()
+                if checkpoint is not None:
+                    count, offset = checkpoint.entries, checkpoint.offset
+                with open(self.storage, "rb") as f:
+                    f.seek(offset)
+                    count += sum(1 for raw in f if raw.strip())
+            self._entry_count = count
+        return self._entry_count
+
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+
+    def _write_checkpoint(self, entries: int, offset: int, chain_hash: str) -> None:
+        """Append a signed checkpoint to the ``.checkpoints`` sidecar."""
+        unsigned = AuditCheckpoint(entries, offset, chain_hash, signature="")
+        checkpoint = replace(unsigned, signature=self._sign(unsigned.message))
+        with open(self._checkpoint_path, "a") as f:
+            f.write(json.dumps(asdict(checkpoint)) + "\n")
+
+    def _trusted_checkpoint(self) -> AuditCheckpoint | None:
+        """Newest checkpoint with a valid signature that still matches the log.
+
+        Matching means the entry ending exactly at the checkpoint's offset
+        carries the checkpoint's chain hash and a valid signature, so the
+        covered prefix is unchanged in length and ends where it did. Entries
+        before a checkpoint are not re-read; use ``full=True`` for that.
+        """
+        if not self._checkpoint_path.exists():
+            return None
+
+        size = self.storage.stat().st_size
+        for line in reversed(self._checkpoint_path.read_text().splitlines()):
+            try:
+                checkpoint = AuditCheckpoint(**json.loads(line))
+            except (json.JSONDecodeError, TypeError):
+                continue
+
+            if not hmac.compare_digest(checkpoint.signature, self._sign(checkpoint.message)):
+                continue
+            if checkpoint.offset > size:
+                continue
+
+            try:
+                last = json.loads(_read_last_line(self.storage, end=checkpoint.offset))
+            except json.JSONDecodeError:
+                continue
+            if (
+                isinstance(last, dict)
+                and last.get("entry_hash") == checkpoint.chain_hash
+                and hmac.compare_digest(
+                    str(last.get("signature", "")), self._sign(checkpoint.chain_hash)
+                )
+            ):
+                return checkpoint
+
+        return None
+
+    # -------------------------------------------------------------------------
+    # Query index
+    # -------------------------------------------------------------------------
+
+    def _indexed_to(self) -> int:
+        """Log byte offset covered by the ``.idx`` sidecar."""
+        if self._index is not None:
+            return self._index.end
+        if self._index_end is None:
+            self._index_end = 0
+            if self._index_path.exists():
+                try:
+                    row = _IndexRow.decode(_read_last_line(self._index_path).decode())
+                    self._index_end = row.offset + row.length
+                except (json.JSONDecodeError, UnicodeDecodeError, TypeError, ValueError):
+                    pass
+        return self._index_end
+
+    def _load_index(self) -> _AuditIndex:
+        """Load the ``.idx`` sidecar and catch it up with the log."""
+        size = self.storage.stat().st_size
+
+        if self._index is None:
+            index = _AuditIndex()
+            if self._index_path.exists():
+                with open(self._index_path) as f:
+                    for line in f:
+                        try:
+                            row = _IndexRow.decode(line)
+                        except (json.JSONDecodeError, TypeError, ValueError):
+                            continue
+                        if row.offset < index.end:
+                            # Out of order: don't trust the sidecar
+                            index = _AuditIndex()
+                            break
+                        index.add(row)
+            self._index = index
+
+        if self._index.end > size:
+            # The log was truncated or replaced: rebuild from scratch
+            self._index = _AuditIndex()
+            self._index_path.unlink(missing_ok=True)
+
+        index = self._index
+        if index.end < size:
+            new_rows: list[_IndexRow] = []
+            with open(self.storage, "rb") as f:
+                f.seek(index.end)
+                offset = index.end
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Partially written; index once complete
+                    if raw.strip():
+                        try:
+                            data = json.loads(raw)
+                            row = _IndexRow(
+                                offset,
+                                len(raw),
+                                datetime.fromisoformat(data["timestamp"]),
+                                data["skill_name"],
+                                data["user_id"],
+                                data["action"],
+                            )
+                        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, ValueError):
+                            row = None
+                        if row is not None:
+                            index.add(row)
+                            new_rows.append(row)
+                    offset += len(raw)
+                    index.end = offset
+
+            if new_rows:
+                with open(self._index_path, "a") as f:
+                    f.writelines(row.encode() for row in new_rows)
+
+        return index
+
+    @staticmethod
+    def _read_entry(f: BinaryIO, row: _IndexRow) -> AuditEntry | None:
+        """Read the entry an index row points at."""
+        f.seek(row.offset)
+        try:
+            return AuditEntry.from_dict(json.loads(f.read(row.length)))
+        except (json.JSONDecodeError, KeyError):
+            return None
+
 
 # =============================================================================
 # S3 OBJECT LOCK BACKEND (STUB)
@@ -10,6 +10,7 @@ This module provides:
 """
 
 from sunwell.quality.weakness.analyzer import SmartWeaknessAnalyzer, WeaknessAnalyzer
+from sunwell.quality.weakness.cache import ToolResultCache
 from sunwell.quality.weakness.cascade import CascadeEngine, CascadeExecution, CascadePreview
 from sunwell.quality.weakness.executor import (
     CascadeArtifactBuilder,
@@ -41,6 +42,7 @@ __all__ = [
     # Classes
     "WeaknessAnalyzer",
     "SmartWeaknessAnalyzer",  # RFC-077: LLM prioritization
+    "ToolResultCache",
     "CascadeEngine",
     "CascadeExecution",
     "CascadePreview",
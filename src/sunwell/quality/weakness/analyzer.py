@@ -7,30 +7,44 @@ Analyzes codebase for weak points using static analysis tools:
 - mypy for type errors
 - git for staleness detection
 
+The tools run concurrently as async subprocesses, only on the Python files
+the artifact graph produces. Results are cached per file by content hash
+and tool version (see ``cache.py``), so a rescan only re-runs each tool on
+files that changed.
+
 RFC-077 adds LLM-based severity prioritization for context-aware ranking.
 
 All tools are optional - graceful degradation if missing.
 """
 
 
+import asyncio
+import contextlib
 import json
 import subprocess
+from collections.abc import Awaitable, Callable, Collection
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sunwell.foundation.utils import compute_file_hash
+from sunwell.quality.weakness.cache import ToolResultCache
 from sunwell.quality.weakness.types import (
     WeaknessScore,
     WeaknessSignal,
     WeaknessType,
     _freeze_evidence,
 )
+from sunwell.tools.core.process import run_process
 
 if TYPE_CHECKING:
     from sunwell.models import ModelProtocol
     from sunwell.planning.naaru.artifacts import ArtifactGraph
 
+_BATCH_SIZE = 200
+"""Files passed to one tool invocation."""
+
 
 @dataclass(slots=True)
 class WeaknessAnalyzer:
@@ -44,31 +58,66 @@ class WeaknessAnalyzer:
     complexity_threshold: int = 10
     staleness_months: int = 6
 
-    # Tool availability cache
-    _tool_available: dict[str, bool] = field(default_factory=dict)
+    cache_path: Path | None = None
+    """Per-file tool result cache (default: ``weakness/tool_cache.json`` in
+    the project state dir)."""
+
+    # Tool version cache (None = unavailable)
+    _tool_versions: dict[str, str | None] = field(default_factory=dict)
+
+    _cache: ToolResultCache | None = field(default=None, repr=False)
+
+    _scores: list[WeaknessScore] | None = field(default=None, repr=False)
+    """Result of the last scan."""
 
-    def _check_tool(self, tool: str) -> bool:
-        """Check if a tool is available."""
-        if tool not in self._tool_available:
+    async def _tool_version(self, tool: str) -> str | None:
+        """Version string of a tool, or None if it is not available."""
+        if tool not in self._tool_versions:
+            version = None
             try:
-                result = subprocess.run(
-                    [tool, "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                self._tool_available[tool] = result.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                self._tool_available[tool] = False
-        return self._tool_available[tool]
+                result = await run_process([tool, "--version"], timeout=5)
+                if result.returncode == 0:
+                    version = (result.stdout or result.stderr).strip()
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+            self._tool_versions[tool] = version
+        return self._tool_versions[tool]
+
+    def _get_cache(self) -> ToolResultCache:
+        """Lazy-load the tool result cache."""
+        if self._cache is None:
+            path = self.cache_path
+            if path is None:
+                from sunwell.knowledge.project.state import resolve_state_dir
+
+                path = resolve_state_dir(self.project_root) / "weakness" / "tool_cache.json"
+            self._cache = ToolResultCache(path)
+        return self._cache
+
+    @property
+    def last_scores(self) -> list[WeaknessScore] | None:
+        """Scores from the most recent scan, or None before the first."""
+        return self._scores
 
     async def scan(self) -> list[WeaknessScore]:
         """Scan codebase for weaknesses, returning scored artifacts."""
+        files = await asyncio.to_thread(self._source_files)
+
         # Run analysis tools in parallel (they're I/O bound)
-        coverage_map = await self._analyze_coverage()
-        complexity_map = await self._analyze_complexity()
-        lint_map = await self._analyze_lint()
-        staleness_map = await self._analyze_staleness()
-        type_errors = await self._analyze_types()
+        (
+            coverage_map,
+            complexity_map,
+            lint_map,
+            staleness_map,
+            type_errors,
+        ) = await asyncio.gather(
+            self._analyze_coverage(),
+            self._analyze_complexity(files),
+            self._analyze_lint(files),
+            self._analyze_staleness(files),
+            self._analyze_types(files),
+        )
+        await asyncio.to_thread(self._get_cache().save)
 
         scores: list[WeaknessScore] = []
 
@@ -179,172 +228,262 @@ class WeaknessAnalyzer:
                 )
 
         # Sort by total severity (highest first)
-        return sorted(scores, key=lambda s: s.total_severity, reverse=True)
+        self._scores = sorted(scores, key=lambda s: s.total_severity, reverse=True)
+        return self._scores
+
+    def _source_files(self) -> dict[str, str]:
+        """Content hash of each existing Python file the graph produces."""
+        files: dict[str, str] = {}
+        for artifact_id in self.graph:
+            produces = self.graph[artifact_id].produces_file
+            if not produces or Path(produces).suffix not in (".py", ".pyi"):
+                continue
+            path = self.project_root / produces
+            try:
+                files[self._file_to_artifact(str(path))] = compute_file_hash(path)
+            except OSError:
+                continue
+        return files
+
+    async def _per_file(
+        self,
+        tool: str,
+        files: dict[str, str],
+        run: Callable[[list[str]], Awaitable[dict[str, Any]]],
+        absent: Any,
+        uncached: Collection[str] = (),
+    ) -> dict[str, Any]:
+        """Run a tool on files missing from the cache, in batches.
+
+        Args:
+            tool: Tool executable (its version keys the cache)
+            files: Content hash per file
+            run: Analyzes a batch of files, returning a value per file
+            absent: Value cached for files the tool reports nothing for
+                (None: don't cache them)
+            uncached: Files whose result depends on more than their content;
+                they are always analyzed and never stored
+
+        Returns:
+            Value per file, cached or fresh
+        """
+        version = await self._tool_version(tool)
+        if version is None or not files:
+            return {}
+
+        cache = self._get_cache()
+        results, missing = cache.lookup(
+            tool, version, {file: h for file, h in files.items() if file not in uncached}
+        )
+        missing.extend(file for file in files if file in uncached)
+        for start in range(0, len(missing), _BATCH_SIZE):
+            batch = missing[start : start + _BATCH_SIZE]
+            try:
+                values = await run(batch)
+            except (subprocess.TimeoutExpired, OSError, json.JSONDecodeError, KeyError, ValueError):
+                continue  # Leave the batch uncached; retried on the next scan
+
+            fresh = {
+                file: (files[file], values.get(file, absent))
+                for file in batch
+                if values.get(file, absent) is not None
+            }
+            cache.store(
+                tool,
+                version,
+                {file: entry for file, entry in fresh.items() if file not in uncached},
+            )
+            results.update({file: value for file, (_, value) in fresh.items()})
+        return results
 
     async def _analyze_coverage(self) -> dict[str, float]:
-        """Get test coverage per file using coverage.py."""
-        if not self._check_tool("coverage"):
+        """Get test coverage per file using coverage.py.
+
+        Coverage depends on the recorded data, not on sources, so the whole
+        report is cached against the ``.coverage`` file's size and mtime.
+        """
+        version = await self._tool_version("coverage")
+        data_file = self.project_root / ".coverage"
+        if version is None or not data_file.exists():
             return {}
 
+        stat = data_file.stat()
+        key = f"{stat.st_size}:{stat.st_mtime_ns}"
+        cache = self._get_cache()
+        cached = cache.get_whole("coverage", version, key)
+        if cached is not None:
+            return cached
+
         try:
-            result = subprocess.run(
+            result = await run_process(
                 ["coverage", "json", "-o", "-"],
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
                 timeout=60,
+                max_output=100_000_000,
             )
             if result.returncode == 0 and result.stdout:
                 data = json.loads(result.stdout)
-                return {
+                coverage_map = {
                     self._file_to_artifact(f): info["summary"]["percent_covered"] / 100
                     for f, info in data.get("files", {}).items()
                 }
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError):
+                cache.put_whole("coverage", version, key, coverage_map)
+                return coverage_map
+        except (subprocess.TimeoutExpired, OSError, json.JSONDecodeError, KeyError):
             pass
         return {}
 
-    async def _analyze_complexity(self) -> dict[str, int]:
+    async def _analyze_complexity(self, files: dict[str, str]) -> dict[str, int]:
         """Get cyclomatic complexity per file using radon."""
-        if not self._check_tool("radon"):
-            return {}
 
-        try:
-            src_dir = self.project_root / "src"
-            if not src_dir.exists():
-                src_dir = self.project_root
-
-            result = subprocess.run(
-                ["radon", "cc", "-j", str(src_dir)],
-                capture_output=True,
-                text=True,
+        async def run(batch: list[str]) -> dict[str, int]:
+            result = await run_process(
+                ["radon", "cc", "-j", *batch],
+                cwd=self.project_root,
                 timeout=60,
+                max_output=100_000_000,
             )
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
-                complexity_map: dict[str, int] = {}
-                for file_path, funcs in data.items():
-                    if funcs:
-                        max_complexity = max((f["complexity"] for f in funcs), default=0)
-                        complexity_map[self._file_to_artifact(file_path)] = max_complexity
-                return complexity_map
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError):
-            pass
-        return {}
-
-    async def _analyze_lint(self) -> dict[str, int]:
+            if result.returncode != 0 or not result.stdout:
+                raise ValueError("radon failed")
+            complexity_map: dict[str, int] = {}
+            for file_path, funcs in json.loads(result.stdout).items():
+                if funcs and isinstance(funcs, list):
+                    max_complexity = max((f["complexity"] for f in funcs), default=0)
+                    complexity_map[self._file_to_artifact(file_path)] = max_complexity
+            return complexity_map
+
+        return await self._per_file("radon", files, run, absent=0)
+
+    async def _analyze_lint(self, files: dict[str, str]) -> dict[str, int]:
         """Get lint error count per file using ruff."""
-        if not self._check_tool("ruff"):
-            return {}
 
-        try:
-            src_dir = self.project_root / "src"
-            if not src_dir.exists():
-                src_dir = self.project_root
-
-            result = subprocess.run(
-                ["ruff", "check", "--output-format=json", str(src_dir)],
-                capture_output=True,
-                text=True,
+        async def run(batch: list[str]) -> dict[str, int]:
+            result = await run_process(
+                ["ruff", "check", "--output-format=json", *batch],
+                cwd=self.project_root,
                 timeout=60,
+                max_output=100_000_000,
             )
             # Ruff returns non-zero if there are errors, but still outputs JSON
-            if result.stdout:
-                data = json.loads(result.stdout)
-                error_counts: dict[str, int] = {}
-                for error in data:
-                    file_path = error.get("filename", "")
-                    artifact_id = self._file_to_artifact(file_path)
-                    error_counts[artifact_id] = error_counts.get(artifact_id, 0) + 1
-                return error_counts
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError):
-            pass
-        return {}
+            if not result.stdout:
+                raise ValueError("ruff produced no output")
+            error_counts: dict[str, int] = {}
+            for error in json.loads(result.stdout):
+                artifact_id = self._file_to_artifact(error.get("filename", ""))
+                error_counts[artifact_id] = error_counts.get(artifact_id, 0) + 1
+            return error_counts
 
-    async def _analyze_staleness(self) -> dict[str, int]:
-        """Get months since last commit per file using git."""
-        try:
-            src_dir = self.project_root / "src"
-            if not src_dir.exists():
-                src_dir = self.project_root
-
-            # Get list of Python files
-            result = subprocess.run(
-                ["git", "ls-files", "*.py"],
-                cwd=src_dir,
-                capture_output=True,
-                text=True,
-                timeout=30,
+        return await self._per_file("ruff", files, run, absent=0)
+
+    async def _analyze_staleness(self, files: dict[str, str]) -> dict[str, int]:
+        """Get months since last commit per file using git.
+
+        The cache keeps each file's last commit time; uncached files are
+        resolved with one ``git log`` over all of them instead of one
+        process per file. Files with uncommitted changes are not cached:
+        committing them changes their last commit time but not their hash.
+        """
+
+        async def run(batch: list[str]) -> dict[str, int]:
+            result = await run_process(
+                [
+                    "git",
+                    "-c",
+                    "core.quotepath=off",
+                    "log",
+                    "--format=%x00%ct",
+                    "--name-only",
+                    "--relative",
+                    "--",
+                    *batch,
+                ],
+                cwd=self.project_root,
+                timeout=60,
+                max_output=100_000_000,
             )
             if result.returncode != 0:
-                return {}
-
-            staleness: dict[str, int] = {}
-            now = datetime.now(UTC)
-
-            for file_path in result.stdout.strip().split("\n"):
-                if not file_path:
-                    continue
-
-                # Get last commit date for this file
-                log_result = subprocess.run(
-                    ["git", "log", "-1", "--format=%ct", "--", file_path],
-                    cwd=src_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if log_result.returncode == 0 and log_result.stdout.strip():
-                    timestamp = int(log_result.stdout.strip())
-                    last_modified = datetime.fromtimestamp(timestamp, tz=UTC)
-                    months = (now - last_modified).days // 30
-                    staleness[self._file_to_artifact(file_path)] = months
-
-            return staleness
-        except (subprocess.TimeoutExpired, ValueError):
-            pass
-        return {}
+                raise ValueError("git log failed")
 
-    async def _analyze_types(self) -> dict[str, int]:
-        """Get type error count per file from mypy."""
-        if not self._check_tool("mypy"):
+            # Newest commits come first, so the first mention of a file wins
+            last_commit: dict[str, int] = {}
+            timestamp = 0
+            for line in result.stdout.splitlines():
+                if line.startswith("\0"):
+                    timestamp = int(line[1:])
+                elif line:
+                    last_commit.setdefault(self._file_to_artifact(line), timestamp)
+            return last_commit
+
+        if not files or await self._tool_version("git") is None:
             return {}
 
+        # Untracked files (absent=None) are not cached, so they are picked
+        # up once committed
+        last_commit = await self._per_file(
+            "git", files, run, absent=None, uncached=await self._uncommitted(files)
+        )
+
+        now = datetime.now(UTC)
+        return {
+            artifact_id: (now - datetime.fromtimestamp(timestamp, tz=UTC)).days // 30
+            for artifact_id, timestamp in last_commit.items()
+        }
+
+    async def _uncommitted(self, files: dict[str, str]) -> Collection[str]:
+        """Files that differ from HEAD (all of them if git cannot tell)."""
         try:
-            src_dir = self.project_root / "src"
-            if not src_dir.exists():
-                src_dir = self.project_root
+            result = await run_process(
+                ["git", "diff", "--name-only", "--relative", "-z", "HEAD", "--"],
+                cwd=self.project_root,
+                timeout=60,
+                max_output=100_000_000,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return files.keys()
+        if result.returncode != 0:
+            return files.keys()
+        return {self._file_to_artifact(name) for name in result.stdout.split("\0") if name}
+
+    async def _analyze_types(self, files: dict[str, str]) -> dict[str, int]:
+        """Get type error count per file from mypy.
+
+        Imports are followed silently so each batch only reports errors in
+        its own files. Cached counts refresh when the file itself changes.
+        """
 
-            result = subprocess.run(
+        async def run(batch: list[str]) -> dict[str, int]:
+            result = await run_process(
                 [
                     "mypy",
                     "--no-error-summary",
                     "--show-error-codes",
-                    str(src_dir),
+                    "--follow-imports=silent",
+                    *batch,
                 ],
-                capture_output=True,
-                text=True,
+                cwd=self.project_root,
                 timeout=120,
+                max_output=100_000_000,
             )
             # Parse mypy output: "path/file.py:10: error: Message [code]"
             error_counts: dict[str, int] = {}
             for line in result.stdout.splitlines():
                 if ": error:" in line:
-                    file_path = line.split(":")[0]
-                    artifact_id = self._file_to_artifact(file_path)
+                    artifact_id = self._file_to_artifact(line.split(":")[0])
                     error_counts[artifact_id] = error_counts.get(artifact_id, 0) + 1
             return error_counts
-        except subprocess.TimeoutExpired:
-            pass
-        return {}
+
+        counts = await self._per_file("mypy", files, run, absent=0)
+        return {artifact_id: count for artifact_id, count in counts.items() if count}
 
     def _file_to_artifact(self, file_path: str) -> str:
-        """Convert file path to artifact ID."""
-        try:
-            rel = Path(file_path).relative_to(self.project_root)
-            return str(rel)
-        except ValueError:
-            return file_path
+        """Convert file path to artifact ID (relative to the project root)."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            return str(path)
+        for root in (self.project_root, self.project_root.resolve()):
+            with contextlib.suppress(ValueError):
+                return str(path.relative_to(root))
+        return file_path
 
 
 # =============================================================================
@@ -374,6 +513,12 @@ class SmartWeaknessAnalyzer(WeaknessAnalyzer):
 
     _classifier: Any = field(default=None, repr=False)
 
+    async def _current_scores(self, rescan: bool) -> list[WeaknessScore]:
+        """Signals from the last scan, scanning only if there is none."""
+        if rescan or self._scores is None:
+            return await self.scan()
+        return self._scores
+
     async def _get_classifier(self) -> Any:
         """Lazy-load FastClassifier."""
         if self._classifier is None and self.model is not None:
@@ -382,19 +527,22 @@ class SmartWeaknessAnalyzer(WeaknessAnalyzer):
             self._classifier = FastClassifier(model=self.model)
         return self._classifier
 
-    async def scan_smart(self) -> list[WeaknessScore]:
+    async def scan_smart(self, rescan: bool = False) -> list[WeaknessScore]:
         """Scan with LLM-enhanced severity assessment.
 
         Strategy:
-        1. Run standard scan (static analysis)
+        1. Run standard scan (static analysis), or reuse the last one
         2. For top N weaknesses, get LLM severity assessment
         3. Re-rank based on LLM severity
 
+        Args:
+            rescan: Scan again even if a previous scan's signals exist
+
         Returns:
             List of WeaknessScores ranked by LLM-assessed severity
         """
         # Standard scan first
-        scores = await self.scan()
+        scores = await self._current_scores(rescan)
 
         classifier = await self._get_classifier()
         if classifier is None or not scores:
@@ -448,7 +596,7 @@ Weakness signals:
         )
 
     async def prioritize_for_goal(
-        self, goal: str, top_n: int = 10
+        self, goal: str, top_n: int = 10, rescan: bool = False
     ) -> list[WeaknessScore]:
         """Prioritize weaknesses based on a specific goal (RFC-077).
 
@@ -457,11 +605,12 @@ Weakness signals:
         Args:
             goal: The user's goal (e.g., "improve test coverage for auth")
             top_n: Number of weaknesses to return
+            rescan: Scan again even if a previous scan's signals exist
 
         Returns:
             Weaknesses most relevant to the goal
         """
-        scores = await self.scan()
+        scores = await self._current_scores(rescan)
 
         classifier = await self._get_classifier()
         if classifier is None:
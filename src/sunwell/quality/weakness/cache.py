@@ -0,0 +1,97 @@
+"""Per-file cache of static analysis results for WeaknessAnalyzer (RFC-063).
+
+Each tool's results are stored per file, keyed by the file's content hash,
+under the tool's version string. A rescan only runs a tool on files whose
+content changed since the last run; upgrading a tool drops its entries.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sunwell.foundation.utils import safe_json_dump, safe_json_load
+
+CACHE_VERSION = 1
+
+
+@dataclass(slots=True)
+class ToolResultCache:
+    """Tool results per file, persisted as JSON.
+
+    Layout: ``{"tools": {tool: {"version": str, "files": {file: [hash, value]},
+    "key": str, "value": ...}}}`` where ``key``/``value`` hold a single
+    whole-project result (used for coverage, which depends on the coverage
+    data file rather than on sources).
+    """
+
+    path: Path
+    """JSON file backing the cache."""
+
+    _tools: dict[str, dict[str, Any]] = field(default_factory=dict, init=False)
+    _dirty: bool = field(default=False, init=False)
+
+    def __post_init__(self) -> None:
+        data = safe_json_load(self.path, default={})
+        if isinstance(data, dict) and data.get("cache_version") == CACHE_VERSION:
+            self._tools = data.get("tools", {})
+
+    def _section(self, tool: str, version: str) -> dict[str, Any]:
+        """Entries for a tool, reset when its version changed."""
+        section = self._tools.get(tool)
+        if section is None or section.get("version") != version:
+            section = {"version": version, "files": {}}
+            self._tools[tool] = section
+            self._dirty = True
+        return section
+
+    def lookup(
+        self, tool: str, version: str, hashes: dict[str, str]
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Split files into cached results and files that need the tool.
+
+        Args:
+            tool: Tool name
+            version: Tool version string
+            hashes: Content hash per file
+
+        Returns:
+            (cached value per file, files to analyze)
+        """
+        entries = self._section(tool, version)["files"]
+        cached: dict[str, Any] = {}
+        missing: list[str] = []
+        for file, content_hash in hashes.items():
+            entry = entries.get(file)
+            if entry is not None and entry[0] == content_hash:
+                cached[file] = entry[1]
+            else:
+                missing.append(file)
+        return cached, missing
+
+    def store(self, tool: str, version: str, results: dict[str, tuple[str, Any]]) -> None:
+        """Record results as ``{file: (content_hash, value)}``."""
+        if not results:
+            return
+        entries = self._section(tool, version)["files"]
+        for file, (content_hash, value) in results.items():
+            entries[file] = [content_hash, value]
+        self._dirty = True
+
+    def get_whole(self, tool: str, version: str, key: str) -> Any | None:
+        """Whole-project result stored under ``key``, if still current."""
+        section = self._section(tool, version)
+        return section.get("value") if section.get("key") == key else None
+
+    def put_whole(self, tool: str, version: str, key: str, value: Any) -> None:
+        """Store a whole-project result under ``key``."""
+        section = self._section(tool, version)
+        section["key"] = key
+        section["value"] = value
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed."""
+        if self._dirty and safe_json_dump(
+            {"cache_version": CACHE_VERSION, "tools": self._tools}, self.path, indent=0
+        ):
+            self._dirty = False
@@ -1,6 +1,18 @@
 """Core types and constants for tool calling."""
 
+from sunwell.tools.core.backups import (
+    BackupEntry,
+    BackupMissingError,
+    BackupStore,
+    backup_store,
+)
 from sunwell.tools.core.constants import TRUST_LEVEL_TOOLS
+from sunwell.tools.core.process import (
+    GitWorkspace,
+    ProcessResult,
+    git_workspace,
+    run_process,
+)
 from sunwell.tools.core.types import (
     ToolAuditEntry,
     ToolPolicy,
@@ -16,4 +28,14 @@ __all__ = [
     "ToolAuditEntry",
     "ToolPolicy",
     "TRUST_LEVEL_TOOLS",
+    # Processes
+    "ProcessResult",
+    "run_process",
+    "GitWorkspace",
+    "git_workspace",
+    # Backups
+    "BackupEntry",
+    "BackupMissingError",
+    "BackupStore",
+    "backup_store",
 ]
@@ -0,0 +1,364 @@
+"""Content-addressed backup store for undo/restore.
+
+File tools back up a file's previous bytes here before they overwrite,
+patch or delete it. Each distinct version is stored once as a zlib blob
+keyed by its SHA-256, in a WAL-mode SQLite database next to an indexed
+per-file history. Recording a backup is an append (no index rewrite), and
+recording content identical to the file's latest backup is a no-op.
+
+A new version is delta-encoded against the file's previous backup when that
+is smaller: it is compressed with the previous version as a zlib preset
+dictionary, so a near-identical revision costs a few hundred bytes instead
+of a full copy. Delta chains are capped at MAX_DELTA_DEPTH.
+
+Blobs are reference counted (by backups, and by deltas built on them) and
+deleted once unreferenced, when old backups are pruned or used by undo.
+
+Storage: ``.sunwell/backups/backups.db``. Backups from older versions
+(``backup_index.json`` plus ``{date}/*.bak`` files) are imported on first use.
+"""
+
+import contextlib
+import json
+import logging
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from sunwell.foundation.utils import SQLiteDatabase, compute_hash
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKUPS_PER_FILE = 10
+"""Backups retained per file; older ones are pruned."""
+
+MAX_DELTA_DEPTH = 8
+"""Longest chain of deltas a restore has to decompress."""
+
+BACKUP_DB_NAME = "backups.db"
+
+LEGACY_INDEX_FILE = "backup_index.json"
+
+_ZDICT_SIZE = 32 * 1024  # zlib only uses the last 32 KiB of a preset dictionary
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    base TEXT,
+    depth INTEGER NOT NULL DEFAULT 0,
+    refcount INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_blobs_garbage ON blobs(refcount) WHERE refcount <= 0;
+
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL,
+    blob TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    operation TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_backups_path ON backups(path, id);
+
+CREATE TRIGGER IF NOT EXISTS backups_insert AFTER INSERT ON backups BEGIN
+    UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.blob;
+END;
+
+CREATE TRIGGER IF NOT EXISTS backups_delete AFTER DELETE ON backups BEGIN
+    UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.blob;
+END;
+
+CREATE TRIGGER IF NOT EXISTS blobs_insert AFTER INSERT ON blobs
+WHEN NEW.base IS NOT NULL BEGIN
+    UPDATE blobs SET refcount = refcount + 1 WHERE hash = NEW.base;
+END;
+
+CREATE TRIGGER IF NOT EXISTS blobs_delete AFTER DELETE ON blobs
+WHEN OLD.base IS NOT NULL BEGIN
+    UPDATE blobs SET refcount = refcount - 1 WHERE hash = OLD.base;
+END;
+"""
+
+_ENTRY_COLUMNS = "id, path, blob, timestamp, size_bytes, operation"
+
+
+@dataclass(frozen=True, slots=True)
+class BackupEntry:
+    """A single backup entry."""
+
+    id: int
+    original_path: str
+    content_hash: str
+    timestamp: str
+    size_bytes: int
+    operation: str  # "edit", "write", "delete", "patch", "undo_previous", ...
+
+
+class BackupMissingError(LookupError):
+    """Raised when a backup's content is no longer in the store."""
+
+
+class BackupStore:
+    """Deduplicated, compressed file backups for one workspace.
+
+    Example:
+        >>> store = backup_store(workspace)
+        >>> store.record("src/app.py", path.read_bytes(), "edit")
+        >>> latest = store.entries("src/app.py")[0]
+        >>> path.write_bytes(store.read(latest))
+    """
+
+    def __init__(self, workspace: Path, max_per_file: int = MAX_BACKUPS_PER_FILE) -> None:
+        """Initialize the store (nothing is created until the first backup).
+
+        Args:
+            workspace: Workspace root; backup paths are keyed relative to it
+            max_per_file: Backups retained per file
+        """
+        self.workspace = workspace
+        self.backup_dir = workspace / ".sunwell" / "backups"
+        self.max_per_file = max_per_file
+        self._db = SQLiteDatabase(
+            self.backup_dir / BACKUP_DB_NAME, SCHEMA, on_create=self._import_legacy
+        )
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _exists(self) -> bool:
+        return (
+            self._db.initialized
+            or self._db.path.exists()
+            or (self.backup_dir / LEGACY_INDEX_FILE).exists()
+        )
+
+    def key(self, path: str | Path) -> str:
+        """History key for a file: its workspace-relative POSIX path."""
+        path = Path(path)
+        if path.is_absolute():
+            for candidate in (path, path.resolve()):
+                with contextlib.suppress(ValueError):
+                    return candidate.relative_to(self.workspace).as_posix()
+        return path.as_posix()
+
+    @staticmethod
+    def _entry(row: tuple) -> BackupEntry:
+        return BackupEntry(
+            id=row[0],
+            original_path=row[1],
+            content_hash=row[2],
+            timestamp=row[3],
+            size_bytes=row[4],
+            operation=row[5],
+        )
+
+    def _put_blob(
+        self, conn: sqlite3.Connection, digest: str, data: bytes, base: str | None
+    ) -> None:
+        """Store content, as a delta against ``base`` when that is smaller."""
+        packed = zlib.compress(data)
+        base_used, depth = None, 0
+        if base is not None:
+            row = conn.execute("SELECT depth FROM blobs WHERE hash = ?", (base,)).fetchone()
+            if row is not None and row[0] < MAX_DELTA_DEPTH:
+                zdict = self._read_blob(conn, base)[-_ZDICT_SIZE:]
+                compressor = zlib.compressobj(zdict=zdict)
+                delta = compressor.compress(data) + compressor.flush()
+                if len(delta) < len(packed):
+                    packed, base_used, depth = delta, base, row[0] + 1
+
+        conn.execute(
+            "INSERT INTO blobs (hash, data, size, base, depth) VALUES (?, ?, ?, ?, ?)",
+            (digest, packed, len(data), base_used, depth),
+        )
+
+    def _read_blob(self, conn: sqlite3.Connection, digest: str) -> bytes:
+        """Content of a blob, resolving its delta chain."""
+        chain: list[bytes] = []
+        current: str | None = digest
+        while current is not None:
+            row = conn.execute(
+                "SELECT data, base FROM blobs WHERE hash = ?", (current,)
+            ).fetchone()
+            if row is None:
+                raise BackupMissingError(f"Backup content {current[:12]} is missing")
+            chain.append(row[0])
+            current = row[1]
+
+        data = zlib.decompress(chain.pop())
+        while chain:
+            decompressor = zlib.decompressobj(zdict=data[-_ZDICT_SIZE:])
+            data = decompressor.decompress(chain.pop()) + decompressor.flush()
+        return data
+
+    def _add(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        data: bytes,
+        operation: str,
+        timestamp: str,
+    ) -> BackupEntry:
+        digest = compute_hash(data)
+        latest = conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM backups WHERE path = ? ORDER BY id DESC LIMIT 1",
+            (key,),
+        ).fetchone()
+        if latest is not None and latest[2] == digest:
+            return self._entry(latest)
+
+        if not conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone():
+            self._put_blob(conn, digest, data, latest[2] if latest else None)
+
+        cursor = conn.execute(
+            "INSERT INTO backups (path, blob, timestamp, size_bytes, operation) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, digest, timestamp, len(data), operation),
+        )
+        conn.execute(
+            "DELETE FROM backups WHERE path = ? AND id NOT IN "
+            "(SELECT id FROM backups WHERE path = ? ORDER BY id DESC LIMIT ?)",
+            (key, key, self.max_per_file),
+        )
+        self._collect_garbage(conn)
+        return BackupEntry(
+            id=cursor.lastrowid or 0,
+            original_path=key,
+            content_hash=digest,
+            timestamp=timestamp,
+            size_bytes=len(data),
+            operation=operation,
+        )
+
+    @staticmethod
+    def _collect_garbage(conn: sqlite3.Connection) -> None:
+        """Delete unreferenced blobs (repeating, as deletes release delta bases)."""
+        while conn.execute("DELETE FROM blobs WHERE refcount <= 0").rowcount:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def record(
+        self, path: str | Path, content: str | bytes, operation: str = "edit"
+    ) -> BackupEntry:
+        """Back up a file's content.
+
+        Args:
+            path: The file (workspace-relative, or absolute inside the workspace)
+            content: Content to back up
+            operation: Type of operation (edit, write, delete, patch)
+
+        Returns:
+            The new entry, or the file's latest entry if it already holds
+            this exact content
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with self._db.connect() as conn:
+            return self._add(
+                conn, self.key(path), data, operation, datetime.now().isoformat()
+            )
+
+    def entries(self, path: str | Path) -> list[BackupEntry]:
+        """Backups of a file, most recent first."""
+        if not self._exists():
+            return []
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM backups WHERE path = ? ORDER BY id DESC",
+                (self.key(path),),
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def files(self) -> list[tuple[str, int, str]]:
+        """Every backed-up file as ``(path, backup_count, latest_timestamp)``."""
+        if not self._exists():
+            return []
+        with self._db.connect() as conn:
+            return conn.execute(
+                "SELECT path, COUNT(*), MAX(timestamp) FROM backups "
+                "GROUP BY path ORDER BY path"
+            ).fetchall()
+
+    def read(self, entry: BackupEntry) -> bytes:
+        """Content of a backup.
+
+        Raises:
+            BackupMissingError: If the content is no longer stored
+        """
+        with self._db.connect() as conn:
+            return self._read_blob(conn, entry.content_hash)
+
+    def remove(self, entry: BackupEntry) -> None:
+        """Delete a backup, releasing content no other backup uses."""
+        with self._db.connect() as conn:
+            conn.execute("DELETE FROM backups WHERE id = ?", (entry.id,))
+            self._collect_garbage(conn)
+
+    def stored_bytes(self) -> int:
+        """Compressed size of all stored content."""
+        if not self._exists():
+            return 0
+        with self._db.connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM blobs").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # Legacy import
+    # -------------------------------------------------------------------------
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import ``backup_index.json`` and its ``.bak`` files, then remove them."""
+        index_path = self.backup_dir / LEGACY_INDEX_FILE
+        if not index_path.exists():
+            return
+        try:
+            index: dict[str, list[dict]] = json.loads(index_path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable {index_path}: {e}")
+            index = {}
+
+        imported: list[Path] = []
+        for original_path, entries in index.items():
+            for entry in reversed(entries):  # Stored most recent first
+                bak = self.backup_dir / entry.get("backup_path", "")
+                try:
+                    data = bak.read_bytes()
+                except OSError:
+                    continue
+                self._add(
+                    conn,
+                    self.key(original_path),
+                    data,
+                    entry.get("operation", "edit"),
+                    entry.get("timestamp", datetime.now().isoformat()),
+                )
+                imported.append(bak)
+
+        index_path.unlink()
+        for bak in imported:
+            bak.unlink(missing_ok=True)
+        for date_dir in {bak.parent for bak in imported}:
+            with contextlib.suppress(OSError):
+                date_dir.rmdir()  # Only if empty
+        if imported:
+            logger.info(f"Imported {len(imported)} legacy backups into {self._db.path}")
+
+
+_STORES: dict[Path, BackupStore] = {}
+
+
+def backup_store(workspace: Path) -> BackupStore:
+    """Return the shared :class:`BackupStore` for a workspace root."""
+    key = workspace.resolve()
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = BackupStore(key)
+    return store
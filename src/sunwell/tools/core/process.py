@@ -0,0 +1,217 @@
+"""Non-blocking subprocess execution for tools.
+
+Tools run inside the agent's event loop, so a blocking ``subprocess.run``
+freezes heartbeats, streaming and every concurrently running task until the
+child exits. :func:`run_process` is the shared replacement: it is built on
+``asyncio`` subprocesses, enforces a timeout, caps how much output is kept
+and can hand out stdout as it arrives.
+
+:class:`GitWorkspace` (one per repository, via :func:`git_workspace`) runs
+git through :func:`run_process` and ``git status`` without optional locks, so
+concurrent read-only tool calls do not contend on ``index.lock``.
+"""
+
+import asyncio
+import codecs
+import contextlib
+import os
+import signal
+import subprocess
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_MAX_OUTPUT = 1_000_000
+"""Characters of stdout (and separately stderr) kept by default."""
+
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessResult:
+    """Outcome of a finished process, shaped like ``CompletedProcess``."""
+
+    args: str | tuple[str, ...]
+    returncode: int
+    stdout: str
+    stderr: str
+
+    truncated: bool = False
+    """True if output beyond ``max_output`` was discarded."""
+
+
+async def _drain(
+    stream: asyncio.StreamReader,
+    limit: int,
+    on_chunk: Callable[[str], None] | None,
+) -> tuple[str, bool]:
+    """Read a pipe to EOF, keeping at most ``limit`` characters.
+
+    The pipe is always drained completely so the child never blocks on a
+    full pipe buffer, even once the cap has been reached.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    kept = 0
+    truncated = False
+    while True:
+        data = await stream.read(_READ_SIZE)
+        text = decoder.decode(data, final=not data)
+        if text:
+            if on_chunk is not None:
+                on_chunk(text)
+            if kept < limit:
+                text = text[: limit - kept]
+                parts.append(text)
+                kept += len(text)
+            else:
+                truncated = True
+        if not data:
+            return "".join(parts), truncated
+
+
+def _kill(proc: asyncio.subprocess.Process, own_group: bool) -> None:
+    """Kill a child (and its process group when it leads one)."""
+    with contextlib.suppress(ProcessLookupError):
+        if own_group:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+
+
+async def run_process(
+    cmd: str | Sequence[str],
+    *,
+    cwd: Path | str | None = None,
+    timeout: float | None = 30,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+    env: Mapping[str, str] | None = None,
+    stdin: bytes | None = None,
+    on_stdout: Callable[[str], None] | None = None,
+) -> ProcessResult:
+    """Run a command without blocking the event loop.
+
+    A string ``cmd`` runs through the shell; a sequence is executed directly.
+
+    Args:
+        cmd: Command line or argument vector
+        cwd: Working directory
+        timeout: Seconds before the process (and, for shell commands, its
+            whole process group) is killed; None waits indefinitely
+        max_output: Characters kept from each of stdout and stderr
+        env: Environment for the child (default: inherited)
+        stdin: Bytes written to the child's stdin
+        on_stdout: Called with each decoded chunk of stdout as it arrives,
+            including chunks beyond ``max_output``
+
+    Returns:
+        The process result
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+        subprocess.TimeoutExpired: If ``timeout`` elapsed; ``output`` holds
+            the stdout captured so far
+    """
+    shell = isinstance(cmd, str)
+    kwargs: dict = {
+        "cwd": cwd,
+        "env": dict(env) if env is not None else None,
+        "stdin": subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.PIPE,
+        # Shell commands get their own group so a timeout kills grandchildren too
+        "start_new_session": shell,
+    }
+    if shell:
+        proc = await asyncio.create_subprocess_shell(cmd, **kwargs)
+        args: str | tuple[str, ...] = cmd
+    else:
+        args = tuple(cmd)
+        proc = await asyncio.create_subprocess_exec(*args, **kwargs)
+
+    assert proc.stdout is not None and proc.stderr is not None
+    # Stdout kept for TimeoutExpired, capped like the result itself
+    partial: list[str] = []
+    partial_size = 0
+
+    def collect(chunk: str) -> None:
+        nonlocal partial_size
+        if partial_size < max_output:
+            partial.append(chunk[: max_output - partial_size])
+            partial_size += len(partial[-1])
+        if on_stdout is not None:
+            on_stdout(chunk)
+
+    async def communicate() -> tuple[tuple[str, bool], tuple[str, bool]]:
+        if stdin is not None and proc.stdin is not None:
+            with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                proc.stdin.write(stdin)
+                await proc.stdin.drain()
+            proc.stdin.close()
+        out, err = await asyncio.gather(
+            _drain(proc.stdout, max_output, collect),
+            _drain(proc.stderr, max_output, None),
+        )
+        await proc.wait()
+        return out, err
+
+    try:
+        (stdout, out_cut), (stderr, err_cut) = await asyncio.wait_for(communicate(), timeout)
+    except TimeoutError:
+        _kill(proc, shell)
+        await proc.wait()
+        raise subprocess.TimeoutExpired(
+            args, timeout or 0, output="".join(partial)
+        ) from None
+    except BaseException:
+        # Cancelled: don't leave the child running (or unreaped) behind our back
+        _kill(proc, shell)
+        await proc.wait()
+        raise
+
+    return ProcessResult(
+        args=args,
+        returncode=proc.returncode if proc.returncode is not None else -1,
+        stdout=stdout,
+        stderr=stderr,
+        truncated=out_cut or err_cut,
+    )
+
+
+@dataclass(slots=True)
+class GitWorkspace:
+    """Git helper bound to one repository; commands go through :func:`run_process`."""
+
+    root: Path
+
+    async def run(
+        self,
+        args: Sequence[str],
+        *,
+        timeout: float | None = 10,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+    ) -> ProcessResult:
+        """Run ``git <args>`` in the repository."""
+        return await run_process(
+            ["git", *args], cwd=self.root, timeout=timeout, max_output=max_output
+        )
+
+    async def status(self, *flags: str, timeout: float | None = 10) -> ProcessResult:
+        """Run ``git status <flags>``.
+
+        Uses ``--no-optional-locks``: status never rewrites the index, so
+        parallel status/diff calls don't race for ``index.lock``.
+        """
+        return await self.run(["--no-optional-locks", "status", *flags], timeout=timeout)
+
+
+_WORKSPACES: dict[Path, GitWorkspace] = {}
+
+
+def git_workspace(root: Path) -> GitWorkspace:
+    """Return the shared :class:`GitWorkspace` for a repository root."""
+    key = root.resolve()
+    workspace = _WORKSPACES.get(key)
+    if workspace is None:
+        workspace = _WORKSPACES[key] = GitWorkspace(key)
+    return workspace
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sunwell.tools.core.backups import backup_store
+from sunwell.tools.core.process import run_process
 from sunwell.tools.handlers.base import BaseHandler, PathSecurityError
 
 logger = logging.getLogger(__name__)
@@ -271,9 +273,13 @@ class FileHandlers(BaseHandler):
         old_content = ""
         if not is_new:
             try:
-                old_content = path.read_text(encoding="utf-8", errors="replace")
+                old_bytes = path.read_bytes()
             except OSError:
                 pass
+            else:
+                # Back up the previous version (skipped if already backed up)
+                backup_store(self.workspace).record(path, old_bytes, "write")
+                old_content = old_bytes.decode("utf-8", errors="replace")
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -324,8 +330,7 @@ class FileHandlers(BaseHandler):
                 f"Make sure the content matches exactly, including whitespace and indentation."
             )
 
-        backup_path = path.with_suffix(path.suffix + ".bak")
-        backup_path.write_text(content, encoding="utf-8")
+        backup = backup_store(self.workspace).record(path, path.read_bytes(), "edit")
 
         # Track the index of replacement for accurate line reporting
         if occurrence == 0:
@@ -365,7 +370,7 @@ class FileHandlers(BaseHandler):
             f"✓ Edited {user_path}\n"
             f"  Replaced {replaced_count} occurrence(s) at ~line {lines_before}\n"
             f"  Lines: {old_lines} → {new_lines}\n"
-            f"  Backup: {backup_path.name}"
+            f"  Backup: {backup.content_hash[:12]} (undo_file restores it)"
         )
 
     async def list_files(self, args: dict) -> str:
@@ -407,14 +412,13 @@ class FileHandlers(BaseHandler):
             cmd = ["grep", "-rn", pattern, "."]
 
         try:
-            result = subprocess.run(
+            result = await run_process(
                 cmd,
                 cwd=search_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
+                max_output=10_000,
             )
-            output = result.stdout[:10_000]
+            output = result.stdout
             if result.returncode == 0:
                 lines = output.strip().split('\n')
                 return f"Found {len(lines)} matches:\n{output}" if output else "No matches found"
@@ -439,15 +443,13 @@ class FileHandlers(BaseHandler):
 
         # Read content for backup and line counting
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
-            lines_removed = content.count("\n") + 1 if content else 0
+            data = path.read_bytes()
         except OSError:
-            content = ""
-            lines_removed = 0
+            data = b""
+        lines_removed = data.count(b"\n") + 1 if data else 0
 
         # Create backup before deletion
-        backup_path = path.with_suffix(path.suffix + ".deleted.bak")
-        backup_path.write_text(content, encoding="utf-8")
+        backup = backup_store(self.workspace).record(path, data, "delete")
 
         # Delete the file
         path.unlink()
@@ -455,7 +457,7 @@ class FileHandlers(BaseHandler):
         # Emit file event for lineage tracking (RFC-121)
         self._emit_file_event("file_deleted", user_path, "", 0, lines_removed)
 
-        return f"✓ Deleted {user_path} ({lines_removed} lines, backup: {backup_path.name})"
+        return f"✓ Deleted {user_path} ({lines_removed} lines, backup: {backup.content_hash[:12]})"
 
     async def rename_file(self, args: dict) -> str:
         """Rename or move a file within the workspace."""
@@ -580,8 +582,7 @@ class FileHandlers(BaseHandler):
         old_lines = content.count("\n") + 1 if content else 0
 
         # Create backup before patching
-        backup_path = path.with_suffix(path.suffix + ".bak")
-        backup_path.write_text(content, encoding="utf-8")
+        backup = backup_store(self.workspace).record(path, path.read_bytes(), "patch")
 
         # Parse and apply the diff
         try:
@@ -607,5 +608,5 @@ class FileHandlers(BaseHandler):
             f"✓ Patched {user_path}\n"
             f"  Applied {len(hunks)} hunk(s)\n"
             f"  Lines: {old_lines} → {new_lines}\n"
-            f"  Backup: {backup_path.name}"
+            f"  Backup: {backup.content_hash[:12]} (undo_file restores it)"
         )
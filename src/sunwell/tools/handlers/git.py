@@ -1,7 +1,6 @@
 """Git operation handlers."""
 
-import subprocess
-
+from sunwell.tools.core.process import ProcessResult, git_workspace, run_process
 from sunwell.tools.handlers.base import BaseHandler
 
 
@@ -13,19 +12,16 @@ class GitHandlers(BaseHandler):
         if not (self.workspace / ".git").exists():
             raise ValueError("Not a git repository (no .git directory found)")
 
-    def _run_git(
+    async def _run_git(
         self,
         cmd: list[str],
         timeout: int = 10,
-    ) -> subprocess.CompletedProcess[str]:
-        """Run a git command with standard error handling."""
-        return subprocess.run(
-            cmd,
-            cwd=self.workspace,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+    ) -> ProcessResult:
+        """Run a git command without blocking the event loop."""
+        git = git_workspace(self.workspace)
+        if cmd[1:2] == ["status"]:
+            return await git.status(*cmd[2:], timeout=timeout)
+        return await git.run(cmd[1:], timeout=timeout)
 
     async def git_init(self, args: dict) -> str:
         """Initialize a new git repository."""
@@ -41,11 +37,9 @@ class GitHandlers(BaseHandler):
             return f"Already a git repository: {path}"
 
         # Run git init in the target directory, not workspace root
-        result = subprocess.run(
+        result = await run_process(
             ["git", "init"],
             cwd=target,
-            capture_output=True,
-            text=True,
             timeout=10,
         )
 
@@ -66,14 +60,14 @@ class GitHandlers(BaseHandler):
         info_parts = []
 
         try:
-            result = self._run_git(["git", "remote", "-v"], 5)
+            result = await self._run_git(["git", "remote", "-v"], 5)
             if result.returncode == 0 and result.stdout.strip():
                 info_parts.append(f"**Remotes:**\n{result.stdout.strip()}")
         except Exception:
             pass
 
         try:
-            result = self._run_git(["git", "branch", "--show-current"], 5)
+            result = await self._run_git(["git", "branch", "--show-current"], 5)
             if result.returncode == 0:
                 branch = result.stdout.strip() or "(detached HEAD)"
                 info_parts.append(f"**Branch:** {branch}")
@@ -81,7 +75,7 @@ class GitHandlers(BaseHandler):
             pass
 
         try:
-            result = self._run_git(["git", "log", f"-{commit_count}", "--oneline"], 5)
+            result = await self._run_git(["git", "log", f"-{commit_count}", "--oneline"], 5)
             if result.returncode == 0 and result.stdout.strip():
                 info_parts.append(f"**Recent commits:**\n{result.stdout.strip()}")
         except Exception:
@@ -89,7 +83,7 @@ class GitHandlers(BaseHandler):
 
         if include_status:
             try:
-                result = self._run_git(["git", "status", "--short"], 5)
+                result = await self._run_git(["git", "status", "--short"], 5)
                 if result.returncode == 0:
                     status = result.stdout.strip() or "(clean working tree)"
                     info_parts.append(f"**Status:**\n{status}")
@@ -107,7 +101,7 @@ class GitHandlers(BaseHandler):
         if short:
             cmd.append("--short")
 
-        result = self._run_git(cmd)
+        result = await self._run_git(cmd)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -130,7 +124,7 @@ class GitHandlers(BaseHandler):
             self._safe_path(path)
             cmd.extend(["--", path])
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -163,7 +157,7 @@ class GitHandlers(BaseHandler):
             self._safe_path(path)
             cmd.extend(["--", path])
 
-        result = self._run_git(cmd, 15)
+        result = await self._run_git(cmd, 15)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -185,7 +179,7 @@ class GitHandlers(BaseHandler):
         if lines := args.get("lines"):
             cmd.extend(["-L", lines])
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -208,7 +202,7 @@ class GitHandlers(BaseHandler):
             self._safe_path(path)
             cmd.extend(["--", path])
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -235,12 +229,12 @@ class GitHandlers(BaseHandler):
         else:
             return "No files specified. Use 'paths' or 'all: true'"
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
 
-        status_result = self._run_git(["git", "status", "--short"], 5)
+        status_result = await self._run_git(["git", "status", "--short"], 5)
 
         return f"✓ Files staged\n{status_result.stdout.strip()}"
 
@@ -268,7 +262,7 @@ class GitHandlers(BaseHandler):
 
         cmd.extend(["--"] + paths)
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -290,7 +284,7 @@ class GitHandlers(BaseHandler):
         if amend:
             cmd.append("--amend")
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -306,7 +300,7 @@ class GitHandlers(BaseHandler):
         force = args.get("force", False)
 
         if not name:
-            result = self._run_git(["git", "branch", "-vv"])
+            result = await self._run_git(["git", "branch", "-vv"])
             if result.returncode != 0:
                 return f"Error: {result.stderr}"
             return result.stdout.strip() or "No branches"
@@ -317,7 +311,7 @@ class GitHandlers(BaseHandler):
         else:
             cmd = ["git", "branch", name]
 
-        result = self._run_git(cmd)
+        result = await self._run_git(cmd)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -341,7 +335,7 @@ class GitHandlers(BaseHandler):
             cmd.append("-b")
         cmd.append(target)
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -372,7 +366,7 @@ class GitHandlers(BaseHandler):
         else:
             return f"Unknown stash action: {action}"
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -397,7 +391,7 @@ class GitHandlers(BaseHandler):
         else:
             cmd = ["git", "reset", f"--{mode}", target]
 
-        result = self._run_git(cmd, 30)
+        result = await self._run_git(cmd, 30)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -423,7 +417,7 @@ class GitHandlers(BaseHandler):
         if message:
             cmd.extend(["-m", message])
 
-        result = self._run_git(cmd, 60)
+        result = await self._run_git(cmd, 60)
 
         if result.returncode != 0:
             if "CONFLICT" in result.stdout or "CONFLICT" in result.stderr:
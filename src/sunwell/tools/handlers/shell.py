@@ -7,6 +7,7 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.handlers.base import BaseHandler
 
 if TYPE_CHECKING:
@@ -122,12 +123,9 @@ class ShellHandlers(BaseHandler):
         # Fallback to direct subprocess (unsandboxed)
         logger.debug("Running command without sandbox: %s", command[:100])
         try:
-            result = subprocess.run(
+            result = await run_process(
                 command,
-                shell=True,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
                 timeout=timeout,
             )
 
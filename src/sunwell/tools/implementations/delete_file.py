@@ -1,5 +1,6 @@
 """Delete file tool implementation."""
 
+from sunwell.tools.core.backups import backup_store
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -55,17 +56,15 @@ class DeleteFileTool(BaseTool):
 
         # Read content for backup
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
-            lines_removed = content.count("\n") + 1 if content else 0
+            data = path.read_bytes()
         except OSError:
-            content = ""
-            lines_removed = 0
+            data = b""
+        lines_removed = data.count(b"\n") + 1 if data else 0
 
         # Create backup before deletion
-        backup_path = path.with_suffix(path.suffix + ".deleted.bak")
-        backup_path.write_text(content, encoding="utf-8")
+        backup = backup_store(self.project.root).record(path, data, "delete")
 
         # Delete the file
         path.unlink()
 
-        return f"✓ Deleted {user_path} ({lines_removed} lines, backup: {backup_path.name})"
+        return f"✓ Deleted {user_path} ({lines_removed} lines, backup: {backup.content_hash[:12]})"
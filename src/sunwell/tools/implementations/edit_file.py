@@ -3,6 +3,7 @@
 import logging
 import re
 
+from sunwell.tools.core.backups import backup_store
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -123,9 +124,8 @@ class EditFileTool(BaseTool):
                 f"Make sure the content matches exactly, including whitespace and indentation."
             )
 
-        # Create backup
-        backup_path = path.with_suffix(path.suffix + ".bak")
-        backup_path.write_text(content, encoding="utf-8")
+        # Create backup (deduplicated against the file's previous backups)
+        backup = backup_store(self.project.root).record(path, path.read_bytes(), "edit")
 
         # Perform replacement
         if occurrence == 0:
@@ -163,5 +163,5 @@ class EditFileTool(BaseTool):
             f"✓ Edited {user_path}\n"
             f"  Replaced {replaced_count} occurrence(s) at ~line {lines_before}\n"
             f"  Lines: {old_lines} → {new_lines}\n"
-            f"  Backup: {backup_path.name}"
+            f"  Backup: {backup.content_hash[:12]} (undo_file restores it)"
         )
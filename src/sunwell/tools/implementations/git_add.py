@@ -1,7 +1,7 @@
 """Git add tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import git_workspace, run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -53,23 +53,15 @@ class GitAddTool(BaseTool):
         else:
             return "No files specified. Use 'paths' or 'all: true'"
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
 
-        status_result = subprocess.run(
-            ["git", "status", "--short"],
-            cwd=self.project.root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        status_result = await git_workspace(self.project.root).status("--short", timeout=5)
 
         return f"✓ Files staged\n{status_result.stdout.strip()}"
@@ -1,7 +1,7 @@
 """Git blame tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -50,11 +50,9 @@ class GitBlameTool(BaseTool):
         if lines := arguments.get("lines"):
             cmd.extend(["-L", lines])
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
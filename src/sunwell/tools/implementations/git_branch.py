@@ -1,7 +1,7 @@
 """Git branch tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -50,11 +50,9 @@ class GitBranchTool(BaseTool):
         force = arguments.get("force", False)
 
         if not name:
-            result = subprocess.run(
+            result = await run_process(
                 ["git", "branch", "-vv"],
                 cwd=self.project.root,
-                capture_output=True,
-                text=True,
                 timeout=10,
             )
             if result.returncode != 0:
@@ -67,11 +65,9 @@ class GitBranchTool(BaseTool):
         else:
             cmd = ["git", "branch", name]
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=10,
         )
 
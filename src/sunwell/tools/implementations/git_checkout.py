@@ -1,7 +1,7 @@
 """Git checkout tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -51,11 +51,9 @@ class GitCheckoutTool(BaseTool):
             cmd.append("-b")
         cmd.append(target)
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,7 @@
 """Git commit tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -50,11 +50,9 @@ class GitCommitTool(BaseTool):
         if amend:
             cmd.append("--amend")
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,7 @@
 """Git diff tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -56,11 +56,9 @@ class GitDiffTool(BaseTool):
             self.resolve_path(path)  # Validate path is within workspace
             cmd.extend(["--", path])
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,8 @@
 """Git info tool."""
 
-import subprocess
+import asyncio
 
+from sunwell.tools.core.process import ProcessResult, git_workspace
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -33,15 +34,12 @@ class GitInfoTool(BaseTool):
         "required": [],
     }
 
-    def _run_git(self, cmd: list[str], timeout: int = 5) -> subprocess.CompletedProcess[str]:
-        """Run a git command."""
-        return subprocess.run(
-            cmd,
-            cwd=self.project.root,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+    async def _run_git(self, args: list[str], timeout: int = 5) -> ProcessResult | None:
+        """Run a git command, or return None if it could not be run."""
+        try:
+            return await git_workspace(self.project.root).run(args, timeout=timeout)
+        except Exception:
+            return None
 
     async def execute(self, arguments: dict) -> str:
         include_status = arguments.get("include_status", True)
@@ -51,37 +49,28 @@ class GitInfoTool(BaseTool):
         if not git_dir.exists():
             return "Not a git repository (no .git directory found)"
 
+        # The queries are independent, so run them side by side
+        remotes, branch, log, status = await asyncio.gather(
+            self._run_git(["remote", "-v"]),
+            self._run_git(["branch", "--show-current"]),
+            self._run_git(["log", f"-{commit_count}", "--oneline"]),
+            self._run_git(["--no-optional-locks", "status", "--short"])
+            if include_status
+            else asyncio.sleep(0),
+        )
+
         info_parts = []
 
-        try:
-            result = self._run_git(["git", "remote", "-v"])
-            if result.returncode == 0 and result.stdout.strip():
-                info_parts.append(f"**Remotes:**\n{result.stdout.strip()}")
-        except Exception:
-            pass
+        if remotes and remotes.returncode == 0 and remotes.stdout.strip():
+            info_parts.append(f"**Remotes:**\n{remotes.stdout.strip()}")
 
-        try:
-            result = self._run_git(["git", "branch", "--show-current"])
-            if result.returncode == 0:
-                branch = result.stdout.strip() or "(detached HEAD)"
-                info_parts.append(f"**Branch:** {branch}")
-        except Exception:
-            pass
+        if branch and branch.returncode == 0:
+            info_parts.append(f"**Branch:** {branch.stdout.strip() or '(detached HEAD)'}")
 
-        try:
-            result = self._run_git(["git", "log", f"-{commit_count}", "--oneline"])
-            if result.returncode == 0 and result.stdout.strip():
-                info_parts.append(f"**Recent commits:**\n{result.stdout.strip()}")
-        except Exception:
-            pass
+        if log and log.returncode == 0 and log.stdout.strip():
+            info_parts.append(f"**Recent commits:**\n{log.stdout.strip()}")
 
-        if include_status:
-            try:
-                result = self._run_git(["git", "status", "--short"])
-                if result.returncode == 0:
-                    status = result.stdout.strip() or "(clean working tree)"
-                    info_parts.append(f"**Status:**\n{status}")
-            except Exception:
-                pass
+        if status and status.returncode == 0:
+            info_parts.append(f"**Status:**\n{status.stdout.strip() or '(clean working tree)'}")
 
         return "\n\n".join(info_parts) if info_parts else "Could not retrieve git information"
@@ -1,7 +1,7 @@
 """Git init tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -40,11 +40,9 @@ class GitInitTool(BaseTool):
         if (target / ".git").exists():
             return f"Already a git repository: {path}"
 
-        result = subprocess.run(
+        result = await run_process(
             ["git", "init"],
             cwd=target,
-            capture_output=True,
-            text=True,
             timeout=10,
         )
 
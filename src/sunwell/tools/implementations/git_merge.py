@@ -1,7 +1,7 @@
 """Git merge tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -57,11 +57,9 @@ class GitMergeTool(BaseTool):
         if message:
             cmd.extend(["-m", message])
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=60,
         )
 
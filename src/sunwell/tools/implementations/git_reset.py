@@ -1,7 +1,7 @@
 """Git reset tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -58,11 +58,9 @@ class GitResetTool(BaseTool):
         else:
             cmd = ["git", "reset", f"--{mode}", target]
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,7 @@
 """Git restore tool."""
 
-import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -65,11 +65,9 @@ class GitRestoreTool(BaseTool):
 
         cmd.extend(["--"] + paths)
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,6 @@
 """Git show tool."""
 
-import subprocess
-
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -48,11 +47,9 @@ class GitShowTool(BaseTool):
             self.resolve_path(path)  # Validate path is within workspace
             cmd.extend(["--", path])
 
-        result = subprocess.run(
+        result = await run_process(
             cmd,
             cwd=self.project.root,
-            capture_output=True,
-            text=True,
             timeout=30,
         )
 
@@ -1,7 +1,7 @@
 """Git status tool implementation."""
 
-import subprocess
 
+from sunwell.tools.core.process import git_workspace
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -51,17 +51,8 @@ class GitStatusTool(BaseTool):
 
         short = arguments.get("short", False)
 
-        cmd = ["git", "status"]
-        if short:
-            cmd.append("--short")
-
-        result = subprocess.run(
-            cmd,
-            cwd=self.project.root,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        flags = ["--short"] if short else []
+        result = await git_workspace(self.project.root).status(*flags, timeout=10)
 
         if result.returncode != 0:
             return f"Error: {result.stderr}"
@@ -2,6 +2,7 @@
 
 import re
 
+from sunwell.tools.core.backups import backup_store
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -145,8 +146,7 @@ class PatchFileTool(BaseTool):
         old_lines = content.count("\n") + 1 if content else 0
 
         # Create backup before patching
-        backup_path = path.with_suffix(path.suffix + ".bak")
-        backup_path.write_text(content, encoding="utf-8")
+        backup = backup_store(self.project.root).record(path, path.read_bytes(), "patch")
 
         # Parse and apply the diff
         hunks = _parse_unified_diff(diff)
@@ -164,5 +164,5 @@ class PatchFileTool(BaseTool):
             f"✓ Patched {user_path}\n"
             f"  Applied {len(hunks)} hunk(s)\n"
             f"  Lines: {old_lines} → {new_lines}\n"
-            f"  Backup: {backup_path.name}"
+            f"  Backup: {backup.content_hash[:12]} (undo_file restores it)"
         )
@@ -6,6 +6,7 @@ import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -123,12 +124,9 @@ class RunCommandTool(BaseTool):
         # Fallback to direct subprocess (unsandboxed)
         logger.debug("Running command without sandbox: %s", command[:100])
         try:
-            result = subprocess.run(
+            result = await run_process(
                 command,
-                shell=True,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
                 timeout=timeout,
             )
 
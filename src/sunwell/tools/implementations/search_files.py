@@ -3,6 +3,7 @@
 import shutil
 import subprocess
 
+from sunwell.tools.core.process import run_process
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -76,15 +77,14 @@ class SearchFilesTool(BaseTool):
             cmd = ["grep", "-rn", pattern, "."]
 
         try:
-            result = subprocess.run(
+            result = await run_process(
                 cmd,
                 cwd=search_path,
-                capture_output=True,
-                text=True,
                 timeout=30,
+                max_output=10_000,  # Limit output size
             )
 
-            output = result.stdout[:10_000]  # Limit output size
+            output = result.stdout
 
             if result.returncode == 0:
                 lines = output.strip().split("\n")
@@ -3,6 +3,7 @@
 import logging
 import re
 
+from sunwell.tools.core.backups import backup_store
 from sunwell.tools.core.types import ToolTrust
 from sunwell.tools.registry import BaseTool, tool_metadata
 
@@ -126,6 +127,10 @@ class WriteFileTool(BaseTool):
         # Defensive sanitization
         content = self._sanitize_content(content, user_path)
 
+        # Back up the previous version (skipped if already backed up)
+        if path.exists():
+            backup_store(self.project.root).record(path, path.read_bytes(), "write")
+
         # Write file
         path.write_text(content, encoding="utf-8")
 
@@ -17,8 +17,8 @@ from typing import TYPE_CHECKING
 import numpy as np
 from numpy.typing import NDArray
 
-from sunwell.knowledge.embedding import InMemoryIndex, create_embedder
-from sunwell.knowledge.embedding.protocol import EmbeddingProtocol
+from sunwell.knowledge.embedding import create_embedder, create_vector_index
+from sunwell.knowledge.embedding.protocol import EmbeddingProtocol, VectorIndexProtocol
 from sunwell.memory.simulacrum.core.retrieval.similarity import (
     bm25_score,
     normalize_bm25,
@@ -55,7 +55,7 @@ class ToolEmbeddingIndex:
     vector_weight: float = 0.7  # 70% semantic, 30% BM25
 
     # Internal state
-    _index: InMemoryIndex | None = field(default=None, init=False)
+    _index: VectorIndexProtocol | None = field(default=None, init=False)
     _tool_texts: dict[str, str] = field(default_factory=dict, init=False)
     _initialized: bool = field(default=False, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
@@ -120,8 +120,8 @@ class ToolEmbeddingIndex:
             result = await embedder.embed(tool_texts)
             vectors = result.vectors
 
-            # Create index
-            self._index = InMemoryIndex(_dimensions=result.dimensions)
+            # Create index (exact for small tool sets, ANN past the configured threshold)
+            self._index = create_vector_index(result.dimensions)
 
             # Add all vectors
             metadata = [{"text": text} for text in tool_texts]
@@ -267,3 +267,112 @@ class TestBacklogManager:
         await manager.complete_goal("test-goal", result)
 
         assert "test-goal" in manager.backlog.completed
+
+
+def _goal(goal_id: str, requires: tuple[str, ...] = (), priority: float = 0.5) -> Goal:
+    return Goal(
+        id=goal_id,
+        title=goal_id,
+        description="Test",
+        source_signals=(),
+        priority=priority,
+        estimated_complexity="simple",
+        requires=frozenset(requires),
+        category="fix",
+        auto_approvable=True,
+        scope=GoalScope(),
+    )
+
+
+class TestBacklogStore:
+    """Tests for the SQLite backlog store behind BacklogManager (RFC-051)."""
+
+    @pytest.mark.asyncio
+    async def test_claim_next_is_exclusive_across_managers(self, tmp_path: Path):
+        """Two managers on one project never claim the same goal."""
+        first = BacklogManager(root=tmp_path)
+        await first.add_external_goal(_goal("a", priority=0.9))
+        await first.add_external_goal(_goal("b", priority=0.1))
+
+        second = BacklogManager(root=tmp_path)
+        claimed_1 = await first.claim_next_goal(worker_id=1)
+        claimed_2 = await second.claim_next_goal(worker_id=2)
+
+        assert claimed_1 is not None and claimed_1.id == "a"
+        assert claimed_2 is not None and claimed_2.id == "b"
+        assert await first.claim_next_goal(worker_id=3) is None
+
+    @pytest.mark.asyncio
+    async def test_completion_makes_dependents_ready(self, tmp_path: Path):
+        """A goal becomes claimable once its requirements complete."""
+        manager = BacklogManager(root=tmp_path)
+        await manager.add_external_goal(_goal("base"))
+        await manager.add_external_goal(_goal("next", requires=("base",), priority=1.0))
+
+        claimed = await manager.claim_next_goal(worker_id=1)
+        assert claimed is not None and claimed.id == "base"
+        assert await manager.claim_next_goal(worker_id=2) is None
+
+        await manager.mark_complete("base")
+        claimed = await manager.claim_next_goal(worker_id=2)
+        assert claimed is not None and claimed.id == "next"
+
+    @pytest.mark.asyncio
+    async def test_expired_claims_are_released(self, tmp_path: Path):
+        """Claims without a recent heartbeat go back to pending."""
+        manager = BacklogManager(root=tmp_path)
+        await manager.add_external_goal(_goal("a"))
+        assert await manager.claim_goal("a", worker_id=1)
+        assert not await manager.claim_goal("a", worker_id=2)
+        assert not await manager.heartbeat_goal("a", worker_id=2)
+
+        assert await manager.expire_stale_claims(timeout_seconds=-1) == ["a"]
+        assert manager.get_claims() == {}
+        assert await manager.claim_goal("a", worker_id=2)
+
+    @pytest.mark.asyncio
+    async def test_json_round_trip(self, tmp_path: Path):
+        """current.json stays usable as an import/export format."""
+        manager = BacklogManager(root=tmp_path)
+        await manager.add_external_goal(_goal("a"))
+        await manager.add_external_goal(_goal("b", requires=("a",)))
+        await manager.mark_complete("a")
+        exported = manager.export_json()
+
+        other = BacklogManager(root=tmp_path / "other")
+        assert other.import_json(exported)
+        assert set(other.backlog.goals) == {"a", "b"}
+        assert other.backlog.completed == {"a"}
+        assert other.backlog.goals["b"].requires == frozenset({"a"})
+
+    @pytest.mark.asyncio
+    async def test_stale_manager_keeps_other_workers_state(self, tmp_path: Path):
+        """Saving goal edits from an out-of-date manager leaves claims and completions."""
+        first = BacklogManager(root=tmp_path)
+        await first.add_external_goal(_goal("a"))
+        await first.add_external_goal(_goal("b"))
+        stale = BacklogManager(root=tmp_path)
+
+        assert await first.claim_goal("a", worker_id=1)
+        await first.mark_complete("b")
+        await stale.add_external_goal(_goal("a", priority=0.9))
+        await stale.add_external_goal(_goal("b", priority=0.9))
+
+        reloaded = BacklogManager(root=tmp_path)
+        assert reloaded.get_claims() == {"a": 1}
+        assert reloaded.backlog.completed == {"b"}
+        assert reloaded.backlog.goals["a"].priority == 0.9
+
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_claimed_goals(self, tmp_path: Path):
+        """A refresh from another manager neither drops nor releases a claimed goal."""
+        first = BacklogManager(root=tmp_path)
+        await first.add_external_goal(_goal("a"))
+        await first.add_external_goal(_goal("b"))
+        other = BacklogManager(root=tmp_path)
+
+        assert await first.claim_goal("a", worker_id=1)
+        await other.refresh()
+
+        assert other.get_claims() == {"a": 1}
+        assert BacklogManager(root=tmp_path).get_claims() == {"a": 1}
@@ -163,6 +163,25 @@ class TestRunEventsForObservatory:
                 # At least some expected types should be present
                 assert event_types.intersection(expected_types)
 
+    def test_events_page_past_end_of_stored_run(self, client: TestClient, tmp_path: Path) -> None:
+        """Paging past the last event of a stored run is an empty page, not an error."""
+        from sunwell.interface.server.run_store import RunStore
+        from sunwell.interface.server.runs import RunState
+
+        store = RunStore(runs_dir=tmp_path / "runs")
+        run = RunState(run_id="stored-run", goal="Done", events=[{"type": "response"}])
+        run.complete()
+        store.save_run(run)
+
+        with patch("sunwell.interface.server.routes.agent.get_run_store", return_value=store):
+            caught_up = client.get("/api/run/stored-run/events?since=1").json()
+            missing = client.get("/api/run/no-such-run/events").json()
+
+        assert caught_up["events"] == []
+        assert caught_up["nextSeq"] == 1
+        assert caught_up.get("error") is None
+        assert missing["error"] == "Run not found"
+
 
 class TestRunHistoryForObservatory:
     """Tests for run history endpoints used by Observatory."""
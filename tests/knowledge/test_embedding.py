@@ -7,7 +7,7 @@ from sunwell.knowledge.embedding.index import InMemoryIndex
 from sunwell.knowledge.embedding.simple import HashEmbedding, TFIDFEmbedding
 from sunwell.knowledge.embedding.ollama import OllamaEmbedding
 from sunwell.knowledge.embedding.protocol import SearchResult
-from sunwell.knowledge.embedding import create_embedder
+from sunwell.knowledge.embedding import CachedEmbedding, create_embedder
 
 
 class TestInMemoryIndex:
@@ -267,7 +267,9 @@ class TestCreateEmbedder:
 
     @pytest.mark.skipif(not ollama_available(), reason="Ollama not running")
     def test_create_embedder_prefers_ollama(self):
-        """Factory prefers Ollama when available."""
+        """Factory prefers Ollama when available (behind the embedding cache)."""
         embedder = create_embedder()
+        if isinstance(embedder, CachedEmbedding):
+            embedder = embedder.inner
 
         assert isinstance(embedder, OllamaEmbedding)
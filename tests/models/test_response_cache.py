@@ -0,0 +1,111 @@
+"""Tests for the persistent LLM response cache."""
+
+from pathlib import Path
+
+import pytest
+
+from sunwell.models import GenerateOptions, Message, MockModel
+from sunwell.models.cache import CacheEvent, CachingModel, ResponseCache, request_key
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    return ResponseCache(path=tmp_path / "responses.db")
+
+
+class TestRequestKey:
+    """Tests for request normalization."""
+
+    def test_string_prompt_matches_single_user_message(self) -> None:
+        as_str = request_key("m", "hello", operation="generate")
+        as_messages = request_key(
+            "m", (Message(role="user", content="hello"),), operation="generate"
+        )
+        assert as_str == as_messages
+
+    def test_options_and_model_change_key(self) -> None:
+        base = request_key("m", "hello", operation="generate")
+        assert base != request_key("other", "hello", operation="generate")
+        assert base != request_key(
+            "m", "hello", operation="generate", options=GenerateOptions(temperature=0.0)
+        )
+        assert base != request_key("m", "hello", operation="stream")
+
+
+class TestResponseCache:
+    """Tests for the SQLite store."""
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        ResponseCache(path=tmp_path / "r.db").put("k", "m", b"payload")
+
+        entry = ResponseCache(path=tmp_path / "r.db").get("k")
+
+        assert entry is not None
+        assert entry.payload == b"payload"
+
+    def test_expired_entries_miss(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=tmp_path / "r.db", ttl_seconds=-1)
+        cache.put("k", "m", b"payload")
+
+        assert cache.get("k") is None
+        assert cache.stats.misses == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=tmp_path / "r.db", max_bytes=250)
+        cache.put("a", "m", b"x" * 100)
+        cache.put("b", "m", b"x" * 100)
+        assert cache.get("a") is not None  # "b" is now least recently used
+
+        cache.put("c", "m", b"x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.total_bytes == 200
+
+
+class TestCachingModel:
+    """Tests for the ModelProtocol wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_generate_hits_across_wrappers(self, cache: ResponseCache) -> None:
+        inner = MockModel(responses=["answer"])
+        events: list[CacheEvent] = []
+
+        first = await CachingModel(inner, cache, on_event=events.append).generate("q")
+        second = await CachingModel(inner, cache, on_event=events.append).generate("q")
+
+        assert inner.call_count == 1
+        assert second == first
+        assert [e.hit for e in events] == [False, True]
+        assert events[1].usage == first.usage
+
+    @pytest.mark.asyncio
+    async def test_namespaces_are_separate(self, cache: ResponseCache) -> None:
+        inner = MockModel(responses=["answer"])
+
+        await CachingModel(inner, cache, namespace="a").generate("q")
+        await CachingModel(inner, cache, namespace="b").generate("q")
+
+        assert inner.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_chunks(self, cache: ResponseCache) -> None:
+        inner = MockModel(responses=["one two three"])
+        model = CachingModel(inner, cache)
+
+        first = [chunk async for chunk in model.generate_stream("q")]
+        second = [chunk async for chunk in model.generate_stream("q")]
+
+        assert second == first == ["one ", "two ", "three "]
+        assert inner.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_cached(self, cache: ResponseCache) -> None:
+        inner = MockModel(responses=["one two three"])
+        model = CachingModel(inner, cache)
+
+        stream = model.generate_stream("q")
+        assert await anext(stream) == "one "
+        await stream.aclose()
+
+        assert len(cache) == 0
@@ -0,0 +1,144 @@
+"""Tests for compiled guardrail matchers (RFC-048)."""
+
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+from sunwell.quality.guardrails import (
+    Action,
+    ActionClassifier,
+    ActionRisk,
+    GlobSet,
+    SubstringSet,
+    TrustZone,
+    TrustZoneEvaluator,
+)
+from sunwell.quality.guardrails.classifier import (
+    DEFAULT_TRUST_ZONES,
+    FORBIDDEN_COMMANDS,
+    FORBIDDEN_PATTERNS,
+)
+
+PATHS = (
+    "tests/test_foo.py",
+    "pkg/tests/unit/helpers.py",
+    "src/auth/oauth.py",
+    "src/app/migrations/0001_init.py",
+    "docs/guide.md",
+    "README.md",
+    ".env",
+    "config/.env.production",
+    "deploy/server.pem",
+    "src/my_secret_sauce.py",
+    "/etc/passwd",
+    "~/.ssh/id_rsa",
+    "src/__pycache__/mod.cpython-314.pyc",
+    "src/app.py",
+    "pyproject.toml",
+    "./src/auth/../auth/token.py",
+    "a//b/test_x.py",
+    "",
+)
+
+
+def _first_zone(path: str) -> TrustZone | None:
+    """The original per-pattern fnmatch loop, as a reference."""
+    for zone in DEFAULT_TRUST_ZONES:
+        if fnmatch(path, zone.pattern) or fnmatch(path, f"**/{zone.pattern}"):
+            return zone
+    return None
+
+
+class TestGlobSet:
+    """Tests for GlobSet."""
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_first_match_agrees_with_fnmatch(self, path: str) -> None:
+        globs = GlobSet((z.pattern, f"**/{z.pattern}") for z in DEFAULT_TRUST_ZONES)
+
+        index = globs.first(path)
+
+        expected = _first_zone(path)
+        assert (DEFAULT_TRUST_ZONES[index] if index is not None else None) is expected
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_any_match_agrees_with_fnmatch(self, path: str) -> None:
+        globs = GlobSet(FORBIDDEN_PATTERNS)
+
+        assert globs.matches(path) == any(fnmatch(path, p) for p in FORBIDDEN_PATTERNS)
+
+    def test_empty(self) -> None:
+        assert GlobSet(()).first("anything") is None
+
+
+class TestSubstringSet:
+    """Tests for SubstringSet."""
+
+    @pytest.mark.parametrize(
+        "command",
+        ["sudo rm -rf /tmp/x", "echo hi", "dd if=/dev/zero of=x", "rm -rf /*", "mkfs.ext4 /dev/x"],
+    )
+    def test_agrees_with_substring_scan(self, command: str) -> None:
+        found = SubstringSet(FORBIDDEN_COMMANDS).search(command)
+
+        assert (found is not None) == any(p in command for p in FORBIDDEN_COMMANDS)
+        assert found is None or found in command
+
+    def test_prefers_longest_at_same_position(self) -> None:
+        assert SubstringSet(("rm -rf /", "rm -rf /*")).search("rm -rf /*") == "rm -rf /*"
+
+
+class TestCompiledClassifier:
+    """Tests for ActionClassifier using compiled matchers."""
+
+    def test_custom_zones_take_priority(self) -> None:
+        zone = TrustZone(pattern="src/auth/public/**", risk_override=ActionRisk.SAFE)
+        classifier = ActionClassifier(trust_zones=(zone,))
+
+        result = classifier.classify(
+            Action(action_type="file_write", path="src/auth/public/page.py")
+        )
+
+        assert result.risk == ActionRisk.SAFE
+
+    def test_classifications_are_memoized_until_cleared(self) -> None:
+        classifier = ActionClassifier()
+        action = Action(action_type="file_write", path="src/app.py")
+
+        first = classifier.classify(action)
+        assert classifier.classify(Action(action_type="file_write", path="src/app.py")) is first
+
+        classifier.clear_cache()
+        assert classifier.classify(action) is not first
+
+    def test_changing_zones_invalidates_memo(self) -> None:
+        classifier = ActionClassifier()
+        action = Action(action_type="file_write", path="src/app.py")
+        assert classifier.classify(action).risk == ActionRisk.MODERATE
+
+        classifier.trust_zones = (
+            TrustZone(pattern="src/*.py", risk_override=ActionRisk.DANGEROUS),
+        )
+
+        assert classifier.classify(action).risk == ActionRisk.DANGEROUS
+
+
+class TestCompiledEvaluator:
+    """Tests for TrustZoneEvaluator using compiled matchers."""
+
+    @pytest.mark.parametrize("path", PATHS)
+    def test_agrees_with_component_scan(self, path: str) -> None:
+        def matches(path: str, pattern: str) -> bool:
+            if fnmatch(path, pattern):
+                return True
+            if not pattern.startswith("**") and fnmatch(path, f"**/{pattern}"):
+                return True
+            parts = Path(path).parts
+            return any(fnmatch("/".join(parts[i:]), pattern) for i in range(len(parts)))
+
+        expected = next((z for z in DEFAULT_TRUST_ZONES if matches(path, z.pattern)), None)
+
+        match = TrustZoneEvaluator().evaluate(path)
+
+        assert (match.zone if match else None) is expected
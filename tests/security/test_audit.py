@@ -228,6 +228,77 @@ class TestLocalAuditLog:
         assert recent[-1].skill_name == "skill-5"
 
 
+    def _append_many(self, log: LocalAuditLog, count: int) -> None:
+        for i in range(count):
+            log.append({
+                "timestamp": datetime.now(),
+                "skill_name": f"skill-{i % 3}",
+                "dag_id": f"dag-{i}",
+                "user_id": "user-1",
+                "requested_permissions": PermissionScope(),
+                "action": "violation" if i % 5 == 0 else "execute",
+                "details": f"Entry {i}",
+                "inputs_hash": f"hash{i}",
+                "outputs_hash": None,
+            })
+
+    def test_reopen_continues_chain(self, temp_log):
+        """A reopened log links new entries to the last one on disk."""
+        self._append_many(temp_log, 3)
+        reopened = LocalAuditLog(temp_log.storage, temp_log.key)
+        self._append_many(reopened, 2)
+
+        valid, message = reopened.verify_integrity(full=True)
+        assert valid, message
+        assert "5 entries" in message
+
+    def test_verify_resumes_from_checkpoint(self, temp_log):
+        """Verification resumes from the last checkpoint and still finds breaks."""
+        log = LocalAuditLog(temp_log.storage, temp_log.key, checkpoint_interval=4)
+        self._append_many(log, 10)
+
+        valid, message = log.verify_integrity()
+        assert valid, message
+        assert "10 entries (2 since checkpoint)" in message
+
+        # Corrupt an entry past the last checkpoint: resuming must catch it
+        self._append_many(log, 1)
+        lines = log.storage.read_text().splitlines(keepends=True)
+        data = json.loads(lines[-1])
+        data["previous_hash"] = "0" * 64
+        lines[-1] = json.dumps(data) + "\n"
+        log.storage.write_text("".join(lines))
+
+        valid, message = LocalAuditLog(log.storage, log.key).verify_integrity()
+        assert not valid
+        assert "entry 11" in message
+
+    def test_forged_checkpoint_is_ignored(self, temp_log):
+        """Checkpoints signed with another key are not trusted."""
+        self._append_many(temp_log, 3)
+        forger = LocalAuditLog(temp_log.storage, b"wrong-key")
+        forger._write_checkpoint(3, temp_log.storage.stat().st_size, temp_log._last_hash)
+
+        valid, message = temp_log.verify_integrity()
+        assert valid
+        assert message == "Verified 3 entries"
+
+    def test_query_uses_rebuilt_index(self, temp_log):
+        """Queries match a full scan even when the sidecar index is missing."""
+        self._append_many(temp_log, 20)
+        expected = [
+            e.dag_id for e in temp_log.query(skill_name="skill-1", action="violation")
+        ]
+        assert expected == ["dag-10"]
+
+        temp_log._index_path.unlink()
+        reopened = LocalAuditLog(temp_log.storage, temp_log.key)
+        assert [
+            e.dag_id for e in reopened.query(skill_name="skill-1", action="violation")
+        ] == expected
+        assert len(list(reopened.query(action="violation", limit=2))) == 2
+        assert reopened.get_recent(limit=1)[0].dag_id == "dag-19"
+
 class TestAuditLogManager:
     """Tests for AuditLogManager."""
 
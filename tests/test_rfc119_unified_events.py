@@ -5,6 +5,7 @@ for unified CLI/Studio visibility.
 """
 
 import asyncio
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -175,9 +176,24 @@ class TestEventBus:
     @pytest.fixture
     def mock_websocket(self) -> MagicMock:
         ws = MagicMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         return ws
 
+    @staticmethod
+    def _event(type: str = "task_start", **data: object) -> BusEvent:
+        return BusEvent(
+            v=1,
+            run_id="run-123",
+            type=type,
+            data=dict(data),
+            timestamp=datetime.now(UTC),
+            source="cli",
+        )
+
+    @staticmethod
+    def _sent(ws: MagicMock) -> list[dict]:
+        return [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
+
     @pytest.mark.asyncio
     async def test_subscribe(self, event_bus: EventBus, mock_websocket: MagicMock) -> None:
         """EventBus should accept subscriptions."""
@@ -242,9 +258,10 @@ class TestEventBus:
             source="cli",
         )
         await event_bus.broadcast(event)
+        await event_bus.flush()
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["run_id"] == "run-123"
         assert call_args["type"] == "task_start"
 
@@ -252,11 +269,11 @@ class TestEventBus:
     async def test_broadcast_with_project_filter(self, event_bus: EventBus) -> None:
         """EventBus should filter events by project_id."""
         ws_proj_a = MagicMock()
-        ws_proj_a.send_json = AsyncMock()
+        ws_proj_a.send_text = AsyncMock()
         ws_proj_b = MagicMock()
-        ws_proj_b.send_json = AsyncMock()
+        ws_proj_b.send_text = AsyncMock()
         ws_no_filter = MagicMock()
-        ws_no_filter.send_json = AsyncMock()
+        ws_no_filter.send_text = AsyncMock()
 
         await event_bus.subscribe(ws_proj_a, project_filter="proj-a")
         await event_bus.subscribe(ws_proj_b, project_filter="proj-b")
@@ -273,17 +290,18 @@ class TestEventBus:
             project_id="proj-a",
         )
         await event_bus.broadcast(event)
+        await event_bus.flush()
 
         # Only ws_proj_a and ws_no_filter should receive
-        ws_proj_a.send_json.assert_called_once()
-        ws_proj_b.send_json.assert_not_called()
-        ws_no_filter.send_json.assert_called_once()
+        ws_proj_a.send_text.assert_called_once()
+        ws_proj_b.send_text.assert_not_called()
+        ws_no_filter.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_broadcast_drops_slow_consumers(self, event_bus: EventBus) -> None:
         """EventBus should drop subscribers that timeout."""
         slow_ws = MagicMock()
-        slow_ws.send_json = AsyncMock(side_effect=asyncio.TimeoutError())
+        slow_ws.send_text = AsyncMock(side_effect=asyncio.TimeoutError())
 
         await event_bus.subscribe(slow_ws)
         assert event_bus.subscriber_count == 1
@@ -297,9 +315,105 @@ class TestEventBus:
             source="cli",
         )
         await event_bus.broadcast(event)
+        await event_bus.flush()
 
         # Slow consumer should be dropped
         assert event_bus.subscriber_count == 0
+        assert event_bus.disconnected == 1
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_on_network(self) -> None:
+        """Producers should return while a subscriber is still sending."""
+        event_bus = EventBus()
+        release = asyncio.Event()
+        blocked_ws = MagicMock()
+
+        async def blocked_send(_: str) -> None:
+            await release.wait()
+
+        blocked_ws.send_text = AsyncMock(side_effect=blocked_send)
+        fast_ws = MagicMock()
+        fast_ws.send_text = AsyncMock()
+        await event_bus.subscribe(blocked_ws)
+        await event_bus.subscribe(fast_ws)
+
+        for i in range(3):
+            await event_bus.broadcast(self._event(index=i))
+        await asyncio.sleep(0.01)
+
+        assert [e["data"]["index"] for e in self._sent(fast_ws)] == [0, 1, 2]
+        assert event_bus.metrics()["queued"] == 2  # blocked_ws: one in flight
+        release.set()
+        assert await event_bus.flush(timeout=1.0)
+        assert blocked_ws.send_text.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_payload_serialized_once(self, mock_websocket: MagicMock) -> None:
+        """Every subscriber should get the same encoded payload."""
+        event_bus = EventBus()
+        other_ws = MagicMock()
+        other_ws.send_text = AsyncMock()
+        await event_bus.subscribe(mock_websocket)
+        await event_bus.subscribe(other_ws)
+
+        await event_bus.broadcast(self._event())
+        await event_bus.flush()
+
+        assert mock_websocket.send_text.call_args[0][0] is other_ws.send_text.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_overflow_drop_oldest(self, mock_websocket: MagicMock) -> None:
+        """A full queue should discard its oldest events."""
+        event_bus = EventBus(queue_size=2, overflow="drop_oldest")
+        await event_bus.subscribe(mock_websocket)
+
+        for i in range(4):
+            await event_bus.broadcast(self._event(index=i))
+        await event_bus.flush()
+
+        assert [e["data"]["index"] for e in self._sent(mock_websocket)] == [2, 3]
+        assert event_bus.metrics()["per_subscriber"][0]["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_overflow_coalesces_progress(self, mock_websocket: MagicMock) -> None:
+        """A full queue should replace stale progress for the same task."""
+        event_bus = EventBus(queue_size=3)
+        await event_bus.subscribe(mock_websocket)
+
+        await event_bus.broadcast(self._event("task_start", task_id="t1"))
+        await event_bus.broadcast(self._event("task_progress", task_id="t1", progress=10))
+        await event_bus.broadcast(self._event("task_progress", task_id="t2", progress=10))
+        await event_bus.broadcast(self._event("task_progress", task_id="t1", progress=50))
+        await event_bus.flush()
+
+        sent = [
+            (e["type"], e["data"]["task_id"], e["data"].get("progress"))
+            for e in self._sent(mock_websocket)
+        ]
+        assert sent == [
+            ("task_start", "t1", None),
+            ("task_progress", "t2", 10),
+            ("task_progress", "t1", 50),
+        ]
+        stats = event_bus.metrics()["per_subscriber"][0]
+        assert stats["coalesced"] == 1
+        assert stats["dropped"] == 0
+        assert stats["max_queue_depth"] == 3
+
+    @pytest.mark.asyncio
+    async def test_overflow_disconnect(self, mock_websocket: MagicMock) -> None:
+        """The disconnect policy should close overflowing subscribers."""
+        mock_websocket.close = AsyncMock()
+        event_bus = EventBus(queue_size=1)
+        await event_bus.subscribe(mock_websocket, overflow="disconnect")
+
+        await event_bus.broadcast(self._event())
+        await event_bus.broadcast(self._event())
+        await asyncio.sleep(0.01)
+
+        assert event_bus.subscriber_count == 0
+        mock_websocket.close.assert_awaited_once()
+        mock_websocket.send_text.assert_not_called()
 
 
 class TestRunState:
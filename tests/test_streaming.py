@@ -3,6 +3,8 @@
 Covers Journeys A11 (Report to human) and H3 (Observe progress).
 """
 
+import json
+
 import pytest
 
 from sunwell.models.capability.streaming import (
@@ -159,6 +161,72 @@ class TestToolStreamParser:
         assert all(c.tool_name != "test" for c in tool_chunks if c.tool_name)
 
 
+class TestIncrementalArguments:
+    """Resumable argument scanning: deltas and early-decoded fields."""
+
+    @staticmethod
+    def _feed_in_pieces(parser: ToolStreamParser, text: str, size: int) -> list[StreamChunk]:
+        chunks: list[StreamChunk] = []
+        for i in range(0, len(text), size):
+            chunks += parser.feed(text[i : i + size])
+        return chunks + parser.finalize()
+
+    def test_args_chunks_are_deltas(self):
+        """TOOL_ARGS carry only new text; together they rebuild the call."""
+        call = json.dumps(
+            {"tool": "write_file", "arguments": {"path": "a.py", "content": "x" * 20_000}}
+        )
+        chunks = self._feed_in_pieces(ToolStreamParser(), call, 5)
+
+        deltas = [c.partial_args for c in chunks if c.type == StreamChunkType.TOOL_ARGS]
+        assert "".join(deltas) == call
+        assert all(len(d) <= 5 for d in deltas[1:])
+        ends = [c for c in chunks if c.type == StreamChunkType.TOOL_END]
+        assert len(ends) == 1 and ends[0].is_complete
+
+    def test_path_decoded_before_content_finishes(self):
+        """A completed field is available while later fields still stream."""
+        parser = ToolStreamParser()
+        chunks = parser.feed('{"tool": "write_file", "arguments": {"path": "src/a.py", ')
+        chunks += parser.feed('"content": "def f():\n    return 1')
+
+        fields = [c for c in chunks if c.type == StreamChunkType.TOOL_FIELD]
+        assert [(f.field_name, f.field_value) for f in fields] == [("path", "src/a.py")]
+        assert fields[0].tool_name == "write_file"
+        assert parser.arguments == {"path": "src/a.py"}
+
+        chunks = parser.feed('\n"}}')
+        fields = [c for c in chunks if c.type == StreamChunkType.TOOL_FIELD]
+        assert fields[0].field_value == "def f():\n    return 1\n"
+
+    def test_split_escapes_and_nested_values(self):
+        """State survives splits inside escapes, strings and nested values."""
+        args = {
+            "path": 'we"ird\\\\name}{.py',
+            "options": {"mode": "w", "lines": [1, 2, {"x": "}"}]},
+            "count": 3,
+            "force": True,
+            "note": None,
+        }
+        call = json.dumps({"tool": "edit", "arguments": args}) + " trailing text"
+        for size in (1, 2, 3, 7):
+            parser = ToolStreamParser()
+            chunks = self._feed_in_pieces(parser, call, size)
+            assert parser.arguments == args
+            fields = [c.field_name for c in chunks if c.type == StreamChunkType.TOOL_FIELD]
+            assert fields == list(args)
+            text = "".join(c.content or "" for c in chunks if c.type == StreamChunkType.TEXT)
+            assert text.strip() == "trailing text"
+
+    def test_code_fence_not_leaked_as_text(self):
+        """The closing fence of a ```json call is swallowed."""
+        call = '```json\n{"tool": "read_file", "arguments": {"path": "x"}}\n```'
+        chunks = self._feed_in_pieces(ToolStreamParser(), call, 4)
+        assert not [c for c in chunks if c.type == StreamChunkType.TEXT]
+        fields = [c for c in chunks if c.type == StreamChunkType.TOOL_FIELD]
+        assert [(f.field_name, f.field_value) for f in fields] == [("path", "x")]
+
+
 class TestStreamChunkType:
     """Test StreamChunkType enum."""
 
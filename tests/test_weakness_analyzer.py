@@ -0,0 +1,154 @@
+"""Tests for WeaknessAnalyzer tool caching (RFC-063)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from sunwell.planning.naaru.artifacts import ArtifactGraph, ArtifactSpec
+from sunwell.quality.weakness import analyzer as analyzer_module
+from sunwell.quality.weakness.analyzer import WeaknessAnalyzer
+from sunwell.quality.weakness.cache import ToolResultCache
+from sunwell.tools.core.process import ProcessResult
+
+
+class TestToolResultCache:
+    """Tests for ToolResultCache."""
+
+    def test_lookup_misses_changed_files(self, tmp_path: Path) -> None:
+        cache = ToolResultCache(tmp_path / "cache.json")
+        cache.store("ruff", "1.0", {"a.py": ("h1", 2), "b.py": ("h2", 0)})
+
+        cached, missing = cache.lookup("ruff", "1.0", {"a.py": "h1", "b.py": "changed"})
+
+        assert cached == {"a.py": 2}
+        assert missing == ["b.py"]
+
+    def test_version_change_drops_entries(self, tmp_path: Path) -> None:
+        cache = ToolResultCache(tmp_path / "cache.json")
+        cache.store("ruff", "1.0", {"a.py": ("h1", 2)})
+
+        cached, missing = cache.lookup("ruff", "2.0", {"a.py": "h1"})
+
+        assert cached == {}
+        assert missing == ["a.py"]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.json"
+        cache = ToolResultCache(path)
+        cache.store("radon", "5.1", {"a.py": ("h1", 12)})
+        cache.put_whole("coverage", "7.4", "key", {"a.py": 0.5})
+        cache.save()
+
+        reloaded = ToolResultCache(path)
+        assert reloaded.lookup("radon", "5.1", {"a.py": "h1"}) == ({"a.py": 12}, [])
+        assert reloaded.get_whole("coverage", "7.4", "key") == {"a.py": 0.5}
+        assert reloaded.get_whole("coverage", "7.4", "other") is None
+
+
+class TestWeaknessAnalyzerScan:
+    """Tests for concurrent, cached scanning."""
+
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> tuple[Path, ArtifactGraph]:
+        (tmp_path / "src").mkdir()
+        graph = ArtifactGraph()
+        for name in ("a", "b"):
+            (tmp_path / "src" / f"{name}.py").write_text(f"{name} = 1\n")
+            graph.add(
+                ArtifactSpec(
+                    id=f"src/{name}.py",
+                    description=name,
+                    contract=name,
+                    produces_file=f"src/{name}.py",
+                    requires=frozenset(),
+                )
+            )
+        return tmp_path, graph
+
+    @pytest.mark.asyncio
+    async def test_rescan_only_lints_changed_files(
+        self, project: tuple[Path, ArtifactGraph], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root, graph = project
+        linted: list[list[str]] = []
+
+        async def fake_run_process(cmd, **kwargs):
+            tool = cmd[0]
+            if cmd[1:] == ["--version"]:
+                ok = tool == "ruff"
+                return ProcessResult(tuple(cmd), 0 if ok else 1, "ruff 0.1" if ok else "", "")
+            files = [arg for arg in cmd if arg.endswith(".py")]
+            linted.append(files)
+            errors = [{"filename": str(root / f)} for f in files for _ in range(3)]
+            return ProcessResult(tuple(cmd), 1, json.dumps(errors), "")
+
+        monkeypatch.setattr(analyzer_module, "run_process", fake_run_process)
+        cache_path = root / "cache.json"
+
+        first = WeaknessAnalyzer(graph=graph, project_root=root, cache_path=cache_path)
+        scores = await first.scan()
+        assert sorted(linted[0]) == ["src/a.py", "src/b.py"]
+        assert {s.artifact_id for s in scores} == {"src/a.py", "src/b.py"}
+
+        (root / "src" / "b.py").write_text("b = 2\n")
+        second = WeaknessAnalyzer(graph=graph, project_root=root, cache_path=cache_path)
+        scores = await second.scan()
+
+        assert linted[1] == ["src/b.py"]
+        assert {s.artifact_id for s in scores} == {"src/a.py", "src/b.py"}
+        assert second.last_scores == scores
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_staleness_is_not_cached(
+        self, project: tuple[Path, ArtifactGraph], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root, graph = project
+        identity = {"GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t"}
+        identity |= {"GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}
+
+        def git(*args: str, date: str | None = None) -> None:
+            env = {**os.environ, **identity}
+            if date is not None:
+                env |= {"GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+            subprocess.run(["git", *args], cwd=root, env=env, check=True)
+
+        git("init", "-q")
+        git("add", "src")
+        git("commit", "-q", "-m", "old", date="2020-01-01T00:00:00+00:00")
+        (root / "src" / "b.py").write_text("b = 2\n")
+
+        real_version = WeaknessAnalyzer._tool_version
+
+        async def git_only(self: WeaknessAnalyzer, tool: str) -> str | None:
+            return await real_version(self, tool) if tool == "git" else None
+
+        monkeypatch.setattr(WeaknessAnalyzer, "_tool_version", git_only)
+        cache_path = root / "cache.json"
+
+        first = WeaknessAnalyzer(graph=graph, project_root=root, cache_path=cache_path)
+        stale = await first._analyze_staleness(first._source_files())
+        first._get_cache().save()
+        assert stale["src/b.py"] > 12  # Still the old commit until b.py is committed
+
+        git("commit", "-q", "-am", "new")
+        second = WeaknessAnalyzer(graph=graph, project_root=root, cache_path=cache_path)
+        stale = await second._analyze_staleness(second._source_files())
+
+        assert stale["src/b.py"] == 0
+        assert stale["src/a.py"] > 12
+
+    def test_artifact_ids_under_symlinked_root(
+        self, project: tuple[Path, ArtifactGraph], tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        root, graph = project
+        link = tmp_path_factory.mktemp("links") / "project"
+        link.symlink_to(root)
+        analyzer = WeaknessAnalyzer(graph=graph, project_root=link)
+
+        assert analyzer._file_to_artifact(str(link / "src" / "a.py")) == "src/a.py"
+        assert analyzer._file_to_artifact(str(root.resolve() / "src" / "a.py")) == "src/a.py"
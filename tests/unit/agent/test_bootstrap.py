@@ -0,0 +1,238 @@
+"""Tests for the concurrent goal bootstrap pipeline (RFC-MEMORY)."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from sunwell.agent.core import Agent
+from sunwell.agent.core.bootstrap import StagePipeline, stage_latency_event
+from sunwell.agent.events import EventType
+from sunwell.agent.intent.dag import IntentClassification, IntentNode
+from sunwell.memory import MemoryContext
+
+
+async def _after(delay: float, value: object) -> object:
+    await asyncio.sleep(delay)
+    return value
+
+
+class TestStagePipeline:
+    """Tests for StagePipeline."""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async with StagePipeline(timeouts={}) as stages:
+            for name in ("a", "b", "c"):
+                stages.start(name, _after(0.1, name))
+            values = [(await stages.result(name)).value for name in ("a", "b", "c")]
+
+        assert values == ["a", "b", "c"]
+        assert loop.time() - started < 0.25
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_default(self) -> None:
+        async with StagePipeline(timeouts={"slow": 0.01}) as stages:
+            stages.start("slow", _after(1.0, "late"), default="fallback")
+            result = await stages.result("slow")
+
+        assert result.status == "timeout"
+        assert not result.ok
+        assert result.value == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_stage_reports_default_even_if_finished(self) -> None:
+        async with StagePipeline(timeouts={}) as stages:
+            stages.start("fast", _after(0, "done"), default=None)
+            stages.start("slow", _after(1.0, "late"), default=None)
+            await asyncio.sleep(0.01)
+
+            stages.cancel("fast")
+            stages.cancel("slow")
+
+            assert (await stages.result("fast")).status == "cancelled"
+            slow = await stages.result("slow")
+
+        assert slow.status == "cancelled"
+        assert slow.value is None
+
+    @pytest.mark.asyncio
+    async def test_stage_errors_propagate(self) -> None:
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        async with StagePipeline(timeouts={}) as stages:
+            stages.start("broken", fail())
+            with pytest.raises(ValueError, match="boom"):
+                await stages.result("broken")
+
+    @pytest.mark.asyncio
+    async def test_exit_cancels_pending_stages(self) -> None:
+        stages = StagePipeline(timeouts={})
+        async with stages:
+            stages.start("pending", asyncio.sleep(10))
+            task = stages._tasks["pending"]
+
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_latency_event(self) -> None:
+        async with StagePipeline(timeouts={}) as stages:
+            stages.start("memory", _after(0.02, "ctx"))
+            result = await stages.result("memory")
+
+        event = stage_latency_event("build an API", result)
+
+        assert event.type == EventType.GOAL_ANALYZING
+        assert event.data["stage"] == "memory"
+        assert event.data["status"] == "complete"
+        assert event.data["duration_ms"] >= 20
+        # Latency is measured when the stage finished, not when it was read
+        assert result.duration_ms < 100
+
+
+class _Memory:
+    """PersistentMemory stand-in whose retrieval takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+
+    async def get_relevant(self, goal: str) -> MemoryContext:
+        await asyncio.sleep(self.delay)
+        return MemoryContext(learnings=("use FastAPI",))
+
+
+@pytest.fixture
+def stub_stages(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace every bootstrap stage with a fast stub; tweak via the returned namespace."""
+    state = SimpleNamespace(intent_delay=0.0, prefetched_lens="coder", lens_cancelled=False)
+
+    async def enrich(goal, workspace, model, base_context):
+        return base_context + " + workspace"
+
+    async def classify(goal, model=None):
+        await asyncio.sleep(state.intent_delay)
+        return IntentClassification(
+            path=(IntentNode.CONVERSATION, IntentNode.UNDERSTAND),
+            confidence=0.9,
+            reasoning="question",
+        )
+
+    async def resolve_lens(goal, project_path, auto_select):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state.lens_cancelled = True
+            raise
+
+    async def prefetch(self, briefing, memory):
+        return SimpleNamespace(lens=state.prefetched_lens)
+
+    async def signals(self, goal):
+        return SimpleNamespace(to_dict=lambda: {"complexity": "NO"})
+
+    class LensManager:
+        def load(self, name):
+            return SimpleNamespace(metadata=SimpleNamespace(name=name))
+
+    monkeypatch.setattr("sunwell.knowledge.enrich_context_for_goal", enrich)
+    monkeypatch.setattr("sunwell.agent.intent.classify_intent", classify)
+    monkeypatch.setattr("sunwell.agent.utils.lens.resolve_lens_for_goal", resolve_lens)
+    monkeypatch.setattr("sunwell.planning.lens.manager.LensManager", LensManager)
+    monkeypatch.setattr(Agent, "_run_memory_informed_prefetch", prefetch)
+    monkeypatch.setattr(Agent, "_extract_signals_with_memory", signals)
+    return state
+
+
+def _session(cwd: Path, *, briefing: object = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        goal="Build an API",
+        cwd=cwd,
+        lens=None,
+        briefing=briefing,
+        to_planning_prompt=lambda: "base context",
+    )
+
+
+def _briefing() -> SimpleNamespace:
+    return SimpleNamespace(
+        mission="Ship the API",
+        status=SimpleNamespace(value="in_progress"),
+        hazards=(),
+        predicted_skills=(),
+        suggested_lens=None,
+    )
+
+
+class TestBootstrapGoal:
+    """Tests for Agent._bootstrap_goal with stub stages."""
+
+    @pytest.mark.asyncio
+    async def test_events_in_pipeline_order_and_prefetched_lens_wins(
+        self, tmp_path: Path, stub_stages: SimpleNamespace
+    ) -> None:
+        agent = Agent(model=MagicMock(), cwd=tmp_path)
+        stages = StagePipeline(timeouts={})
+
+        events = [
+            e
+            async for e in agent._bootstrap_goal(
+                _session(tmp_path, briefing=_briefing()), _Memory(), stages
+            )
+        ]
+
+        assert [(e.type, e.data.get("stage")) for e in events] == [
+            (EventType.GOAL_ANALYZING, "context"),
+            (EventType.GOAL_ANALYZING, "intent"),
+            (EventType.INTENT_CLASSIFIED, None),
+            (EventType.DOMAIN_DETECTED, None),
+            (EventType.GOAL_ANALYZING, "prefetch"),
+            (EventType.LENS_SELECTED, None),
+            (EventType.GOAL_ANALYZING, "memory"),
+            (EventType.ORIENT, None),
+            (EventType.BRIEFING_LOADED, None),
+            (EventType.GOAL_ANALYZING, "lens"),
+            (EventType.SIGNAL, None),
+            (EventType.GOAL_ANALYZING, "signals"),
+            (EventType.SIGNAL, None),
+        ]
+        assert events[-1].data["status"] == "extracted"
+        assert events[5].data["source"] == "memory_prefetch"
+        assert events[9].data["status"] == "cancelled"
+        assert stub_stages.lens_cancelled
+        assert agent.lens.metadata.name == "coder"
+        assert agent._workspace_context == "base context + workspace"
+        assert events[7].data["learnings"] == 1
+
+    @pytest.mark.asyncio
+    async def test_intent_and_memory_timeouts_fall_back(
+        self, tmp_path: Path, stub_stages: SimpleNamespace
+    ) -> None:
+        stub_stages.intent_delay = 10
+        agent = Agent(model=MagicMock(), cwd=tmp_path, auto_lens=False)
+        stages = StagePipeline(timeouts={"intent": 0.01, "memory": 0.01})
+
+        events = [
+            e async for e in agent._bootstrap_goal(_session(tmp_path), _Memory(delay=10), stages)
+        ]
+
+        statuses = {
+            e.data["stage"]: e.data["status"]
+            for e in events
+            if e.type == EventType.GOAL_ANALYZING
+        }
+        assert statuses == {
+            "context": "complete",
+            "intent": "timeout",
+            "memory": "timeout",
+            "signals": "complete",
+        }
+        assert EventType.INTENT_CLASSIFIED not in {e.type for e in events}
+        orient = next(e for e in events if e.type == EventType.ORIENT)
+        assert orient.data["learnings"] == 0
+        assert (await stages.result("memory")).value == MemoryContext()
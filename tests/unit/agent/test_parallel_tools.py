@@ -0,0 +1,94 @@
+"""Tests for concurrent execution of read-only tool calls in AgentLoop."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from sunwell.agent.core.loop import AgentLoop
+from sunwell.agent.events import EventType
+from sunwell.agent.loop.config import LoopConfig, LoopState
+from sunwell.models import Tool, ToolCall
+from sunwell.tools.core.types import ToolResult
+
+
+class FakeExecutor:
+    """Executor whose tools sleep, recording start/finish order and concurrency."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.log: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_tool_definitions(self) -> tuple[Tool, ...]:
+        names = ("read_file", "write_file")
+        return tuple(Tool(name=n, description="", parameters={}) for n in names)
+
+    async def execute(self, tool_call: ToolCall) -> ToolResult:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.log.append(f"start {tool_call.id}")
+        await asyncio.sleep(self.delays.get(tool_call.id, 0.01))
+        self.log.append(f"end {tool_call.id}")
+        self.in_flight -= 1
+        return ToolResult(tool_call_id=tool_call.id, success=True, output=f"out {tool_call.id}")
+
+
+def _loop(executor: FakeExecutor, model_id: str = "gpt-4o", **config) -> AgentLoop:
+    model = MagicMock()
+    model.model_id = model_id
+    return AgentLoop(
+        model=model,
+        executor=executor,
+        config=LoopConfig(enable_introspection=False, **config),
+        workspace=Path("."),
+    )
+
+
+def _read(i: int) -> ToolCall:
+    return ToolCall(id=f"r{i}", name="read_file", arguments={"path": f"{i}.py"})
+
+
+async def _run(loop: AgentLoop, calls: tuple[ToolCall, ...]) -> tuple[list, LoopState]:
+    state = LoopState()
+    events = [e async for e in loop._execute_tool_calls(calls, state)]
+    return events, state
+
+
+class TestParallelToolCalls:
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently_but_report_in_order(self) -> None:
+        # r0 is the slowest; sequentially it would finish first
+        executor = FakeExecutor({"r0": 0.05, "r1": 0.01, "r2": 0.02})
+        events, state = await _run(_loop(executor), tuple(_read(i) for i in range(3)))
+
+        assert executor.peak == 3
+        assert executor.log.index("end r1") < executor.log.index("end r0")
+        completes = [e.data["tool_call_id"] for e in events if e.type == EventType.TOOL_COMPLETE]
+        assert completes == ["r0", "r1", "r2"]
+        assert [m.tool_call_id for m in state.messages if m.role == "tool"] == ["r0", "r1", "r2"]
+        assert state.tool_calls_total == 3
+
+    @pytest.mark.asyncio
+    async def test_write_is_a_barrier(self) -> None:
+        executor = FakeExecutor({})
+        write = ToolCall(id="w", name="write_file", arguments={"path": "x.py", "content": ""})
+        await _run(_loop(executor), (_read(0), _read(1), write, _read(2)))
+
+        ends_before_write = executor.log[: executor.log.index("start w")]
+        assert {"end r0", "end r1"} <= set(ends_before_write)
+        assert executor.log.index("end w") < executor.log.index("start r2")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self) -> None:
+        executor = FakeExecutor({})
+        await _run(_loop(executor, max_parallel_tools=2), tuple(_read(i) for i in range(5)))
+        assert executor.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_parallel_capability(self) -> None:
+        executor = FakeExecutor({})
+        await _run(_loop(executor, model_id="unknown-model"), (_read(0), _read(1)))
+        assert executor.peak == 1
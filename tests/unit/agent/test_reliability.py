@@ -445,6 +445,24 @@ class TestSessionCostTracker:
         assert tracker.total_cost_usd == 0.0
         assert tracker.total_tokens == 0
 
+    def test_record_cache_counts_savings(self) -> None:
+        """Cache hits are free and count as saved tokens/cost."""
+        from sunwell.models import TokenUsage
+        from sunwell.models.cache import CacheEvent
+
+        tracker = SessionCostTracker(session_id="test")
+        usage = TokenUsage(prompt_tokens=1000, completion_tokens=1000, total_tokens=2000)
+        tracker.record_cache(CacheEvent("gpt-4o", False, "generate", 500, usage))
+        tracker.record_cache(CacheEvent("gpt-4o", True, "generate", 500, usage))
+
+        summary = tracker.summary()
+        assert summary["cache_hits"] == 1
+        assert summary["cache_misses"] == 1
+        assert summary["cache_bytes_saved"] == 500
+        assert summary["cache_tokens_saved"] == 2000
+        assert summary["cache_cost_saved_usd"] == pytest.approx(0.02)
+        assert tracker.total_cost_usd == 0.0
+
 
 # =============================================================================
 # HealthStatus Tests
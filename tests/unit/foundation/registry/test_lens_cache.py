@@ -0,0 +1,208 @@
+"""Tests for the compiled lens cache behind LayeredLensRegistry."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sunwell.foundation.registry.cache import LensCache
+from sunwell.foundation.registry.layered import LayeredLensRegistry
+from sunwell.foundation.schema.loader import LensLoader
+
+LENS_YAML = """\
+lens:
+  metadata:
+    name: coder
+    domain: software
+    description: {description}
+  router:
+    shortcuts:
+      "::code": write-code
+  skills:
+    - include: skills.yaml
+"""
+
+SKILLS_YAML = """\
+skills:
+  - name: write-code
+    description: {description}
+    instructions: Write the code.
+"""
+
+DEPLOY_LENS_YAML = """\
+lens:
+  metadata:
+    name: deployer
+    domain: software
+  skills:
+    - name: deploy
+      description: Deploy the service
+      instructions: Deploy it.
+      preset: team
+"""
+
+PRESETS_YAML = """\
+presets:
+  team:
+    permissions:
+      filesystem:
+        read: ["{pattern}"]
+"""
+
+
+def _write(path: Path, content: str) -> None:
+    """Write a file and move its mtime forward so the change is always seen."""
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def lenses_dir(tmp_path: Path) -> Path:
+    lenses = tmp_path / "lenses"
+    lenses.mkdir()
+    _write(lenses / "coder.lens", LENS_YAML.format(description="Writes code"))
+    _write(lenses / "skills.yaml", SKILLS_YAML.format(description="Write code"))
+    return lenses
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LensCache:
+    return LensCache(path=tmp_path / "cache" / "lenses.db")
+
+
+class TestLensCache:
+    """Tests for LensCache."""
+
+    def test_warm_build_does_not_parse(
+        self, lenses_dir: Path, cache: LensCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cold = LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+        expected = cold.get("coder")
+
+        def fail(self: LensLoader, path: Path) -> None:
+            raise AssertionError(f"{path} was parsed")
+
+        monkeypatch.setattr(LensLoader, "load_with_dependencies", fail)
+        warm = LayeredLensRegistry.build(local_dir=lenses_dir, cache=LensCache(cache.path))
+
+        entry = warm.get_entry("coder")
+        assert entry is not None
+        assert entry._lens is None  # Indexed without unpickling the lens
+        assert warm.shortcuts == {"::code": "coder"}
+
+        lens, skill_name = warm.resolve_shortcut("::code")
+        assert skill_name == "write-code"
+        assert lens == expected
+        assert [s.description for s in lens.skills] == ["Write code"]
+
+    def test_changed_lens_file_recompiles(self, lenses_dir: Path, cache: LensCache) -> None:
+        LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+
+        _write(lenses_dir / "coder.lens", LENS_YAML.format(description="Reviews code"))
+        registry = LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+
+        assert registry.get_entry("coder").metadata.description == "Reviews code"
+
+    def test_changed_skill_include_recompiles(self, lenses_dir: Path, cache: LensCache) -> None:
+        LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+
+        _write(lenses_dir / "skills.yaml", SKILLS_YAML.format(description="Write tests"))
+        registry = LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+
+        assert [s.description for s in registry.get("coder").skills] == ["Write tests"]
+
+    def test_lazy_load_sees_changes_after_indexing(
+        self, lenses_dir: Path, cache: LensCache
+    ) -> None:
+        LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+        registry = LayeredLensRegistry.build(local_dir=lenses_dir, cache=cache)
+
+        _write(lenses_dir / "skills.yaml", SKILLS_YAML.format(description="Write tests"))
+
+        assert [s.description for s in registry.get("coder").skills] == ["Write tests"]
+
+    def test_removed_files_leave_the_cache(self, lenses_dir: Path, cache: LensCache) -> None:
+        cache.index(lenses_dir)
+        (lenses_dir / "coder.lens").unlink()
+
+        compiled, errors = cache.index(lenses_dir)
+
+        assert compiled == [] and errors == []
+        with cache._db.connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM lenses").fetchone() == (0,)
+
+    def test_broken_lens_is_reported_not_cached(self, lenses_dir: Path, cache: LensCache) -> None:
+        (lenses_dir / "broken.lens").write_text("lens: [unclosed")
+
+        compiled, errors = cache.index(lenses_dir)
+
+        assert [c.metadata.name for c in compiled] == ["coder"]
+        assert [path.name for path, _ in errors] == ["broken.lens"]
+        assert len(cache.index(lenses_dir)[1]) == 1
+
+
+class TestWorkingDirectoryLookups:
+    """Presets and includes found relative to the working directory."""
+
+    @staticmethod
+    def _project(root: Path, pattern: str) -> Path:
+        (root / "skills").mkdir(parents=True)
+        _write(root / "skills" / "permission-presets.yaml", PRESETS_YAML.format(pattern=pattern))
+        return root
+
+    def test_other_presets_file_recompiles(
+        self, tmp_path: Path, cache: LensCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lenses = tmp_path / "lenses"
+        lenses.mkdir()
+        _write(lenses / "deployer.lens", DEPLOY_LENS_YAML)
+        monkeypatch.chdir(self._project(tmp_path / "api", "api/**"))
+        cache.index(lenses)
+
+        monkeypatch.chdir(self._project(tmp_path / "web", "web/**"))
+        compiled, _ = cache.index(lenses)
+
+        assert compiled[0].lens is not None  # Recompiled, not served from the cache
+        skill = cache.load(lenses / "deployer.lens").skills[0]
+        assert skill.permissions["filesystem"]["read"] == ["web/**"]
+
+    def test_presets_file_appearing_recompiles(
+        self,
+        tmp_path: Path,
+        lenses_dir: Path,
+        cache: LensCache,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        project = tmp_path / "project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+        cache.index(lenses_dir)
+        assert cache.index(lenses_dir)[0][0].lens is None
+
+        self._project(project, "**")
+
+        assert cache.index(lenses_dir)[0][0].lens is not None
+
+    def test_include_found_elsewhere_recompiles(
+        self, tmp_path: Path, cache: LensCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lenses = tmp_path / "lenses"
+        lenses.mkdir()
+        _write(lenses / "coder.lens", LENS_YAML.format(description="Writes code"))
+        for name, description in (("api", "Write API code"), ("web", "Write web code")):
+            (tmp_path / name / "skills").mkdir(parents=True)
+            _write(
+                tmp_path / name / "skills" / "skills.yaml",
+                SKILLS_YAML.format(description=description),
+            )
+        monkeypatch.chdir(tmp_path / "api")
+        cache.index(lenses)
+
+        monkeypatch.chdir(tmp_path / "web")
+        cache.index(lenses)
+
+        assert [s.description for s in cache.load(lenses / "coder.lens").skills] == [
+            "Write web code"
+        ]
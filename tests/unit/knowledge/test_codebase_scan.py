@@ -0,0 +1,173 @@
+"""Tests for cached, incremental CodebaseAnalyzer scans and per-file graph storage."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from sunwell.knowledge.codebase import (
+    CodebaseAnalyzer,
+    CodebaseGraph,
+    NodeType,
+    StructuralNode,
+)
+from sunwell.knowledge.codebase import codebase as codebase_module
+from sunwell.knowledge.codebase.graph_store import LEGACY_PICKLE_NAME, CodebaseGraphStore
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A small project with two modules."""
+    root = tmp_path / "project"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text(
+        "import os\n\n\nclass Base:\n    pass\n\n\ndef helper():\n    return os.getcwd()\n"
+    )
+    (root / "pkg" / "b.py").write_text(
+        "from pkg.a import Base, helper\n\n\nclass Child(Base):\n"
+        "    def run(self):\n        return helper()\n"
+    )
+    return root
+
+
+def _node_names(graph: CodebaseGraph, file_path: Path) -> set[str]:
+    return {graph.structural_nodes[i].name for i in graph.file_to_nodes[file_path]}
+
+
+class TestFullScan:
+    """Tests for CodebaseAnalyzer.full_scan."""
+
+    @pytest.mark.asyncio
+    async def test_builds_legacy_and_structural_graphs(self, project: Path) -> None:
+        graph = await CodebaseAnalyzer().full_scan(project)
+
+        assert graph.import_graph["pkg.a"] == ["os"]
+        assert graph.class_hierarchy["pkg.b.Child"] == ["Base"]
+        assert "getcwd" in graph.call_graph["pkg.a.helper"]
+        assert _node_names(graph, project / "pkg" / "b.py") == {"pkg.b", "Child", "run"}
+        assert "class:Base:external" in graph.structural_nodes
+        assert set(graph.file_analyses) == {project / "pkg" / "a.py", project / "pkg" / "b.py"}
+
+    @pytest.mark.asyncio
+    async def test_rescan_only_reparses_changed_files(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        analyzer = CodebaseAnalyzer()
+        graph = await analyzer.full_scan(project)
+
+        parsed: list[Path] = []
+        original = codebase_module.CodebaseAnalyzer._build_structural_graph
+
+        def spy(self, file_path, *args):
+            parsed.append(file_path)
+            return original(self, file_path, *args)
+
+        monkeypatch.setattr(codebase_module.CodebaseAnalyzer, "_build_structural_graph", spy)
+        (project / "pkg" / "a.py").write_text("def renamed():\n    pass\n")
+        (project / "pkg" / "b.py").unlink()
+        (project / "pkg" / "c.py").write_text("VALUE = 1\n")
+
+        graph = await analyzer.full_scan(project, graph=graph)
+
+        assert sorted(parsed) == [project / "pkg" / "a.py", project / "pkg" / "c.py"]
+        assert _node_names(graph, project / "pkg" / "a.py") == {"pkg.a", "renamed"}
+        assert project / "pkg" / "b.py" not in graph.file_to_nodes
+        assert "pkg.a.helper" not in graph.call_graph
+        assert "pkg.b.Child" not in graph.class_hierarchy
+        assert "pkg.b" not in graph.import_graph
+
+    @pytest.mark.asyncio
+    async def test_parallel_scan_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for i in range(12):
+            (tmp_path / f"mod{i}.py").write_text(f"def f{i}():\n    return g{i}()\n")
+
+        serial = await CodebaseAnalyzer().full_scan(tmp_path)
+        monkeypatch.setattr(codebase_module, "_PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(codebase_module, "cpu_count", lambda: 4)
+        parallel = await CodebaseAnalyzer().full_scan(tmp_path)
+
+        assert parallel.call_graph == serial.call_graph
+        assert parallel.structural_nodes == serial.structural_nodes
+        assert parallel.structural_edges_out == serial.structural_edges_out
+
+
+class TestGraphPersistence:
+    """Tests for per-file CodebaseGraph storage."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, project: Path, tmp_path: Path) -> None:
+        graph = await CodebaseAnalyzer().full_scan(project)
+        graph.add_structural_node(
+            StructuralNode(id="module:scanned", node_type=NodeType.MODULE, name="scanned")
+        )
+        graph.save(tmp_path / "intel")
+
+        loaded = CodebaseGraph.load(tmp_path / "intel")
+
+        assert loaded.structural_nodes == graph.structural_nodes
+        assert loaded.structural_edges_out == graph.structural_edges_out
+        assert loaded.call_graph == graph.call_graph
+        assert loaded.file_analyses == graph.file_analyses
+        assert "module:scanned" in loaded.structural_nodes
+
+    @pytest.mark.asyncio
+    async def test_partial_load_and_per_file_update(self, project: Path, tmp_path: Path) -> None:
+        base = tmp_path / "intel"
+        analyzer = CodebaseAnalyzer()
+        (await analyzer.full_scan(project)).save(base)
+
+        a_path = project / "pkg" / "a.py"
+        partial = CodebaseGraph.load(base, files=[a_path])
+        assert set(partial.file_analyses) == {a_path}
+
+        a_path.write_text("def only():\n    pass\n")
+        await analyzer.incremental_update([a_path], partial, project)
+        partial.save(base)
+
+        full = CodebaseGraph.load(base)
+        assert _node_names(full, a_path) == {"pkg.a", "only"}
+        assert _node_names(full, project / "pkg" / "b.py") == {"pkg.b", "Child", "run"}
+
+    @pytest.mark.asyncio
+    async def test_rescan_of_legacy_graph_replaces_calls(
+        self, project: Path, tmp_path: Path
+    ) -> None:
+        base = tmp_path / "intel"
+        legacy = CodebaseGraph()
+        legacy.call_graph["pkg.a.helper"] = ["getcwd"]
+        (base / "codebase").mkdir(parents=True)
+        (base / "codebase" / LEGACY_PICKLE_NAME).write_bytes(pickle.dumps(legacy))
+
+        migrated = CodebaseGraph.load(base)
+        graph = await CodebaseAnalyzer().full_scan(project, graph=migrated)
+
+        assert graph.call_graph["pkg.a.helper"] == ["getcwd"]
+
+    def test_store_is_created_on_first_use(self, tmp_path: Path) -> None:
+        store = CodebaseGraphStore.for_base_path(tmp_path / "intel")
+        assert not store.exists()
+
+        store.write([(Path("a.py"), "a", "hash", b"blob")], meta={"k": b"v"})
+
+        assert store.file_hashes() == {Path("a.py"): "hash"}
+        assert store.load_meta() == {"k": b"v"}
+
+    def test_loads_manually_built_graph(self, tmp_path: Path) -> None:
+        graph = CodebaseGraph()
+        graph.add_structural_node(
+            StructuralNode(
+                id="module:test.py",
+                node_type=NodeType.MODULE,
+                name="test",
+                file_path=Path("test.py"),
+            )
+        )
+        graph.call_graph["test.f"] = ["g"]
+        graph.save(tmp_path)
+
+        loaded = CodebaseGraph.load(tmp_path)
+
+        assert loaded.file_to_nodes == {Path("test.py"): {"module:test.py"}}
+        assert loaded.call_graph == {"test.f": ["g"]}
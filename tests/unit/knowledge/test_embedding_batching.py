@@ -0,0 +1,131 @@
+"""Tests for cross-caller embedding micro-batching."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding.batching import EmbeddingBatcher, pack_batches
+from sunwell.knowledge.embedding.ollama import OllamaEmbedding
+
+
+class FakeServer:
+    """Embeds each text as [len(text), index-in-batch] and records requests."""
+
+    def __init__(self, delay: float = 0.01, fail_on: str | None = None) -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, texts: list[str]) -> np.ndarray:
+        self.requests.append(texts)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on in texts:
+                raise RuntimeError(f"cannot embed {self.fail_on}")
+            return np.array([[len(t), 0.0] for t in texts], dtype=np.float32)
+        finally:
+            self.in_flight -= 1
+
+
+class TestPackBatches:
+    """Tests for pack_batches."""
+
+    def test_respects_char_budget(self) -> None:
+        assert list(pack_batches(["aa", "bb", "cc", "d"], 4)) == [(0, 2), (2, 4)]
+
+    def test_oversized_text_gets_own_batch(self) -> None:
+        assert list(pack_batches(["a", "x" * 10, "b"], 4)) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_empty(self) -> None:
+        assert list(pack_batches([], 4)) == []
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_request(self) -> None:
+        server = FakeServer()
+        batcher = EmbeddingBatcher(server, max_batch_chars=100, max_concurrent=4)
+
+        results = await asyncio.gather(
+            batcher.embed(["a"]), batcher.embed(["bb", "a"]), batcher.embed(["ccc"])
+        )
+
+        assert server.requests == [["a", "bb", "ccc"]]
+        assert [r[:, 0].tolist() for r in results] == [[1], [2, 1], [3]]
+
+    @pytest.mark.asyncio
+    async def test_large_input_fans_out_up_to_concurrency(self) -> None:
+        server = FakeServer()
+        batcher = EmbeddingBatcher(server, max_batch_chars=10, max_concurrent=3)
+        texts = [f"text-{i:04d}" for i in range(12)]  # One 9-char text per batch
+
+        vectors = await batcher.embed(texts)
+
+        assert len(server.requests) == 12
+        assert server.peak_in_flight == 3
+        assert vectors.shape == (12, 2)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_dispatches_without_waiting(self) -> None:
+        server = FakeServer(delay=0)
+        batcher = EmbeddingBatcher(
+            server, max_batch_chars=4, max_concurrent=1, window_seconds=60
+        )
+
+        vectors = await asyncio.wait_for(batcher.embed(["abcd"]), timeout=1)
+
+        assert vectors.shape == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_only_fails_its_callers(self) -> None:
+        server = FakeServer(fail_on="bad")
+        batcher = EmbeddingBatcher(server, max_batch_chars=3, max_concurrent=2)
+
+        ok, failed = await asyncio.gather(
+            batcher.embed(["ok"]), batcher.embed(["bad"]), return_exceptions=True
+        )
+
+        assert ok[:, 0].tolist() == [2]
+        assert isinstance(failed, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_waiting_callers(self) -> None:
+        batcher = EmbeddingBatcher(
+            FakeServer(), max_batch_chars=100, max_concurrent=1, window_seconds=60
+        )
+        waiting = asyncio.ensure_future(batcher.embed(["a"]))
+        await asyncio.sleep(0)
+
+        await batcher.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+
+class TestOllamaEmbeddingCoalescing:
+    """Tests for OllamaEmbedding request coalescing (no server needed)."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_queries_share_one_http_request(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server = FakeServer()
+
+        async def post_batch(self: OllamaEmbedding, texts: list[str]) -> np.ndarray:
+            return await server(texts)
+
+        monkeypatch.setattr(OllamaEmbedding, "_post_batch", post_batch)
+        embedder = OllamaEmbedding(max_concurrent=2)
+
+        vectors = await asyncio.gather(*(embedder.embed_single(q) for q in ("a", "bb", "ccc")))
+
+        assert server.requests == [["a", "bb", "ccc"]]
+        assert [v[0] for v in vectors] == [1, 2, 3]
+        await embedder.close()
@@ -0,0 +1,154 @@
+"""Tests for the persistent embedding cache."""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding import (
+    CachedEmbedding,
+    EmbeddingCache,
+    EmbeddingProtocol,
+    HashEmbedding,
+    with_embedding_cache,
+)
+from sunwell.knowledge.embedding.cache import text_key
+from sunwell.knowledge.embedding.protocol import EmbeddingResult
+
+
+class CountingEmbedding:
+    """HashEmbedding that records which texts reached it."""
+
+    def __init__(self) -> None:
+        self.inner = HashEmbedding(_dimensions=8)
+        self.calls: list[list[str]] = []
+
+    @property
+    def dimensions(self) -> int:
+        return self.inner.dimensions
+
+    async def embed(self, texts: Sequence[str]) -> EmbeddingResult:
+        self.calls.append(list(texts))
+        return await self.inner.embed(texts)
+
+    async def embed_single(self, text: str) -> np.ndarray:
+        return (await self.embed([text])).vectors[0]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    return EmbeddingCache(path=tmp_path / "embeddings.db")
+
+
+class TestTextKey:
+    """Tests for text normalization."""
+
+    def test_normalizes_unicode_and_outer_whitespace(self) -> None:
+        assert text_key("café") == text_key("café")
+        assert text_key("  hello\n") == text_key("hello")
+        assert text_key("hello world") != text_key("hello  world")
+
+
+class TestEmbeddingCache:
+    """Tests for the SQLite store."""
+
+    def test_roundtrip_shared_between_instances(self, tmp_path: Path) -> None:
+        vector = np.arange(4, dtype=np.float32)
+        EmbeddingCache(path=tmp_path / "e.db").put_many("m", {"k": vector})
+
+        found = EmbeddingCache(path=tmp_path / "e.db").get_many("m", ["k", "missing"])
+
+        assert list(found) == ["k"]
+        np.testing.assert_array_equal(found["k"], vector)
+
+    def test_models_do_not_share_entries(self, cache: EmbeddingCache) -> None:
+        cache.put_many("a", {"k": np.ones(4, dtype=np.float32)})
+
+        assert cache.get_many("b", ["k"]) == {}
+
+    def test_evicts_least_recently_used(self, cache: EmbeddingCache) -> None:
+        cache.max_bytes = 110  # Room for three 32-byte vectors
+        vector = np.zeros(8, dtype=np.float32)
+        cache.put_many("m", {"a": vector})
+        cache.put_many("m", {"b": vector})
+        cache.put_many("m", {"c": vector})
+        with cache._db.connect() as conn:
+            conn.execute("UPDATE embeddings SET accessed_at = 0 WHERE key = 'b'")
+
+        cache.put_many("m", {"d": vector})
+
+        assert set(cache.get_many("m", ["a", "b", "c", "d"])) == {"a", "c", "d"}
+        assert cache.stats.evictions == 1
+
+    def test_report_persists_across_instances(self, cache: EmbeddingCache) -> None:
+        cache.put_many("m", {"k": np.zeros(8, dtype=np.float32)})
+        cache.get_many("m", ["k", "other"])
+        cache.flush()
+
+        report = EmbeddingCache(path=cache.path).report()
+
+        assert (report.hits, report.misses, report.bytes_saved) == (1, 1, 32)
+        assert report.hit_rate == 0.5
+        assert report.entries == 1 and report.total_bytes == 32
+        assert report.models == {"m": 1}
+
+    def test_lookups_are_buffered_until_flushed(self, cache: EmbeddingCache) -> None:
+        cache.put_many("m", {"k": np.zeros(8, dtype=np.float32)})
+        with cache._db.connect() as conn:
+            conn.execute("UPDATE embeddings SET accessed_at = 0")
+
+        for _ in range(3):
+            cache.get_many("m", ["k", "other"])
+        other = EmbeddingCache(path=cache.path)
+
+        assert other.report().hits == 0
+        cache.flush()
+        assert (other.report().hits, other.report().misses) == (3, 3)
+        with cache._db.connect() as conn:
+            assert conn.execute("SELECT accessed_at FROM embeddings").fetchone()[0] > 0
+
+    def test_clear_resets_counters(self, cache: EmbeddingCache) -> None:
+        cache.put_many("m", {"k": np.zeros(8, dtype=np.float32)})
+        cache.get_many("m", ["k"])
+
+        cache.clear()
+
+        report = cache.report()
+        assert (report.entries, report.total_bytes, report.hits) == (0, 0, 0)
+
+
+class TestCachedEmbedding:
+    """Tests for the caching wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_reach_inner_embedder(self, cache: EmbeddingCache) -> None:
+        inner = CountingEmbedding()
+        embedder = CachedEmbedding(inner, cache)
+        await embedder.embed(["a", "b"])
+
+        result = await embedder.embed(["b", "c", "a", "c"])
+
+        assert inner.calls == [["a", "b"], ["c"]]
+        expected = await inner.inner.embed(["b", "c", "a", "c"])
+        np.testing.assert_array_equal(result.vectors, expected.vectors)
+        assert result.vectors.dtype == np.float32
+
+    @pytest.mark.asyncio
+    async def test_hits_survive_a_new_process(self, cache: EmbeddingCache) -> None:
+        await CachedEmbedding(CountingEmbedding(), cache).embed(["hello"])
+
+        inner = CountingEmbedding()
+        vector = await CachedEmbedding(inner, EmbeddingCache(path=cache.path)).embed_single(
+            " hello "
+        )
+
+        assert inner.calls == []
+        assert vector.shape == (8,)
+
+    def test_implements_protocol_and_wraps_once(self, cache: EmbeddingCache) -> None:
+        embedder = with_embedding_cache(HashEmbedding(), cache)
+
+        assert isinstance(embedder, EmbeddingProtocol)
+        assert with_embedding_cache(embedder, cache) is embedder
+        assert with_embedding_cache(HashEmbedding(), None).__class__ is HashEmbedding
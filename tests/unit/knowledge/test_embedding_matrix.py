@@ -0,0 +1,130 @@
+"""Tests for the memory-mapped embedding matrix and CodebaseIndex search."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix, top_k_indices
+from sunwell.knowledge.workspace.indexer import CodebaseIndex, CodeChunk
+
+
+def _chunk(path: str, content: str) -> CodeChunk:
+    return CodeChunk(
+        file_path=Path(path),
+        start_line=1,
+        end_line=3,
+        content=content,
+        chunk_type="block",
+    )
+
+
+class TestEmbeddingMatrix:
+    def test_rows_are_normalized_on_insert(self) -> None:
+        m = EmbeddingMatrix()
+        m.add("a", np.array([3.0, 4.0]))
+        assert m.dimensions == 2
+        np.testing.assert_allclose(m.get("a"), [0.6, 0.8], rtol=1e-6)
+
+    def test_search_orders_by_cosine(self) -> None:
+        m = EmbeddingMatrix(dimensions=3)
+        m.add_batch(
+            ["x", "y", "xy"],
+            np.array([[1, 0, 0], [0, 1, 0], [1, 1, 0]], dtype=np.float32),
+        )
+        results = m.search(np.array([1.0, 0.1, 0.0]), top_k=2)
+        assert [id_ for id_, _ in results] == ["x", "xy"]
+        assert results[0][1] > results[1][1]
+
+    def test_threshold_filters(self) -> None:
+        m = EmbeddingMatrix(dimensions=2)
+        m.add("a", [1.0, 0.0])
+        m.add("b", [0.0, 1.0])
+        assert [i for i, _ in m.search([1.0, 0.0], top_k=5, threshold=0.5)] == ["a"]
+
+    def test_replace_existing_id_keeps_one_row(self) -> None:
+        m = EmbeddingMatrix(dimensions=2)
+        m.add("a", [1.0, 0.0])
+        m.add("a", [0.0, 1.0])
+        assert m.count == 1
+        assert m.search([0.0, 1.0], top_k=1)[0][0] == "a"
+
+    def test_discard_tombstones_and_compact(self) -> None:
+        m = EmbeddingMatrix(dimensions=2)
+        m.add_batch(["a", "b", "c"], np.eye(3, 2, dtype=np.float32) + 0.1)
+        assert m.discard("b")
+        assert not m.discard("b")
+        assert m.tombstones == 1
+        assert "b" not in {i for i, _ in m.search([0.1, 1.1], top_k=3)}
+        m.compact()
+        assert m.tombstones == 0
+        assert list(m.ids()) == ["a", "c"]
+
+    def test_save_and_mmap_load(self, tmp_path: Path) -> None:
+        m = EmbeddingMatrix(dimensions=4)
+        rng = np.random.default_rng(0)
+        m.add_batch([f"id{i}" for i in range(10)], rng.normal(size=(10, 4)))
+        m.discard("id3")
+        m.save(tmp_path / "vectors.npy")
+
+        loaded = EmbeddingMatrix.load(tmp_path / "vectors.npy")
+        assert isinstance(loaded.matrix, np.memmap) or not loaded.matrix.flags.writeable
+        assert loaded.count == 9
+        assert "id3" not in loaded
+        query = m.get("id5")
+        assert loaded.search(query, top_k=1)[0][0] == "id5"
+
+        # Mutating a mapped matrix copies it into memory, leaving the file untouched
+        loaded.add("new", np.ones(4))
+        assert loaded.count == 10
+        assert EmbeddingMatrix.load(tmp_path / "vectors.npy").count == 9
+
+    def test_top_k_indices_matches_full_sort(self) -> None:
+        scores = np.random.default_rng(1).random(1000).astype(np.float32)
+        expected = np.argsort(-scores, kind="stable")[:17]
+        np.testing.assert_array_equal(top_k_indices(scores, 17), expected)
+        assert len(top_k_indices(scores, 5000)) == 1000
+        assert len(top_k_indices(scores, 0)) == 0
+
+
+class TestCodebaseIndex:
+    def test_search_returns_duplicate_content_chunks(self) -> None:
+        index = CodebaseIndex()
+        a = _chunk("a.py", "def alpha(): pass")
+        b = _chunk("b.py", "def alpha(): pass")  # same content, same id
+        c = _chunk("c.py", "def gamma(): pass")
+        index.add_batch([a, b, c], np.array([[1, 0], [1, 0], [0, 1]], dtype=np.float32))
+
+        assert index.vectors.count == 2
+        hits = index.search(np.array([1.0, 0.0]), top_k=5, threshold=0.5)
+        assert {h.file_path for h, _ in hits} == {Path("a.py"), Path("b.py")}
+
+    def test_remove_file_keeps_shared_embeddings(self) -> None:
+        index = CodebaseIndex()
+        a = _chunk("a.py", "shared")
+        b = _chunk("b.py", "shared")
+        c = _chunk("a.py", "only in a")
+        index.add_batch([a, b, c], np.array([[1, 0], [1, 0], [0, 1]], dtype=np.float32))
+
+        assert index.remove_file(Path("a.py")) == 2
+        assert a.id in index.vectors
+        assert c.id not in index.vectors
+        assert [h.file_path for h, _ in index.search([1.0, 0.0], top_k=5)] == [Path("b.py")]
+
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
+        index = CodebaseIndex(file_count=1, total_lines=3)
+        index.add_batch([_chunk("a.py", "x = 1")], np.array([[0.5, 0.5]], dtype=np.float32))
+        index.save(tmp_path)
+
+        assert CodebaseIndex.exists(tmp_path)
+        loaded = CodebaseIndex.load(tmp_path)
+        assert loaded.file_count == 1
+        assert loaded.search([1.0, 1.0], top_k=1)[0][1] == pytest.approx(1.0, abs=1e-6)
+
+    def test_load_rejects_legacy_pickle(self, tmp_path: Path) -> None:
+        import pickle
+
+        (tmp_path / "index.pickle").write_bytes(pickle.dumps({"chunks": []}))
+        EmbeddingMatrix(dimensions=2).save(tmp_path / "index.vectors.npy")
+        with pytest.raises(ValueError):
+            CodebaseIndex.load(tmp_path)
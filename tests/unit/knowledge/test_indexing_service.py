@@ -0,0 +1,156 @@
+"""Tests for incremental indexing: file-keyed CodebaseIndex, append-only
+persistence and the pipelined IndexingService."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding.protocol import EmbeddingResult
+from sunwell.knowledge.embedding.simple import HashEmbedding
+from sunwell.knowledge.indexing import IndexingService
+from sunwell.knowledge.workspace.indexer import CodebaseIndex, CodeChunk
+
+
+def _chunk(path: str, content: str, line: int = 1) -> CodeChunk:
+    return CodeChunk(Path(path), line, line, content, "block")
+
+
+def _vectors(n: int, dims: int = 4, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, dims)).astype(np.float32)
+
+
+class CountingEmbedder(HashEmbedding):
+    """HashEmbedding that records every text it was asked to embed."""
+
+    def __init__(self) -> None:
+        super().__init__(_dimensions=16)
+        self.embedded: list[str] = []
+
+    async def embed(self, texts: list[str]) -> EmbeddingResult:
+        self.embedded.extend(texts)
+        return await super().embed(texts)
+
+
+class TestFileKeyedIndex:
+    def test_replace_file_reuses_unchanged_embeddings(self) -> None:
+        index = CodebaseIndex()
+        a, b = _chunk("a.py", "keep"), _chunk("a.py", "old", 2)
+        index.add_batch([a, b], _vectors(2))
+
+        missing = index.replace_file(
+            Path("a.py"), [_chunk("a.py", "keep"), _chunk("a.py", "new", 2)]
+        )
+
+        assert [c.content for c in missing] == ["new"]
+        assert a.id in index.vectors
+        assert b.id not in index.vectors
+        assert index.chunk_count == 1
+        index.add_batch(missing, _vectors(1, seed=1))
+        assert sorted(c.content for c in index.files[Path("a.py")]) == ["keep", "new"]
+
+    def test_shared_content_survives_one_file_removal(self) -> None:
+        index = CodebaseIndex()
+        index.add_batch([_chunk("a.py", "same"), _chunk("b.py", "same")], _vectors(2))
+
+        assert index.remove_file(Path("a.py")) == 1
+        assert [c.file_path for c, _ in index.search(_vectors(1)[0], top_k=5)] == [Path("b.py")]
+        assert index.chunk_count == len(index.chunks) == 1
+
+
+class TestAppendOnlyPersistence:
+    def test_incremental_save_appends_log(self, tmp_path: Path) -> None:
+        index = CodebaseIndex()
+        index.add_batch([_chunk("a.py", "alpha"), _chunk("b.py", "beta")], _vectors(2))
+        index.stamp_file(Path("a.py"), (1, 5))
+        index.save(tmp_path)
+        snapshot = (tmp_path / "index.pickle").stat().st_mtime_ns
+
+        missing = index.replace_file(Path("a.py"), [_chunk("a.py", "gamma")], (2, 5))
+        index.add_batch(missing, _vectors(1, seed=2))
+        index.remove_file(Path("b.py"))
+        index.save(tmp_path)
+
+        assert (tmp_path / "index.log").exists()
+        assert (tmp_path / "index.pickle").stat().st_mtime_ns == snapshot
+
+        loaded = CodebaseIndex.load(tmp_path)
+        assert [c.content for c in loaded.chunks] == ["gamma"]
+        assert loaded.file_stamps == {Path("a.py"): (2, 5)}
+        assert loaded.vectors.count == 1
+        np.testing.assert_allclose(
+            loaded.vectors.get(missing[0].id), index.vectors.get(missing[0].id)
+        )
+
+    def test_torn_log_tail_forces_snapshot(self, tmp_path: Path) -> None:
+        index = CodebaseIndex()
+        index.add_batch([_chunk("a.py", "alpha")], _vectors(1))
+        index.save(tmp_path)
+        index.add_batch([_chunk("b.py", "beta")], _vectors(1, seed=1))
+        index.save(tmp_path)
+        with open(tmp_path / "index.log", "ab") as f:
+            f.write(b"\x80\x05partial")
+
+        loaded = CodebaseIndex.load(tmp_path)
+        assert loaded.chunk_count == 2
+        loaded.save(tmp_path)
+        assert not (tmp_path / "index.log").exists()
+        assert CodebaseIndex.load(tmp_path).chunk_count == 2
+
+
+class TestIncrementalService:
+    @pytest.fixture
+    def workspace(self, tmp_path: Path) -> Path:
+        root = tmp_path / "ws"
+        root.mkdir()
+        for i in range(6):
+            (root / f"mod{i}.py").write_text(f"def f{i}():\n    return {i}\n")
+        return root
+
+    async def _build(self, root: Path, embedder: CountingEmbedder) -> IndexingService:
+        service = IndexingService(workspace_root=root, embedder=embedder)
+        service._embedder = embedder
+        await service._index_files(sorted(service._tier_files()))
+        await service._save_cache()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_build_indexes_every_file(self, workspace: Path) -> None:
+        embedder = CountingEmbedder()
+        service = await self._build(workspace, embedder)
+
+        assert service.status.file_count == 6
+        assert len(service._index.file_stamps) == 6
+        assert len(embedder.embedded) == service.status.chunk_count
+
+    @pytest.mark.asyncio
+    async def test_update_reembeds_only_changed_chunks(self, workspace: Path) -> None:
+        embedder = CountingEmbedder()
+        service = await self._build(workspace, embedder)
+        embedder.embedded.clear()
+
+        changed = workspace / "mod0.py"
+        changed.write_text("def f0():\n    return 0\n\ndef g():\n    return 'new'\n")
+        (workspace / "mod1.py").unlink()
+        await service._update_files([changed, workspace / "mod1.py"])
+
+        assert embedder.embedded and all("new" in t for t in embedder.embedded)
+        assert workspace / "mod1.py" not in service._index.files
+        assert service.status.file_count == 5
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_refreshes_only_changed_files(self, workspace: Path) -> None:
+        await self._build(workspace, CountingEmbedder())
+        (workspace / "mod2.py").write_text("def changed():\n    return 'edit'\n")
+        (workspace / "extra.py").write_text("def extra():\n    return 'added'\n")
+
+        embedder = CountingEmbedder()
+        service = IndexingService(workspace_root=workspace, embedder=embedder)
+        assert await service._load_cached_index()
+        assert not await service._verify_cache_fresh()
+        await service._refresh_stale_files()
+
+        assert embedder.embedded
+        assert all("edit" in t or "added" in t for t in embedder.embedded)
+        assert service._index.file_stamps.keys() == set(service._tier_files())
+        assert await service._verify_cache_fresh()
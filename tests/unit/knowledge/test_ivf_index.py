@@ -0,0 +1,155 @@
+"""Tests for the IVF approximate nearest-neighbour index."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding import (
+    InMemoryIndex,
+    IVFIndex,
+    VectorIndexProtocol,
+    create_vector_index,
+    load_vector_index,
+)
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix
+from sunwell.knowledge.workspace.indexer import CodebaseIndex, CodeChunk
+
+
+def _clustered(n: int, dims: int = 32, clusters: int = 20, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims))
+    labels = rng.integers(0, clusters, size=n)
+    return (centers[labels] + 0.1 * rng.normal(size=(n, dims))).astype(np.float32)
+
+
+def _recall(index: IVFIndex, exact: EmbeddingMatrix, queries: np.ndarray, k: int) -> float:
+    hits = 0
+    for q in queries:
+        truth = {i for i, _ in exact.search(q, top_k=k)}
+        hits += len(truth & {r.id for r in index.search(q, top_k=k)})
+    return hits / (k * len(queries))
+
+
+class TestIVFIndex:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(IVFIndex(_dimensions=4), VectorIndexProtocol)
+
+    def test_exact_below_train_size(self) -> None:
+        index = IVFIndex(_dimensions=2, min_train_size=100)
+        index.add("a", np.array([1.0, 0.0], dtype=np.float32), {"k": 1})
+        index.add("b", np.array([0.0, 1.0], dtype=np.float32))
+        results = index.search(np.array([1.0, 0.1], dtype=np.float32), top_k=1)
+        assert not index.is_trained
+        assert results[0].id == "a"
+        assert results[0].metadata == {"k": 1}
+
+    def test_trains_and_keeps_recall(self) -> None:
+        vectors = _clustered(3000)
+        ids = [f"v{i}" for i in range(len(vectors))]
+        index = IVFIndex(_dimensions=32, min_train_size=1000, nprobe=4)
+        index.add_batch(ids, vectors)
+        exact = EmbeddingMatrix(dimensions=32)
+        exact.add_batch(ids, vectors)
+
+        queries = _clustered(20, seed=1)
+        assert _recall(index, exact, queries, k=10) >= 0.8
+        assert index.is_trained
+        # Probing every list is an exact search
+        full = len(index.centroids)
+        for q in queries[:5]:
+            approx = [r.id for r in index.search(q, top_k=5, nprobe=full)]
+            assert approx == [i for i, _ in exact.search(q, top_k=5)]
+
+    def test_incremental_add_after_training(self) -> None:
+        index = IVFIndex(_dimensions=32, min_train_size=500)
+        index.add_batch([f"v{i}" for i in range(600)], _clustered(600))
+        index.search(_clustered(1, seed=3)[0])
+        assert index.is_trained
+
+        probe = np.ones(32, dtype=np.float32)
+        index.add("late", probe)
+        assert index.search(probe, top_k=1)[0].id == "late"
+
+    def test_delete_tombstones_then_compacts(self) -> None:
+        index = IVFIndex(_dimensions=32, min_train_size=100, compact_ratio=0.25)
+        vectors = _clustered(200)
+        index.add_batch([f"v{i}" for i in range(200)], vectors)
+        index.search(vectors[0])
+
+        assert index.delete("v0")
+        assert not index.delete("v0")
+        assert "v0" not in {r.id for r in index.search(vectors[0], top_k=5)}
+
+        for i in range(1, 80):
+            index.delete(f"v{i}")
+        assert index.count == 120
+        assert index.search(vectors[150], top_k=1)[0].id == "v150"
+
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
+        vectors = _clustered(400)
+        index = IVFIndex(
+            _dimensions=32,
+            min_train_size=200,
+            nprobe=3,
+            retrain_factor=2.0,
+            compact_ratio=0.5,
+            seed=7,
+        )
+        index.add_batch([f"v{i}" for i in range(400)], vectors, [{"i": i} for i in range(400)])
+        before = [r.id for r in index.search(vectors[7], top_k=5)]
+        index.save(tmp_path / "ivf")
+
+        loaded = load_vector_index(tmp_path / "ivf")
+        assert isinstance(loaded, IVFIndex)
+        assert loaded.is_trained and loaded.nprobe == 3
+        assert (loaded.retrain_factor, loaded.compact_ratio, loaded.seed) == (2.0, 0.5, 7)
+        assert [r.id for r in loaded.search(vectors[7], top_k=5)] == before
+        assert loaded.search(vectors[7], top_k=1)[0].metadata == {"i": 7}
+
+    def test_save_after_clear_drops_old_quantizer(self, tmp_path: Path) -> None:
+        index = IVFIndex(_dimensions=32, min_train_size=200)
+        index.add_batch([f"v{i}" for i in range(400)], _clustered(400))
+        index.search(_clustered(1)[0])
+        index.save(tmp_path / "ivf")
+
+        index.clear()
+        index.add("only", np.ones(32, dtype=np.float32))
+        index.save(tmp_path / "ivf")
+
+        loaded = IVFIndex.load(tmp_path / "ivf")
+        assert not loaded.is_trained
+        assert loaded.search(np.ones(32, dtype=np.float32), top_k=1)[0].id == "only"
+
+
+class TestBackendSelection:
+    def test_create_vector_index_backends(self) -> None:
+        assert isinstance(create_vector_index(8, backend="flat"), InMemoryIndex)
+        assert isinstance(create_vector_index(8, backend="ivf"), IVFIndex)
+        auto = create_vector_index(8, backend="auto")
+        assert isinstance(auto, IVFIndex) and auto.min_train_size > 1000
+        with pytest.raises(ValueError):
+            create_vector_index(8, backend="faiss")
+
+    def test_load_vector_index_reads_flat_format(self, tmp_path: Path) -> None:
+        flat = InMemoryIndex(_dimensions=2)
+        flat.add("a", np.array([1.0, 0.0], dtype=np.float32))
+        flat.save(tmp_path / "flat")
+        assert isinstance(load_vector_index(tmp_path / "flat"), InMemoryIndex)
+        assert load_vector_index(tmp_path / "missing") is None
+
+    def test_codebase_index_switches_to_ann(self, tmp_path: Path) -> None:
+        vectors = _clustered(300)
+        chunks = [
+            CodeChunk(Path(f"f{i}.py"), 1, 3, f"content {i}", "block") for i in range(300)
+        ]
+        index = CodebaseIndex(ann_threshold=200)
+        index.add_batch(chunks, vectors)
+
+        assert index.search(vectors[42], top_k=1)[0][0].content == "content 42"
+        assert index._ann is not None and index._ann.is_trained
+
+        index.save(tmp_path)
+        loaded = CodebaseIndex.load(tmp_path)
+        loaded.ann_threshold = 200
+        assert loaded.search(vectors[42], top_k=1)[0][0].content == "content 42"
@@ -0,0 +1,147 @@
+"""Tests for the append-only vector file and the stores built on it."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.codebase.decisions import DecisionMemory
+from sunwell.knowledge.embedding import HashEmbedding
+from sunwell.knowledge.embedding.matrix import EmbeddingMatrix
+from sunwell.knowledge.embedding.vectors import VectorFile
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "vectors.f32"
+
+
+class TestVectorFile:
+    """Tests for VectorFile."""
+
+    def test_nothing_is_read_until_first_lookup(self, path: Path) -> None:
+        VectorFile(path).put("a", [1.0, 0.0])
+
+        vectors = VectorFile(path)
+
+        assert not vectors.loaded
+        assert "a" in vectors
+        assert vectors.loaded
+
+    def test_appends_rows_instead_of_rewriting(self, path: Path) -> None:
+        vectors = VectorFile(path)
+        vectors.put("a", [1.0, 0.0])
+        before = path.stat().st_ino
+
+        vectors.put("b", [0.0, 1.0])
+
+        assert path.stat().st_ino == before
+        assert path.stat().st_size == 2 * 2 * 4
+
+    def test_last_write_wins_across_instances(self, path: Path) -> None:
+        vectors = VectorFile(path)
+        vectors.put("a", [1.0, 0.0])
+        vectors.put("b", [0.0, 1.0])
+        vectors.put("a", [0.0, 2.0])
+
+        reloaded = VectorFile(path)
+
+        assert len(reloaded) == 2
+        np.testing.assert_allclose(reloaded.get("a"), [0.0, 1.0])
+        assert reloaded.search([1.0, 0.0], top_k=2)[0][1] == pytest.approx(0.0)
+
+    def test_search_threshold_and_exclude(self, path: Path) -> None:
+        vectors = VectorFile(path)
+        vectors.put_many(
+            ["x", "xy", "y"], np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+        )
+
+        assert [i for i, _ in vectors.search([1.0, 0.0], top_k=3, threshold=0.5)] == [
+            "x",
+            "xy",
+        ]
+        assert [i for i, _ in vectors.search([1.0, 0.0], top_k=1, exclude={"x"})] == ["xy"]
+
+    def test_compacts_once_dead_rows_dominate(self, path: Path) -> None:
+        vectors = VectorFile(path)
+        for i in range(70):
+            vectors.put("same", [float(i + 1), 1.0])
+
+        assert path.stat().st_size < 70 * 2 * 4
+        np.testing.assert_allclose(
+            VectorFile(path).get("same"), vectors.get("same"), rtol=1e-6
+        )
+
+    def test_torn_append_is_ignored_and_repaired(self, path: Path) -> None:
+        vectors = VectorFile(path)
+        vectors.put("a", [1.0, 0.0])
+        with open(path, "ab") as f:  # Crash after the vector, before its id
+            f.write(np.array([0.0, 1.0], dtype=np.float32).tobytes())
+
+        reloaded = VectorFile(path)
+        assert len(reloaded) == 1
+        reloaded.put("b", [0.0, 1.0])
+
+        assert path.stat().st_size == 2 * 2 * 4
+        assert set(VectorFile(path).search([1.0, 1.0], top_k=5)) == set(
+            reloaded.search([1.0, 1.0], top_k=5)
+        )
+
+    def test_imports_and_removes_legacy_json(self, tmp_path: Path, path: Path) -> None:
+        legacy = tmp_path / "old_embeddings.json"
+        legacy.write_text(json.dumps({"a": [3.0, 4.0]}))
+
+        vectors = VectorFile(path, legacy_json=legacy)
+
+        np.testing.assert_allclose(vectors.get("a"), [0.6, 0.8], rtol=1e-6)
+        assert not legacy.exists()
+        assert "a" in VectorFile(path)
+
+    def test_rejects_ids_with_newlines(self, path: Path) -> None:
+        with pytest.raises(ValueError):
+            VectorFile(path).put("a\nb", [1.0])
+
+
+class TestFromRows:
+    """Tests for EmbeddingMatrix.from_rows."""
+
+    def test_repeated_ids_keep_last_row(self) -> None:
+        data = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+
+        matrix = EmbeddingMatrix.from_rows(data, ["a", "a"])
+
+        assert len(matrix) == 1 and matrix.tombstones == 1
+        assert matrix.search([1.0, 0.0], top_k=2) == [("a", 0.0)]
+
+
+class TestDecisionMemoryVectors:
+    """DecisionMemory semantic search over the vector file."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_survives_restart(self, tmp_path: Path) -> None:
+        embedder = HashEmbedding(_dimensions=64)
+        memory = DecisionMemory(tmp_path, embedder=embedder)
+        await memory.record_decision("database", "Which DB?", "sqlite", [], "Simple")
+        auth = await memory.record_decision("auth", "How to auth?", "jwt", [], "Stateless")
+
+        reloaded = DecisionMemory(tmp_path, embedder=embedder)
+        assert not reloaded._embeddings.loaded
+
+        found = await reloaded.find_relevant_decisions(auth.to_text(), top_k=1)
+
+        assert [d.id for d in found] == [auth.id]
+        assert len(reloaded._embeddings) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_vectors_do_not_take_result_slots(self, tmp_path: Path) -> None:
+        embedder = HashEmbedding(_dimensions=64)
+        memory = DecisionMemory(tmp_path, embedder=embedder)
+        db = await memory.record_decision("database", "Which DB?", "sqlite", [], "Simple")
+        auth = await memory.record_decision("auth", "How to auth?", "jwt", [], "Stateless")
+        # A vector whose decision is gone, and which matches the query best
+        memory._embeddings.put("gone", await embedder.embed_single(auth.to_text()))
+
+        found = await memory.find_relevant_decisions(auth.to_text(), top_k=2)
+
+        assert [d.id for d in found] == [auth.id, db.id]
@@ -0,0 +1,102 @@
+"""Tests for the FTS5-backed workspace signature index."""
+
+from pathlib import Path
+
+import pytest
+
+from sunwell.knowledge.workspace import workspace_index
+from sunwell.knowledge.workspace.types import Workspace, WorkspaceProject
+from sunwell.knowledge.workspace.workspace_index import (
+    WorkspaceSignatureIndex,
+    _fts_query,
+    _name_words,
+)
+
+
+@pytest.fixture
+def projects(tmp_path: Path) -> tuple[WorkspaceProject, WorkspaceProject]:
+    api = tmp_path / "api"
+    api.mkdir()
+    (api / "auth.py").write_text(
+        'def authenticate_user(token: str) -> bool:\n    """Check a login token."""\n'
+        "\n\nclass UserService:\n    pass\n"
+    )
+    (api / "billing.py").write_text("def charge_card(amount: int) -> None:\n    pass\n")
+    web = tmp_path / "web"
+    web.mkdir()
+    (web / "auth.py").write_text("def authenticate(request) -> None:\n    pass\n")
+    return WorkspaceProject(id="api", path=api), WorkspaceProject(id="web", path=web)
+
+
+@pytest.fixture
+def index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    projects: tuple[WorkspaceProject, WorkspaceProject],
+):
+    index_dir = tmp_path / "index"
+    index_dir.mkdir()
+    monkeypatch.setattr(workspace_index, "get_workspace_index_dir", lambda _: index_dir)
+    index = WorkspaceSignatureIndex(Workspace(id="ws", name="ws", projects=projects))
+    yield index
+    index.close()
+
+
+def test_name_words_split_identifiers() -> None:
+    assert _name_words("getUserByID") == "get user by id"
+    assert _name_words("HTTPServer_v2") == "http server v 2"
+    assert _fts_query("UserService") == '"userservice"* OR "user"* OR "service"*'
+
+
+@pytest.mark.asyncio
+async def test_exact_name_ranks_first_and_projects_filter(
+    index: WorkspaceSignatureIndex,
+) -> None:
+    await index.scan_all()
+
+    matches = await index.search("authenticate")
+
+    assert [(m.project_id, m.signature.name) for m in matches[:2]] == [
+        ("web", "authenticate"),
+        ("api", "authenticate_user"),
+    ]
+    assert [m.score for m in matches[:2]] == [1.0, 0.8]
+    filtered = await index.search("authenticate", project_ids=["api"])
+    assert {m.project_id for m in filtered} == {"api"}
+
+
+@pytest.mark.asyncio
+async def test_matches_docstrings_and_name_words(index: WorkspaceSignatureIndex) -> None:
+    await index.scan_all()
+
+    by_doc = await index.search("login")
+    by_word = await index.search("service")
+
+    assert [m.signature.name for m in by_doc] == ["authenticate_user"]
+    assert 0 < by_doc[0].score < 0.6
+    assert [m.signature.name for m in by_word] == ["UserService"]
+    assert await index.search("!!") == []
+
+
+@pytest.mark.asyncio
+async def test_rescan_skips_unchanged_files(
+    index: WorkspaceSignatureIndex,
+    projects: tuple[WorkspaceProject, WorkspaceProject],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    api, _ = projects
+    assert await index.scan_project(api) == 3
+
+    extracted: list[str] = []
+    extract = index._extractor.extract
+    monkeypatch.setattr(
+        index._extractor, "extract", lambda path: extracted.append(path.name) or extract(path)
+    )
+    (api.path / "billing.py").write_text("def refund(amount: int) -> None:\n    pass\n")
+    (api.path / "auth.py").unlink()
+
+    assert await index.scan_project(api) == 1
+    assert extracted == ["billing.py"]
+    assert [m.signature.name for m in await index.search("refund")] == ["refund"]
+    assert await index.search("charge_card") == []
+    assert await index.search("authenticate_user", project_ids=["api"]) == []
@@ -0,0 +1,148 @@
+"""Tests for the ConversationDAG embedding matrix and vectorized retrieval."""
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sunwell.knowledge.embedding.matrix import EmbeddingRowView
+from sunwell.memory.simulacrum.core.dag import ConversationDAG
+from sunwell.memory.simulacrum.core.retrieval.importance import compute_importance
+from sunwell.memory.simulacrum.core.retrieval.semantic_retriever import SemanticRetriever
+from sunwell.memory.simulacrum.core.retrieval.similarity import (
+    bm25_score,
+    bm25_scores,
+    hybrid_score,
+)
+from sunwell.memory.simulacrum.core.turn import Learning
+
+
+def _learning(fact: str, category: str = "fact", **kwargs) -> Learning:
+    return Learning(
+        fact=fact,
+        source_turns=(),
+        confidence=0.9,
+        category=category,  # type: ignore[arg-type]
+        activity_day_created=1,
+        activity_day_accessed=1,
+        **kwargs,
+    )
+
+
+class _StubEmbedder:
+    """Returns a fixed query vector."""
+
+    def __init__(self, vector: np.ndarray) -> None:
+        self._vector = vector
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        return np.tile(self._vector, (len(texts), 1))
+
+
+class TestDAGEmbeddingMatrix:
+    def test_set_embeddings_attaches_row_views(self) -> None:
+        dag = ConversationDAG()
+        a = _learning("uses postgres")
+        dag.add_learning(a)
+
+        assert dag.set_embeddings([a.id, "missing"], np.array([[3.0, 4.0], [1.0, 0.0]])) == 1
+        embedding = dag.learnings[a.id].embedding
+        assert isinstance(embedding, EmbeddingRowView)
+        assert embedding == pytest.approx((0.6, 0.8))
+        assert dag.embeddings.count == 1
+        np.testing.assert_allclose(dag.get_embedding(a.id), [0.6, 0.8], rtol=1e-6)
+
+    def test_inline_embeddings_move_into_matrix(self) -> None:
+        dag = ConversationDAG()
+        dag.add_learning(_learning("inline vector", embedding=(1.0, 0.0, 0.0)))
+        learning = next(iter(dag.learnings.values()))
+        assert isinstance(learning.embedding, EmbeddingRowView)
+        assert learning.id in dag.embeddings
+
+    def test_replace_learning_moves_row(self) -> None:
+        dag = ConversationDAG()
+        old = _learning("cache results", category="fact")
+        dag.add_learning(old)
+        dag.set_embeddings([old.id], np.array([[0.0, 1.0]]))
+
+        stored = dag.learnings[old.id]
+        new = Learning(
+            fact=stored.fact,
+            source_turns=(),
+            confidence=0.9,
+            category="pattern",
+            embedding=stored.embedding,
+        )
+        assert dag.replace_learning(stored, new)
+        assert old.id not in dag.embeddings
+        assert list(dag.learnings[new.id].embedding) == pytest.approx([0.0, 1.0])
+
+    def test_save_load_uses_sidecar(self, tmp_path: Path) -> None:
+        dag = ConversationDAG()
+        learnings = [_learning(f"fact {i}") for i in range(3)]
+        dag.add_learnings_batch(learnings)
+        dag.set_embeddings([learning.id for learning in learnings], np.eye(3, dtype=np.float32))
+
+        path = tmp_path / "session_dag.json"
+        dag.save(path)
+        assert (tmp_path / "session_dag.embeddings.npy").exists()
+        assert '"embedding": null' in path.read_text()
+
+        loaded = ConversationDAG.load(path)
+        assert loaded.embeddings.count == 3
+        assert list(loaded.learnings[learnings[1].id].embedding) == [0.0, 1.0, 0.0]
+
+
+class TestVectorizedRetrieval:
+    def test_bm25_scores_match_scalar(self) -> None:
+        docs = ["user auth flow", "database setup", "", "auth auth user tokens"]
+        expected = [bm25_score("user auth", d) for d in docs]
+        np.testing.assert_allclose(bm25_scores("user auth", docs), expected)
+        assert not bm25_scores("", docs).any()
+
+    def test_get_learnings_matches_per_learning_scoring(self) -> None:
+        rng = np.random.default_rng(0)
+        dag = ConversationDAG()
+        facts = [
+            "auth tokens expire after an hour",
+            "user sessions are stored in redis",
+            "use pytest fixtures for auth tests",
+            "deploy with docker compose",
+        ]
+        learnings = [_learning(f, use_count=i) for i, f in enumerate(facts)]
+        dag.add_learnings_batch(learnings)
+        vectors = rng.normal(size=(len(facts), 8)).astype(np.float32)
+        dag.set_embeddings([learning.id for learning in learnings[:3]], vectors[:3])
+
+        query = "auth tokens"
+        query_vector = rng.normal(size=8).astype(np.float32)
+        retriever = SemanticRetriever(dag, embedder=_StubEmbedder(query_vector))
+        result = asyncio.run(
+            retriever.retrieve_parallel(
+                query,
+                include_episodes=False,
+                include_recent_turns=False,
+                include_chunks=False,
+                activity_days=3,
+            )
+        )
+
+        expected = []
+        for learning in dag.get_active_learnings():
+            semantic = hybrid_score(
+                query,
+                learning.fact,
+                query_embedding=tuple(query_vector.tolist()),
+                doc_embedding=learning.embedding,
+            )
+            score = compute_importance(
+                learning, semantic, 3, dag.get_inbound_link_count(learning.id)
+            )
+            if score > 0.3:
+                expected.append((learning.fact, score))
+        expected.sort(key=lambda x: -x[1])
+
+        actual = [(learning.fact, s) for learning, s in result.learnings]
+        assert [f for f, _ in actual] == [f for f, _ in expected]
+        assert [s for _, s in actual] == pytest.approx([s for _, s in expected], abs=1e-6)
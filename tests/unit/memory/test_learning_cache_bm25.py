@@ -0,0 +1,159 @@
+"""Tests for the incrementally maintained BM25 index in LearningCache."""
+
+import math
+import sqlite3
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from sunwell.agent.learning.learning import Learning
+from sunwell.memory.core.learning_cache import LearningCache
+
+
+def _reference_bm25(
+    docs: dict[str, str], query: str, k1: float = 1.5, b: float = 0.75
+) -> dict[str, float]:
+    """Straightforward BM25 over raw documents, for comparison."""
+    tokenized = {doc_id: fact.lower().split() for doc_id, fact in docs.items()}
+    n = len(tokenized)
+    avgdl = sum(len(t) for t in tokenized.values()) / n
+    scores: dict[str, float] = {}
+    for term in set(query.lower().split()):
+        df = sum(1 for t in tokenized.values() if term in t)
+        if df == 0:
+            continue
+        idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+        for doc_id, tokens in tokenized.items():
+            tf = Counter(tokens)[term]
+            if tf:
+                denom = tf + k1 * (1 - b + b * len(tokens) / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / denom
+    return scores
+
+
+class TestLearningCacheBM25:
+    """BM25 index maintenance and scoring."""
+
+    def test_add_indexes_incrementally(self, tmp_path: Path) -> None:
+        """Learnings are searchable immediately, without a rebuild."""
+        cache = LearningCache(tmp_path)
+        react = Learning(fact="React hooks manage state", category="pattern")
+        cache.add(react)
+
+        assert cache.has_bm25_index()
+        assert [r[0] for r in cache.bm25_query_fast("hooks")] == [react.id]
+
+        ts = Learning(fact="TypeScript types catch bugs", category="pattern")
+        assert cache.add_batch([ts, react]) == 1
+        assert [r[0] for r in cache.bm25_query_fast("typescript")] == [ts.id]
+
+        stats = cache.get_bm25_stats()
+        assert stats["total_docs"] == 2
+        assert stats["avg_doc_length"] == 4.0
+
+    def test_duplicate_add_does_not_inflate_stats(self, tmp_path: Path) -> None:
+        cache = LearningCache(tmp_path)
+        learning = Learning(fact="use uv for installs", category="preference")
+        assert cache.add(learning)
+        assert not cache.add(learning)
+        assert cache.add_batch([learning]) == 0
+        assert cache.get_bm25_stats()["total_docs"] == 1
+
+    def test_add_batch_inserts_in_one_statement(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A batch is one executemany; in-batch duplicates are indexed once."""
+        cache = LearningCache(tmp_path)
+        existing = Learning(fact="use uv for installs", category="preference")
+        cache.add(existing)
+
+        calls: list[tuple[str, str]] = []
+
+        class TracedConnection(sqlite3.Connection):
+            def execute(self, sql, *args):  # type: ignore[override]
+                calls.append(("execute", sql))
+                return super().execute(sql, *args)
+
+            def executemany(self, sql, *args):  # type: ignore[override]
+                calls.append(("executemany", sql))
+                return super().executemany(sql, *args)
+
+        connect = sqlite3.connect
+        monkeypatch.setattr(
+            sqlite3, "connect", lambda *a, **kw: connect(*a, factory=TracedConnection, **kw)
+        )
+        batch = [Learning(fact=f"fact number {i}", category="fact") for i in range(5)]
+        assert cache.add_batch([*batch, existing, batch[0]]) == 5
+
+        inserts = [kind for kind, sql in calls if "INTO learnings" in sql]
+        assert inserts == ["executemany"]
+        assert cache.get_bm25_stats()["total_docs"] == 6
+        matches = {r[0] for r in cache.bm25_query_fast("number")}
+        assert matches == {learning.id for learning in batch}
+
+    def test_scores_match_reference_bm25(self, tmp_path: Path) -> None:
+        cache = LearningCache(tmp_path)
+        facts = [
+            "React hooks are powerful for state management",
+            "Use React with TypeScript for type safety",
+            "PostgreSQL is a relational database",
+            "hooks hooks hooks everywhere in React",
+            "Redis caches database queries",
+        ]
+        learnings = [Learning(fact=f, category="pattern") for f in facts]
+        cache.add_batch(learnings[:3])
+        for learning in learnings[3:]:
+            cache.add(learning)
+
+        query = "react hooks database"
+        expected = _reference_bm25({learning.id: learning.fact for learning in learnings}, query)
+        results = cache.bm25_query_fast(query, limit=10)
+
+        assert {doc_id for doc_id, _ in results} == set(expected)
+        for doc_id, score in results:
+            assert score == pytest.approx(expected[doc_id])
+        assert [s for _, s in results] == sorted((s for _, s in results), reverse=True)
+
+        # Full rebuild yields identical results
+        cache.build_bm25_index()
+        assert cache.bm25_query_fast(query, limit=10) == pytest.approx(results)
+        assert cache.bm25_query_fast(query, limit=2) == results[:2]
+
+    def test_unknown_terms_return_empty(self, tmp_path: Path) -> None:
+        cache = LearningCache(tmp_path)
+        assert cache.bm25_query_fast("anything") == []
+        cache.add(Learning(fact="known words", category="fact"))
+        assert cache.bm25_query_fast("unknown") == []
+        assert cache.bm25_query_fast("   ") == []
+
+    def test_legacy_index_is_migrated(self, tmp_path: Path) -> None:
+        """Caches written before doc lengths were persisted are rebuilt on open."""
+        cache = LearningCache(tmp_path)
+        learning = Learning(fact="legacy fact here", category="fact")
+        cache.add(learning)
+
+        conn = sqlite3.connect(tmp_path / "learnings.db")
+        conn.execute("DELETE FROM bm25_doc_length")
+        conn.execute("DELETE FROM bm25_terms")
+        conn.execute("DELETE FROM bm25_metadata WHERE key = 'total_length'")
+        conn.commit()
+        conn.close()
+
+        reopened = LearningCache(tmp_path)
+        assert [r[0] for r in reopened.bm25_query_fast("legacy")] == [learning.id]
+
+    def test_duplicate_add_after_migration_is_not_reindexed(self, tmp_path: Path) -> None:
+        """The migration's writes must not make a skipped INSERT look like an add."""
+        first = Learning(fact="legacy fact here", category="fact")
+        second = Learning(fact="another legacy fact", category="fact")
+        LearningCache(tmp_path).add_batch([first, second])
+
+        conn = sqlite3.connect(tmp_path / "learnings.db")
+        conn.execute("DELETE FROM bm25_metadata WHERE key = 'total_length'")
+        conn.commit()
+        conn.close()
+
+        reopened = LearningCache(tmp_path)
+        assert not reopened.add(first)
+        assert reopened.get_bm25_stats()["total_docs"] == 2
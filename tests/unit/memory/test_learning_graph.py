@@ -10,6 +10,7 @@ from sunwell.memory.simulacrum.core.dag import ConversationDAG
 from sunwell.memory.simulacrum.core.retrieval.learning_graph import (
     LearningEdge,
     LearningGraph,
+    LearningIndex,
     RelationType,
     detect_relationships,
 )
@@ -354,3 +355,137 @@ class TestDAGLearningGraphIntegration:
         original_edges = dag.learning_graph.stats["total_edges"]
         loaded_edges = loaded_dag.learning_graph.stats["total_edges"]
         assert loaded_edges == original_edges
+
+
+def _corpus() -> list[Learning]:
+    """Learnings exercising every relationship type."""
+    facts = [
+        ("Use pytest fixtures for database setup in tests", ("t1",), "pattern"),
+        ("pytest fixtures simplify database setup and teardown", ("t2",), "pattern"),
+        ("Database setup with pytest fixtures is slow", ("t3",), "fact"),
+        ("Mocking the database failed but fixtures for setup work", ("t4",), "dead_end"),
+        ("Redis caches session data", ("t1",), "fact"),
+        ("Deploy with docker compose", (), "preference"),
+        ("the a an is of and", (), "fact"),
+    ]
+    learnings = [
+        Learning(
+            fact=fact,
+            source_turns=turns,
+            confidence=0.8,
+            category=category,  # type: ignore[arg-type]
+            activity_day_created=i,
+            activity_day_accessed=i,
+        )
+        for i, (fact, turns, category) in enumerate(facts)
+    ]
+    successor = learnings[2]
+    learnings[0] = Learning(
+        fact=learnings[0].fact,
+        source_turns=learnings[0].source_turns,
+        confidence=0.8,
+        category="pattern",
+        superseded_by=successor.id,
+        activity_day_created=0,
+        activity_day_accessed=0,
+    )
+    return learnings
+
+
+class TestLearningIndex:
+    """The inverted index must agree with the full-scan detector."""
+
+    def test_matches_detect_relationships(self) -> None:
+        learnings = _corpus()
+        index = LearningIndex()
+        by_id: dict[str, Learning] = {}
+
+        for learning in learnings:
+            expected = detect_relationships(learning, list(by_id.values()))
+            assert index.detect(learning, by_id) == expected
+            by_id[learning.id] = learning
+            index.add(learning)
+
+        relation_types = {
+            edge.relation_type
+            for learning in learnings
+            for edge in index.detect(learning, by_id)
+        }
+        assert relation_types >= {
+            RelationType.DERIVES_FROM,
+            RelationType.SUPPORTS,
+            RelationType.RELATED,
+            RelationType.CONTRADICTS,
+            RelationType.ELABORATES,
+        }
+
+    def test_remove_drops_postings(self) -> None:
+        learnings = _corpus()
+        index = LearningIndex()
+        for learning in learnings[:3]:
+            index.add(learning)
+        by_id = {learning.id: learning for learning in learnings[:3]}
+
+        index.remove(learnings[1].id)
+        targets = {e.target_id for e in index.detect(learnings[3], by_id)}
+        assert learnings[1].id not in targets
+        assert len(index) == 2
+
+
+class TestAddLearningsBatch:
+    """ConversationDAG.add_learnings_batch."""
+
+    def test_batch_matches_sequential_adds(self) -> None:
+        learnings = _corpus()
+        sequential = ConversationDAG()
+        for learning in learnings:
+            sequential.add_learning(learning)
+
+        batched = ConversationDAG()
+        ids = batched.add_learnings_batch(learnings)
+
+        assert ids == [learning.id for learning in learnings]
+        assert batched.learning_graph.stats == sequential.learning_graph.stats
+        for learning in learnings:
+            assert batched.learning_graph.get_outbound(learning.id) == (
+                sequential.learning_graph.get_outbound(learning.id)
+            )
+
+    def test_index_rebuilt_after_load(self, tmp_path) -> None:
+        learnings = _corpus()
+        dag = ConversationDAG()
+        dag.add_learnings_batch(learnings[:2])
+        dag.save(tmp_path / "dag.json")
+
+        loaded = ConversationDAG.load(tmp_path / "dag.json")
+        loaded.add_learning(learnings[2])
+        dag.add_learning(learnings[2])
+        assert loaded.learning_graph.get_outbound(learnings[2].id) == (
+            dag.learning_graph.get_outbound(learnings[2].id)
+        )
+        assert loaded.get_inbound_link_count(learnings[1].id) == 1
+
+    def test_index_rebuilt_after_same_size_direct_edit(self) -> None:
+        """Swapping one learning for another in ``learnings`` keeps the count."""
+        learnings = _corpus()
+        dag = ConversationDAG()
+        dag.add_learnings_batch(learnings[:2])
+
+        del dag.learnings[learnings[1].id]
+        dag.learnings[learnings[3].id] = learnings[3]
+
+        dag.add_learning(learnings[2])
+        targets = {e.target_id for e in dag.learning_graph.get_outbound(learnings[2].id)}
+        assert learnings[1].id not in targets
+        assert learnings[3].id in targets
+
+    def test_index_rebuilt_after_learnings_reassigned(self) -> None:
+        learnings = _corpus()
+        dag = ConversationDAG()
+        dag.add_learnings_batch(learnings[:2])
+
+        dag.learnings = {learnings[4].id: learnings[4], learnings[5].id: learnings[5]}
+
+        dag.add_learning(learnings[0])
+        assert dag.get_inbound_link_count(learnings[4].id) == 1
+        assert dag.get_inbound_link_count(learnings[1].id) == 0
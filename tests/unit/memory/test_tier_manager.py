@@ -0,0 +1,139 @@
+"""Tests for indexed compressed/archived turn storage."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from sunwell.memory.simulacrum.core.config import StorageConfig
+from sunwell.memory.simulacrum.core.dag import ConversationDAG
+from sunwell.memory.simulacrum.core.tier_manager import TierManager
+from sunwell.memory.simulacrum.core.turn import Turn, TurnType
+from sunwell.memory.simulacrum.core.turn_index import FRAME_BYTES, turn_to_record
+
+
+def _turn(content: str, day: str = "2020-01-02", i: int = 0) -> Turn:
+    return Turn(
+        content=content,
+        turn_type=TurnType.USER,
+        timestamp=f"{day}T10:00:{i % 60:02d}",
+    )
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> TierManager:
+    dag = ConversationDAG()
+    return TierManager(tmp_path, StorageConfig(hot_max_turns=0), dag)
+
+
+def _demote(manager: TierManager, turns: list[Turn]) -> None:
+    for turn in turns:
+        manager._hot_dag.add_turn(turn)
+    manager.maybe_demote_to_compressed()
+
+
+class TestCompressedTier:
+    def test_retrieve_by_id(self, manager: TierManager) -> None:
+        turns = [_turn(f"message {i}", i=i) for i in range(20)]
+        _demote(manager, turns)
+
+        found = manager.retrieve_from_compressed(turns[7].id)
+        assert found is not None and found.content == "message 7"
+        assert manager.retrieve_from_compressed("missing") is None
+
+    def test_demote_is_idempotent(self, manager: TierManager) -> None:
+        _demote(manager, [_turn("only once")])
+        manager.maybe_demote_to_compressed()
+        shard = manager.warm_path / "2020-01-02.jsonl"
+        assert len(shard.read_text().splitlines()) == 1
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("postgres", {"use postgres for storage", "PostgreSQL is great"}),
+            ("gres for sto", {"use postgres for storage"}),
+            ("auth", {"the oauth flow", "auth tokens expire"}),
+            ("tokens expire", {"auth tokens expire"}),
+            ("!", {"hello!"}),
+            ("nothing here", set()),
+        ],
+    )
+    def test_search_matches_substring_semantics(
+        self, manager: TierManager, query: str, expected: set[str]
+    ) -> None:
+        contents = [
+            "use postgres for storage",
+            "PostgreSQL is great",
+            "the oauth flow",
+            "auth tokens expire",
+            "hello!",
+        ]
+        _demote(manager, [_turn(c, i=i) for i, c in enumerate(contents)])
+        assert {t.content for t in manager.search_compressed(query, limit=10)} == expected
+
+    def test_cleanup_dead_ends_rewrites_only_affected_shards(
+        self, manager: TierManager
+    ) -> None:
+        a, b = _turn("keep me", "2020-01-02"), _turn("drop me", "2020-01-02", 1)
+        other = _turn("other day", "2020-01-03")
+        _demote(manager, [a, b, other])
+        untouched = (manager.warm_path / "2020-01-03.jsonl").stat().st_mtime_ns
+
+        assert manager.cleanup_dead_ends({b.id}) == 1
+        assert manager.retrieve_from_compressed(b.id) is None
+        assert manager.retrieve_from_compressed(a.id).content == "keep me"
+        assert manager.search_compressed("drop") == []
+        assert (manager.warm_path / "2020-01-03.jsonl").stat().st_mtime_ns == untouched
+
+    def test_indexes_legacy_shards(self, tmp_path: Path) -> None:
+        warm = tmp_path / "turns" / "compressed"
+        warm.mkdir(parents=True)
+        turn = _turn("written before the index")
+        (warm / "2020-01-02.jsonl").write_text(json.dumps(turn_to_record(turn)) + "\n")
+
+        manager = TierManager(tmp_path, StorageConfig(), ConversationDAG())
+        assert manager.retrieve_from_compressed(turn.id).content == turn.content
+        assert [t.content for t in manager.search_compressed("before")] == [turn.content]
+
+
+class TestArchivedTier:
+    def test_archive_is_framed_and_seekable(self, manager: TierManager) -> None:
+        filler = "x" * 500
+        turns = [_turn(f"turn {i} {filler}", i=i) for i in range(400)]
+        _demote(manager, turns)
+
+        assert manager.move_to_archived(older_than_hours=1) == 1
+        assert not list(manager.warm_path.glob("*.jsonl"))
+        archive = next(manager.cold_path.glob("2020-01-02.jsonl.*"))
+
+        # Several frames, and the whole file still decompresses as one stream
+        assert archive.stat().st_size > 0
+        location = manager._index.locate(turns[-1].id)
+        assert location is not None and location.frame_offset > 0
+        assert location.frame_length < archive.stat().st_size
+        if archive.suffix == ".gz":
+            assert len(gzip.decompress(archive.read_bytes())) > FRAME_BYTES
+
+        assert manager.retrieve_from_compressed(turns[123].id).content.startswith("turn 123 ")
+        assert [t.content for t in manager.search_compressed("turn 399 ")] == [turns[399].content]
+
+    def test_legacy_single_stream_archive_is_reframed(self, tmp_path: Path) -> None:
+        cold = tmp_path / "turns" / "archived"
+        cold.mkdir(parents=True)
+        turn = _turn("archived long ago")
+        with gzip.open(cold / "2019-05-01.jsonl.gz", "wt") as f:
+            f.write(json.dumps(turn_to_record(turn)) + "\n")
+
+        manager = TierManager(tmp_path, StorageConfig(), ConversationDAG())
+        assert manager.retrieve_from_compressed(turn.id).content == turn.content
+
+    def test_uncompressed_archive(self, tmp_path: Path) -> None:
+        manager = TierManager(
+            tmp_path, StorageConfig(hot_max_turns=0, cold_compression=False), ConversationDAG()
+        )
+        turn = _turn("plain archive")
+        _demote(manager, [turn])
+        assert manager.move_to_archived(older_than_hours=1) == 1
+        assert (manager.cold_path / "2020-01-02.jsonl").exists()
+        assert manager.retrieve_from_compressed(turn.id).content == "plain archive"
@@ -0,0 +1,205 @@
+"""Tests for RunStore (RFC-112 Observatory).
+
+Tests the run catalog, append-only event segments, and stored snapshots.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from sunwell.interface.server import run_store as run_store_module
+from sunwell.interface.server.run_store import RunStore
+from sunwell.interface.server.runs import RunState
+
+
+def _task_events(count: int) -> list[dict]:
+    return [
+        {"type": "task_start", "data": {"task_id": f"t{i}", "description": f"Task {i}"}}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> RunStore:
+    return RunStore(runs_dir=tmp_path / "runs")
+
+
+class TestEventSegments:
+    """Tests for incremental event persistence."""
+
+    def test_append_then_save_writes_each_event_once(self, store: RunStore) -> None:
+        """save_run() should only write events not appended yet."""
+        run = RunState(run_id="run-1", goal="Build it")
+        for event in _task_events(3):
+            run.events.append(event)
+            store.append_events(run, [event])
+
+        run.events.extend(_task_events(5)[3:])
+        run.complete()
+        store.save_run(run)
+
+        assert store.get_events("run-1") == _task_events(5)
+        assert store.list_runs()[0].event_count == 5
+
+    def test_paging_across_segments(
+        self, store: RunStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_events() should page by sequence number across segment files."""
+        monkeypatch.setattr(run_store_module, "SEGMENT_EVENTS", 4)
+        run = RunState(run_id="run-1", goal="Build it", events=_task_events(10))
+        run.complete()
+        store.save_run(run)
+
+        segments = sorted(p.name for p in store._events_dir("run-1").iterdir())
+        assert segments == ["00000000.jsonl", "00000004.jsonl", "00000008.jsonl"]
+
+        page = store.get_events("run-1", since=5, limit=4)
+        assert [e["data"]["task_id"] for e in page] == ["t5", "t6", "t7", "t8"]
+        assert store.get_events("run-1", since=10) == []
+
+    def test_torn_write_is_repaired(self, tmp_path: Path) -> None:
+        """A partial final line should be dropped before appending resumes."""
+        store = RunStore(runs_dir=tmp_path / "runs")
+        run = RunState(run_id="run-1", goal="Build it", events=_task_events(2))
+        store.append_events(run, run.events)
+        segment = store._events_dir("run-1") / "00000000.jsonl"
+        with segment.open("a") as f:
+            f.write('{"type": "task_st')
+
+        restarted = RunStore(runs_dir=tmp_path / "runs")
+        assert len(restarted.get_events("run-1")) == 2
+        run.events.append(_task_events(3)[2])
+        run.complete()
+        restarted.save_run(run)
+
+        assert restarted.get_events("run-1") == _task_events(3)
+
+
+class TestCatalog:
+    """Tests for run metadata queries."""
+
+    def test_list_runs_newest_first_with_filter(self, store: RunStore) -> None:
+        """list_runs() should sort by start time and filter by project."""
+        for i, project in enumerate(["a", "b", "a"]):
+            run = RunState(run_id=f"run-{i}", goal=f"Goal {i}", project_id=project)
+            run.started_at = run.started_at.replace(year=2020 + i)
+            run.complete()
+            store.save_run(run)
+
+        assert [r.run_id for r in store.list_runs()] == ["run-2", "run-1", "run-0"]
+        assert [r.run_id for r in store.list_runs(project_id="a")] == ["run-2", "run-0"]
+        assert [r.run_id for r in store.list_runs(limit=1)] == ["run-2"]
+
+    def test_appends_update_event_count(self, store: RunStore) -> None:
+        """The catalog should count events as they are appended."""
+        run = RunState(run_id="run-1", goal="Build it")
+        store.append_events(run, _task_events(2))
+        store.append_events(run, _task_events(3)[2:])
+
+        assert store.has_run("run-1")
+        assert not store.has_run("run-2")
+        assert store.list_runs()[0].event_count == 3
+
+    def test_catalog_counts_are_batched_on_one_connection(
+        self, store: RunStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Appends should reuse the store's connection and sync counts in batches."""
+        monkeypatch.setattr(run_store_module, "CATALOG_SYNC_EVENTS", 3)
+        monkeypatch.setattr(run_store_module, "CATALOG_SYNC_SECONDS", 3600.0)
+        monkeypatch.setattr(
+            sqlite3, "connect", lambda *a, **k: pytest.fail("opened another connection")
+        )
+        run = RunState(run_id="run-1", goal="Build it")
+
+        def stored_count() -> int:
+            with store._connect() as conn:
+                return conn.execute("SELECT event_count FROM runs").fetchone()[0]
+
+        for event in _task_events(2):
+            store.append_events(run, [event])
+        assert stored_count() == 0
+        assert store.list_runs()[0].event_count == 2
+
+        store.append_events(run, _task_events(3)[2:])
+        assert stored_count() == 3
+
+    def test_idle_writers_are_closed_and_cleaned_up(
+        self, store: RunStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A run that stops appending should release its segment and be cleanable."""
+        abandoned = RunState(run_id="abandoned", goal="Crashed")
+        store.append_events(abandoned, _task_events(1))
+        for i in range(2):
+            run = RunState(run_id=f"done-{i}", goal="Done")
+            run.complete()
+            store.save_run(run)
+
+        monkeypatch.setattr(run_store_module, "WRITER_IDLE_SECONDS", 0.0)
+        assert store.cleanup_old_runs(max_runs=2) == 1
+
+        assert "abandoned" not in store._writers
+        assert {r.run_id for r in store.list_runs()} == {"done-0", "done-1"}
+        assert not store._events_dir("abandoned").exists()
+
+    def test_cleanup_keeps_active_runs(self, store: RunStore) -> None:
+        """cleanup_old_runs() should trim by count but skip runs still writing."""
+        active = RunState(run_id="active", goal="Still going")
+        store.append_events(active, _task_events(1))
+        for i in range(3):
+            run = RunState(run_id=f"done-{i}", goal="Done")
+            run.complete()
+            store.save_run(run)
+
+        # "active" is the oldest of the two runs over the limit, but is kept
+        assert store.cleanup_old_runs(max_runs=2) == 1
+        assert {r.run_id for r in store.list_runs()} == {"active", "done-1", "done-2"}
+        assert not store._events_dir("done-0").exists()
+
+    def test_imports_legacy_json_runs(self, tmp_path: Path) -> None:
+        """Runs saved as {run_id}.json should move into the catalog."""
+        runs_dir = tmp_path / "runs"
+        runs_dir.mkdir()
+        (runs_dir / "old-run.json").write_text(
+            json.dumps({
+                "run_id": "old-run",
+                "goal": "Legacy",
+                "status": "complete",
+                "started_at": "2025-01-01T00:00:00+00:00",
+                "events": _task_events(2),
+            })
+        )
+
+        store = RunStore(runs_dir=runs_dir)
+
+        assert not (runs_dir / "old-run.json").exists()
+        loaded = store.load_run("old-run")
+        assert loaded is not None
+        assert loaded.goal == "Legacy"
+        assert list(loaded.events) == _task_events(2)
+
+
+class TestObservatorySnapshot:
+    """Tests for stored Observatory snapshots."""
+
+    def test_snapshot_stored_on_completion(
+        self, store: RunStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The snapshot should be computed once, when the run is saved."""
+        run = RunState(run_id="run-1", goal="Build it", events=_task_events(2))
+        run.events.append({"type": "task_complete", "data": {"task_id": "t0"}})
+        run.complete()
+        store.save_run(run)
+
+        def fail(_run: object) -> None:
+            raise AssertionError("snapshot re-derived on load")
+
+        monkeypatch.setattr(run_store_module, "_extract_observatory_snapshot", fail)
+        snapshot = store.get_observatory_snapshot("run-1")
+
+        assert snapshot is not None
+        assert [(t["id"], t["status"]) for t in snapshot.tasks] == [
+            ("t0", "complete"),
+            ("t1", "running"),
+        ]
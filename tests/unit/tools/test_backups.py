@@ -0,0 +1,128 @@
+"""Tests for the content-addressed backup store used by undo/restore."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sunwell.tools.core.backups import BackupStore
+from sunwell.tools.handlers.file import FileHandlers
+from sunwell.tools.handlers.undo import UndoHandlers
+
+
+def _source(version: int) -> str:
+    body = "\n".join(f"def handler_{i}():\n    return {i}\n" for i in range(300))
+    return f"VERSION = {version}\n{body}"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BackupStore:
+    return BackupStore(tmp_path)
+
+
+class TestBackupStore:
+    """Tests for BackupStore."""
+
+    def test_unchanged_content_is_not_backed_up_twice(self, store: BackupStore) -> None:
+        first = store.record("app.py", "print(1)\n", "edit")
+        again = store.record("app.py", "print(1)\n", "write")
+
+        assert again == first
+        assert len(store.entries("app.py")) == 1
+
+    def test_identical_content_shares_a_blob(self, store: BackupStore) -> None:
+        store.record("a.py", _source(1))
+        size = store.stored_bytes()
+
+        store.record("b.py", _source(1))
+
+        assert store.stored_bytes() == size
+        assert store.read(store.entries("b.py")[0]) == _source(1).encode()
+
+    def test_revisions_are_delta_encoded(self, store: BackupStore) -> None:
+        store.record("app.py", _source(0))
+        full = store.stored_bytes()
+
+        for version in range(1, 6):
+            store.record("app.py", _source(version))
+
+        assert store.stored_bytes() < full * 2
+        entries = store.entries("app.py")
+        assert [store.read(e) for e in entries] == [
+            _source(v).encode() for v in range(5, -1, -1)
+        ]
+
+    def test_pruning_releases_unreferenced_blobs(self, tmp_path: Path) -> None:
+        store = BackupStore(tmp_path, max_per_file=3)
+        for version in range(20):
+            store.record("app.py", f"value = {version}\n" * 50)
+
+        entries = store.entries("app.py")
+        assert [store.read(e) for e in entries] == [
+            (f"value = {v}\n" * 50).encode() for v in (19, 18, 17)
+        ]
+        with store._db.connect() as conn:
+            (blobs,) = conn.execute("SELECT COUNT(*) FROM blobs").fetchone()
+        # Kept versions, plus at most a delta chain's worth of bases
+        assert blobs <= 3 + 8
+
+        for entry in entries:
+            store.remove(entry)
+        assert store.stored_bytes() == 0
+
+    def test_imports_legacy_backups(self, tmp_path: Path) -> None:
+        backup_dir = tmp_path / ".sunwell" / "backups"
+        (backup_dir / "2026-01-01").mkdir(parents=True)
+        (backup_dir / "2026-01-01" / "old.bak").write_text("old\n")
+        (backup_dir / "2026-01-01" / "new.bak").write_text("new\n")
+        (backup_dir / "backup_index.json").write_text(
+            json.dumps({
+                "app.py": [
+                    {"backup_path": "2026-01-01/new.bak", "timestamp": "t2", "operation": "edit"},
+                    {"backup_path": "2026-01-01/old.bak", "timestamp": "t1", "operation": "write"},
+                ]
+            })
+        )
+
+        store = BackupStore(tmp_path)
+
+        entries = store.entries("app.py")
+        assert [(e.timestamp, store.read(e)) for e in entries] == [
+            ("t2", b"new\n"),
+            ("t1", b"old\n"),
+        ]
+        assert not (backup_dir / "backup_index.json").exists()
+        assert not (backup_dir / "2026-01-01").exists()
+
+
+class TestUndoHandlers:
+    """Tests for undo/restore through the handlers."""
+
+    @pytest.mark.asyncio
+    async def test_undo_then_restore(self, tmp_path: Path) -> None:
+        handlers = UndoHandlers(tmp_path)
+        target = tmp_path / "app.py"
+        target.write_text("v1\n")
+        handlers.record_backup("app.py", target.read_bytes(), "edit")
+        target.write_text("v2\n")
+
+        result = await handlers.undo_file({"path": "app.py"})
+
+        assert result.startswith("✓ Restored app.py")
+        assert target.read_text() == "v1\n"
+        # The state undo replaced is itself restorable
+        assert "undo_previous" in await handlers.list_backups({"path": "app.py"})
+        await handlers.restore_file({"path": "app.py", "index": 0})
+        assert target.read_text() == "v2\n"
+
+    @pytest.mark.asyncio
+    async def test_undo_edit_keeps_crlf_line_endings(self, tmp_path: Path) -> None:
+        target = tmp_path / "app.py"
+        target.write_bytes(b"a = 1\r\nb = 2\r\n")
+
+        await FileHandlers(tmp_path).edit_file(
+            {"path": "app.py", "old_content": "a = 1", "new_content": "a = 3"}
+        )
+        await UndoHandlers(tmp_path).undo_file({"path": "app.py"})
+
+        assert target.read_bytes() == b"a = 1\r\nb = 2\r\n"
@@ -0,0 +1,124 @@
+"""Tests for the non-blocking process runner and GitWorkspace."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from sunwell.tools.core.process import git_workspace, run_process
+
+PY = sys.executable
+
+
+class TestRunProcess:
+    @pytest.mark.asyncio
+    async def test_captures_output_and_exit_code(self) -> None:
+        result = await run_process(
+            [PY, "-c", "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"]
+        )
+        assert (result.returncode, result.stdout, result.stderr) == (3, "out\n", "err\n")
+        assert not result.truncated
+
+    @pytest.mark.asyncio
+    async def test_string_runs_through_shell(self, tmp_path: Path) -> None:
+        result = await run_process("echo a && echo b | tr b c", cwd=tmp_path)
+        assert result.stdout == "a\nc\n"
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self) -> None:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await run_process([PY, "-c", "import time; time.sleep(0.3)"])
+        task.cancel()
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_shell_process_group(self) -> None:
+        with pytest.raises(subprocess.TimeoutExpired) as exc:
+            await run_process("echo started; sleep 30", timeout=0.5)
+        assert exc.value.output == "started\n"
+
+    @pytest.mark.asyncio
+    async def test_cancel_kills_and_reaps_child(self) -> None:
+        started = asyncio.Event()
+        pids: list[int] = []
+
+        def on_stdout(chunk: str) -> None:
+            pids.append(int(chunk))
+            started.set()
+
+        task = asyncio.create_task(
+            run_process(
+                [PY, "-c", "import os, time; print(os.getpid(), flush=True); time.sleep(30)"],
+                on_stdout=on_stdout,
+            )
+        )
+        await asyncio.wait_for(started.wait(), 10)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(pids[0], 0)
+
+    @pytest.mark.asyncio
+    async def test_output_is_capped_but_streamed(self) -> None:
+        chunks: list[str] = []
+        result = await run_process(
+            [PY, "-c", "print('x' * 200_000)"], max_output=1000, on_stdout=chunks.append
+        )
+        assert result.returncode == 0
+        assert result.truncated
+        assert len(result.stdout) == 1000
+        assert len("".join(chunks)) == 200_001
+
+    @pytest.mark.asyncio
+    async def test_output_kept_for_timeout_is_capped(self) -> None:
+        script = (
+            "import sys, time; sys.stdout.write('x' * 20_000_000); sys.stdout.flush(); "
+            "time.sleep(30)"
+        )
+        tracemalloc.start()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired) as exc:
+                await run_process([PY, "-c", script], timeout=3, max_output=1000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert exc.value.output == "x" * 1000
+        assert peak < 5_000_000  # Far below the 20MB the child wrote
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitWorkspace:
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        (tmp_path / "a.txt").write_text("hello\n")
+        git("add", "a.txt")
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_status_and_shared_instance(self, repo: Path) -> None:
+        (repo / "b.txt").write_text("new\n")
+        result = await git_workspace(repo).status("--short")
+
+        assert result.stdout == "?? b.txt\n"
+        assert git_workspace(repo / ".") is git_workspace(repo)